@@ -0,0 +1,39 @@
+"""V2 incident full-text search — tsvector generated column + GIN index.
+
+Replaces the ILIKE '%q%' scan behind the chat "historical_lookup" intent
+with an index probe ranked by ts_rank. SQLite (dev/tests) gets an FTS5
+shadow table from riskcast.db.fulltext at create_all time instead.
+
+Revision ID: v2_incident_fts_002
+Revises: v2_foundation_001
+Create Date: 2026-02-10
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_incident_fts_002"
+down_revision = "v2_foundation_001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    ALTER TABLE v2_incidents ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple',
+                coalesce(type, '') || ' ' ||
+                coalesce(description, '') || ' ' ||
+                coalesce(resolution, ''))
+        ) STORED
+    """)
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS ix_v2_incidents_search_vector
+        ON v2_incidents USING GIN (search_vector)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_v2_incidents_search_vector")
+    op.execute("ALTER TABLE v2_incidents DROP COLUMN IF EXISTS search_vector")
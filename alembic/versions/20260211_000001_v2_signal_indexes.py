@@ -0,0 +1,72 @@
+"""V2 signal hot-path indexes + partitioned archive table.
+
+Adds partial (WHERE is_active) composite indexes for the two shapes every
+signal read uses:
+- (company_id, entity_type, entity_id)  — RiskEngine.assess_entity,
+  get_active_signals_map, SignalService deactivation
+- (company_id, severity_score DESC)     — dashboard top risks,
+  get_active_signals, /signals listing
+
+Also creates v2_signals_archive, range-partitioned by month on created_at.
+Partitions are created on demand by riskcast.services.signal_archive.
+
+Indexes are built CONCURRENTLY so the migration does not block writers.
+
+Revision ID: v2_signal_indexes_003
+Revises: v2_incident_fts_002
+Create Date: 2026-02-11
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_signal_indexes_003"
+down_revision = "v2_incident_fts_002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_v2_signals_entity_active
+            ON v2_signals (company_id, entity_type, entity_id)
+            WHERE is_active
+        """)
+        op.execute("""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_v2_signals_active_severity
+            ON v2_signals (company_id, severity_score DESC)
+            INCLUDE (entity_type, entity_id, signal_type)
+            WHERE is_active
+        """)
+
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS v2_signals_archive (
+        id              UUID NOT NULL,
+        created_at      TIMESTAMP NOT NULL,
+        company_id      UUID NOT NULL,
+        source          VARCHAR(100) NOT NULL,
+        signal_type     VARCHAR(100) NOT NULL,
+        entity_type     VARCHAR(50),
+        entity_id       UUID,
+        confidence      NUMERIC(3,2) NOT NULL,
+        severity_score  NUMERIC(5,2),
+        evidence        JSONB NOT NULL,
+        context         JSONB DEFAULT '{}',
+        expires_at      TIMESTAMP,
+        updated_at      TIMESTAMP,
+        archived_at     TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS ix_v2_signals_archive_company
+        ON v2_signals_archive (company_id, created_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS v2_signals_archive CASCADE")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_v2_signals_active_severity")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_v2_signals_entity_active")
@@ -0,0 +1,62 @@
+"""V2 per-day accuracy rollup for the outcomes page.
+
+Creates v2_outcome_accuracy_daily: one row per (company, day, calibration
+bin) holding the sums every accuracy metric is built from. OutcomeRecorder
+upserts into it on each recorded outcome; this migration backfills it
+from existing v2_outcomes rows.
+
+Revision ID: v2_outcome_rollup_004
+Revises: v2_signal_indexes_003
+Create Date: 2026-02-12
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_outcome_rollup_004"
+down_revision = "v2_signal_indexes_003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS v2_outcome_accuracy_daily (
+        company_id      UUID NOT NULL,
+        day             DATE NOT NULL,
+        bin             INTEGER NOT NULL,
+        n               INTEGER NOT NULL DEFAULT 0,
+        sum_predicted   NUMERIC(18,6) NOT NULL DEFAULT 0,
+        sum_sq_error    NUMERIC(18,6) NOT NULL DEFAULT 0,
+        sum_abs_error   NUMERIC(18,6) NOT NULL DEFAULT 0,
+        materialized    INTEGER NOT NULL DEFAULT 0,
+        accurate        INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (company_id, day, bin)
+    )
+    """)
+    op.execute("""
+    DO $$
+    BEGIN
+        IF to_regclass('v2_outcomes') IS NOT NULL THEN
+            INSERT INTO v2_outcome_accuracy_daily
+                (company_id, day, bin, n, sum_predicted, sum_sq_error,
+                 sum_abs_error, materialized, accurate)
+            SELECT company_id,
+                   recorded_at::date,
+                   LEAST(GREATEST(width_bucket(predicted_risk_score, 0, 100, 10) - 1, 0), 9),
+                   COUNT(*),
+                   SUM(predicted_risk_score / 100.0),
+                   SUM(power(predicted_risk_score / 100.0 - risk_materialized::int, 2)),
+                   SUM(prediction_error),
+                   SUM(risk_materialized::int),
+                   SUM(was_accurate::int)
+            FROM v2_outcomes
+            GROUP BY 1, 2, 3
+            ON CONFLICT (company_id, day, bin) DO NOTHING;
+        END IF;
+    END $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS v2_outcome_accuracy_daily")
@@ -0,0 +1,42 @@
+"""Keyset pagination indexes for active decision listings.
+
+/decisions/active filters, orders (created_at DESC, decision_id DESC) and
+pages in SQL. These partial (WHERE NOT is_expired) indexes serve that
+order directly, for all customers (admin view) and per customer:
+- (created_at, decision_id)
+- (customer_id, created_at, decision_id)
+
+Indexes are built CONCURRENTLY so the migration does not block writers.
+
+Revision ID: decision_keyset_005
+Revises: v2_outcome_rollup_004
+Create Date: 2026-02-13
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "decision_keyset_005"
+down_revision = "v2_outcome_rollup_004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_decisions_active_keyset
+            ON decisions (created_at, decision_id)
+            WHERE NOT is_expired
+        """)
+        op.execute("""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_decisions_customer_active_keyset
+            ON decisions (customer_id, created_at, decision_id)
+            WHERE NOT is_expired
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_decisions_customer_active_keyset")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_decisions_active_keyset")
@@ -0,0 +1,82 @@
+"""Normalized customer/shipment chokepoint association tables.
+
+customers.relevant_chokepoints and shipments.route_chokepoints are JSON
+arrays, so "which customers are exposed to X" was a JSON-contains scan.
+This adds two association tables, maintained by PostgresCustomerRepository
+on every write, and backfills them from the JSON columns:
+- customer_chokepoints (customer_id, chokepoint)
+- shipment_chokepoints (shipment_id, chokepoint, customer_id, is_active)
+  with ix_shipment_chokepoints_exposure on (chokepoint, is_active,
+  customer_id) for the exposure lookup
+
+Chokepoints are stored lowercase. The JSON columns stay the source for
+API payloads.
+
+Revision ID: chokepoint_exposure_006
+Revises: decision_keyset_005
+Create Date: 2026-02-14
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "chokepoint_exposure_006"
+down_revision = "decision_keyset_005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS customer_chokepoints (
+        customer_id     VARCHAR(50) NOT NULL
+                        REFERENCES customers (customer_id) ON DELETE CASCADE,
+        chokepoint      VARCHAR(50) NOT NULL,
+        PRIMARY KEY (customer_id, chokepoint)
+    )
+    """)
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS ix_customer_chokepoints_chokepoint
+        ON customer_chokepoints (chokepoint, customer_id)
+    """)
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS shipment_chokepoints (
+        shipment_id     VARCHAR(100) NOT NULL
+                        REFERENCES shipments (shipment_id) ON DELETE CASCADE,
+        chokepoint      VARCHAR(50) NOT NULL,
+        customer_id     VARCHAR(50) NOT NULL
+                        REFERENCES customers (customer_id) ON DELETE CASCADE,
+        is_active       BOOLEAN NOT NULL DEFAULT TRUE,
+        PRIMARY KEY (shipment_id, chokepoint)
+    )
+    """)
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS ix_shipment_chokepoints_exposure
+        ON shipment_chokepoints (chokepoint, is_active, customer_id)
+    """)
+    op.execute("""
+    CREATE INDEX IF NOT EXISTS ix_shipment_chokepoints_customer
+        ON shipment_chokepoints (customer_id)
+    """)
+
+    # Backfill from the JSON arrays
+    op.execute("""
+    INSERT INTO customer_chokepoints (customer_id, chokepoint)
+    SELECT DISTINCT c.customer_id, lower(cp.value)
+    FROM customers c,
+         json_array_elements_text(COALESCE(c.relevant_chokepoints, '[]'::json)) AS cp(value)
+    ON CONFLICT DO NOTHING
+    """)
+    op.execute("""
+    INSERT INTO shipment_chokepoints (shipment_id, chokepoint, customer_id, is_active)
+    SELECT DISTINCT s.shipment_id, lower(cp.value), s.customer_id,
+           s.status NOT IN ('delivered', 'cancelled')
+    FROM shipments s,
+         json_array_elements_text(COALESCE(s.route_chokepoints, '[]'::json)) AS cp(value)
+    ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS shipment_chokepoints")
+    op.execute("DROP TABLE IF EXISTS customer_chokepoints")
@@ -0,0 +1,49 @@
+"""Legal hold entities and retention checkpoints.
+
+RetentionManager now deletes expired rows in bounded batches instead of
+loading every candidate ID and issuing one IN (...) delete:
+- legal_hold_entities (entity_type, entity_id, hold_id) mirrors the
+  active legal holds so held rows are excluded with NOT EXISTS on its
+  primary key
+- retention_checkpoints records the cutoff and last swept id of an
+  unfinished sweep so the next run resumes from it
+
+Revision ID: retention_sweep_007
+Revises: chokepoint_exposure_006
+Create Date: 2026-02-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "retention_sweep_007"
+down_revision = "chokepoint_exposure_006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS legal_hold_entities (
+        entity_type     VARCHAR(50) NOT NULL,
+        entity_id       VARCHAR(100) NOT NULL,
+        hold_id         VARCHAR(100) NOT NULL,
+        created_at      TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (entity_type, entity_id, hold_id)
+    )
+    """)
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS retention_checkpoints (
+        data_type       VARCHAR(50) PRIMARY KEY,
+        cutoff          TIMESTAMP NOT NULL,
+        last_id         INTEGER NOT NULL DEFAULT 0,
+        rows_processed  INTEGER NOT NULL DEFAULT 0,
+        started_at      TIMESTAMP NOT NULL DEFAULT NOW(),
+        updated_at      TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS retention_checkpoints")
+    op.execute("DROP TABLE IF EXISTS legal_hold_entities")
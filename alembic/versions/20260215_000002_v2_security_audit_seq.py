@@ -0,0 +1,57 @@
+"""V2 security audit chain sequence + signed checkpoints.
+
+Adds v2_security_audit_log.seq, the entry's position in the hash chain.
+SecurityAuditService assigns it under a transaction-scoped advisory lock,
+and the unique index makes a racing append fail instead of forking the
+chain. Existing rows are numbered in the timestamp order the chain was
+built (and verified) in.
+
+Also creates v2_security_audit_checkpoints: HMAC-signed (seq, entry_hash)
+markers that let verification resume after the last verified entry.
+
+Revision ID: v2_security_audit_seq_008
+Revises: retention_sweep_007
+Create Date: 2026-02-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_security_audit_seq_008"
+down_revision = "retention_sweep_007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    DO $$
+    BEGIN
+        IF to_regclass('v2_security_audit_log') IS NOT NULL THEN
+            ALTER TABLE v2_security_audit_log ADD COLUMN IF NOT EXISTS seq BIGINT;
+            UPDATE v2_security_audit_log l
+               SET seq = n.seq
+              FROM (SELECT id, row_number() OVER (ORDER BY timestamp, id) AS seq
+                      FROM v2_security_audit_log) n
+             WHERE l.id = n.id AND l.seq IS NULL;
+            ALTER TABLE v2_security_audit_log ALTER COLUMN seq SET NOT NULL;
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_security_audit_seq
+                ON v2_security_audit_log (seq);
+        END IF;
+    END $$
+    """)
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS v2_security_audit_checkpoints (
+        seq                 BIGINT PRIMARY KEY,
+        entry_hash          VARCHAR(128) NOT NULL,
+        entries_verified    BIGINT NOT NULL,
+        signature           VARCHAR(128) NOT NULL,
+        created_at          TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS v2_security_audit_checkpoints")
+    op.execute("DROP INDEX IF EXISTS ix_security_audit_seq")
+    op.execute("ALTER TABLE IF EXISTS v2_security_audit_log DROP COLUMN IF EXISTS seq")
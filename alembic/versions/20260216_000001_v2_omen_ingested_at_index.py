@@ -0,0 +1,37 @@
+"""V2 ingested_at index for pipeline health checks.
+
+PipelineHealthMonitor computes freshness, volume, ingest lag and gaps as
+range scans / window functions over v2_omen_signals.ingested_at. The
+model declares ix_omen_signals_ingested_at, but the OMEN tables predate
+the migration chain (create_all), so databases created before the index
+was added may lack it. Build it CONCURRENTLY if missing.
+
+Revision ID: v2_omen_ingested_idx_009
+Revises: v2_security_audit_seq_008
+Create Date: 2026-02-16
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_omen_ingested_idx_009"
+down_revision = "v2_security_audit_seq_008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    exists = op.get_bind().execute(sa.text("SELECT to_regclass('v2_omen_signals')")).scalar()
+    if exists is None:
+        return
+    with op.get_context().autocommit_block():
+        op.execute("""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_omen_signals_ingested_at
+            ON v2_omen_signals (ingested_at)
+        """)
+
+
+def downgrade() -> None:
+    # The index belongs to the model; leave it in place
+    pass
@@ -0,0 +1,26 @@
+"""V2 morning brief input hash.
+
+MorningBriefGenerator stores a SHA-256 of each brief's LLM prompt; when
+the next day's prompt hashes the same, the previous content is reused
+instead of calling the LLM again. Fallback (non-LLM) briefs store NULL.
+
+Revision ID: v2_brief_input_hash_010
+Revises: v2_omen_ingested_idx_009
+Create Date: 2026-02-17
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_brief_input_hash_010"
+down_revision = "v2_omen_ingested_idx_009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS v2_morning_briefs ADD COLUMN IF NOT EXISTS input_hash VARCHAR(64)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS v2_morning_briefs DROP COLUMN IF EXISTS input_hash")
@@ -0,0 +1,73 @@
+"""V2 per-day entity rollup for ROI reports and flywheel priors.
+
+Creates v2_outcome_entity_daily: one row per (company, day, entity type)
+holding the sums ROICalculator and FlywheelEngine are built from.
+OutcomeRecorder upserts into it on each recorded outcome; this migration
+backfills it from existing v2_outcomes rows.
+
+Revision ID: v2_outcome_entity_rollup_011
+Revises: v2_brief_input_hash_010
+Create Date: 2026-02-18
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "v2_outcome_entity_rollup_011"
+down_revision = "v2_brief_input_hash_010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE TABLE IF NOT EXISTS v2_outcome_entity_daily (
+        company_id              UUID NOT NULL,
+        day                     DATE NOT NULL,
+        entity_type             VARCHAR(50) NOT NULL,
+        n                       INTEGER NOT NULL DEFAULT 0,
+        followed                INTEGER NOT NULL DEFAULT 0,
+        helped                  INTEGER NOT NULL DEFAULT 0,
+        materialized            INTEGER NOT NULL DEFAULT 0,
+        predicted_loss          NUMERIC(20,2) NOT NULL DEFAULT 0,
+        actual_loss             NUMERIC(20,2) NOT NULL DEFAULT 0,
+        value                   NUMERIC(20,2) NOT NULL DEFAULT 0,
+        followed_predicted_loss NUMERIC(20,2) NOT NULL DEFAULT 0,
+        sum_predicted           NUMERIC(18,6) NOT NULL DEFAULT 0,
+        sum_error               NUMERIC(18,6) NOT NULL DEFAULT 0,
+        PRIMARY KEY (company_id, day, entity_type)
+    )
+    """)
+    op.execute("""
+    DO $$
+    BEGIN
+        IF to_regclass('v2_outcomes') IS NOT NULL THEN
+            INSERT INTO v2_outcome_entity_daily
+                (company_id, day, entity_type, n, followed, helped, materialized,
+                 predicted_loss, actual_loss, value, followed_predicted_loss,
+                 sum_predicted, sum_error)
+            SELECT company_id,
+                   recorded_at::date,
+                   entity_type,
+                   COUNT(*),
+                   COUNT(*) FILTER (WHERE action_followed_recommendation),
+                   COUNT(*) FILTER (WHERE action_followed_recommendation
+                                      AND value_generated_usd > 0),
+                   COUNT(*) FILTER (WHERE risk_materialized),
+                   SUM(predicted_loss_usd),
+                   SUM(actual_loss_usd),
+                   SUM(value_generated_usd),
+                   COALESCE(SUM(predicted_loss_usd)
+                            FILTER (WHERE action_followed_recommendation), 0),
+                   SUM(predicted_risk_score / 100.0),
+                   SUM(prediction_error)
+            FROM v2_outcomes
+            GROUP BY 1, 2, 3
+            ON CONFLICT (company_id, day, entity_type) DO NOTHING;
+        END IF;
+    END $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS v2_outcome_entity_daily")
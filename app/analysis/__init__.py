@@ -7,6 +7,7 @@ This module provides analytical tools for decision-making:
 - Decision Boundaries: Find thresholds that flip recommendations
 - What-If Analysis: Explore alternative scenarios
 - Robustness Assessment: Measure decision stability
+- Global Sensitivity: Morris screening and Sobol variance indices
 
 Key question answered: "Which inputs, if changed, would flip the decision?"
 """
@@ -16,6 +17,8 @@ from app.analysis.sensitivity import (
     DecisionRobustness,
     SensitivityAnalyzer,
     WhatIfResult,
+    GlobalSensitivity,
+    GlobalSensitivityIndex,
     create_sensitivity_analyzer,
 )
 
@@ -24,5 +27,7 @@ __all__ = [
     "DecisionRobustness",
     "SensitivityAnalyzer",
     "WhatIfResult",
+    "GlobalSensitivity",
+    "GlobalSensitivityIndex",
     "create_sensitivity_analyzer",
 ]
@@ -10,8 +10,16 @@ Key questions answered:
 
 Methods:
 1. One-at-a-time (OAT): Vary each input while holding others constant
-2. Binary search for decision boundaries
+2. Batched k-ary search for decision boundaries (all inputs per round)
 3. Robustness scoring
+4. Global indices: Morris elementary effects, Sobol first/total order
+
+Evaluation:
+    Every method builds a batch of input points and evaluates it in one
+    pass: through `batch_function` if given (vectorized), otherwise by
+    calling the decision function concurrently (bounded by
+    max_concurrency). Results are memoized per call, so the base case and
+    repeated points are computed once.
 
 Usage:
     analyzer = SensitivityAnalyzer(decision_function)
@@ -23,11 +31,16 @@ Usage:
     
     print(f"Robustness: {robustness.robustness_score:.0%}")
     print(f"Key driver: {robustness.key_drivers[0].factor_name}")
+    
+    indices = await analyzer.sobol(base_inputs, input_ranges, max_evaluations=2000)
 """
 
+import asyncio
+import inspect
 from datetime import datetime
 from typing import Optional, Callable, Any, Tuple
 from pydantic import BaseModel, Field
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -114,6 +127,45 @@ class WhatIfResult(BaseModel):
     )
 
 
+class GlobalSensitivityIndex(BaseModel):
+    """Global sensitivity of the output to one factor."""
+    
+    factor_name: str = Field(description="Name of the input factor")
+    mu_star: Optional[float] = Field(
+        default=None,
+        description="Morris: mean absolute elementary effect",
+    )
+    mu: Optional[float] = Field(
+        default=None,
+        description="Morris: mean elementary effect (sign shows direction)",
+    )
+    sigma: Optional[float] = Field(
+        default=None,
+        description="Morris: std of elementary effects (non-linearity/interactions)",
+    )
+    first_order: Optional[float] = Field(
+        default=None,
+        description="Sobol: share of output variance due to this factor alone",
+    )
+    total_order: Optional[float] = Field(
+        default=None,
+        description="Sobol: share of variance including interactions",
+    )
+
+
+class GlobalSensitivity(BaseModel):
+    """Result of a Morris or Sobol global sensitivity analysis."""
+    
+    method: str = Field(description="'morris' or 'sobol'")
+    output: str = Field(description="'utility' or 'action_flip'")
+    base_decision: str = Field(description="Decision at the base inputs")
+    evaluations: int = Field(description="Decision evaluations performed")
+    indices: list[GlobalSensitivityIndex] = Field(
+        default_factory=list,
+        description="Per-factor indices, most influential first",
+    )
+
+
 class SensitivityAnalyzer:
     """
     Analyzes sensitivity of decisions to input changes.
@@ -132,6 +184,9 @@ class SensitivityAnalyzer:
         self,
         decision_function: Callable[[dict], Tuple[str, float]],
         is_async: bool = True,
+        batch_function: Optional[Callable[[list[dict]], list[Tuple[str, float]]]] = None,
+        max_concurrency: int = 32,
+        grid_points: int = 7,
     ):
         """
         Initialize analyzer.
@@ -140,9 +195,19 @@ class SensitivityAnalyzer:
             decision_function: Function that takes inputs dict and returns (action, utility)
                               Can be sync or async
             is_async: Whether decision_function is async
+            batch_function: Optional vectorized version taking a list of input
+                            dicts and returning one (action, utility) per dict
+                            (sync or async); used for every batch when given
+            max_concurrency: Max concurrent decision_function calls per batch
+            grid_points: Interior points probed per boundary-search round;
+                         each round shrinks the bracket grid_points + 1 times
+                         (1 = plain binary search)
         """
         self._decide = decision_function
         self._is_async = is_async
+        self._batch = batch_function
+        self._max_concurrency = max(1, max_concurrency)
+        self._grid_points = max(1, grid_points)
     
     async def analyze(
         self,
@@ -165,28 +230,37 @@ class SensitivityAnalyzer:
             range_count=len(input_ranges),
         )
         
-        # Get base decision
-        base_action, base_utility = await self._call_decision(base_inputs)
+        cache: dict = {}
+        names = [name for name in input_ranges if name in base_inputs]
+        
+        # Base case plus both extremes of every input in one batch
+        extremes = [
+            _with(base_inputs, name, bound)
+            for name in names
+            for bound in input_ranges[name]
+        ]
+        outcomes = await self._evaluate_batch([base_inputs] + extremes, cache)
+        base_action, base_utility = outcomes[0]
+        
+        # Find decision boundaries for all inputs together
+        found = await self._find_boundaries(
+            base_inputs=base_inputs,
+            names=names,
+            input_ranges=input_ranges,
+            base_action=base_action,
+            extreme_actions={
+                name: (outcomes[1 + 2 * i][0], outcomes[2 + 2 * i][0])
+                for i, name in enumerate(names)
+            },
+            cache=cache,
+        )
         
-        # Find decision boundaries for each input
         factors = []
         boundaries = {}
         
-        for input_name, (min_val, max_val) in input_ranges.items():
-            if input_name not in base_inputs:
-                continue
-                
+        for input_name in names:
             current_val = base_inputs[input_name]
-            
-            # Search for boundary
-            boundary = await self._find_boundary(
-                base_inputs=base_inputs,
-                input_name=input_name,
-                current=current_val,
-                min_val=min_val,
-                max_val=max_val,
-                base_action=base_action,
-            )
+            boundary = found[input_name]
             
             # Calculate headroom
             if boundary is not None:
@@ -246,6 +320,7 @@ class SensitivityAnalyzer:
             robustness=robustness,
             fragile_count=len(fragile_factors),
             boundary_count=len(boundaries),
+            evaluations=len(cache),
         )
         
         return DecisionRobustness(
@@ -273,12 +348,12 @@ class SensitivityAnalyzer:
         Returns:
             Comparison of base vs changed decision
         """
-        base_action, base_utility = await self._call_decision(base_inputs)
-        
         changed_inputs = base_inputs.copy()
         changed_inputs.update(changes)
         
-        new_action, new_utility = await self._call_decision(changed_inputs)
+        (base_action, base_utility), (new_action, new_utility) = await self._evaluate_batch(
+            [base_inputs, changed_inputs], {}
+        )
         
         utility_change = new_utility - base_utility
         utility_change_pct = (
@@ -349,62 +424,327 @@ class SensitivityAnalyzer:
         else:
             return self._decide(inputs)
     
-    async def _find_boundary(
+    # ========================================================================
+    # GLOBAL SENSITIVITY
+    # ========================================================================
+    
+    async def morris(
         self,
         base_inputs: dict,
-        input_name: str,
-        current: float,
-        min_val: float,
-        max_val: float,
-        base_action: str,
-        tolerance: float = 0.01,
-    ) -> Optional[float]:
+        input_ranges: dict[str, Tuple[float, float]],
+        trajectories: int = 20,
+        levels: int = 4,
+        output: str = "utility",
+        max_evaluations: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> GlobalSensitivity:
         """
-        Binary search for decision boundary.
+        Morris elementary-effects screening.
         
-        Returns the value at which decision changes, or None if no boundary in range.
+        Each trajectory starts at a random grid point and moves one factor
+        at a time by delta = levels / (2 * (levels - 1)) of its range, so
+        the cost is trajectories * (factors + 1) evaluations plus one for
+        the base point. Effects are
+        per full-range change of the factor. Inputs not in input_ranges
+        stay at their base values.
+        
+        Args:
+            base_inputs: Current inputs (held for factors not varied)
+            input_ranges: Range to sample for each factor
+            trajectories: Number of trajectories (r)
+            levels: Grid levels per factor (p, even)
+            output: "utility", or "action_flip" (1 if action differs from base)
+            max_evaluations: Cap on evaluations (base point included);
+                reduces trajectories to fit
+            seed: RNG seed for reproducible samples
+        
+        Raises:
+            ValueError: If max_evaluations is below one trajectory (factors + 2)
         """
-        # Check if extremes have same decision
-        test_inputs = base_inputs.copy()
+        names = list(input_ranges)
+        d = len(names)
+        if max_evaluations is not None:
+            fit = (max_evaluations - 1) // (d + 1)
+            if fit < 1:
+                raise ValueError(
+                    f"max_evaluations={max_evaluations} is below one Morris "
+                    f"trajectory ({d + 2} evaluations)"
+                )
+            trajectories = min(trajectories, fit)
+        rng = np.random.default_rng(seed)
+        delta = levels / (2 * (levels - 1))
+        
+        # Unit-cube trajectories: (r, d + 1, d)
+        grid = np.arange(levels) / (levels - 1)
+        starts = rng.choice(grid[grid + delta <= 1 + 1e-12], size=(trajectories, d))
+        paths = np.repeat(starts[:, None, :], d + 1, axis=1)
+        orders = np.array([rng.permutation(d) for _ in range(trajectories)]).reshape(trajectories, d)
+        for step in range(d):
+            moved = orders[:, step]
+            paths[np.arange(trajectories), step + 1:, moved] += delta
+        
+        base_action, y, evaluations = await self._evaluate_unit_points(
+            base_inputs, input_ranges, paths.reshape(-1, d), output
+        )
+        y = y.reshape(trajectories, d + 1)
+        
+        effects = np.empty((trajectories, d))
+        rows = np.arange(trajectories)
+        for step in range(d):
+            effects[rows, orders[:, step]] = (y[:, step + 1] - y[:, step]) / delta
+        
+        indices = [
+            GlobalSensitivityIndex(
+                factor_name=name,
+                mu_star=float(np.abs(effects[:, i]).mean()),
+                mu=float(effects[:, i].mean()),
+                sigma=float(effects[:, i].std(ddof=1)) if trajectories > 1 else 0.0,
+            )
+            for i, name in enumerate(names)
+        ]
+        indices.sort(key=lambda idx: idx.mu_star, reverse=True)
         
-        test_inputs[input_name] = min_val
-        min_action, _ = await self._call_decision(test_inputs)
+        return GlobalSensitivity(
+            method="morris",
+            output=output,
+            base_decision=base_action,
+            evaluations=evaluations,
+            indices=indices,
+        )
+    
+    async def sobol(
+        self,
+        base_inputs: dict,
+        input_ranges: dict[str, Tuple[float, float]],
+        samples: int = 256,
+        output: str = "utility",
+        max_evaluations: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> GlobalSensitivity:
+        """
+        Sobol first-order and total-order indices (Saltelli sampling).
         
-        test_inputs[input_name] = max_val
-        max_action, _ = await self._call_decision(test_inputs)
+        Costs samples * (factors + 2) evaluations plus one for the base
+        point; uses the Saltelli (2010)
+        first-order and Jansen total-order estimators. Factors are sampled
+        uniformly over input_ranges; others stay at their base values.
         
-        # If same action at both extremes and same as base, no boundary
-        if min_action == max_action == base_action:
-            return None
+        Args:
+            base_inputs: Current inputs (held for factors not varied)
+            input_ranges: Range to sample for each factor
+            samples: Base sample size N
+            output: "utility", or "action_flip" (1 if action differs from base)
+            max_evaluations: Cap on evaluations (base point included);
+                reduces samples to fit
+            seed: RNG seed for reproducible samples
+        
+        Raises:
+            ValueError: If max_evaluations is below two samples
+                (2 * (factors + 2) + 1)
+        """
+        names = list(input_ranges)
+        d = len(names)
+        if max_evaluations is not None:
+            fit = (max_evaluations - 1) // (d + 2)
+            if fit < 2:
+                raise ValueError(
+                    f"max_evaluations={max_evaluations} is below the smallest "
+                    f"Sobol design ({2 * (d + 2) + 1} evaluations)"
+                )
+            samples = min(samples, fit)
+        rng = np.random.default_rng(seed)
+        
+        a = rng.random((samples, d))
+        b = rng.random((samples, d))
+        ab = np.repeat(a[None, :, :], d, axis=0)  # (d, N, d)
+        for i in range(d):
+            ab[i, :, i] = b[:, i]
+        
+        points = np.concatenate([a, b, ab.reshape(-1, d)])
+        base_action, y, evaluations = await self._evaluate_unit_points(
+            base_inputs, input_ranges, points, output
+        )
+        # Centering leaves the estimators unbiased and cuts their variance
+        y = y - y[:2 * samples].mean()
+        f_a, f_b = y[:samples], y[samples:2 * samples]
+        f_ab = y[2 * samples:].reshape(d, samples)
+        
+        variance = np.concatenate([f_a, f_b]).var()
+        indices = []
+        for i, name in enumerate(names):
+            if variance > 0:
+                first = float(np.mean(f_b * (f_ab[i] - f_a)) / variance)
+                total = float(0.5 * np.mean((f_a - f_ab[i]) ** 2) / variance)
+            else:
+                first = total = 0.0
+            indices.append(GlobalSensitivityIndex(
+                factor_name=name,
+                first_order=first,
+                total_order=total,
+            ))
+        indices.sort(key=lambda idx: idx.total_order, reverse=True)
+        
+        return GlobalSensitivity(
+            method="sobol",
+            output=output,
+            base_decision=base_action,
+            evaluations=evaluations,
+            indices=indices,
+        )
+    
+    async def _evaluate_unit_points(
+        self,
+        base_inputs: dict,
+        input_ranges: dict[str, Tuple[float, float]],
+        unit_points: np.ndarray,
+        output: str,
+    ) -> tuple[str, np.ndarray, int]:
+        """Scale unit-cube points to input_ranges, evaluate, return the output column."""
+        if output not in ("utility", "action_flip"):
+            raise ValueError(f"Unknown output: {output}")
+        names = list(input_ranges)
+        low = np.array([input_ranges[n][0] for n in names], dtype=float)
+        span = np.array([input_ranges[n][1] for n in names], dtype=float) - low
+        scaled = low + unit_points * span
+        
+        batch = [base_inputs]
+        for row in scaled:
+            point = base_inputs.copy()
+            point.update(zip(names, row.tolist()))
+            batch.append(point)
+        
+        cache: dict = {}
+        outcomes = await self._evaluate_batch(batch, cache)
+        base_action = outcomes[0][0]
+        if output == "utility":
+            y = np.array([utility for _, utility in outcomes[1:]], dtype=float)
+        else:
+            y = np.array([action != base_action for action, _ in outcomes[1:]], dtype=float)
+        return base_action, y, len(cache)
+    
+    # ========================================================================
+    # EVALUATION
+    # ========================================================================
+    
+    async def _evaluate_batch(self, batch: list[dict], cache: dict) -> list[Tuple[str, float]]:
+        """
+        Evaluate a batch of input dicts in one pass.
         
-        # Determine search direction
-        if min_action != base_action:
-            # Boundary is between min and current
-            low, high = min_val, current
+        Points already in `cache` (or repeated within the batch) are only
+        evaluated once.
+        """
+        keys = [_cache_key(inputs) for inputs in batch]
+        pending: dict = {}
+        for key, inputs in zip(keys, batch):
+            if key is None or key in cache or key in pending:
+                continue
+            pending[key] = inputs
+        uncached = [i for i, key in enumerate(keys) if key is None]
+        
+        todo = list(pending.values()) + [batch[i] for i in uncached]
+        if todo:
+            outcomes = await self._evaluate_all(todo)
+            cache.update(zip(pending, outcomes))
+            direct = dict(zip(uncached, outcomes[len(pending):]))
         else:
-            # Boundary is between current and max
-            low, high = current, max_val
+            direct = {}
         
-        # Binary search
-        abs_tolerance = tolerance * abs(current if current != 0 else 1)
+        return [cache[key] if key is not None else direct[i] for i, key in enumerate(keys)]
+    
+    async def _evaluate_all(self, batch: list[dict]) -> list[Tuple[str, float]]:
+        if self._batch is not None:
+            outcomes = self._batch(batch)
+            if inspect.isawaitable(outcomes):
+                outcomes = await outcomes
+            return [(action, float(utility)) for action, utility in outcomes]
         
-        while high - low > abs_tolerance:
-            mid = (low + high) / 2
-            test_inputs[input_name] = mid
-            mid_action, _ = await self._call_decision(test_inputs)
+        if not self._is_async:
+            return [self._decide(inputs) for inputs in batch]
+        
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        
+        async def one(inputs: dict) -> Tuple[str, float]:
+            async with semaphore:
+                return await self._decide(inputs)
+        
+        return list(await asyncio.gather(*(one(inputs) for inputs in batch)))
+    
+    async def _find_boundaries(
+        self,
+        base_inputs: dict,
+        names: list[str],
+        input_ranges: dict[str, Tuple[float, float]],
+        base_action: str,
+        extreme_actions: dict[str, Tuple[str, str]],
+        cache: dict,
+        tolerance: float = 0.01,
+    ) -> dict[str, Optional[float]]:
+        """
+        Search decision boundaries for all inputs at once.
+        
+        Each round probes grid_points interior points of every open bracket
+        in a single batch and keeps the sub-interval where the decision
+        flips, so the number of sequential rounds is
+        log_{grid_points+1}(range / tolerance), shared by all inputs.
+        
+        Returns {input: boundary value, or None if no boundary in range}.
+        """
+        found: dict[str, Optional[float]] = {}
+        brackets: dict[str, list[float]] = {}  # name -> [low, high, abs_tolerance]
+        flip_low: dict[str, bool] = {}
+        
+        for name in names:
+            min_val, max_val = input_ranges[name]
+            min_action, max_action = extreme_actions[name]
+            current = base_inputs[name]
             
-            if mid_action == base_action:
-                if min_action != base_action:
-                    high = mid
-                else:
-                    low = mid
-            else:
-                if min_action != base_action:
-                    low = mid
+            # If same action at both extremes and same as base, no boundary
+            if min_action == max_action == base_action:
+                found[name] = None
+                continue
+            
+            # Boundary is between min and current, or between current and max
+            flip_low[name] = min_action != base_action
+            low, high = (min_val, current) if flip_low[name] else (current, max_val)
+            brackets[name] = [low, high, tolerance * abs(current if current != 0 else 1)]
+        
+        k = self._grid_points
+        while True:
+            active = [name for name, (low, high, tol) in brackets.items() if high - low > tol]
+            if not active:
+                break
+            
+            probes = {
+                name: [
+                    brackets[name][0] + (brackets[name][1] - brackets[name][0]) * j / (k + 1)
+                    for j in range(1, k + 1)
+                ]
+                for name in active
+            }
+            batch = [
+                _with(base_inputs, name, value)
+                for name in active
+                for value in probes[name]
+            ]
+            outcomes = iter(await self._evaluate_batch(batch, cache))
+            
+            for name in active:
+                points = probes[name]
+                same = [next(outcomes)[0] == base_action for _ in points]
+                low, high, tol = brackets[name]
+                edges = [low] + points + [high]
+                if flip_low[name]:
+                    # Flipped below, base above: keep the last flipped point
+                    j = max((i for i, s in enumerate(same) if not s), default=-1)
+                    brackets[name] = [edges[j + 1], edges[j + 2], tol]
                 else:
-                    high = mid
+                    # Base below, flipped above: keep the first flipped point
+                    j = next((i for i, s in enumerate(same) if not s), k)
+                    brackets[name] = [edges[j], edges[j + 1], tol]
         
-        return (low + high) / 2
+        for name, (low, high, _) in brackets.items():
+            found[name] = (low + high) / 2
+        return found
     
     def _calculate_robustness(self, factors: list[SensitivityFactor]) -> float:
         """Calculate overall robustness score."""
@@ -463,6 +803,22 @@ class SensitivityAnalyzer:
             )
 
 
+def _with(inputs: dict, name: str, value: float) -> dict:
+    changed = inputs.copy()
+    changed[name] = value
+    return changed
+
+
+def _cache_key(inputs: dict) -> Optional[tuple]:
+    """Hashable key for memoizing an input dict (None if unhashable)."""
+    try:
+        key = tuple(sorted(inputs.items()))
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
 # ============================================================================
 # FACTORY
 # ============================================================================
@@ -471,6 +827,8 @@ class SensitivityAnalyzer:
 def create_sensitivity_analyzer(
     decision_function: Callable[[dict], Tuple[str, float]],
     is_async: bool = True,
+    batch_function: Optional[Callable[[list[dict]], list[Tuple[str, float]]]] = None,
+    max_concurrency: int = 32,
 ) -> SensitivityAnalyzer:
     """
     Factory function to create SensitivityAnalyzer.
@@ -478,6 +836,8 @@ def create_sensitivity_analyzer(
     Args:
         decision_function: Function that takes inputs and returns (action, utility)
         is_async: Whether the decision function is async
+        batch_function: Optional vectorized decision function over a list of inputs
+        max_concurrency: Max concurrent decision_function calls per batch
         
     Returns:
         Configured SensitivityAnalyzer
@@ -485,4 +845,6 @@ def create_sensitivity_analyzer(
     return SensitivityAnalyzer(
         decision_function=decision_function,
         is_async=is_async,
+        batch_function=batch_function,
+        max_concurrency=max_concurrency,
     )
@@ -5,6 +5,7 @@ Generate and retrieve RISKCAST decisions.
 UPDATED: Now includes authentication, pagination, and multi-tenancy.
 """
 
+from dataclasses import asdict
 from typing import Optional, Annotated
 from datetime import datetime
 
@@ -117,6 +118,10 @@ class PaginationMeta(BaseModel):
     limit: int = Field(description="Items per page")
     offset: int = Field(description="Current offset")
     has_more: bool = Field(description="Whether there are more items")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page (keyset pagination)",
+    )
 
 
 class DecisionListResponse(BaseModel):
@@ -455,6 +460,10 @@ async def list_active_decisions(
     severity: Optional[Severity] = Query(default=None, description="Filter by severity"),
     limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
     offset: int = Query(default=0, ge=0, description="Number of items to skip"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from pagination.next_cursor (takes precedence over offset)",
+    ),
 ) -> DecisionListResponse:
     """
     List all active decisions.
@@ -462,33 +471,39 @@ async def list_active_decisions(
     Requires: decisions:read scope
 
     Non-admin users only see their own decisions.
+
+    Filtering, ordering and pagination run in the database and only the
+    summary columns are loaded. For deep pages, follow next_cursor
+    instead of increasing offset.
     """
     riskcast = create_async_riskcast_service(session, use_cache=True)
 
     # Non-admin users can only see their own decisions
     customer_id = None if auth.is_admin else auth.customer_id
 
-    decisions, total = await riskcast.get_active_decisions(
-        customer_id=customer_id,
-        limit=limit,
-        offset=offset,
-    )
-
-    # Apply additional filters (in-memory for now, should be in DB query)
-    if chokepoint:
-        decisions = [d for d in decisions if d.chokepoint == chokepoint.lower()]
-        total = len(decisions)
-    if severity:
-        decisions = [d for d in decisions if d.severity == severity]
-        total = len(decisions)
+    try:
+        page = await riskcast.list_decision_summaries(
+            customer_id=customer_id,
+            chokepoint=chokepoint,
+            severity=severity.value if severity else None,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return DecisionListResponse(
-        items=[decision_to_summary(d) for d in decisions],
+        items=[DecisionSummaryResponse(**asdict(row)) for row in page.items],
         pagination=PaginationMeta(
-            total=total,
+            total=page.total,
             limit=limit,
-            offset=offset,
-            has_more=(offset + limit) < total,
+            offset=0 if cursor else offset,
+            has_more=page.next_cursor is not None,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -29,6 +29,8 @@ from app.backtest.schemas import (
 )
 from app.backtest.framework import (
     BacktestFramework,
+    BacktestRunStats,
+    ShardStats,
     create_backtest_framework,
 )
 
@@ -41,5 +43,7 @@ __all__ = [
     "AccuracyByCategory",
     # Framework
     "BacktestFramework",
+    "BacktestRunStats",
+    "ShardStats",
     "create_backtest_framework",
 ]
@@ -26,9 +26,15 @@ Pipeline:
     5. Aggregate → BacktestSummary with calibration
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, Any
 from collections import defaultdict
+import asyncio
+import multiprocessing
+import random
+import time
 import uuid
 import math
 
@@ -67,6 +73,60 @@ from app.riskcast.schemas.decision import DecisionObject
 
 logger = structlog.get_logger(__name__)
 
+# Rate index 1.0 in BacktestEvent.market_conditions maps to this rate
+BASELINE_RATE_PER_TEU = 2000.0
+
+
+# =============================================================================
+# RUN STATISTICS
+# =============================================================================
+
+
+@dataclass
+class ShardStats:
+    """Counters for one shard of event-customer pairs."""
+    
+    shard: int
+    pairs: int
+    results: int
+    failures: int
+    elapsed_seconds: float
+
+
+@dataclass
+class BacktestRunStats:
+    """
+    Throughput of one BacktestFramework.run call.
+    
+    Serial runs report a single shard. busy_seconds is the summed shard
+    time, so busy_seconds / elapsed_seconds is the parallelism achieved.
+    """
+    
+    workers: int
+    pairs: int
+    elapsed_seconds: float
+    shards: list[ShardStats] = field(default_factory=list)
+    
+    @property
+    def results(self) -> int:
+        return sum(s.results for s in self.shards)
+    
+    @property
+    def failures(self) -> int:
+        return sum(s.failures for s in self.shards)
+    
+    @property
+    def busy_seconds(self) -> float:
+        return sum(s.elapsed_seconds for s in self.shards)
+    
+    @property
+    def pairs_per_second(self) -> float:
+        return self.pairs / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+    
+    def speedup_over(self, serial: "BacktestRunStats") -> float:
+        """Wall-clock speedup relative to a serial run of the same pairs."""
+        return serial.elapsed_seconds / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
 
 # =============================================================================
 # BACKTEST FRAMEWORK
@@ -105,6 +165,9 @@ class BacktestFramework:
         
         # For tracking calibration
         self._predictions_by_bucket: dict[int, list[tuple[float, bool]]] = defaultdict(list)
+        
+        # Throughput of the most recent run()
+        self.last_run_stats: Optional[BacktestRunStats] = None
     
     # =========================================================================
     # MAIN ENTRY POINT
@@ -115,14 +178,28 @@ class BacktestFramework:
         events: list[BacktestEvent],
         customer_contexts: list[CustomerContext],
         filters: Optional[dict[str, Any]] = None,
+        workers: int = 1,
+        shards: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> BacktestSummary:
         """
         Run backtest against historical events.
         
+        With workers > 1 the event × customer pairs are split into
+        contiguous shards and run in a process pool. Results are merged
+        back in serial order, so the summary matches a serial run. The
+        framework (including a custom composer), events and contexts are
+        pickled once per worker process.
+        
         Args:
             events: List of historical events with known outcomes
             customer_contexts: Customer contexts to test against
             filters: Optional filters (chokepoint, category, date_range, etc.)
+            workers: Worker processes (1 = run serially in this process)
+            shards: Number of shards (default: 4 per worker, for load balance)
+            seed: If set, `random` is reseeded per pair from (seed, pair index),
+                so a stochastic composer gives the same results however
+                the pairs are sharded
         
         Returns:
             BacktestSummary with accuracy, calibration, and value metrics
@@ -134,32 +211,42 @@ class BacktestFramework:
             logger.warning("backtest_no_events", filters=filters)
             return self._empty_summary(filters or {})
         
+        total_pairs = len(filtered_events) * len(customer_contexts)
         logger.info(
             "backtest_starting",
             total_events=len(filtered_events),
             customers=len(customer_contexts),
             filters=filters,
+            workers=workers,
         )
         
-        # Reset calibration tracking
-        self._predictions_by_bucket = defaultdict(list)
-        
         # Run backtest for each event-customer combination
-        results: list[BacktestResult] = []
-        
-        for event in filtered_events:
-            for context in customer_contexts:
-                try:
-                    result = await self._test_single_event(event, context)
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    logger.error(
-                        "backtest_event_failed",
-                        event_id=event.event_id,
-                        customer_id=context.profile.customer_id,
-                        error=str(e),
-                    )
+        started = time.perf_counter()
+        if workers > 1 and total_pairs > 1:
+            indexed, shard_stats = await self._run_sharded(
+                filtered_events, customer_contexts, workers, shards, seed
+            )
+        else:
+            indexed, stats = await self._run_pairs(
+                filtered_events, customer_contexts, 0, total_pairs, seed
+            )
+            shard_stats = [stats]
+        
+        # Shards may finish in any order; pair index restores serial order
+        indexed.sort(key=lambda item: item[0])
+        results = [result for _, result in indexed]
+        
+        self.last_run_stats = BacktestRunStats(
+            workers=max(1, workers),
+            pairs=total_pairs,
+            elapsed_seconds=time.perf_counter() - started,
+            shards=shard_stats,
+        )
+        
+        # Rebuild calibration tracking from the merged results
+        self._predictions_by_bucket = defaultdict(list)
+        for result in results:
+            self._track_calibration(result)
         
         # Calculate summary
         summary = self._calculate_summary(
@@ -174,10 +261,94 @@ class BacktestFramework:
             accuracy=summary.accuracy,
             value_captured=summary.total_value_captured_usd,
             grade=summary.grade,
+            pairs_per_second=round(self.last_run_stats.pairs_per_second, 1),
         )
         
         return summary
     
+    # =========================================================================
+    # SHARDED EXECUTION
+    # =========================================================================
+    
+    async def _run_pairs(
+        self,
+        events: list[BacktestEvent],
+        customer_contexts: list[CustomerContext],
+        start: int,
+        stop: int,
+        seed: Optional[int] = None,
+        shard: int = 0,
+    ) -> tuple[list[tuple[int, BacktestResult]], ShardStats]:
+        """
+        Test pairs [start, stop) of the event-major event × customer grid.
+        
+        Returns (pair index, result) tuples plus the shard's counters.
+        """
+        began = time.perf_counter()
+        indexed: list[tuple[int, BacktestResult]] = []
+        failures = 0
+        n_contexts = len(customer_contexts)
+        
+        for index in range(start, stop):
+            event = events[index // n_contexts]
+            context = customer_contexts[index % n_contexts]
+            if seed is not None:
+                random.seed(f"{seed}:{index}")
+            try:
+                result = await self._test_single_event(event, context)
+                if result:
+                    indexed.append((index, result))
+            except Exception as e:
+                failures += 1
+                logger.error(
+                    "backtest_event_failed",
+                    event_id=event.event_id,
+                    customer_id=context.profile.customer_id,
+                    error=str(e),
+                )
+        
+        return indexed, ShardStats(
+            shard=shard,
+            pairs=stop - start,
+            results=len(indexed),
+            failures=failures,
+            elapsed_seconds=time.perf_counter() - began,
+        )
+    
+    async def _run_sharded(
+        self,
+        events: list[BacktestEvent],
+        customer_contexts: list[CustomerContext],
+        workers: int,
+        shards: Optional[int],
+        seed: Optional[int],
+    ) -> tuple[list[tuple[int, BacktestResult]], list[ShardStats]]:
+        """Fan contiguous pair ranges out to a process pool and merge them."""
+        total_pairs = len(events) * len(customer_contexts)
+        ranges = _shard_ranges(total_pairs, shards or workers * 4)
+        
+        # spawn: forked children would inherit the running event loop
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_shard_worker,
+            initargs=(self, events, customer_contexts),
+        )
+        try:
+            outputs = await asyncio.gather(*(
+                asyncio.wrap_future(pool.submit(_run_shard, i, start, stop, seed))
+                for i, (start, stop) in enumerate(ranges)
+            ))
+        finally:
+            pool.shutdown(wait=True)
+        
+        indexed: list[tuple[int, BacktestResult]] = []
+        shard_stats: list[ShardStats] = []
+        for shard_results, stats in outputs:
+            indexed.extend(shard_results)
+            shard_stats.append(stats)
+        return indexed, shard_stats
+    
     # =========================================================================
     # SINGLE EVENT TESTING
     # =========================================================================
@@ -211,20 +382,15 @@ class BacktestFramework:
             return None
         
         # Step 4: Compare decision to actual outcome
-        result = self._evaluate_decision(event, decision, context)
-        
-        # Track for calibration
-        bucket_idx = int(decision.q6_confidence.score * self._num_buckets)
+        return self._evaluate_decision(event, decision, context)
+    
+    def _track_calibration(self, result: BacktestResult) -> None:
+        """Record a result's confidence and outcome in its calibration bucket."""
+        bucket_idx = int(result.decision_confidence * self._num_buckets)
         bucket_idx = min(bucket_idx, self._num_buckets - 1)
-        actual_occurred = event.outcome in [
-            EventOutcome.MATERIALIZED,
-            EventOutcome.PARTIALLY_MATERIALIZED,
-        ]
         self._predictions_by_bucket[bucket_idx].append(
-            (decision.q6_confidence.score, actual_occurred)
+            (result.decision_confidence, result.prediction_accuracy.actual_occurred)
         )
-        
-        return result
     
     # =========================================================================
     # SIGNAL SIMULATION
@@ -311,21 +477,30 @@ class BacktestFramework:
             status = CorrelationStatus.PREDICTED_NOT_OBSERVED
         
         # Build reality snapshot
+        disrupted = event.outcome != EventOutcome.DID_NOT_MATERIALIZE
+        vessels = event.actual_impact.vessels_affected
+        delay_hours = event.actual_impact.actual_delay_days * 24
         chokepoint_health = ChokepointHealth(
-            chokepoint=signal.geographic.primary_chokepoint.value,
-            health_score=0.5 if event.outcome != EventOutcome.DID_NOT_MATERIALIZE else 0.8,
-            congestion_level=0.6 if event.outcome != EventOutcome.DID_NOT_MATERIALIZE else 0.2,
-            rate_index=event.market_conditions.get("rate_index", 1.0),
-            vessels_affected=event.actual_impact.vessels_affected,
-            avg_delay_hours=event.actual_impact.actual_delay_days * 24,
+            chokepoint=signal.geographic.primary_chokepoint,
+            timestamp=event.event_date,
+            vessels_in_transit=vessels,
+            vessels_waiting=vessels // 2 if disrupted else 0,
+            rerouting_count=vessels if disrupted else 0,
+            current_rate_per_teu=BASELINE_RATE_PER_TEU * event.market_conditions.get("rate_index", 1.0),
+            baseline_rate_per_teu=BASELINE_RATE_PER_TEU,
+            average_delay_hours=delay_hours,
+            max_delay_hours=delay_hours,
+            disruption_level="severe" if disrupted else "normal",
         )
         
         reality = RealitySnapshot(
-            timestamp=event.event_date,
+            snapshot_id=f"ORACLE-BT-{event.event_id}",
+            generated_at=event.event_date,
             chokepoint_health={signal.geographic.primary_chokepoint.value: chokepoint_health},
         )
         
         return CorrelatedIntelligence(
+            correlation_id=f"CORR-BT-{event.event_id}",
             signal=signal,
             reality=reality,
             correlation_status=status,
@@ -424,8 +599,11 @@ class BacktestFramework:
             event, decision, prediction_accuracy, value_analysis
         )
         
+        # Derived from the pair (not random) so serial and sharded runs agree
+        pair_key = uuid.uuid5(uuid.NAMESPACE_OID, f"{event.event_id}:{context.profile.customer_id}")
+        
         return BacktestResult(
-            result_id=f"bt_{uuid.uuid4().hex[:8]}",
+            result_id=f"bt_{pair_key.hex[:8]}",
             event_id=event.event_id,
             decision_id=decision.decision_id,
             recommended_action=decision.q5_action.action_type,
@@ -827,6 +1005,49 @@ class BacktestFramework:
         )
 
 
+# =============================================================================
+# SHARD WORKERS
+# =============================================================================
+
+
+# Set once per worker process by _init_shard_worker
+_shard_state: Optional[tuple[BacktestFramework, list[BacktestEvent], list[CustomerContext]]] = None
+
+
+def _shard_ranges(total: int, shards: int) -> list[tuple[int, int]]:
+    """Split [0, total) into at most `shards` contiguous, near-equal ranges."""
+    shards = max(1, min(shards, total))
+    size, extra = divmod(total, shards)
+    ranges = []
+    start = 0
+    for i in range(shards):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _init_shard_worker(
+    framework: BacktestFramework,
+    events: list[BacktestEvent],
+    customer_contexts: list[CustomerContext],
+) -> None:
+    global _shard_state
+    _shard_state = (framework, events, customer_contexts)
+
+
+def _run_shard(
+    shard: int,
+    start: int,
+    stop: int,
+    seed: Optional[int],
+) -> tuple[list[tuple[int, BacktestResult]], ShardStats]:
+    framework, events, customer_contexts = _shard_state
+    return asyncio.run(
+        framework._run_pairs(events, customer_contexts, start, stop, seed, shard)
+    )
+
+
 # =============================================================================
 # HISTORICAL EVENT LOADER
 # =============================================================================
@@ -153,6 +153,20 @@ OMEN_API_DURATION = Histogram(
     buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
 )
 
+# OMEN signal validation (ValidationPipeline)
+OMEN_VALIDATION_STAGE_DURATION = Histogram(
+    "riskcast_omen_validation_stage_seconds",
+    "Per-signal OMEN validation time by stage (amortized over a batch)",
+    ["stage"],
+    buckets=[0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05],
+)
+
+OMEN_VALIDATION_BATCH_SIZE = Histogram(
+    "riskcast_omen_validation_batch_size",
+    "Signals per ValidationPipeline batch",
+    buckets=[1, 5, 10, 50, 100, 500, 1000, 5000],
+)
+
 # ORACLE data sources
 ORACLE_AIS_REQUESTS = Counter(
     "riskcast_oracle_ais_requests_total",
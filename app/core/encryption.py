@@ -13,8 +13,10 @@ import hashlib
 import hmac
 import os
 import secrets
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Sequence, Union
 from datetime import datetime
 import json
 
@@ -23,6 +25,9 @@ from pydantic import BaseModel
 
 logger = structlog.get_logger(__name__)
 
+# Max cached derived keys per FieldEncryptor (one per context)
+DERIVED_KEY_CACHE_SIZE = 256
+
 
 # ============================================================================
 # ENCRYPTION PRIMITIVES
@@ -96,6 +101,10 @@ class FieldEncryptor:
         
         self._master_key = master_key
         self._key_version = 1
+        # context -> derived key. PBKDF2 at 100k iterations costs tens of
+        # ms; the set of contexts is small and fixed.
+        self._key_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._key_cache_lock = threading.Lock()
     
     @classmethod
     def from_key_string(cls, key_string: str) -> "FieldEncryptor":
@@ -110,14 +119,51 @@ class FieldEncryptor:
         return base64.b64encode(key).decode()
     
     def _derive_key(self, context: str) -> bytes:
-        """Derive a context-specific key from master key."""
-        return hashlib.pbkdf2_hmac(
+        """
+        Derive a context-specific key from master key.
+        
+        The key depends only on the master key and context (the version
+        tag on EncryptedValue does not select a key). Derived keys are
+        cached per context in a bounded LRU, so only the first use of a
+        context pays for PBKDF2.
+        """
+        with self._key_cache_lock:
+            key = self._key_cache.get(context)
+            if key is not None:
+                self._key_cache.move_to_end(context)
+                return key
+        
+        key = hashlib.pbkdf2_hmac(
             "sha256",
             self._master_key,
             context.encode(),
             iterations=100000,
             dklen=32,
         )
+        
+        with self._key_cache_lock:
+            self._key_cache[context] = key
+            while len(self._key_cache) > DERIVED_KEY_CACHE_SIZE:
+                self._key_cache.popitem(last=False)
+        return key
+    
+    def clear_key_cache(self) -> None:
+        """Drop all cached derived keys (call after changing key material)."""
+        with self._key_cache_lock:
+            self._key_cache.clear()
+    
+    @staticmethod
+    def _aesgcm_class():
+        """AESGCM, or fail fast when cryptography is missing."""
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError as e:
+            # CRITICAL: Fail fast instead of using insecure fallback
+            raise EncryptionError(
+                "cryptography library is required for encryption. "
+                "Install with: pip install cryptography"
+            ) from e
+        return AESGCM
     
     def encrypt(
         self,
@@ -149,13 +195,14 @@ class FieldEncryptor:
                 "Install with: pip install cryptography"
             ) from e
         
+        aesgcm = AESGCM(self._derive_key(context))
+        return self._encrypt_one(aesgcm, plaintext)
+    
+    def _encrypt_one(self, aesgcm: Any, plaintext: Union[str, bytes]) -> EncryptedValue:
         if isinstance(plaintext, str):
             plaintext = plaintext.encode("utf-8")
         
-        key = self._derive_key(context)
         nonce = secrets.token_bytes(12)
-        
-        aesgcm = AESGCM(key)
         ciphertext = aesgcm.encrypt(nonce, plaintext, None)
         
         # AES-GCM appends tag to ciphertext
@@ -199,9 +246,11 @@ class FieldEncryptor:
                 "Install with: pip install cryptography"
             ) from e
         
-        key = self._derive_key(context)
-        aesgcm = AESGCM(key)
-        
+        aesgcm = AESGCM(self._derive_key(context))
+        return self._decrypt_one(aesgcm, encrypted)
+    
+    @staticmethod
+    def _decrypt_one(aesgcm: Any, encrypted: EncryptedValue) -> bytes:
         # Reconstruct ciphertext with tag
         ciphertext_with_tag = encrypted.ciphertext + encrypted.tag
         
@@ -211,6 +260,38 @@ class FieldEncryptor:
         except Exception as e:
             raise DecryptionError(f"Decryption failed: {e}")
     
+    def encrypt_many(
+        self,
+        plaintexts: Sequence[Union[str, bytes]],
+        context: str = "default",
+    ) -> List[EncryptedValue]:
+        """
+        Encrypt a batch of values under one context.
+        
+        Derives the key and builds the cipher once for the whole batch;
+        every value still gets its own random nonce.
+        """
+        AESGCM = self._aesgcm_class()
+        aesgcm = AESGCM(self._derive_key(context))
+        return [self._encrypt_one(aesgcm, p) for p in plaintexts]
+    
+    def decrypt_many(
+        self,
+        encrypted: Sequence[EncryptedValue],
+        context: str = "default",
+    ) -> List[bytes]:
+        """
+        Decrypt a batch of values under one context.
+        
+        Derives the key and builds the cipher once for the whole batch.
+        
+        Raises:
+            DecryptionError: If any value fails to decrypt
+        """
+        AESGCM = self._aesgcm_class()
+        aesgcm = AESGCM(self._derive_key(context))
+        return [self._decrypt_one(aesgcm, value) for value in encrypted]
+    
     def encrypt_string(self, plaintext: str, context: str = "default") -> str:
         """Encrypt string and return base64-encoded result."""
         encrypted = self.encrypt(plaintext, context)
@@ -222,6 +303,15 @@ class FieldEncryptor:
         plaintext = self.decrypt(encrypted, context)
         return plaintext.decode("utf-8")
     
+    def encrypt_strings(self, plaintexts: Sequence[str], context: str = "default") -> List[str]:
+        """Bulk variant of encrypt_string."""
+        return [v.to_string() for v in self.encrypt_many(plaintexts, context)]
+    
+    def decrypt_strings(self, encrypted_strings: Sequence[str], context: str = "default") -> List[str]:
+        """Bulk variant of decrypt_string."""
+        values = [EncryptedValue.from_string(e) for e in encrypted_strings]
+        return [p.decode("utf-8") for p in self.decrypt_many(values, context)]
+    
     # SECURITY: Insecure fallback methods have been REMOVED.
     # The system will fail fast if cryptography library is not available.
     # This is intentional - weak encryption is worse than no encryption.
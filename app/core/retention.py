@@ -11,8 +11,9 @@ P1 COMPLIANCE: Implements automated retention cleanup job.
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
@@ -241,6 +242,44 @@ class LegalHoldManager:
                     holds.append(self._holds[hold_id])
         
         return [h for h in holds if h.is_active]
+    
+    def active_entities(self, entity_type: str) -> List[Tuple[str, str]]:
+        """(hold_id, entity_id) pairs of active holds on an entity type."""
+        return [
+            (hold.hold_id, entity_id)
+            for hold in self._holds.values()
+            if hold.is_active and hold.entity_type == entity_type
+            for entity_id in dict.fromkeys(hold.entity_ids)
+        ]
+
+
+# ============================================================================
+# RETENTION SWEEP
+# ============================================================================
+
+
+# Receives (data_type, rows) for each batch before it is deleted
+ArchiveSink = Callable[[str, List[Dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class SweepTarget:
+    """Table swept by RetentionManager."""
+    
+    model_name: str  # Model class in app.db.models (integer "id" primary key)
+    timestamp_column: str
+    hold_column: Optional[str] = None  # Matched against legal_hold_entities
+    
+    def resolve(self):
+        from app.db import models
+        return getattr(models, self.model_name)
+
+
+SWEEP_TARGETS: Dict[str, SweepTarget] = {
+    "decisions": SweepTarget("DecisionModel", "created_at", hold_column="decision_id"),
+    "outcomes": SweepTarget("DecisionOutcomeModel", "outcome_recorded_at", hold_column="outcome_id"),
+    "alerts": SweepTarget("AlertModel", "created_at"),
+}
 
 
 # ============================================================================
@@ -263,9 +302,24 @@ class RetentionManager:
         self,
         session_factory=None,
         legal_hold_manager: Optional[LegalHoldManager] = None,
+        batch_size: int = 1000,
+        max_batches: Optional[int] = None,
+        archiver: Optional[ArchiveSink] = None,
     ):
+        """
+        Args:
+            session_factory: Async session factory
+            legal_hold_manager: Source of legal holds
+            batch_size: Rows deleted per transaction
+            max_batches: Batches per data type per run; an unfinished
+                sweep resumes from its checkpoint on the next run
+            archiver: Called with each batch before it is deleted
+        """
         self._session_factory = session_factory
         self._legal_holds = legal_hold_manager or LegalHoldManager()
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._archiver = archiver
         self._last_cleanup: Optional[datetime] = None
     
     async def run_cleanup(
@@ -409,41 +463,7 @@ class RetentionManager:
     ) -> Dict[str, Any]:
         """Process decisions retention."""
         try:
-            from sqlalchemy import select, func, delete, and_
-            from app.db.models import DecisionModel
-            
-            async with self._session_factory() as session:
-                now = datetime.utcnow()
-                delete_cutoff = now - timedelta(days=policy.total_retention_days)
-                
-                # Find decisions eligible for deletion
-                query = select(DecisionModel.decision_id).where(
-                    DecisionModel.created_at < delete_cutoff
-                )
-                to_delete = await session.execute(query)
-                decision_ids = [row[0] for row in to_delete.fetchall()]
-                
-                # Filter out those under legal hold
-                deletable = []
-                held_count = 0
-                
-                for decision_id in decision_ids:
-                    if self._legal_holds.is_under_hold("decisions", decision_id):
-                        held_count += 1
-                    else:
-                        deletable.append(decision_id)
-                
-                result["to_delete"] = len(deletable)
-                result["held"] = held_count
-                
-                if not dry_run and deletable:
-                    delete_stmt = delete(DecisionModel).where(
-                        DecisionModel.decision_id.in_(deletable)
-                    )
-                    await session.execute(delete_stmt)
-                    await session.commit()
-                    result["deleted"] = len(deletable)
-                
+            result = await self._sweep("decisions", policy, result, dry_run)
         except Exception as e:
             logger.error("decision_retention_failed", error=str(e))
         
@@ -457,29 +477,7 @@ class RetentionManager:
     ) -> Dict[str, Any]:
         """Process outcomes retention."""
         try:
-            from sqlalchemy import select, func, delete, and_
-            from app.db.models import DecisionOutcomeModel
-            
-            async with self._session_factory() as session:
-                now = datetime.utcnow()
-                delete_cutoff = now - timedelta(days=policy.total_retention_days)
-                
-                # Count outcomes to delete
-                count_result = await session.execute(
-                    select(func.count(DecisionOutcomeModel.id)).where(
-                        DecisionOutcomeModel.outcome_recorded_at < delete_cutoff
-                    )
-                )
-                result["to_delete"] = count_result.scalar() or 0
-                
-                if not dry_run and result["to_delete"] > 0:
-                    delete_stmt = delete(DecisionOutcomeModel).where(
-                        DecisionOutcomeModel.outcome_recorded_at < delete_cutoff
-                    )
-                    await session.execute(delete_stmt)
-                    await session.commit()
-                    result["deleted"] = result["to_delete"]
-                
+            result = await self._sweep("outcomes", policy, result, dry_run)
         except Exception as e:
             logger.error("outcome_retention_failed", error=str(e))
         
@@ -493,34 +491,163 @@ class RetentionManager:
     ) -> Dict[str, Any]:
         """Process alerts retention."""
         try:
-            from sqlalchemy import select, func, delete
-            from app.db.models import AlertModel
+            result = await self._sweep("alerts", policy, result, dry_run)
+        except Exception as e:
+            logger.error("alert_retention_failed", error=str(e))
+        
+        return result
+    
+    async def _sweep(
+        self,
+        data_type: str,
+        policy: RetentionPolicy,
+        result: Dict[str, Any],
+        dry_run: bool,
+    ) -> Dict[str, Any]:
+        """
+        Delete expired rows of one data type in bounded batches.
+        
+        Rows under legal hold are excluded in SQL (NOT EXISTS against
+        legal_hold_entities). Batches walk the integer primary key and
+        each one commits together with its checkpoint, so no transaction
+        holds more than batch_size rows and an interrupted sweep picks
+        up where it stopped.
+        """
+        from sqlalchemy import select, func, delete, exists, or_
+        from app.db.models import LegalHoldEntityModel, RetentionCheckpointModel
+        
+        target = SWEEP_TARGETS[data_type]
+        table = target.resolve().__table__
+        pk = table.c.id
+        
+        async with self._session_factory() as session:
+            checkpoint = await session.get(RetentionCheckpointModel, data_type)
+            if checkpoint is not None:
+                cutoff, last_id = checkpoint.cutoff, checkpoint.last_id
+                result["resumed_from"] = last_id
+            else:
+                cutoff = datetime.utcnow() - timedelta(days=policy.total_retention_days)
+                last_id = 0
+            result["delete_cutoff"] = cutoff.isoformat()
             
-            async with self._session_factory() as session:
-                now = datetime.utcnow()
-                delete_cutoff = now - timedelta(days=policy.total_retention_days)
+            expired = table.c[target.timestamp_column] < cutoff
+            if target.hold_column is not None:
+                await self._sync_legal_holds(session, data_type)
+                holds = LegalHoldEntityModel.__table__
+                held = exists().where(
+                    holds.c.entity_type == data_type,
+                    or_(
+                        holds.c.entity_id == table.c[target.hold_column],
+                        holds.c.entity_id == "*",
+                    ),
+                )
+                eligible = [expired, ~held]
+                result["held"] = (await session.execute(
+                    select(func.count()).select_from(table).where(expired, held)
+                )).scalar() or 0
+            else:
+                eligible = [expired]
+            
+            result["to_delete"] = (await session.execute(
+                select(func.count()).select_from(table).where(pk > last_id, *eligible)
+            )).scalar() or 0
+            if dry_run or result["to_delete"] == 0:
+                if checkpoint is not None and not dry_run:
+                    await session.delete(checkpoint)
+                    await session.commit()
+                return result
+            
+            if checkpoint is None:
+                checkpoint = RetentionCheckpointModel(
+                    data_type=data_type, cutoff=cutoff, last_id=0, rows_processed=0,
+                )
+                session.add(checkpoint)
+            
+            started = time.perf_counter()
+            batches = deleted = archived = 0
+            complete = False
+            while True:
+                if self._max_batches is not None and batches >= self._max_batches:
+                    break
                 
-                # Count alerts to delete
-                count_result = await session.execute(
-                    select(func.count(AlertModel.id)).where(
-                        AlertModel.created_at < delete_cutoff
-                    )
+                window = (
+                    select(pk).where(pk > last_id, *eligible)
+                    .order_by(pk).limit(self._batch_size)
                 )
-                result["to_delete"] = count_result.scalar() or 0
+                if self._archiver is not None:
+                    rows = (await session.execute(
+                        select(table).where(pk.in_(window)).order_by(pk)
+                    )).mappings().all()
+                    upper = rows[-1]["id"] if rows else None
+                    if rows:
+                        await self._archiver(data_type, [dict(r) for r in rows])
+                        archived += len(rows)
+                else:
+                    upper = (await session.execute(
+                        select(func.max(window.subquery().c.id))
+                    )).scalar()
                 
-                if not dry_run and result["to_delete"] > 0:
-                    delete_stmt = delete(AlertModel).where(
-                        AlertModel.created_at < delete_cutoff
-                    )
-                    await session.execute(delete_stmt)
-                    await session.commit()
-                    result["deleted"] = result["to_delete"]
+                if upper is None:
+                    complete = True
+                    break
                 
-        except Exception as e:
-            logger.error("alert_retention_failed", error=str(e))
+                # Same predicates as the window, bounded by its last id:
+                # deletes exactly that batch without an IN list
+                outcome = await session.execute(
+                    delete(table).where(pk > last_id, pk <= upper, *eligible)
+                )
+                deleted += outcome.rowcount or 0
+                last_id = upper
+                batches += 1
+                
+                checkpoint.last_id = last_id
+                checkpoint.rows_processed += outcome.rowcount or 0
+                checkpoint.updated_at = datetime.utcnow()
+                await session.commit()
+                await asyncio.sleep(0)
+            
+            if complete:
+                await session.delete(checkpoint)
+                await session.commit()
+            
+            elapsed = time.perf_counter() - started
+            result.update(
+                deleted=deleted,
+                archived=archived,
+                batches=batches,
+                complete=complete,
+                duration_seconds=round(elapsed, 3),
+                rows_per_second=round(deleted / elapsed, 1) if elapsed > 0 else 0.0,
+            )
         
+        logger.info(
+            "retention_sweep_completed" if complete else "retention_sweep_paused",
+            data_type=data_type,
+            deleted=deleted,
+            batches=batches,
+            last_id=last_id,
+            rows_per_second=result["rows_per_second"],
+        )
         return result
     
+    async def _sync_legal_holds(self, session, entity_type: str) -> None:
+        """Mirror the active holds on entity_type into legal_hold_entities."""
+        from sqlalchemy import delete, insert
+        from app.db.models import LegalHoldEntityModel
+        
+        await session.execute(
+            delete(LegalHoldEntityModel).where(
+                LegalHoldEntityModel.entity_type == entity_type
+            )
+        )
+        rows = [
+            {"hold_id": hold_id, "entity_type": entity_type, "entity_id": entity_id}
+            for hold_id, entity_id in self._legal_holds.active_entities(entity_type)
+        ]
+        if rows:
+            await session.execute(insert(LegalHoldEntityModel), rows)
+        await session.commit()
+    
     def get_policy(self, data_type: str) -> Optional[RetentionPolicy]:
         """Get retention policy for a data type."""
         return RETENTION_POLICIES.get(data_type)
@@ -25,6 +25,7 @@ from sqlalchemy import (
     JSON,
     UniqueConstraint,
     Index,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -207,6 +208,76 @@ class ShipmentModel(Base):
         return f"<Shipment {self.shipment_id}: {self.origin_port} -> {self.destination_port}>"
 
 
+# ============================================================================
+# CHOKEPOINT EXPOSURE MODELS
+# ============================================================================
+
+
+class CustomerChokepointModel(Base):
+    """
+    Customer <-> chokepoint association.
+
+    Normalized copy of CustomerModel.relevant_chokepoints (lowercase),
+    maintained by PostgresCustomerRepository on every write so chokepoint
+    lookups are an indexed join instead of a JSON scan.
+    """
+
+    __tablename__ = "customer_chokepoints"
+
+    customer_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("customers.customer_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    chokepoint: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_customer_chokepoints_chokepoint", "chokepoint", "customer_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CustomerChokepoint {self.customer_id}: {self.chokepoint}>"
+
+
+class ShipmentChokepointModel(Base):
+    """
+    Shipment <-> chokepoint association.
+
+    Normalized copy of ShipmentModel.route_chokepoints (lowercase), with
+    customer_id and an is_active flag (status not DELIVERED/CANCELLED)
+    denormalized so "who is exposed to X right now" is answered from
+    ix_shipment_chokepoints_exposure alone.
+    """
+
+    __tablename__ = "shipment_chokepoints"
+
+    shipment_id: Mapped[str] = mapped_column(
+        String(100),
+        ForeignKey("shipments.shipment_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    chokepoint: Mapped[str] = mapped_column(String(50), primary_key=True)
+    customer_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("customers.customer_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index(
+            "ix_shipment_chokepoints_exposure",
+            "chokepoint", "is_active", "customer_id",
+        ),
+        Index("ix_shipment_chokepoints_customer", "customer_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ShipmentChokepoint {self.shipment_id}: {self.chokepoint}>"
+
+
 # ============================================================================
 # DECISION MODEL
 # ============================================================================
@@ -298,6 +369,17 @@ class DecisionModel(Base):
         Index("ix_decisions_created", "created_at"),
         Index("ix_decisions_chokepoint", "chokepoint"),
         Index("ix_decisions_validity", "valid_until", "is_expired"),
+        # Keyset pagination for active listings (newest first)
+        Index(
+            "ix_decisions_active_keyset",
+            "created_at", "decision_id",
+            postgresql_where=text("NOT is_expired"),
+        ),
+        Index(
+            "ix_decisions_customer_active_keyset",
+            "customer_id", "created_at", "decision_id",
+            postgresql_where=text("NOT is_expired"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -915,3 +997,57 @@ class NetworkEffectsMetricModel(Base):
     
     def __repr__(self) -> str:
         return f"<NetworkEffects {self.period_type}: {self.period_start} - accuracy={self.overall_accuracy_rate:.2f}>"
+
+
+# ============================================================================
+# RETENTION MODELS
+# ============================================================================
+
+
+class LegalHoldEntityModel(Base):
+    """
+    Entity covered by an active legal hold.
+
+    One row per (hold, entity); entity_id "*" holds every entity of the
+    type. RetentionManager refreshes these rows from LegalHoldManager
+    before each sweep and excludes them from deletion with an anti-join.
+    """
+
+    __tablename__ = "legal_hold_entities"
+
+    # Key order serves the retention anti-join lookup
+    entity_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    entity_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    hold_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<LegalHoldEntity {self.hold_id}: {self.entity_type}:{self.entity_id}>"
+
+
+class RetentionCheckpointModel(Base):
+    """
+    Progress of an unfinished retention sweep.
+
+    Written in the same transaction as each deleted batch, so an
+    interrupted sweep resumes after last_id with the cutoff it started
+    with. The row is removed when the sweep completes.
+    """
+
+    __tablename__ = "retention_checkpoints"
+
+    data_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    cutoff: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<RetentionCheckpoint {self.data_type}: last_id={self.last_id}>"
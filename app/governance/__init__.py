@@ -45,6 +45,8 @@ from app.governance.bias_detection import (
     GroupFairnessReport,
     FairnessReport,
     BiasDetector,
+    DecisionColumns,
+    FairnessEngine,
     ProductionBiasDetector,
     create_production_bias_detector,
 )
@@ -83,6 +85,8 @@ __all__ = [
     "GroupFairnessReport",
     "FairnessReport",
     "BiasDetector",
+    "DecisionColumns",
+    "FairnessEngine",
     "ProductionBiasDetector",
     "create_production_bias_detector",
     # Ethics
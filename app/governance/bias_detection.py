@@ -10,7 +10,7 @@ Fairness Metrics:
 - Calibration: Predictions equally accurate across groups
 
 This module provides:
-- Group fairness analysis
+- Group fairness analysis (columnar, incl. intersectional groups)
 - Disparate impact detection (80% rule)
 - Fairness report generation
 - Bias mitigation recommendations
@@ -19,11 +19,12 @@ Addresses audit gap C4.2 (Fairness & Bias): +12 points target
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Union
 from pydantic import BaseModel, Field, computed_field
 from enum import Enum
 import math
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -199,6 +200,10 @@ class FairnessReport(BaseModel):
     fairness_by_chokepoint: List[GroupFairnessReport] = Field(default_factory=list)
     fairness_by_region: List[GroupFairnessReport] = Field(default_factory=list)
     fairness_by_cargo_type: List[GroupFairnessReport] = Field(default_factory=list)
+    fairness_by_intersection: Dict[str, List[GroupFairnessReport]] = Field(
+        default_factory=dict,
+        description="Intersectional groups, keyed by 'attribute|attribute'",
+    )
     
     # Aggregate fairness scores
     demographic_parity_score: float = Field(
@@ -250,6 +255,233 @@ class FairnessReport(BaseModel):
         )
 
 
+# ============================================================================
+# COLUMNAR FAIRNESS ENGINE
+# ============================================================================
+
+
+# Protected attributes analyzed in every fairness report
+FAIRNESS_ATTRIBUTES: Tuple[str, ...] = ("customer_size", "chokepoint", "region", "cargo_type")
+
+# Joins attribute names / values of an intersectional group ("small|EMEA")
+INTERSECTION_SEPARATOR = "|"
+
+# Per-decision outcome cell: counted once per group in a single bincount
+_CELL_UNKNOWN_NO_ACTION, _CELL_UNKNOWN_ACTION, _CELL_TP, _CELL_FP, _CELL_TN, _CELL_FN = range(6)
+_N_CELLS = 6
+
+Grouping = Union[str, Tuple[str, ...]]
+
+
+def grouping_name(grouping: Grouping) -> str:
+    """Attribute label of a grouping: 'region' or 'customer_size|region'."""
+    if isinstance(grouping, str):
+        return grouping
+    return INTERSECTION_SEPARATOR.join(grouping)
+
+
+def wilson_intervals(
+    successes: np.ndarray,
+    totals: np.ndarray,
+    z: float = 1.96,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized Wilson score intervals; (0, 1) where total is 0."""
+    successes = np.asarray(successes, dtype=np.float64)
+    totals = np.asarray(totals, dtype=np.float64)
+    n = np.where(totals > 0, totals, 1.0)
+    p = successes / n
+
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    spread = z * np.sqrt((p * (1 - p) + z * z / (4 * n)) / n) / denominator
+
+    empty = totals == 0
+    lower = np.where(empty, 0.0, np.maximum(0.0, center - spread))
+    upper = np.where(empty, 1.0, np.minimum(1.0, center + spread))
+    return lower, upper
+
+
+class DecisionColumns:
+    """
+    Decisions as columns: three boolean flags and integer-coded attributes.
+
+    Attribute codes follow first-seen order, so groups are reported in the
+    same order as the dict-based analysis produced them.
+    """
+
+    def __init__(
+        self,
+        action_recommended: np.ndarray,
+        outcome_known: np.ndarray,
+        was_correct: np.ndarray,
+        codes: Dict[str, np.ndarray],
+        levels: Dict[str, List[Any]],
+    ):
+        self.action_recommended = action_recommended
+        self.outcome_known = outcome_known
+        self.was_correct = was_correct
+        self.codes = codes
+        self.levels = levels
+
+    def __len__(self) -> int:
+        return len(self.action_recommended)
+
+    @classmethod
+    def from_decisions(
+        cls,
+        decisions: List[Dict[str, Any]],
+        attributes: Tuple[str, ...] = FAIRNESS_ATTRIBUTES,
+    ) -> "DecisionColumns":
+        """Load decision dicts once; missing attributes are grouped as 'unknown'."""
+        n = len(decisions)
+
+        def flag(key: str) -> np.ndarray:
+            return np.fromiter((bool(d.get(key, False)) for d in decisions), dtype=bool, count=n)
+
+        codes: Dict[str, np.ndarray] = {}
+        levels: Dict[str, List[Any]] = {}
+        for attribute in attributes:
+            index: Dict[Any, int] = {}
+            codes[attribute] = np.fromiter(
+                (index.setdefault(d.get(attribute, "unknown"), len(index)) for d in decisions),
+                dtype=np.int64,
+                count=n,
+            )
+            levels[attribute] = list(index)
+
+        return cls(
+            action_recommended=flag("action_recommended"),
+            outcome_known=flag("outcome_known"),
+            was_correct=flag("was_correct"),
+            codes=codes,
+            levels=levels,
+        )
+
+
+class FairnessEngine:
+    """
+    Group fairness metrics for any number of groupings in one pass.
+
+    Each decision falls in one outcome cell (unknown ± action, TP, FP,
+    TN, FN). Cell counts for every group of every grouping come from a
+    single ``np.bincount``; rates, ratios and Wilson intervals are then
+    computed on the per-group count arrays. A grouping is an attribute
+    name or a tuple of names for intersectional groups.
+    """
+
+    def __init__(
+        self,
+        columns: DecisionColumns,
+        overall_positive_rate: Optional[float] = None,
+        overall_accuracy: Optional[float] = None,
+    ):
+        """
+        Args:
+            columns: Decisions to analyze
+            overall_positive_rate: Baseline for positive_rate_ratio
+                (default: the rate over ``columns``)
+            overall_accuracy: Baseline for accuracy_ratio
+                (default: the accuracy over ``columns``)
+        """
+        self.columns = columns
+        c = columns
+        self._cells = np.where(
+            c.outcome_known,
+            _CELL_TP + 2 * ~c.action_recommended + ~c.was_correct,
+            c.action_recommended.astype(np.int64),
+        ).astype(np.int64)
+
+        self.total = len(columns)
+        self.with_outcomes = int(np.count_nonzero(c.outcome_known))
+        self.positive = int(np.count_nonzero(c.action_recommended))
+        self.correct = int(np.count_nonzero(c.was_correct))
+        if overall_positive_rate is None:
+            overall_positive_rate = self.positive / self.total if self.total > 0 else 0.0
+        if overall_accuracy is None:
+            overall_accuracy = self.correct / self.with_outcomes if self.with_outcomes > 0 else 0.0
+        self.overall_positive_rate = overall_positive_rate
+        self.overall_accuracy = overall_accuracy
+
+    def analyze(self, groupings: List[Grouping]) -> Dict[str, List[GroupFairnessReport]]:
+        """Group reports keyed by grouping name; empty intersections are omitted."""
+        group_codes, group_labels = [], []
+        for grouping in groupings:
+            codes, labels = self._group_codes(grouping)
+            group_codes.append(codes)
+            group_labels.append(labels)
+
+        # One bincount over (group offset + code) x cell for every grouping
+        offsets = np.cumsum([0] + [len(labels) for labels in group_labels])
+        keys = np.concatenate([
+            (codes + offset) * _N_CELLS + self._cells
+            for codes, offset in zip(group_codes, offsets)
+        ]) if groupings else np.zeros(0, dtype=np.int64)
+        counts = np.bincount(keys, minlength=int(offsets[-1]) * _N_CELLS).reshape(-1, _N_CELLS)
+
+        tp, fp, tn, fn = (counts[:, cell] for cell in (_CELL_TP, _CELL_FP, _CELL_TN, _CELL_FN))
+        total = counts.sum(axis=1)
+        positive = counts[:, _CELL_UNKNOWN_ACTION] + tp + fp
+        known = tp + fp + tn + fn
+
+        positive_rate = np.divide(positive, total, out=np.zeros(len(total)), where=total > 0)
+        accuracy = np.divide(tp + tn, known, out=np.zeros(len(known)), where=known > 0)
+        positive_rate_ratio = (
+            positive_rate / self.overall_positive_rate
+            if self.overall_positive_rate > 0 else np.ones(len(total))
+        )
+        accuracy_ratio = (
+            accuracy / self.overall_accuracy
+            if self.overall_accuracy > 0 else np.ones(len(total))
+        )
+        ci_lower, ci_upper = wilson_intervals(positive, total)
+
+        results: Dict[str, List[GroupFairnessReport]] = {}
+        for grouping, labels, offset in zip(groupings, group_labels, offsets):
+            attribute = grouping_name(grouping)
+            reports = []
+            for i, label in enumerate(labels):
+                row = offset + i
+                if total[row] == 0:
+                    continue
+                reports.append(GroupFairnessReport(
+                    group_attribute=attribute,
+                    group_value=label,
+                    metrics=GroupMetrics(
+                        total=int(total[row]),
+                        positive_outcomes=int(positive[row]),
+                        negative_outcomes=int(total[row] - positive[row]),
+                        true_positives=int(tp[row]),
+                        false_positives=int(fp[row]),
+                        true_negatives=int(tn[row]),
+                        false_negatives=int(fn[row]),
+                        outcomes_known=int(known[row]),
+                    ),
+                    positive_rate_ratio=float(positive_rate_ratio[row]),
+                    accuracy_ratio=float(accuracy_ratio[row]),
+                    positive_rate_ci=(float(ci_lower[row]), float(ci_upper[row])),
+                ))
+            results[attribute] = reports
+        return results
+
+    def _group_codes(self, grouping: Grouping) -> Tuple[np.ndarray, List[Any]]:
+        """Per-decision group code and the label of every possible code."""
+        if isinstance(grouping, str):
+            return self.columns.codes[grouping], self.columns.levels[grouping]
+
+        # Intersection: mixed-radix code over the attributes' level counts
+        sizes = [len(self.columns.levels[a]) for a in grouping]
+        codes = np.zeros(len(self.columns), dtype=np.int64)
+        for attribute, size in zip(grouping, sizes):
+            codes = codes * size + self.columns.codes[attribute]
+        labels = [
+            INTERSECTION_SEPARATOR.join(
+                str(self.columns.levels[a][i]) for a, i in zip(grouping, combo)
+            )
+            for combo in np.ndindex(*sizes)
+        ]
+        return codes, labels
+
+
 # ============================================================================
 # BIAS DETECTOR
 # ============================================================================
@@ -266,6 +498,10 @@ class BiasDetector:
     - Cargo type discrimination
     
     EU AI Act compliance requires regular fairness audits.
+    
+    Group metrics come from FairnessEngine: decisions are loaded into
+    columns once and all attributes (plus any intersections) are counted
+    in a single grouped pass.
     """
     
     # Thresholds
@@ -274,14 +510,21 @@ class BiasDetector:
     CALIBRATION_THRESHOLD = 0.1         # Max 10% calibration difference
     MIN_SAMPLE_SIZE = 30                # Minimum for reliable estimates
     
-    def __init__(self, decision_repository: Optional[Any] = None):
+    def __init__(
+        self,
+        decision_repository: Optional[Any] = None,
+        intersections: Optional[List[Tuple[str, ...]]] = None,
+    ):
         """
         Initialize bias detector.
         
         Args:
             decision_repository: Repository for accessing decision data
+            intersections: Attribute combinations to analyze as
+                intersectional groups, e.g. [("customer_size", "region")]
         """
         self.decision_repo = decision_repository
+        self.intersections = [tuple(i) for i in intersections or []]
     
     async def generate_fairness_report(
         self,
@@ -306,29 +549,23 @@ class BiasDetector:
         if not decisions:
             return self._empty_report(start_date, end_date)
         
-        # Calculate overall metrics
-        total = len(decisions)
-        with_outcomes = len([d for d in decisions if d.get("outcome_known", False)])
-        overall_positive = len([d for d in decisions if d.get("action_recommended", False)])
-        overall_positive_rate = overall_positive / total if total > 0 else 0.0
+        # Load once, then analyze every attribute in one grouped pass
+        attributes = tuple(dict.fromkeys(
+            FAIRNESS_ATTRIBUTES + tuple(a for i in self.intersections for a in i)
+        ))
+        engine = FairnessEngine(DecisionColumns.from_decisions(decisions, attributes))
+        groups = engine.analyze(list(FAIRNESS_ATTRIBUTES) + self.intersections)
         
-        # Calculate overall accuracy
-        correct = len([d for d in decisions if d.get("was_correct", False)])
-        overall_accuracy = correct / with_outcomes if with_outcomes > 0 else 0.0
+        total = engine.total
+        with_outcomes = engine.with_outcomes
+        overall_positive_rate = engine.overall_positive_rate
+        overall_accuracy = engine.overall_accuracy
         
-        # Analyze by each attribute
-        by_customer_size = self._analyze_by_group(
-            decisions, "customer_size", overall_positive_rate, overall_accuracy
-        )
-        by_chokepoint = self._analyze_by_group(
-            decisions, "chokepoint", overall_positive_rate, overall_accuracy
-        )
-        by_region = self._analyze_by_group(
-            decisions, "region", overall_positive_rate, overall_accuracy
-        )
-        by_cargo = self._analyze_by_group(
-            decisions, "cargo_type", overall_positive_rate, overall_accuracy
-        )
+        by_customer_size = groups["customer_size"]
+        by_chokepoint = groups["chokepoint"]
+        by_region = groups["region"]
+        by_cargo = groups["cargo_type"]
+        by_intersection = {grouping_name(i): groups[grouping_name(i)] for i in self.intersections}
         
         # Calculate aggregate scores
         dp_score = self._demographic_parity_score(by_customer_size)
@@ -340,6 +577,8 @@ class BiasDetector:
         alerts.extend(self._detect_disparate_impact(by_customer_size, "customer_size"))
         alerts.extend(self._detect_disparate_impact(by_chokepoint, "chokepoint"))
         alerts.extend(self._detect_accuracy_disparity(by_region, "region"))
+        for name, reports in by_intersection.items():
+            alerts.extend(self._detect_disparate_impact(reports, name))
         
         # Determine overall status
         bias_detected = len(alerts) > 0
@@ -360,6 +599,7 @@ class BiasDetector:
             fairness_by_chokepoint=by_chokepoint,
             fairness_by_region=by_region,
             fairness_by_cargo_type=by_cargo,
+            fairness_by_intersection=by_intersection,
             demographic_parity_score=dp_score,
             equal_opportunity_score=eo_score,
             calibration_score=cal_score,
@@ -642,62 +882,12 @@ class BiasDetector:
         overall_accuracy: float,
     ) -> List[GroupFairnessReport]:
         """Analyze fairness metrics by group attribute."""
-        groups: Dict[str, List[Dict]] = {}
-        
-        for d in decisions:
-            group_value = d.get(attribute, "unknown")
-            if group_value not in groups:
-                groups[group_value] = []
-            groups[group_value].append(d)
-        
-        reports = []
-        for group_value, group_decisions in groups.items():
-            total = len(group_decisions)
-            positive = len([d for d in group_decisions if d.get("action_recommended", False)])
-            negative = total - positive
-            
-            # Calculate outcomes where known
-            tp, fp, tn, fn = 0, 0, 0, 0
-            outcomes_known = 0
-            for d in group_decisions:
-                if d.get("outcome_known", False):
-                    outcomes_known += 1
-                    if d.get("action_recommended") and d.get("was_correct"):
-                        tp += 1
-                    elif d.get("action_recommended") and not d.get("was_correct"):
-                        fp += 1
-                    elif not d.get("action_recommended") and d.get("was_correct"):
-                        tn += 1
-                    else:
-                        fn += 1
-            
-            metrics = GroupMetrics(
-                total=total,
-                positive_outcomes=positive,
-                negative_outcomes=negative,
-                true_positives=tp,
-                false_positives=fp,
-                true_negatives=tn,
-                false_negatives=fn,
-                outcomes_known=outcomes_known,
-            )
-            
-            positive_rate = positive / total if total > 0 else 0.0
-            accuracy = metrics.accuracy
-            
-            # Calculate confidence interval (Wilson score)
-            ci = self._wilson_confidence_interval(positive, total)
-            
-            reports.append(GroupFairnessReport(
-                group_attribute=attribute,
-                group_value=group_value,
-                metrics=metrics,
-                positive_rate_ratio=positive_rate / overall_positive_rate if overall_positive_rate > 0 else 1.0,
-                accuracy_ratio=accuracy / overall_accuracy if overall_accuracy > 0 else 1.0,
-                positive_rate_ci=ci,
-            ))
-        
-        return reports
+        engine = FairnessEngine(
+            DecisionColumns.from_decisions(decisions, (attribute,)),
+            overall_positive_rate=overall_positive_rate,
+            overall_accuracy=overall_accuracy,
+        )
+        return engine.analyze([attribute])[attribute]
     
     def _wilson_confidence_interval(
         self,
@@ -2,15 +2,28 @@
 Cross-reference validation for OMEN signals.
 
 Stage 4 of the 4-stage validation pipeline.
+
+Recent signals live in a SignalWindowStore: time buckets of arrivals,
+each holding per-chokepoint entries sorted by probability. A validation
+is a handful of binary searches per bucket instead of a scan over every
+recent signal, and eviction touches only expired entries.
 """
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# |p - q| below this corroborates, above CONFLICT_DELTA conflicts
+CORROBORATION_DELTA = 0.2
+CONFLICT_DELTA = 0.5
+
 
 @dataclass
 class CrossReferenceResult:
@@ -21,113 +34,356 @@ class CrossReferenceResult:
     conflicting_signals: List[str]
     errors: List[str]
     warnings: List[str]
+    # Exact counts; the lists above may be capped (see max_listed)
+    corroboration_count: int = 0
+    conflict_count: int = 0
+
+
+# (probability, seq, signal_id, cached_at). seq is unique, so entries
+# sort by probability and never compare past it.
+_Entry = Tuple[float, int, Any, float]
+
+
+class _Bucket:
+    """Signals that arrived in [start, start + bucket_seconds)."""
+
+    __slots__ = ("start", "by_chokepoint", "arrivals", "head")
+
+    def __init__(self, start: float):
+        self.start = start
+        # chokepoint -> (probabilities, entries), both sorted by probability;
+        # the bare float list keeps bisect free of key calls
+        self.by_chokepoint: Dict[Any, Tuple[List[float], List[_Entry]]] = {}
+        self.arrivals: List[tuple] = []  # (chokepoint, entry) in arrival order
+        self.head = 0  # arrivals[:head] are evicted
+
+
+_seq = itemgetter(1)
+_NOTHING = object()
+
+
+def _first(
+    probs: List[float],
+    lo: int,
+    hi: int,
+    guess: float,
+    pred: Callable[[float], bool],
+) -> int:
+    """
+    First index in [lo, hi) whose probability satisfies a monotone predicate.
+
+    bisect on `guess` (the predicate's threshold, e.g. p - 0.2) lands within
+    a rounding error of the answer; the exact predicate fixes up the edge,
+    so results match the |p - q| comparisons bit for bit.
+    """
+    i = bisect_left(probs, guess, lo, hi)
+    while i > lo and pred(probs[i - 1]):
+        i -= 1
+    while i < hi and not pred(probs[i]):
+        i += 1
+    return i
+
+
+@dataclass
+class RelatedSignals:
+    """Corroborating/conflicting signals found for one probe."""
+    corroboration_count: int = 0
+    conflict_count: int = 0
+    corroborating: List[_Entry] = field(default_factory=list)  # insertion order
+    conflicting: List[_Entry] = field(default_factory=list)
+
+
+class SignalWindowStore:
+    """
+    Sliding window of recent signals, indexed for cross-reference lookups.
+
+    Arrivals are grouped into time buckets; inside a bucket each chokepoint
+    keeps its entries sorted by probability. Corroboration (|p - q| < 0.2)
+    and conflict (|p - q| > 0.5) are contiguous ranges of that order, so
+    both are counted with binary searches. Whole buckets past the window
+    are dropped; the bucket straddling the cutoff is trimmed in arrival
+    order, so eviction costs O(expired).
+    """
+
+    def __init__(self, window_seconds: float = 86400.0, bucket_seconds: float = 3600.0):
+        self._window = window_seconds
+        self._bucket_seconds = bucket_seconds
+        self._buckets: deque[_Bucket] = deque()
+        self._by_id: Dict[Any, List[tuple]] = {}  # signal_id -> [(chokepoint, entry)]
+        self._seq = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, chokepoint: Any, probability: float, signal_id: Any, now: float) -> None:
+        self.evict(now)
+        start = now - now % self._bucket_seconds
+        if not self._buckets or self._buckets[-1].start < start:
+            self._buckets.append(_Bucket(start))
+        # A clock that steps back files into the newest bucket
+        bucket = self._buckets[-1]
+
+        entry = (probability, self._seq, signal_id, now)
+        self._seq += 1
+        probs, entries = bucket.by_chokepoint.setdefault(chokepoint, ([], []))
+        i = bisect_right(probs, probability)
+        probs.insert(i, probability)
+        entries.insert(i, entry)
+        bucket.arrivals.append((chokepoint, entry))
+        self._by_id.setdefault(signal_id, []).append((chokepoint, entry))
+        self._size += 1
+
+    def evict(self, now: float) -> int:
+        """Drop entries cached at or before now - window. Returns how many."""
+        cutoff = now - self._window
+        removed = 0
+        while self._buckets:
+            bucket = self._buckets[0]
+            if bucket.start + self._bucket_seconds <= cutoff:
+                for chokepoint, entry in bucket.arrivals[bucket.head:]:
+                    self._forget(chokepoint, entry)
+                removed += len(bucket.arrivals) - bucket.head
+                self._buckets.popleft()
+                continue
+
+            while bucket.head < len(bucket.arrivals):
+                chokepoint, entry = bucket.arrivals[bucket.head]
+                if entry[3] > cutoff:
+                    break
+                probs, entries = bucket.by_chokepoint[chokepoint]
+                i = bisect_left(probs, entry[0])
+                while entries[i] is not entry:
+                    i += 1
+                del probs[i], entries[i]
+                self._forget(chokepoint, entry)
+                bucket.head += 1
+                removed += 1
+            break
+
+        self._size -= removed
+        return removed
+
+    def _forget(self, chokepoint: Any, entry: _Entry) -> None:
+        refs = self._by_id[entry[2]]
+        refs.remove((chokepoint, entry))
+        if not refs:
+            del self._by_id[entry[2]]
+
+    def related(
+        self,
+        chokepoint: Any,
+        probability: float,
+        signal_id: Any,
+        now: float,
+        max_listed: Optional[int] = None,
+    ) -> RelatedSignals:
+        """
+        Corroborating and conflicting signals for a probe.
+
+        Counts are exact. With max_listed, only the most recent max_listed
+        entries of each kind are materialized.
+        """
+        self.evict(now)
+        p = probability
+        result = RelatedSignals()
+        corroborating: List[_Entry] = []
+        conflicting: List[_Entry] = []
+        own = self._by_id.get(signal_id, ())
+        # Gather a few extra so excluding the probe's own entries still fills the cap
+        wanted = None if max_listed is None else max_listed + len(own)
+
+        # Range edges, as monotone predicates over q below / above p
+        corr_below = lambda q: p - q < CORROBORATION_DELTA
+        corr_above = lambda q: q - p >= CORROBORATION_DELTA
+        conf_below = lambda q: p - q <= CONFLICT_DELTA
+        conf_above = lambda q: q - p > CONFLICT_DELTA
+
+        # Newest first, so a capped listing stops early
+        for bucket in reversed(self._buckets):
+            probs, entries = bucket.by_chokepoint.get(chokepoint, ((), ()))
+            n = len(probs)
+            if not n:
+                continue
+            mid = bisect_left(probs, p)
+            corr_lo = _first(probs, 0, mid, p - CORROBORATION_DELTA, corr_below)
+            corr_hi = _first(probs, mid, n, p + CORROBORATION_DELTA, corr_above)
+            conf_lo = _first(probs, 0, mid, p - CONFLICT_DELTA, conf_below)
+            conf_hi = _first(probs, mid, n, p + CONFLICT_DELTA, conf_above)
+
+            result.corroboration_count += corr_hi - corr_lo
+            result.conflict_count += conf_lo + n - conf_hi
+            if wanted is None or len(corroborating) < wanted:
+                corroborating.extend(entries[corr_lo:corr_hi])
+            if wanted is None or len(conflicting) < wanted:
+                conflicting.extend(entries[:conf_lo])
+                conflicting.extend(entries[conf_hi:])
+
+        # A signal is never related to itself (or to re-adds of itself)
+        for other_chokepoint, entry in own:
+            if other_chokepoint != chokepoint:
+                continue
+            delta = abs(p - entry[0])
+            if delta < CORROBORATION_DELTA:
+                result.corroboration_count -= 1
+            elif delta > CONFLICT_DELTA:
+                result.conflict_count -= 1
+
+        exclude = signal_id if own else _NOTHING
+        result.corroborating = _listing(corroborating, exclude, max_listed)
+        result.conflicting = _listing(conflicting, exclude, max_listed)
+        return result
+
+
+def _listing(entries: List[_Entry], exclude: Any, max_listed: Optional[int]) -> List[_Entry]:
+    """Entries in insertion order, minus signal_id `exclude`, capped to the newest."""
+    entries.sort(key=_seq)
+    if exclude is not _NOTHING:
+        entries = [e for e in entries if e[2] != exclude]
+    if max_listed is not None:
+        entries = entries[len(entries) - max_listed:] if max_listed else []
+    return entries
 
 
 class CrossReferenceValidator:
     """
     Validates signals against other recent signals.
-    
+
     Ensures consistency and identifies corroboration/conflicts.
+
+    Args:
+        cache_duration: How long added signals stay in the window
+        bucket_width: Time bucket size of the window store
+        max_listed: Cap on signal IDs (and conflict warnings) listed per
+            result; counts and the consistency score stay exact.
+            None lists everything.
+        clock: Seconds since the epoch (default time.time)
     """
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        cache_duration: timedelta = timedelta(hours=24),
+        bucket_width: timedelta = timedelta(hours=1),
+        max_listed: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         # Recent signals cache (in production, would query DB)
-        self._recent_signals: List[Dict[str, Any]] = []
-        self._cache_duration = timedelta(hours=24)
-    
-    def add_signal(self, signal: Dict[str, Any]) -> None:
-        """Add a signal to the recent cache."""
-        signal["_cached_at"] = datetime.utcnow()
-        self._recent_signals.append(signal)
-        
-        # Clean old signals
-        self._clean_cache()
-    
-    def _clean_cache(self) -> None:
-        """Remove old signals from cache."""
-        cutoff = datetime.utcnow() - self._cache_duration
-        self._recent_signals = [
-            s for s in self._recent_signals
-            if s.get("_cached_at", datetime.min) > cutoff
-        ]
-    
+        self._cache_duration = cache_duration
+        self._max_listed = max_listed
+        self._clock = clock
+        self._store = SignalWindowStore(
+            window_seconds=cache_duration.total_seconds(),
+            bucket_seconds=bucket_width.total_seconds(),
+        )
+
+    @property
+    def cached_signals(self) -> int:
+        """Number of signals currently in the window."""
+        return len(self._store)
+
+    def add_signal(self, signal: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Add a signal to the recent cache (evicting expired ones)."""
+        self._store.add(
+            signal.get("chokepoint"),
+            signal.get("probability", 0.5),
+            signal.get("signal_id"),
+            self._clock() if now is None else now,
+        )
+
+    def validate_many(
+        self,
+        signals: List[Dict[str, Any]],
+        min_corroboration: int = 0,
+    ) -> List[CrossReferenceResult]:
+        """
+        Validate a batch in one pass, adding each signal after its check.
+
+        Each signal is checked against the window plus the batch signals
+        before it, exactly as validate() followed by add_signal() per
+        signal would, but with one clock reading for the whole batch.
+        """
+        now = self._clock()
+        results = []
+        for signal in signals:
+            results.append(self.validate(signal, min_corroboration, now=now))
+            self.add_signal(signal, now=now)
+        return results
+
     def validate(
         self,
         signal: Dict[str, Any],
         min_corroboration: int = 0,
+        now: Optional[float] = None,
     ) -> CrossReferenceResult:
         """
         Validate a signal against recent signals.
-        
+
         Args:
             signal: Signal to validate
             min_corroboration: Minimum corroborating signals required
-            
+            now: Clock reading to use (default: the validator's clock)
+
         Returns:
             CrossReferenceResult
         """
         errors = []
         warnings = []
-        corroborating = []
-        conflicting = []
-        
+
         # Get relevant fields from the signal
         chokepoint = signal.get("chokepoint")
-        event_type = signal.get("event_type") or signal.get("signal_type")
         probability = signal.get("probability", 0.5)
-        
-        # Find related signals
-        for other in self._recent_signals:
-            if other.get("signal_id") == signal.get("signal_id"):
-                continue
-            
-            # Check if same chokepoint
-            if other.get("chokepoint") != chokepoint:
-                continue
-            
-            other_prob = other.get("probability", 0.5)
-            other_event = other.get("event_type") or other.get("signal_type")
-            
-            # Check for corroboration (same direction)
-            if abs(probability - other_prob) < 0.2:
-                corroborating.append(other.get("signal_id", "unknown"))
-            
-            # Check for conflict (opposite direction)
-            elif abs(probability - other_prob) > 0.5:
-                conflicting.append(other.get("signal_id", "unknown"))
-                warnings.append(
-                    f"Conflicts with signal {other.get('signal_id')}: "
-                    f"prob {probability:.2f} vs {other_prob:.2f}"
-                )
-        
+
+        # Find related signals on the same chokepoint
+        related = self._store.related(
+            chokepoint,
+            probability,
+            signal.get("signal_id"),
+            self._clock() if now is None else now,
+            max_listed=self._max_listed,
+        )
+        corroborating = [_listed_id(e) for e in related.corroborating]
+        conflicting = [_listed_id(e) for e in related.conflicting]
+        n_corroborating = related.corroboration_count
+        n_conflicting = related.conflict_count
+
+        for entry in related.conflicting:
+            warnings.append(
+                f"Conflicts with signal {entry[2]}: "
+                f"prob {probability:.2f} vs {entry[0]:.2f}"
+            )
+        if n_conflicting > len(conflicting):
+            warnings.append(
+                f"Conflicts with {n_conflicting - len(conflicting)} more signals"
+            )
+
         # Check minimum corroboration
-        if min_corroboration > 0 and len(corroborating) < min_corroboration:
+        if min_corroboration > 0 and n_corroborating < min_corroboration:
             warnings.append(
-                f"Insufficient corroboration: {len(corroborating)} < {min_corroboration}"
+                f"Insufficient corroboration: {n_corroborating} < {min_corroboration}"
             )
-        
+
         # Calculate consistency score
-        total_related = len(corroborating) + len(conflicting)
+        total_related = n_corroborating + n_conflicting
         if total_related > 0:
-            consistency_score = len(corroborating) / total_related
+            consistency_score = n_corroborating / total_related
         else:
             consistency_score = 0.5  # Neutral if no related signals
-        
+
         # Major conflicts reduce validity
-        if len(conflicting) > len(corroborating):
+        if n_conflicting > n_corroborating:
             consistency_score *= 0.5
-        
+
         valid = len(errors) == 0
-        
+
         logger.debug(
             "cross_reference_validation_completed",
             signal_id=signal.get("signal_id"),
             valid=valid,
-            corroborating=len(corroborating),
-            conflicting=len(conflicting),
+            corroborating=n_corroborating,
+            conflicting=n_conflicting,
             consistency_score=consistency_score,
         )
-        
+
         return CrossReferenceResult(
             valid=valid,
             consistency_score=consistency_score,
@@ -135,4 +391,10 @@ class CrossReferenceValidator:
             conflicting_signals=conflicting,
             errors=errors,
             warnings=warnings,
+            corroboration_count=n_corroborating,
+            conflict_count=n_conflicting,
         )
+
+
+def _listed_id(entry: _Entry) -> str:
+    return entry[2] if entry[2] is not None else "unknown"
@@ -51,21 +51,46 @@ class SchemaValidator:
         Returns:
             SchemaValidationResult
         """
+        return self.validate_many(signal_type, [data])[0]
+    
+    def validate_many(
+        self,
+        signal_type: str,
+        items: List[Dict[str, Any]],
+    ) -> List[SchemaValidationResult]:
+        """
+        Validate many signals of one type, looking the schema up once.
+        
+        Args:
+            signal_type: Type shared by all items
+            items: Raw signal data
+            
+        Returns:
+            One SchemaValidationResult per item, in order
+        """
+        schema = self._schemas.get(signal_type)
+        if schema is None:
+            message = f"No schema registered for signal type: {signal_type}"
+            return [
+                SchemaValidationResult(
+                    valid=True,  # Pass through if no schema
+                    errors=[],
+                    warnings=[message],
+                    validated_data=data,
+                )
+                for data in items
+            ]
+        return [self._validate_with(schema, signal_type, data) for data in items]
+    
+    def _validate_with(
+        self,
+        schema: Type[BaseModel],
+        signal_type: str,
+        data: Dict[str, Any],
+    ) -> SchemaValidationResult:
         errors = []
         warnings = []
         
-        # Check if schema exists
-        if signal_type not in self._schemas:
-            warnings.append(f"No schema registered for signal type: {signal_type}")
-            return SchemaValidationResult(
-                valid=True,  # Pass through if no schema
-                errors=errors,
-                warnings=warnings,
-                validated_data=data,
-            )
-        
-        schema = self._schemas[signal_type]
-        
         try:
             # Validate against Pydantic model
             validated = schema(**data)
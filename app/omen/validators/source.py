@@ -6,7 +6,7 @@ Stage 2 of the 4-stage validation pipeline.
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -67,14 +67,16 @@ class SourceValidator:
         source: str,
         data_timestamp: datetime,
         metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None,
     ) -> SourceValidationResult:
         """
         Validate a signal source.
         
         Args:
             source: Source identifier
-            data_timestamp: When the data was generated
+            data_timestamp: When the data was generated (naive UTC)
             metadata: Additional source metadata
+            now: Reference time for freshness (default: utcnow)
             
         Returns:
             SourceValidationResult
@@ -87,7 +89,7 @@ class SourceValidator:
         
         # Check freshness
         max_age = self._max_age_hours.get(source, 6)
-        age = datetime.utcnow() - data_timestamp
+        age = (now or datetime.utcnow()) - data_timestamp
         age_hours = age.total_seconds() / 3600
         
         if age_hours > max_age:
@@ -134,6 +136,28 @@ class SourceValidator:
             warnings=warnings,
         )
     
+    def validate_many(
+        self,
+        items: List[Tuple[str, datetime]],
+        now: Optional[datetime] = None,
+    ) -> List[SourceValidationResult]:
+        """
+        Validate many (source, timestamp) pairs against one clock reading.
+        
+        Each distinct pair is assessed once; repeats (a burst from one
+        source) share that result.
+        """
+        now = now or datetime.utcnow()
+        assessed: Dict[Tuple[str, datetime], SourceValidationResult] = {}
+        results = []
+        for source, data_timestamp in items:
+            key = (source, data_timestamp)
+            result = assessed.get(key)
+            if result is None:
+                result = assessed[key] = self.validate(source, data_timestamp, now=now)
+            results.append(result)
+        return results
+    
     def add_source(
         self,
         source_id: str,
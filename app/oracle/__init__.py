@@ -31,7 +31,12 @@ from app.oracle.port import (
     PortStatus,
     get_port_client,
 )
-from app.oracle.correlator import SignalCorrelator, get_correlator, create_correlator
+from app.oracle.correlator import (
+    SignalCorrelator,
+    SnapshotCache,
+    get_correlator,
+    create_correlator,
+)
 from app.oracle.service import OracleService, get_oracle_service, create_oracle_service
 
 __all__ = [
@@ -60,6 +65,7 @@ __all__ = [
     "get_port_client",
     # Correlator
     "SignalCorrelator",
+    "SnapshotCache",
     "get_correlator",
     "create_correlator",
     # Service
@@ -14,11 +14,17 @@ The correlation status indicates how well prediction matches reality:
 - PREDICTED_NOT_OBSERVED: Signal exists but reality still normal
 - SURPRISE: Reality disruption without prior signal
 - NORMAL: No significant signal or disruption
+
+Reality snapshots are cached for a short TTL and loaded single-flight:
+concurrent correlations for the same chokepoint share one fetch of AIS,
+freight and port data instead of each refetching it. Upstream fetches and
+batch correlations are bounded by semaphores.
 """
 
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from datetime import datetime
 import asyncio
+import time
 
 import structlog
 
@@ -67,6 +73,95 @@ CORRELATION_THRESHOLDS = {
 }
 
 
+# Cache key of the all-chokepoint snapshot
+_GLOBAL_SNAPSHOT_KEY = "__all__"
+
+# Chokepoints covered by the global reality snapshot
+SNAPSHOT_CHOKEPOINTS = [Chokepoint.RED_SEA, Chokepoint.SUEZ, Chokepoint.PANAMA, Chokepoint.MALACCA]
+
+
+# ============================================================================
+# SNAPSHOT CACHE
+# ============================================================================
+
+
+class SnapshotCache:
+    """
+    TTL cache of reality snapshots with single-flight loading.
+
+    If a key is missing or stale, the first caller starts the load and
+    every concurrent caller awaits that same load. A failed load is not
+    cached; all waiters see the error and the next call retries.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[RealitySnapshot, float]] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[RealitySnapshot]],
+    ) -> RealitySnapshot:
+        """Return the cached snapshot for key, or load it (once) if stale."""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[1] < self._ttl:
+            self.hits += 1
+            return entry[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.coalesced += 1
+
+        # shield: a cancelled caller must not cancel the shared load
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[RealitySnapshot]],
+    ) -> RealitySnapshot:
+        snapshot = await loader()
+        self._entries[key] = (snapshot, self._clock())
+        return snapshot
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("reality_snapshot_load_failed", key=key, error=str(task.exception()))
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached snapshot, or all of them."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
 # ============================================================================
 # CORRELATOR
 # ============================================================================
@@ -96,6 +191,10 @@ class SignalCorrelator:
         ais_client: Optional[AISClient] = None,
         freight_client: Optional[FreightRateClient] = None,
         port_client: Optional[PortDataClient] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+        snapshot_ttl_seconds: float = 30.0,
+        max_concurrent_fetches: int = 4,
+        max_concurrent_correlations: int = 16,
     ):
         """
         Initialize correlator with data clients.
@@ -104,11 +203,20 @@ class SignalCorrelator:
             ais_client: AIS vessel tracking client
             freight_client: Freight rate client
             port_client: Port data client
+            snapshot_cache: Shared snapshot cache (created if None)
+            snapshot_ttl_seconds: TTL of cached reality snapshots
+            max_concurrent_fetches: Chokepoints fetched from the data
+                clients at once (each fetch is 5 upstream calls)
+            max_concurrent_correlations: Signals correlated at once in
+                correlate_batch
         """
         self._ais = ais_client
         self._freight = freight_client
         self._port = port_client
         self._running = False
+        self._snapshots = snapshot_cache or SnapshotCache(ttl_seconds=snapshot_ttl_seconds)
+        self._fetch_limit = asyncio.Semaphore(max_concurrent_fetches)
+        self._max_concurrent_correlations = max_concurrent_correlations
 
     async def start(self):
         """Start the correlator and connect clients."""
@@ -143,8 +251,20 @@ class SignalCorrelator:
             self._port.disconnect() if self._port else asyncio.sleep(0),
         )
 
+        self._snapshots.invalidate()
         logger.info("correlator_stopped")
 
+    def invalidate_snapshots(self, chokepoint: Optional[Chokepoint] = None) -> None:
+        """Force the next correlation to refetch reality data."""
+        if chokepoint is None:
+            self._snapshots.invalidate()
+        else:
+            self._snapshots.invalidate(chokepoint.value)
+            self._snapshots.invalidate(_GLOBAL_SNAPSHOT_KEY)
+
+    def snapshot_cache_stats(self) -> dict[str, int]:
+        return self._snapshots.stats()
+
     # ========================================================================
     # CORRELATION
     # ========================================================================
@@ -166,9 +286,8 @@ class SignalCorrelator:
         """
         chokepoint = signal.geographic.primary_chokepoint
 
-        # Fetch reality data in parallel
-        reality_task = self._build_reality_snapshot(chokepoint)
-        reality = await reality_task
+        # Shared with concurrent correlations on the same chokepoint
+        reality = await self._build_reality_snapshot(chokepoint)
 
         # Calculate correlation factors
         factors = self._calculate_correlation_factors(signal, reality)
@@ -214,9 +333,14 @@ class SignalCorrelator:
         Returns:
             List of CorrelatedIntelligence
         """
-        # Process in parallel
-        tasks = [self.correlate(signal) for signal in signals]
-        return await asyncio.gather(*tasks)
+        # Process in parallel, at most max_concurrent_correlations at a time
+        limit = asyncio.Semaphore(self._max_concurrent_correlations)
+
+        async def correlate_one(signal: OmenSignal) -> CorrelatedIntelligence:
+            async with limit:
+                return await self.correlate(signal)
+
+        return list(await asyncio.gather(*(correlate_one(s) for s in signals)))
 
     async def get_reality_snapshot(
         self,
@@ -234,16 +358,26 @@ class SignalCorrelator:
         if chokepoint:
             return await self._build_reality_snapshot(chokepoint)
 
-        # Get snapshot for all chokepoints
-        snapshot_id = f"ORACLE-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
-        all_health = {}
+        return await self._snapshots.get_or_load(
+            _GLOBAL_SNAPSHOT_KEY, self._load_global_snapshot
+        )
+
+    # ========================================================================
+    # INTERNAL METHODS
+    # ========================================================================
 
-        for cp in [Chokepoint.RED_SEA, Chokepoint.SUEZ, Chokepoint.PANAMA, Chokepoint.MALACCA]:
-            health = await self._get_chokepoint_health(cp)
-            all_health[cp.value] = health
+    async def _load_global_snapshot(self) -> RealitySnapshot:
+        """Snapshot of all chokepoints, reusing cached per-chokepoint snapshots."""
+        snapshot_id = f"ORACLE-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
 
-        # Get global rerouting vessels
-        rerouting = await self._ais.get_rerouting_vessels()
+        # All chokepoints concurrently; each fetch takes the semaphore itself
+        *per_chokepoint, rerouting = await asyncio.gather(
+            *(self._build_reality_snapshot(cp) for cp in SNAPSHOT_CHOKEPOINTS),
+            self._limited(self._ais.get_rerouting_vessels),
+        )
+        all_health = {}
+        for cp, snapshot in zip(SNAPSHOT_CHOKEPOINTS, per_chokepoint):
+            all_health[cp.value] = snapshot.chokepoint_health[cp.value]
 
         # Calculate global disruption
         avg_premium = sum(h.rate_premium_pct for h in all_health.values()) / len(all_health)
@@ -259,22 +393,24 @@ class SignalCorrelator:
             global_disruption_score=round(global_disruption, 3),
         )
 
-    # ========================================================================
-    # INTERNAL METHODS
-    # ========================================================================
-
     async def _build_reality_snapshot(
         self,
         chokepoint: Chokepoint,
     ) -> RealitySnapshot:
-        """Build reality snapshot for a specific chokepoint."""
-        snapshot_id = f"ORACLE-{chokepoint.value}-{datetime.utcnow().strftime('%H%M%S')}"
+        """Reality snapshot for a specific chokepoint (cached, single-flight)."""
+        return await self._snapshots.get_or_load(
+            chokepoint.value, lambda: self._load_chokepoint_snapshot(chokepoint)
+        )
 
-        # Get chokepoint health
-        health = await self._get_chokepoint_health(chokepoint)
+    async def _load_chokepoint_snapshot(
+        self,
+        chokepoint: Chokepoint,
+    ) -> RealitySnapshot:
+        """Fetch and build the snapshot for one chokepoint."""
+        snapshot_id = f"ORACLE-{chokepoint.value}-{datetime.utcnow().strftime('%H%M%S')}"
 
-        # Get rerouting vessels
-        rerouting = await self._ais.get_rerouting_vessels(chokepoint)
+        # Health and rerouting vessels come from the same fetch
+        health, rerouting = await self._limited(self._fetch_chokepoint, chokepoint)
 
         # Calculate disruption score
         rate_factor = min(1.0, health.rate_premium_pct)
@@ -291,11 +427,24 @@ class SignalCorrelator:
             global_disruption_score=round(disruption, 3),
         )
 
+    async def _limited(self, fetch: Callable[..., Awaitable], *args):
+        """Run an upstream fetch under the fetch semaphore."""
+        async with self._fetch_limit:
+            return await fetch(*args)
+
     async def _get_chokepoint_health(
         self,
         chokepoint: Chokepoint,
     ) -> ChokepointHealth:
         """Get health metrics for a chokepoint."""
+        health, _ = await self._fetch_chokepoint(chokepoint)
+        return health
+
+    async def _fetch_chokepoint(
+        self,
+        chokepoint: Chokepoint,
+    ) -> tuple[ChokepointHealth, list[VesselMovement]]:
+        """Fetch health metrics and rerouting vessels for a chokepoint."""
         # Get data in parallel
         vessels_task = self._ais.get_vessels_in_chokepoint(chokepoint)
         waiting_task = self._ais.get_vessels_waiting(chokepoint)
@@ -331,7 +480,7 @@ class SignalCorrelator:
         else:
             disruption_level = "normal"
 
-        return ChokepointHealth(
+        health = ChokepointHealth(
             chokepoint=chokepoint,
             vessels_in_transit=len(vessels),
             vessels_waiting=len(waiting),
@@ -343,6 +492,7 @@ class SignalCorrelator:
             is_operational=(disruption_level != "critical"),
             disruption_level=disruption_level,
         )
+        return health, rerouting
 
     def _calculate_correlation_factors(
         self,
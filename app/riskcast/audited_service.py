@@ -77,7 +77,9 @@ class AuditedRiskCastService:
         self._audit = audit_service
         self._customer_repo = PostgresCustomerRepository(session)
         self._decision_repo = create_decision_repository(session, use_cache=use_cache)
-        self._composer = create_decision_composer()
+        self._composer = create_decision_composer(
+            exposure_index=self._customer_repo.exposure_index,
+        )
         self._use_cache = use_cache
         
         logger.info(
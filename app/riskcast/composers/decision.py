@@ -57,7 +57,12 @@ from app.riskcast.generators import (
     create_action_generator,
     create_tradeoff_analyzer,
 )
-from app.riskcast.matchers import ExposureMatch, ExposureMatcher, create_exposure_matcher
+from app.riskcast.matchers import (
+    ExposureIndex,
+    ExposureMatch,
+    ExposureMatcher,
+    create_exposure_matcher,
+)
 from app.riskcast.schemas.action import ActionSet, TradeOffAnalysis
 from app.riskcast.schemas.customer import CustomerContext
 from app.riskcast.schemas.decision import (
@@ -124,6 +129,7 @@ class DecisionComposer:
         reasoning_engine: Optional["ReasoningEngine"] = None,
         audit_service: Optional["AuditService"] = None,
         calibrator: Optional["PersistentCalibrator"] = None,
+        exposure_index: Optional[ExposureIndex] = None,
     ):
         """
         Initialize decision composer with component dependencies.
@@ -138,8 +144,10 @@ class DecisionComposer:
             reasoning_engine: 6-layer reasoning engine (A1)
             audit_service: Audit trail service (A3)
             calibrator: Persistent calibrator for confidence calibration (A3)
+            exposure_index: Shipment index for the default exposure matcher
+                (e.g. the customer repository's exposure_index)
         """
-        self.exposure_matcher = exposure_matcher or create_exposure_matcher()
+        self.exposure_matcher = exposure_matcher or create_exposure_matcher(index=exposure_index)
         self.impact_calculator = impact_calculator or create_impact_calculator()
         self.action_generator = action_generator or create_action_generator()
         self.tradeoff_analyzer = tradeoff_analyzer or create_tradeoff_analyzer()
@@ -1560,6 +1568,7 @@ def create_decision_composer(
     reasoning_engine: Optional["ReasoningEngine"] = None,
     audit_service: Optional["AuditService"] = None,
     calibrator: Optional["PersistentCalibrator"] = None,
+    exposure_index: Optional[ExposureIndex] = None,
 ) -> DecisionComposer:
     """
     Create decision composer with optional custom dependencies.
@@ -1573,6 +1582,7 @@ def create_decision_composer(
         reasoning_engine: 6-layer reasoning engine (A1)
         audit_service: Audit trail service (A3)
         calibrator: Persistent calibrator (A3)
+        exposure_index: Shipment index for the default exposure matcher
         
     Returns:
         Configured DecisionComposer
@@ -1590,6 +1600,7 @@ def create_decision_composer(
         reasoning_engine=reasoning_engine,
         audit_service=audit_service,
         calibrator=calibrator,
+        exposure_index=exposure_index,
     )
 
 
@@ -1602,6 +1613,7 @@ def create_decision_composer_with_reasoning(
     action_generator: Optional[ActionGenerator] = None,
     tradeoff_analyzer: Optional[TradeOffAnalyzer] = None,
     confidence_communicator: Optional[ConfidenceCommunicator] = None,
+    exposure_index: Optional[ExposureIndex] = None,
 ) -> DecisionComposer:
     """
     Create decision composer with reasoning engine enabled.
@@ -1617,6 +1629,7 @@ def create_decision_composer_with_reasoning(
         action_generator: Custom action generator
         tradeoff_analyzer: Custom tradeoff analyzer
         confidence_communicator: Custom confidence communicator
+        exposure_index: Shipment index for the default exposure matcher
         
     Returns:
         DecisionComposer with reasoning mode enabled
@@ -1645,4 +1658,5 @@ def create_decision_composer_with_reasoning(
         reasoning_engine=reasoning_engine,
         audit_service=audit_service,
         calibrator=calibrator,
+        exposure_index=exposure_index,
     )
@@ -5,5 +5,12 @@ from app.riskcast.matchers.exposure import (
     ExposureMatcher,
     create_exposure_matcher,
 )
+from app.riskcast.matchers.exposure_index import ExposureIndex, IntervalTree
 
-__all__ = ["ExposureMatch", "ExposureMatcher", "create_exposure_matcher"]
+__all__ = [
+    "ExposureIndex",
+    "ExposureMatch",
+    "ExposureMatcher",
+    "IntervalTree",
+    "create_exposure_matcher",
+]
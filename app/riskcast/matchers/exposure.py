@@ -18,6 +18,7 @@ from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.oracle.schemas import CorrelatedIntelligence
 from app.riskcast.constants import ShipmentStatus
+from app.riskcast.matchers.exposure_index import ExposureIndex
 from app.riskcast.schemas.customer import CustomerContext, Shipment
 
 logger = structlog.get_logger(__name__)
@@ -148,6 +149,11 @@ class ExposureMatcher:
     4. Filter by status (not already delivered/cancelled)
     5. Calculate total exposure and confidence
 
+    With an ExposureIndex, steps 2-4 are one interval-tree lookup per
+    customer (O(log n + k)) instead of a timing check on every shipment.
+    The context stays authoritative: an index candidate only matches if it
+    is one of context.active_shipments, and the context's copy is used.
+
     This is the FOUNDATION of personalized decisions.
     """
 
@@ -155,6 +161,7 @@ class ExposureMatcher:
         self,
         timing_buffer_days: int = 7,
         min_confidence: float = 0.3,
+        index: Optional[ExposureIndex] = None,
     ):
         """
         Initialize exposure matcher.
@@ -162,9 +169,11 @@ class ExposureMatcher:
         Args:
             timing_buffer_days: Buffer days for timing overlap check
             min_confidence: Minimum confidence to include a match
+            index: Optional chokepoint/time-window index of shipments
         """
         self.timing_buffer_days = timing_buffer_days
         self.min_confidence = min_confidence
+        self.index = index
 
     def match(
         self,
@@ -194,9 +203,20 @@ class ExposureMatcher:
 
         # 2. Find affected shipments
         affected: list[Shipment] = []
-        for shipment in context.active_shipments:
-            if self._is_affected(shipment, chokepoint, intelligence):
-                affected.append(shipment)
+        if self.index is not None:
+            window_start, window_end = self._event_window(intelligence)
+            active = {s.shipment_id: s for s in context.active_shipments}
+            affected = [
+                active[s.shipment_id]
+                for s in self.index.candidates(
+                    context.profile.customer_id, chokepoint, window_start, window_end
+                )
+                if s.shipment_id in active and not active[s.shipment_id].is_completed
+            ]
+        else:
+            for shipment in context.active_shipments:
+                if self._is_affected(shipment, chokepoint, intelligence):
+                    affected.append(shipment)
 
         # 3. Calculate aggregates
         total_value = sum(s.cargo_value_usd for s in affected)
@@ -309,23 +329,7 @@ class ExposureMatcher:
         Returns:
             True if timing overlaps
         """
-        now = datetime.utcnow()
-        buffer = timedelta(days=self.timing_buffer_days)
-
-        # Get event window from signal
-        event_start = intelligence.signal.temporal.earliest_impact
-        event_end = intelligence.signal.temporal.latest_resolution
-
-        # Default event window if not specified
-        if event_start is None:
-            event_start = now
-        if event_end is None:
-            # If no end specified, assume ongoing for 30 days
-            event_end = now + timedelta(days=30)
-
-        # Add buffer for uncertainty
-        event_start_with_buffer = event_start - buffer
-        event_end_with_buffer = event_end + buffer
+        event_start_with_buffer, event_end_with_buffer = self._event_window(intelligence)
 
         # Check overlap conditions:
         # 1. Shipment arrives AFTER event starts AND
@@ -346,6 +350,36 @@ class ExposureMatcher:
 
         return True
 
+    def _event_window(
+        self,
+        intelligence: CorrelatedIntelligence,
+    ) -> tuple[datetime, datetime]:
+        """
+        Event window widened by the timing buffer.
+
+        Args:
+            intelligence: Intelligence with event timing
+
+        Returns:
+            (start, end) of the buffered event window
+        """
+        now = datetime.utcnow()
+        buffer = timedelta(days=self.timing_buffer_days)
+
+        # Get event window from signal
+        event_start = intelligence.signal.temporal.earliest_impact
+        event_end = intelligence.signal.temporal.latest_resolution
+
+        # Default event window if not specified
+        if event_start is None:
+            event_start = now
+        if event_end is None:
+            # If no end specified, assume ongoing for 30 days
+            event_end = now + timedelta(days=30)
+
+        # Add buffer for uncertainty
+        return event_start - buffer, event_end + buffer
+
     def _compute_confidence(
         self,
         affected: list[Shipment],
@@ -436,8 +470,17 @@ class ExposureMatcher:
         Returns:
             List of ExposureMatch for customers with exposure
         """
+        if self.index is not None:
+            # Only customers with a shipment through the chokepoint can match
+            exposed = set(self.index.customers_exposed_to(
+                intelligence.signal.geographic.primary_chokepoint.value
+            ))
+            candidates = [c for c in contexts if c.profile.customer_id in exposed]
+        else:
+            candidates = contexts
+
         matches = []
-        for context in contexts:
+        for context in candidates:
             match = self.match(intelligence, context)
             if match.has_exposure:
                 matches.append(match)
@@ -457,6 +500,6 @@ class ExposureMatcher:
 # ============================================================================
 
 
-def create_exposure_matcher() -> ExposureMatcher:
+def create_exposure_matcher(index: Optional[ExposureIndex] = None) -> ExposureMatcher:
     """Create default exposure matcher instance."""
-    return ExposureMatcher()
+    return ExposureMatcher(index=index)
@@ -0,0 +1,240 @@
+"""Exposure Index - Chokepoint + time-window index over active shipments.
+
+Answers "which shipments of this customer transit chokepoint X during
+[start, end]?" without scanning the whole book of business.
+
+Structure:
+- One interval tree per (customer_id, chokepoint) over [etd, eta] windows
+- Per chokepoint, a count of indexed shipments per customer (for
+  "which customers are exposed to X?")
+
+The interval tree is a treap (randomized balanced BST) keyed by etd and
+augmented with the max eta of each subtree, so inserts/removes are
+O(log n) expected and an overlap query is O(log n + k).
+
+Only non-completed shipments are indexed; updating a shipment to
+DELIVERED/CANCELLED removes it.
+"""
+
+import random
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+
+import structlog
+
+from app.riskcast.schemas.customer import Shipment
+
+logger = structlog.get_logger(__name__)
+
+
+def _ts(dt: datetime) -> float:
+    """Comparable timestamp; naive datetimes are UTC (datetime.utcnow)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+# ============================================================================
+# INTERVAL TREE
+# ============================================================================
+
+
+class _Node:
+    __slots__ = ("key", "end", "max_end", "priority", "left", "right", "shipment")
+
+    def __init__(self, key: tuple[float, str], end: float, shipment: Shipment):
+        self.key = key
+        self.end = end
+        self.max_end = end
+        self.priority = random.random()
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+        self.shipment = shipment
+
+    def update(self) -> None:
+        m = self.end
+        if self.left is not None and self.left.max_end > m:
+            m = self.left.max_end
+        if self.right is not None and self.right.max_end > m:
+            m = self.right.max_end
+        self.max_end = m
+
+
+def _split(node: Optional[_Node], key: tuple) -> tuple[Optional[_Node], Optional[_Node]]:
+    """Split into (keys < key, keys >= key)."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        node.update()
+        return node, right
+    left, node.left = _split(node.left, key)
+    node.update()
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps where every key in left < every key in right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+class IntervalTree:
+    """
+    Shipments keyed by [etd, eta], supporting overlap queries.
+
+    A shipment overlaps [start, end] when eta >= start and etd <= end
+    (the same rule ExposureMatcher._timing_overlaps applies).
+    """
+
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._keys: dict[str, tuple[float, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, shipment_id: str) -> bool:
+        return shipment_id in self._keys
+
+    def insert(self, shipment: Shipment) -> None:
+        self.remove(shipment.shipment_id)
+        key = (_ts(shipment.etd), shipment.shipment_id)
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, _ts(shipment.eta), shipment)), right)
+        self._keys[shipment.shipment_id] = key
+
+    def remove(self, shipment_id: str) -> bool:
+        key = self._keys.pop(shipment_id, None)
+        if key is None:
+            return False
+        left, rest = _split(self._root, key)
+        _, right = _split(rest, (key[0], key[1] + "\0"))  # drop exactly `key`
+        self._root = _merge(left, right)
+        return True
+
+    def overlapping(self, start: datetime, end: datetime) -> list[Shipment]:
+        """Shipments with eta >= start and etd <= end, ordered by etd."""
+        out: list[Shipment] = []
+        self._collect(self._root, _ts(start), _ts(end), out)
+        return out
+
+    def _collect(self, node: Optional[_Node], start: float, end: float, out: list) -> None:
+        # Prune: nothing in this subtree arrives after `start`
+        if node is None or node.max_end < start:
+            return
+        self._collect(node.left, start, end, out)
+        # Keys are ordered by etd: this node and its right subtree depart too late
+        if node.key[0] > end:
+            return
+        if node.end >= start:
+            out.append(node.shipment)
+        self._collect(node.right, start, end, out)
+
+    def __iter__(self) -> Iterator[Shipment]:
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.shipment
+            node = node.right
+
+
+# ============================================================================
+# EXPOSURE INDEX
+# ============================================================================
+
+
+class ExposureIndex:
+    """
+    Incrementally maintained chokepoint/time-window index of shipments.
+
+    Keep it in sync by calling upsert() on add/update and remove() on
+    delete (InMemoryCustomerRepository does this).
+    """
+
+    def __init__(self, shipments: Iterable[Shipment] = ()):
+        self._trees: dict[tuple[str, str], IntervalTree] = {}
+        self._customers: dict[str, dict[str, int]] = {}  # chokepoint -> customer -> count
+        self._indexed: dict[str, tuple[str, tuple[str, ...]]] = {}  # shipment -> (customer, chokepoints)
+        for shipment in shipments:
+            self.upsert(shipment)
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def __contains__(self, shipment_id: str) -> bool:
+        return shipment_id in self._indexed
+
+    def upsert(self, shipment: Shipment) -> None:
+        """Index (or re-index) a shipment; completed shipments are dropped."""
+        self.remove(shipment.shipment_id)
+        if shipment.is_completed:
+            return
+
+        chokepoints = tuple({cp.lower() for cp in shipment.route_chokepoints})
+        for cp in chokepoints:
+            tree = self._trees.get((shipment.customer_id, cp))
+            if tree is None:
+                tree = self._trees[(shipment.customer_id, cp)] = IntervalTree()
+            tree.insert(shipment)
+            counts = self._customers.setdefault(cp, {})
+            counts[shipment.customer_id] = counts.get(shipment.customer_id, 0) + 1
+        self._indexed[shipment.shipment_id] = (shipment.customer_id, chokepoints)
+
+    def remove(self, shipment_id: str) -> bool:
+        entry = self._indexed.pop(shipment_id, None)
+        if entry is None:
+            return False
+        customer_id, chokepoints = entry
+        for cp in chokepoints:
+            tree = self._trees.get((customer_id, cp))
+            if tree is not None:
+                tree.remove(shipment_id)
+                if not len(tree):
+                    del self._trees[(customer_id, cp)]
+            counts = self._customers.get(cp, {})
+            remaining = counts.get(customer_id, 0) - 1
+            if remaining > 0:
+                counts[customer_id] = remaining
+            else:
+                counts.pop(customer_id, None)
+        return True
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self._customers.clear()
+        self._indexed.clear()
+
+    def candidates(
+        self,
+        customer_id: str,
+        chokepoint: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[Shipment]:
+        """A customer's active shipments through `chokepoint` overlapping [start, end]."""
+        tree = self._trees.get((customer_id, chokepoint.lower()))
+        if tree is None:
+            return []
+        return tree.overlapping(start, end)
+
+    def customers_exposed_to(self, chokepoint: str) -> list[str]:
+        """Customers with at least one active shipment through `chokepoint`."""
+        return list(self._customers.get(chokepoint.lower(), {}))
+
+    def shipments_through(self, customer_id: str, chokepoint: str) -> list[Shipment]:
+        tree = self._trees.get((customer_id, chokepoint.lower()))
+        return list(tree) if tree is not None else []
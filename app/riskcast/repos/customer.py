@@ -9,15 +9,17 @@ Implementations:
 
 import json
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 import structlog
-from sqlalchemy import select, delete, and_
+from sqlalchemy import select, delete, insert, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.riskcast.constants import ShipmentStatus, RiskTolerance, derive_chokepoints
+from app.riskcast.matchers.exposure_index import ExposureIndex
 from app.riskcast.schemas.customer import (
     CustomerContext,
     CustomerProfile,
@@ -78,6 +80,10 @@ class CustomerRepositoryInterface(ABC):
     Allows swapping implementations (in-memory, PostgreSQL, etc.)
     """
 
+    # Chokepoint/ETA-window index over active shipments, for implementations
+    # that keep one in sync (see ExposureMatcher). None: matchers scan.
+    exposure_index: Optional[ExposureIndex] = None
+
     @abstractmethod
     async def get_profile(self, customer_id: str) -> Optional[CustomerProfile]:
         """Get customer profile by ID."""
@@ -166,6 +172,8 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
         self._profiles: dict[str, CustomerProfile] = {}
         self._shipments: dict[str, Shipment] = {}  # shipment_id -> Shipment
         self._customer_shipments: dict[str, set[str]] = {}  # customer_id -> set of shipment_ids
+        # chokepoint + ETA-window index over active shipments (kept in sync below)
+        self.exposure_index = ExposureIndex()
 
     async def get_profile(self, customer_id: str) -> Optional[CustomerProfile]:
         """Get customer profile by ID."""
@@ -197,11 +205,13 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
         contexts = []
         chokepoint_lower = chokepoint.lower()
 
-        for customer_id, profile in self._profiles.items():
+        # Index lookup: only customers with an active shipment through it
+        for customer_id in self.exposure_index.customers_exposed_to(chokepoint_lower):
+            profile = self._profiles.get(customer_id)
             # Check if customer's routes include this chokepoint
-            if profile.has_chokepoint_exposure(chokepoint_lower):
+            if profile and profile.has_chokepoint_exposure(chokepoint_lower):
                 context = await self.get_context(customer_id)
-                if context and context.has_exposure_to(chokepoint_lower):
+                if context:
                     contexts.append(context)
 
         logger.debug(
@@ -263,6 +273,7 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
         shipment_ids = self._customer_shipments.get(customer_id, set())
         for sid in shipment_ids:
             self._shipments.pop(sid, None)
+            self.exposure_index.remove(sid)
 
         # Delete profile
         del self._profiles[customer_id]
@@ -314,6 +325,7 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
 
         self._shipments[shipment.shipment_id] = shipment
         self._customer_shipments[shipment.customer_id].add(shipment.shipment_id)
+        self.exposure_index.upsert(shipment)
 
         logger.info(
             "shipment_added",
@@ -346,6 +358,7 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
 
         updated_shipment = Shipment(**shipment_dict)
         self._shipments[shipment_id] = updated_shipment
+        self.exposure_index.upsert(updated_shipment)
 
         logger.info(
             "shipment_updated",
@@ -366,6 +379,7 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
             self._customer_shipments[customer_id].discard(shipment_id)
 
         del self._shipments[shipment_id]
+        self.exposure_index.remove(shipment_id)
 
         logger.info("shipment_deleted", shipment_id=shipment_id)
         return True
@@ -421,12 +435,18 @@ class InMemoryCustomerRepository(CustomerRepositoryInterface):
         for shipment in self._shipments.values():
             if shipment.customer_id in self._customer_shipments:
                 self._customer_shipments[shipment.customer_id].add(shipment.shipment_id)
+        # Repopulate in place: matchers hold a reference to this index
+        self.exposure_index.clear()
+        for shipment in self._shipments.values():
+            if shipment.customer_id in self._customer_shipments:
+                self.exposure_index.upsert(shipment)
 
     def clear(self) -> None:
         """Clear all data (for testing)."""
         self._profiles.clear()
         self._shipments.clear()
         self._customer_shipments.clear()
+        self.exposure_index.clear()
 
     # ========================================================================
     # SYNCHRONOUS METHODS (for service layer convenience)
@@ -483,23 +503,21 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         """Initialize with database session."""
         self._session = session
 
+    # Statuses that end a shipment's chokepoint exposure
+    _COMPLETED_STATUSES = (ShipmentStatus.DELIVERED.value, ShipmentStatus.CANCELLED.value)
+
     def _profile_from_model(self, model: "CustomerModel") -> CustomerProfile:
         """Convert SQLAlchemy model to Pydantic model."""
         return CustomerProfile(
             customer_id=model.customer_id,
             company_name=model.company_name,
-            industry=model.industry,
             primary_phone=model.primary_phone,
             secondary_phone=model.secondary_phone,
             email=model.email,
             risk_tolerance=RiskTolerance(model.risk_tolerance),
-            notification_enabled=model.notification_enabled,
-            whatsapp_enabled=model.whatsapp_enabled,
-            email_enabled=model.email_enabled,
             primary_routes=model.primary_routes or [],
             relevant_chokepoints=model.relevant_chokepoints or [],
             is_active=model.is_active,
-            tier=model.tier,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -511,24 +529,16 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
             customer_id=model.customer_id,
             origin_port=model.origin_port,
             destination_port=model.destination_port,
-            route_code=model.route_code,
             route_chokepoints=model.route_chokepoints or [],
             cargo_value_usd=model.cargo_value_usd,
             cargo_description=model.cargo_description,
             container_count=model.container_count,
             container_type=model.container_type,
-            hs_code=model.hs_code,
             carrier_code=model.carrier_code,
-            carrier_name=model.carrier_name,
             booking_reference=model.booking_reference,
-            bill_of_lading=model.bill_of_lading,
             etd=model.etd,
             eta=model.eta,
-            actual_departure=model.actual_departure,
-            actual_arrival=model.actual_arrival,
             status=ShipmentStatus(model.status),
-            is_insured=model.is_insured,
-            insurance_value_usd=model.insurance_value_usd,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -574,35 +584,67 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
     async def get_customers_by_chokepoint(
         self, chokepoint: str
     ) -> list[CustomerContext]:
-        """Get all customers with exposure to a chokepoint."""
-        from app.db.models import CustomerModel
+        """
+        Get all customers with exposure to a chokepoint.
+
+        A customer is exposed when the chokepoint is among their relevant
+        chokepoints and at least one active shipment routes through it.
+        Both checks are indexed joins on the chokepoint association
+        tables; only the matching customers' active shipments are loaded.
+        """
+        from app.db.models import (
+            CustomerChokepointModel,
+            CustomerModel,
+            ShipmentChokepointModel,
+            ShipmentModel,
+        )
 
-        # Query customers with this chokepoint in their relevant_chokepoints
-        # JSON contains query varies by database, this is PostgreSQL specific
+        chokepoint_lower = chokepoint.lower()
+        exposed = select(ShipmentChokepointModel.customer_id).where(
+            and_(
+                ShipmentChokepointModel.chokepoint == chokepoint_lower,
+                ShipmentChokepointModel.is_active == True,
+            )
+        )
         result = await self._session.execute(
             select(CustomerModel)
-            .options(selectinload(CustomerModel.shipments))
+            .join(
+                CustomerChokepointModel,
+                and_(
+                    CustomerChokepointModel.customer_id == CustomerModel.customer_id,
+                    CustomerChokepointModel.chokepoint == chokepoint_lower,
+                ),
+            )
             .where(
                 and_(
                     CustomerModel.is_active == True,
-                    CustomerModel.relevant_chokepoints.contains([chokepoint.lower()])
+                    CustomerModel.customer_id.in_(exposed),
                 )
             )
+            .order_by(CustomerModel.customer_id)
         )
         models = result.scalars().all()
 
-        contexts = []
-        for model in models:
-            context = CustomerContext(
+        shipments: dict[str, list[Shipment]] = defaultdict(list)
+        if models:
+            result = await self._session.execute(
+                select(ShipmentModel).where(
+                    and_(
+                        ShipmentModel.customer_id.in_([m.customer_id for m in models]),
+                        ShipmentModel.status.not_in(self._COMPLETED_STATUSES),
+                    )
+                )
+            )
+            for s in result.scalars().all():
+                shipments[s.customer_id].append(self._shipment_from_model(s))
+
+        contexts = [
+            CustomerContext(
                 profile=self._profile_from_model(model),
-                active_shipments=[
-                    self._shipment_from_model(s)
-                    for s in model.shipments
-                    if s.status not in [ShipmentStatus.DELIVERED.value, ShipmentStatus.CANCELLED.value]
-                ],
+                active_shipments=shipments[model.customer_id],
             )
-            if context.has_exposure_to(chokepoint.lower()):
-                contexts.append(context)
+            for model in models
+        ]
 
         logger.debug(
             "customers_by_chokepoint",
@@ -611,6 +653,46 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         )
         return contexts
 
+    async def _sync_customer_chokepoints(
+        self, customer_id: str, chokepoints: list[str]
+    ) -> None:
+        """Rewrite a customer's rows in customer_chokepoints."""
+        from app.db.models import CustomerChokepointModel
+
+        await self._session.execute(
+            delete(CustomerChokepointModel).where(
+                CustomerChokepointModel.customer_id == customer_id
+            )
+        )
+        rows = [
+            {"customer_id": customer_id, "chokepoint": cp}
+            for cp in sorted({c.lower() for c in chokepoints or []})
+        ]
+        if rows:
+            await self._session.execute(insert(CustomerChokepointModel), rows)
+
+    async def _sync_shipment_chokepoints(self, model: "ShipmentModel") -> None:
+        """Rewrite a shipment's rows in shipment_chokepoints."""
+        from app.db.models import ShipmentChokepointModel
+
+        await self._session.execute(
+            delete(ShipmentChokepointModel).where(
+                ShipmentChokepointModel.shipment_id == model.shipment_id
+            )
+        )
+        is_active = model.status not in self._COMPLETED_STATUSES
+        rows = [
+            {
+                "shipment_id": model.shipment_id,
+                "chokepoint": cp,
+                "customer_id": model.customer_id,
+                "is_active": is_active,
+            }
+            for cp in sorted({c.lower() for c in model.route_chokepoints or []})
+        ]
+        if rows:
+            await self._session.execute(insert(ShipmentChokepointModel), rows)
+
     async def create_profile(self, profile: CustomerProfile) -> CustomerProfile:
         """Create a new customer profile."""
         from app.db.models import CustomerModel
@@ -623,22 +705,20 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         model = CustomerModel(
             customer_id=profile.customer_id,
             company_name=profile.company_name,
-            industry=profile.industry,
             primary_phone=profile.primary_phone,
             secondary_phone=profile.secondary_phone,
             email=profile.email,
             risk_tolerance=profile.risk_tolerance.value,
-            notification_enabled=profile.notification_enabled,
-            whatsapp_enabled=profile.whatsapp_enabled,
-            email_enabled=profile.email_enabled,
             primary_routes=profile.primary_routes,
             relevant_chokepoints=profile.relevant_chokepoints,
             is_active=profile.is_active,
-            tier=profile.tier,
         )
 
         self._session.add(model)
         await self._session.flush()
+        await self._sync_customer_chokepoints(
+            profile.customer_id, profile.relevant_chokepoints
+        )
 
         logger.info(
             "customer_created",
@@ -672,6 +752,10 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         model.updated_at = datetime.utcnow()
 
         await self._session.flush()
+        if "relevant_chokepoints" in updates:
+            await self._sync_customer_chokepoints(
+                customer_id, model.relevant_chokepoints
+            )
 
         logger.info(
             "customer_updated",
@@ -683,7 +767,11 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
 
     async def delete_profile(self, customer_id: str) -> bool:
         """Delete customer profile and all shipments."""
-        from app.db.models import CustomerModel
+        from app.db.models import (
+            CustomerChokepointModel,
+            CustomerModel,
+            ShipmentChokepointModel,
+        )
 
         result = await self._session.execute(
             select(CustomerModel).where(CustomerModel.customer_id == customer_id)
@@ -693,6 +781,11 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         if not model:
             return False
 
+        # Explicit rather than relying on ON DELETE CASCADE (off in SQLite)
+        for table in (ShipmentChokepointModel, CustomerChokepointModel):
+            await self._session.execute(
+                delete(table).where(table.customer_id == customer_id)
+            )
         await self._session.delete(model)
         await self._session.flush()
 
@@ -758,20 +851,16 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
             cargo_description=shipment.cargo_description,
             container_count=shipment.container_count,
             container_type=shipment.container_type,
-            hs_code=shipment.hs_code,
             carrier_code=shipment.carrier_code,
-            carrier_name=shipment.carrier_name,
             booking_reference=shipment.booking_reference,
-            bill_of_lading=shipment.bill_of_lading,
             etd=shipment.etd,
             eta=shipment.eta,
             status=shipment.status.value,
-            is_insured=shipment.is_insured,
-            insurance_value_usd=shipment.insurance_value_usd,
         )
 
         self._session.add(model)
         await self._session.flush()
+        await self._sync_shipment_chokepoints(model)
 
         logger.info(
             "shipment_added",
@@ -814,6 +903,7 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         model.updated_at = datetime.utcnow()
 
         await self._session.flush()
+        await self._sync_shipment_chokepoints(model)
 
         logger.info(
             "shipment_updated",
@@ -825,7 +915,7 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
 
     async def delete_shipment(self, shipment_id: str) -> bool:
         """Delete a shipment."""
-        from app.db.models import ShipmentModel
+        from app.db.models import ShipmentChokepointModel, ShipmentModel
 
         result = await self._session.execute(
             select(ShipmentModel).where(ShipmentModel.shipment_id == shipment_id)
@@ -835,6 +925,11 @@ class PostgresCustomerRepository(CustomerRepositoryInterface):
         if not model:
             return False
 
+        await self._session.execute(
+            delete(ShipmentChokepointModel).where(
+                ShipmentChokepointModel.shipment_id == shipment_id
+            )
+        )
         await self._session.delete(model)
         await self._session.flush()
 
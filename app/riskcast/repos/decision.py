@@ -8,8 +8,10 @@ Implementations:
 - CachedDecisionRepository: PostgreSQL + Redis caching
 """
 
+import base64
 import json
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 import uuid
@@ -45,6 +47,58 @@ class DuplicateDecisionError(Exception):
         super().__init__(f"Decision already exists: {decision_id}")
 
 
+# ============================================================================
+# SUMMARY QUERIES
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class DecisionSummaryRow:
+    """Summary columns of a decision, projected without the Q1-Q7 payloads."""
+
+    decision_id: str
+    customer_id: str
+    signal_id: Optional[str]
+    chokepoint: str
+    severity: str
+    urgency: str
+    recommended_action: str
+    action_cost_usd: float
+    exposure_usd: float
+    potential_loss_usd: float
+    potential_delay_days: float
+    confidence_score: float
+    valid_until: datetime
+    created_at: datetime
+    headline: str
+    action_summary: str
+
+
+@dataclass(frozen=True)
+class DecisionPage:
+    """One page of decision summaries."""
+
+    items: list[DecisionSummaryRow]
+    next_cursor: Optional[str]  # None on the last page
+    total: Optional[int]  # None when include_total=False
+
+
+def encode_decision_cursor(created_at: datetime, decision_id: str) -> str:
+    """Opaque keyset cursor for the (created_at, decision_id) position."""
+    raw = f"{created_at.isoformat()}|{decision_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_decision_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of encode_decision_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, decision_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), decision_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
 # ============================================================================
 # ABSTRACT REPOSITORY INTERFACE
 # ============================================================================
@@ -94,6 +148,21 @@ class DecisionRepositoryInterface(ABC):
         """Get active (non-expired) decisions with pagination."""
         pass
 
+    @abstractmethod
+    async def list_summaries(
+        self,
+        customer_id: Optional[str] = None,
+        chokepoint: Optional[str] = None,
+        severity: Optional[str] = None,
+        active_only: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        include_total: bool = True,
+    ) -> DecisionPage:
+        """List decision summaries, newest first, with filters applied in the query."""
+        pass
+
     @abstractmethod
     async def update(
         self,
@@ -327,6 +396,122 @@ class PostgresDecisionRepository(DecisionRepositoryInterface):
         decisions = [self._decision_from_model(m) for m in models]
         return decisions, total
 
+    async def list_summaries(
+        self,
+        customer_id: Optional[str] = None,
+        chokepoint: Optional[str] = None,
+        severity: Optional[str] = None,
+        active_only: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        include_total: bool = True,
+    ) -> DecisionPage:
+        """
+        List decision summaries, newest first.
+
+        All filters run in SQL and only the summary columns are selected
+        (headline/action_summary are extracted from the JSON in the
+        database), so no Q1-Q7 payload is loaded.
+
+        Pagination: pass the previous page's next_cursor to continue. The
+        cursor is a (created_at, decision_id) keyset position, so deep
+        pages cost the same as the first. offset is only applied when no
+        cursor is given.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        from app.db.models import DecisionModel
+
+        conditions = []
+        if active_only:
+            conditions.append(DecisionModel.is_expired == False)
+            conditions.append(DecisionModel.valid_until > datetime.utcnow())
+        if customer_id:
+            conditions.append(DecisionModel.customer_id == customer_id)
+        if chokepoint:
+            conditions.append(DecisionModel.chokepoint == chokepoint.lower())
+        if severity:
+            conditions.append(DecisionModel.severity == severity)
+
+        total = None
+        if include_total:
+            count_query = select(func.count(DecisionModel.id))
+            if conditions:
+                count_query = count_query.where(and_(*conditions))
+            total = (await self._session.execute(count_query)).scalar_one()
+
+        query = select(
+            DecisionModel.decision_id,
+            DecisionModel.customer_id,
+            DecisionModel.signal_id,
+            DecisionModel.chokepoint,
+            DecisionModel.severity,
+            DecisionModel.urgency,
+            DecisionModel.recommended_action,
+            DecisionModel.action_cost_usd,
+            DecisionModel.exposure_usd,
+            DecisionModel.potential_loss_usd,
+            DecisionModel.potential_delay_days,
+            DecisionModel.confidence_score,
+            DecisionModel.valid_until,
+            DecisionModel.created_at,
+            DecisionModel.q1_what["event_summary"].as_string().label("headline"),
+            DecisionModel.q5_action["action_summary"].as_string().label("action_summary"),
+        )
+        page_conditions = list(conditions)
+        if cursor:
+            after_created, after_id = decode_decision_cursor(cursor)
+            page_conditions.append(
+                or_(
+                    DecisionModel.created_at < after_created,
+                    and_(
+                        DecisionModel.created_at == after_created,
+                        DecisionModel.decision_id < after_id,
+                    ),
+                )
+            )
+        if page_conditions:
+            query = query.where(and_(*page_conditions))
+        query = query.order_by(
+            DecisionModel.created_at.desc(),
+            DecisionModel.decision_id.desc(),
+        )
+        if not cursor and offset:
+            query = query.offset(offset)
+
+        # One extra row tells us whether there is a next page
+        rows = (await self._session.execute(query.limit(limit + 1))).all()
+        items = [
+            DecisionSummaryRow(
+                decision_id=row.decision_id,
+                customer_id=row.customer_id,
+                signal_id=row.signal_id,
+                chokepoint=row.chokepoint,
+                severity=row.severity,
+                urgency=row.urgency,
+                recommended_action=row.recommended_action,
+                action_cost_usd=row.action_cost_usd or 0.0,
+                exposure_usd=row.exposure_usd,
+                potential_loss_usd=row.potential_loss_usd or 0.0,
+                potential_delay_days=row.potential_delay_days or 0.0,
+                confidence_score=row.confidence_score,
+                valid_until=row.valid_until,
+                created_at=row.created_at,
+                headline=row.headline or "",
+                action_summary=row.action_summary or "",
+            )
+            for row in rows[:limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_decision_cursor(last.created_at, last.decision_id)
+
+        return DecisionPage(items=items, next_cursor=next_cursor, total=total)
+
     async def update(
         self,
         decision_id: str,
@@ -588,6 +773,28 @@ class CachedDecisionRepository(DecisionRepositoryInterface):
     ) -> tuple[List[DecisionObject], int]:
         return await self._postgres.get_active(customer_id, limit, offset)
 
+    async def list_summaries(
+        self,
+        customer_id: Optional[str] = None,
+        chokepoint: Optional[str] = None,
+        severity: Optional[str] = None,
+        active_only: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        include_total: bool = True,
+    ) -> DecisionPage:
+        return await self._postgres.list_summaries(
+            customer_id=customer_id,
+            chokepoint=chokepoint,
+            severity=severity,
+            active_only=active_only,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+
     async def update(
         self,
         decision_id: str,
@@ -36,6 +36,7 @@ from app.riskcast.repos.decision import (
     CachedDecisionRepository,
     create_decision_repository,
     DecisionNotFoundError,
+    DecisionPage,
 )
 from app.riskcast.schemas.customer import CustomerContext
 from app.riskcast.schemas.decision import DecisionObject
@@ -119,7 +120,9 @@ class AsyncRiskCastService:
                 self._audit_service = AuditService(InMemoryAuditRepository())
             
             # Create audited decision composer
-            base_composer = create_decision_composer()
+            base_composer = create_decision_composer(
+                exposure_index=self._customer_repo.exposure_index,
+            )
             self._composer = AuditedDecisionComposer(
                 audit_service=self._audit_service,
                 decision_composer=base_composer,
@@ -136,7 +139,9 @@ class AsyncRiskCastService:
                 config_version=config_version,
             )
         else:
-            self._composer = create_decision_composer()
+            self._composer = create_decision_composer(
+                exposure_index=self._customer_repo.exposure_index,
+            )
             logger.warning("audit_trail_disabled")
 
     # ========================================================================
@@ -377,6 +382,34 @@ class AsyncRiskCastService:
             customer_id=customer_id, limit=limit, offset=offset
         )
 
+    async def list_decision_summaries(
+        self,
+        customer_id: Optional[str] = None,
+        chokepoint: Optional[str] = None,
+        severity: Optional[str] = None,
+        active_only: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        include_total: bool = True,
+    ) -> DecisionPage:
+        """
+        List decision summaries with filtering and keyset pagination in SQL.
+
+        Prefer this over get_active_decisions for listings: it loads only
+        the summary columns instead of hydrating full DecisionObjects.
+        """
+        return await self._decision_repo.list_summaries(
+            customer_id=customer_id,
+            chokepoint=chokepoint,
+            severity=severity,
+            active_only=active_only,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+
     # ========================================================================
     # FEEDBACK & TRACKING (with audit trail)
     # ========================================================================
@@ -774,7 +807,9 @@ class RiskCastService:
     ):
         """Initialize sync service."""
         self._customer_repo = customer_repository or create_customer_repository()
-        self._composer = decision_composer or create_decision_composer()
+        self._composer = decision_composer or create_decision_composer(
+            exposure_index=self._customer_repo.exposure_index,
+        )
         self._decisions: dict[str, DecisionObject] = {}
         self._by_customer: dict[str, list[str]] = {}
         self._by_signal: dict[str, list[str]] = {}
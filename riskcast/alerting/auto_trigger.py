@@ -15,6 +15,11 @@ from typing import Optional
 import structlog
 
 from riskcast.alerting.channels import ChannelRouter
+from riskcast.alerting.delivery import (
+    AlertDeliveryQueue,
+    get_delivery_queue,
+    start_delivery_queue,
+)
 from riskcast.alerting.engine import AlertEngine
 from riskcast.alerting.schemas import (
     AlertChannel,
@@ -121,6 +126,28 @@ def _mark_fired(rule_id: str):
     _last_fired[rule_id] = datetime.utcnow()
 
 
+# ── Delivery ──────────────────────────────────────────────────────────────
+
+def start_alert_delivery() -> AlertDeliveryQueue:
+    """Start background delivery workers for auto-triggered alerts (app lifespan)."""
+    return start_delivery_queue(_router)
+
+
+async def _deliver(alert: AlertRecord, channel_configs: dict[str, dict]) -> dict[str, dict]:
+    """
+    Hand the alert to the outbound queue when it is running, so rule
+    evaluation never waits on webhook latency; otherwise (or when the
+    queue is full) deliver inline.
+    """
+    queue = get_delivery_queue()
+    if queue is not None and queue.submit(alert, channel_configs):
+        return {
+            ch.value: {"success": None, "detail": "queued", "queued": True}
+            for ch in alert.channels
+        }
+    return await _router.dispatch_alert(alert, channel_configs)
+
+
 # ── Channel config builder ───────────────────────────────────────────────
 
 async def _build_channel_configs(company_id: str = "") -> dict[str, dict]:
@@ -295,7 +322,7 @@ async def on_decision_generated(
                 alert.title += f" — ${inaction:,.0f} đang gặp nguy"
 
             # Dispatch to channels
-            results = await _router.dispatch_alert(alert, channel_configs)
+            results = await _deliver(alert, channel_configs)
             alert.delivery_results = results
 
             _mark_fired(rule.rule_id)
@@ -391,7 +418,7 @@ async def on_signal_ingested(
 
             alert.title = f"📡 {cat_vi} — Mức {severity_score:.0f}/100"
 
-            results = await _router.dispatch_alert(alert, channel_configs)
+            results = await _deliver(alert, channel_configs)
             alert.delivery_results = results
             _mark_fired(rule.rule_id)
             fired.append(alert)
@@ -446,7 +473,7 @@ async def on_scan_completed(
         triggered_at=datetime.utcnow().isoformat(),
     )
 
-    results = await _router.dispatch_alert(alert, channel_configs)
+    results = await _deliver(alert, channel_configs)
     alert.delivery_results = results
 
     logger.info(
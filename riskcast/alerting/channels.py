@@ -6,15 +6,20 @@ Each channel is independent and fault-tolerant:
 - Email: Send via SMTP (async)
 - In-App: Store in DB for frontend polling
 
+Webhooks reuse pooled per-host clients (see delivery.HostClientPool), and
+ChannelRouter sends all channels of an alert — and many alerts — concurrently.
 All dispatches are logged and tracked.
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from typing import Optional, Protocol
 
+import httpx
 import structlog
 
+from riskcast.alerting.delivery import HostClientPool, get_http_pool
 from riskcast.alerting.schemas import AlertChannel, AlertRecord, AlertStatus
 
 logger = structlog.get_logger(__name__)
@@ -37,10 +42,15 @@ class WebhookDispatcher:
     """
     Dispatch alerts via HTTP webhook.
 
-    Posts a JSON payload to the configured webhook URL.
-    Includes SSRF protection via URL validation.
+    Posts a JSON payload to the configured webhook URL over a pooled,
+    keep-alive client for that host. Includes SSRF protection via URL
+    validation. Failed results carry ``retryable`` for 429/5xx/transport
+    errors so the delivery queue knows what to retry.
     """
 
+    def __init__(self, pool: Optional[HostClientPool] = None):
+        self._pool = pool
+
     async def dispatch(self, alert: AlertRecord, config: dict) -> dict:
         """
         Send alert to webhook URL.
@@ -64,32 +74,40 @@ class WebhookDispatcher:
         payload = self._build_payload(url, alert)
 
         timeout = config.get("timeout", 10)
-        headers = config.get("headers", {})
+        headers = dict(config.get("headers", {}))
         headers.setdefault("Content-Type", "application/json")
 
+        pool = self._pool or get_http_pool()
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                if response.status_code < 400:
-                    logger.info(
-                        "webhook_alert_sent",
-                        alert_id=alert.alert_id,
-                        url=url,
-                        status=response.status_code,
-                    )
-                    return {"success": True, "detail": f"HTTP {response.status_code}"}
-                else:
-                    logger.warning(
-                        "webhook_alert_failed",
-                        alert_id=alert.alert_id,
-                        url=url,
-                        status=response.status_code,
-                    )
-                    return {"success": False, "detail": f"HTTP {response.status_code}"}
+            async with pool.acquire(url) as client:
+                response = await client.post(url, json=payload, headers=headers, timeout=timeout)
+            if response.status_code < 400:
+                logger.info(
+                    "webhook_alert_sent",
+                    alert_id=alert.alert_id,
+                    url=url,
+                    status=response.status_code,
+                )
+                return {"success": True, "detail": f"HTTP {response.status_code}"}
+            else:
+                logger.warning(
+                    "webhook_alert_failed",
+                    alert_id=alert.alert_id,
+                    url=url,
+                    status=response.status_code,
+                )
+                return {
+                    "success": False,
+                    "detail": f"HTTP {response.status_code}",
+                    "retryable": response.status_code == 429 or response.status_code >= 500,
+                }
         except Exception as e:
             logger.error("webhook_dispatch_error", alert_id=alert.alert_id, error=str(e))
-            return {"success": False, "detail": str(e)}
+            return {
+                "success": False,
+                "detail": str(e),
+                "retryable": isinstance(e, httpx.TransportError),
+            }
 
 
     # ── Payload builders ───────────────────────────────────────────
@@ -364,50 +382,73 @@ class ChannelRouter:
     Dispatches to all configured channels in parallel.
     """
 
-    def __init__(self):
+    def __init__(self, max_concurrent_alerts: int = 32):
         self._dispatchers: dict[AlertChannel, ChannelDispatcher] = {
             AlertChannel.WEBHOOK: WebhookDispatcher(),
             AlertChannel.EMAIL: EmailDispatcher(),
             AlertChannel.IN_APP: InAppDispatcher(),
         }
+        self.max_concurrent_alerts = max_concurrent_alerts
 
     async def dispatch_alert(
         self,
         alert: AlertRecord,
         channel_configs: dict[str, dict],
+        channels: Optional[list[AlertChannel]] = None,
     ) -> dict[str, dict]:
         """
-        Dispatch an alert to all its configured channels.
+        Dispatch an alert to all its configured channels concurrently.
 
         Args:
             alert: The alert to dispatch
             channel_configs: Dict of channel_name → config dict
+            channels: Subset of ``alert.channels`` to send (used for retries)
 
         Returns:
             Dict of channel_name → delivery result
         """
-        results: dict[str, dict] = {}
+        targets = list(channels if channels is not None else alert.channels)
+        results = await asyncio.gather(
+            *(self._dispatch_channel(alert, ch, channel_configs) for ch in targets)
+        )
+        return {ch.value: result for ch, result in zip(targets, results)}
 
-        for channel in alert.channels:
-            dispatcher = self._dispatchers.get(channel)
-            if not dispatcher:
-                results[channel.value] = {
-                    "success": False,
-                    "detail": f"Unknown channel: {channel}",
-                }
-                continue
+    async def dispatch_many(
+        self,
+        alerts: list[tuple[AlertRecord, dict[str, dict]]],
+    ) -> list[dict[str, dict]]:
+        """
+        Dispatch many alerts concurrently (bounded by ``max_concurrent_alerts``).
 
-            config = channel_configs.get(channel.value, {})
-            try:
-                result = await dispatcher.dispatch(alert, config)
-                results[channel.value] = result
-            except Exception as e:
-                logger.error(
-                    "channel_dispatch_error",
-                    channel=channel.value,
-                    alert_id=alert.alert_id,
-                    error=str(e),
-                )
-                results[channel.value] = {"success": False, "detail": str(e)}
+        Per-host limits still apply on top via the shared HostClientPool.
+        Results are returned in input order.
+        """
+        gate = asyncio.Semaphore(self.max_concurrent_alerts)
+
+        async def _one(alert: AlertRecord, configs: dict[str, dict]) -> dict[str, dict]:
+            async with gate:
+                return await self.dispatch_alert(alert, configs)
+
+        return list(await asyncio.gather(*(_one(a, c) for a, c in alerts)))
+
+    async def _dispatch_channel(
+        self,
+        alert: AlertRecord,
+        channel: AlertChannel,
+        channel_configs: dict[str, dict],
+    ) -> dict:
+        dispatcher = self._dispatchers.get(channel)
+        if not dispatcher:
+            return {"success": False, "detail": f"Unknown channel: {channel}"}
 
-        return results
+        config = channel_configs.get(channel.value, {})
+        try:
+            return await dispatcher.dispatch(alert, config)
+        except Exception as e:
+            logger.error(
+                "channel_dispatch_error",
+                channel=channel.value,
+                alert_id=alert.alert_id,
+                error=str(e),
+            )
+            return {"success": False, "detail": str(e)}
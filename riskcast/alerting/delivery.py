@@ -0,0 +1,275 @@
+"""
+Alert Delivery — pooled HTTP clients and a bounded outbound queue.
+
+- HostClientPool: one keep-alive httpx.AsyncClient per destination host
+  (Discord, Slack, customer webhooks), with a per-host concurrency cap so
+  a burst of alerts cannot open hundreds of sockets to the same host.
+- AlertDeliveryQueue: bounded queue + worker tasks that call
+  ChannelRouter.dispatch_alert. Alert generation only enqueues; delivery
+  latency and retries (exponential backoff on retryable failures) happen
+  on the workers. When the queue is full, callers fall back to inline
+  delivery instead of dropping the alert. On stop, scheduled retries are
+  put back on the queue and get one final attempt during the drain.
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+
+from riskcast.alerting.schemas import AlertChannel, AlertRecord
+
+if TYPE_CHECKING:
+    from riskcast.alerting.channels import ChannelRouter
+
+logger = structlog.get_logger(__name__)
+
+
+# ── Pooled HTTP clients ───────────────────────────────────────────────────
+
+
+class HostClientPool:
+    """Shared, lazily created httpx clients keyed by scheme://host:port."""
+
+    def __init__(
+        self,
+        max_per_host: int = 8,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    @asynccontextmanager
+    async def acquire(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the host's client, waiting for one of its concurrency slots."""
+        key = self.host_key(url)
+        slots = self._slots.setdefault(key, asyncio.Semaphore(self.max_per_host))
+        async with slots:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    transport=self._transport,
+                    limits=httpx.Limits(
+                        max_connections=self.max_per_host,
+                        max_keepalive_connections=self.max_per_host,
+                    ),
+                )
+                self._clients[key] = client
+            yield client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        self._slots = {}
+        for client in clients.values():
+            await client.aclose()
+
+
+_pool: Optional[HostClientPool] = None
+
+
+def get_http_pool() -> HostClientPool:
+    """Process-wide client pool used by WebhookDispatcher."""
+    global _pool
+    if _pool is None:
+        _pool = HostClientPool()
+    return _pool
+
+
+async def close_http_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+
+
+# ── Outbound queue ────────────────────────────────────────────────────────
+
+
+@dataclass
+class _Delivery:
+    alert: AlertRecord
+    configs: dict[str, dict]
+    channels: list[AlertChannel]
+    attempt: int = 0
+    results: dict[str, dict] = field(default_factory=dict)
+
+
+class AlertDeliveryQueue:
+    """Bounded, retrying delivery queue in front of a ChannelRouter."""
+
+    def __init__(
+        self,
+        router: "ChannelRouter",
+        maxsize: int = 1000,
+        workers: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        self.router = router
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue[_Delivery] = asyncio.Queue(maxsize=maxsize)
+        self._num_workers = workers
+        self._workers: list[asyncio.Task] = []
+        self._pending_retries: dict[asyncio.TimerHandle, _Delivery] = {}
+        self._stopping = False
+        self.delivered = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"alert-delivery-{i}")
+            for i in range(self._num_workers)
+        ]
+        logger.info("alert_delivery_queue_started", workers=self._num_workers)
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """
+        Drain what is queued (bounded by ``drain_timeout``), then stop workers.
+
+        Scheduled retries are requeued for a final attempt instead of waiting
+        out their backoff; no further retries are scheduled while stopping.
+        """
+        self._stopping = True
+        retries, self._pending_retries = self._pending_retries, {}
+        requeued = 0
+        for handle, item in retries.items():
+            handle.cancel()
+            try:
+                self._queue.put_nowait(item)
+                requeued += 1
+            except asyncio.QueueFull:
+                self.failed += 1
+        if retries:
+            logger.info(
+                "alert_delivery_retries_flushed",
+                requeued=requeued,
+                dropped=len(retries) - requeued,
+            )
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("alert_delivery_drain_timeout", pending=self._queue.qsize())
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, alert: AlertRecord, configs: dict[str, dict]) -> bool:
+        """Enqueue an alert for delivery. Returns False when the queue is full."""
+        try:
+            self._queue.put_nowait(_Delivery(alert, configs, list(alert.channels)))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("alert_delivery_queue_full", alert_id=alert.alert_id)
+            return False
+
+    async def join(self) -> None:
+        """Wait until everything submitted so far (incl. retries) is processed."""
+        while True:
+            await self._queue.join()
+            if not self._pending_retries:
+                return
+            await asyncio.sleep(self.base_delay / 2)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return delay + random.uniform(0, delay * 0.1)
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._deliver(item)
+            except Exception as e:
+                logger.error("alert_delivery_worker_error", alert_id=item.alert.alert_id, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, item: _Delivery) -> None:
+        results = await self.router.dispatch_alert(item.alert, item.configs, channels=item.channels)
+        item.results.update(results)
+        item.alert.delivery_results = dict(item.results)
+
+        retry = [
+            ch for ch in item.channels
+            if results.get(ch.value, {}).get("retryable")
+        ]
+        if retry and item.attempt < self.max_retries and not self._stopping:
+            delay = self._backoff(item.attempt)
+            logger.warning(
+                "alert_delivery_retry",
+                alert_id=item.alert.alert_id,
+                channels=[c.value for c in retry],
+                attempt=item.attempt + 1,
+                delay=round(delay, 2),
+            )
+            nxt = _Delivery(item.alert, item.configs, retry, item.attempt + 1, item.results)
+            self._schedule_retry(nxt, delay)
+            return
+
+        if all(r.get("success") for r in item.results.values()):
+            self.delivered += 1
+        else:
+            self.failed += 1
+
+    def _schedule_retry(self, item: _Delivery, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+
+        def _requeue() -> None:
+            self._pending_retries.pop(handle, None)
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.failed += 1
+                logger.warning("alert_retry_dropped_queue_full", alert_id=item.alert.alert_id)
+
+        handle = loop.call_later(delay, _requeue)
+        self._pending_retries[handle] = item
+
+
+_queue: Optional[AlertDeliveryQueue] = None
+
+
+def get_delivery_queue() -> Optional[AlertDeliveryQueue]:
+    """The running queue, or None when delivery is inline (tests, scripts)."""
+    return _queue if _queue is not None and _queue.running else None
+
+
+def start_delivery_queue(router: "ChannelRouter", **kwargs) -> AlertDeliveryQueue:
+    global _queue
+    if _queue is None:
+        _queue = AlertDeliveryQueue(router, **kwargs)
+    _queue.start()
+    return _queue
+
+
+async def stop_delivery_queue() -> None:
+    global _queue
+    if _queue is not None:
+        await _queue.stop()
+        _queue = None
@@ -207,7 +207,7 @@ async def evaluate_alerts(
         rules, body.metrics, body.entity_type, body.entity_id
     )
 
-    sent: list[AlertRecord] = []
+    to_send: list[AlertRecord] = []
     for alert in fired:
         # Find matching rule for cooldown config
         rule = next((r for r in rules if r.rule_id == alert.rule_id), None)
@@ -220,15 +220,23 @@ async def evaluate_alerts(
             alert.status = AlertStatus.SUPPRESSED
             alert.delivery_results = {"suppressed": True, "reason": reason}
         else:
-            # Dispatch to channels
-            channel_configs = _build_channel_configs()
-            delivery = await _channels.dispatch_alert(alert, channel_configs)
+            to_send.append(alert)
+            _dedup.record_fired(alert)
+
+    # Dispatch all unsuppressed alerts concurrently (dispatch never raises)
+    if to_send:
+        channel_configs = _build_channel_configs()
+        deliveries = await _channels.dispatch_many(
+            [(alert, channel_configs) for alert in to_send]
+        )
+        for alert, delivery in zip(to_send, deliveries):
             alert.delivery_results = delivery
             alert.status = AlertStatus.SENT
             alert.sent_at = datetime.utcnow().isoformat()
-            _dedup.record_fired(alert)
 
-        # Persist
+    # Persist
+    sent: list[AlertRecord] = []
+    for alert in fired:
         alert_model = Alert(
             id=uuid.uuid4(),
             alert_id=alert.alert_id,
@@ -83,4 +83,6 @@ async def check_integrity(
         total_entries=report["total_entries"],
         chain_intact=report["chain_intact"],
         breaks_found=report.get("breaks_found", 0),
+        verified_entries=report.get("verified_entries", 0),
+        checkpoint_seq=report.get("checkpoint_seq"),
     )
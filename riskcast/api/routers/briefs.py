@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from riskcast.api.deps import get_company_id, get_db, get_user_id
 from riskcast.db import queries as db_queries
 from riskcast.db.models import MorningBrief
-from riskcast.services.llm_gateway import LLMGateway
+from riskcast.services.llm_gateway import build_llm_gateway
 from riskcast.services.morning_brief import MorningBriefGenerator
 from riskcast.services.sse_manager import sse_manager
 
@@ -39,7 +39,7 @@ async def get_today_brief(
         return brief
 
     # Generate on-demand
-    llm = LLMGateway()
+    llm = build_llm_gateway()
     generator = MorningBriefGenerator(llm=llm, sse_manager=sse_manager)
     brief = await generator.generate(db, cid)
 
@@ -34,7 +34,18 @@ router = APIRouter(prefix="/api/v1/chat", tags=["chat"])
 # Service singletons (initialized once, reused)
 _llm = LLMGateway()
 _omen = OmenClient(base_url=settings.omen_url)
-_context_builder = ContextBuilder(llm=_llm, omen_client=_omen)
+
+
+def _context_session() -> AsyncSession:
+    """Fresh session per context lookup so ContextBuilder can run them concurrently."""
+    from riskcast.db.engine import get_session_factory
+
+    return get_session_factory()()
+
+
+_context_builder = ContextBuilder(
+    llm=_llm, omen_client=_omen, session_factory=_context_session
+)
 _suggestion_extractor = SuggestionExtractor()
 
 
@@ -99,17 +110,12 @@ async def send_message(
             return
 
         # Save assistant response
-        from riskcast.db.engine import get_session_factory
+        from riskcast.db.engine import get_session_factory, set_tenant_context
 
         factory = get_session_factory()
         async with factory() as save_session:
             # SET tenant context for PostgreSQL RLS (skip on SQLite)
-            if "postgresql" in settings.async_database_url:
-                from sqlalchemy import text
-                await save_session.execute(
-                    text("SET LOCAL app.current_company_id = :cid"),
-                    {"cid": cid},
-                )
+            await set_tenant_context(save_session, cid)
 
             msg = await db_queries.save_message(
                 save_session,
@@ -122,6 +128,8 @@ async def send_message(
                     "data_keys": list(context.data_summary.keys()),
                     "intent_method": context.intent.get("method", "unknown"),
                     "intent_type": context.intent.get("type", "unknown"),
+                    "timings_ms": context.timings_ms,
+                    "degraded_steps": context.degraded_steps,
                 },
             )
 
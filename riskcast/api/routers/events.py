@@ -9,11 +9,15 @@ Client usage:
 
 Auth via query param token (v1). Will move to cookie auth in v2.
 EventSource API does not support custom headers.
+
+Resume: EventSource sends Last-Event-ID on reconnect; missed events still
+in the replay ring are sent first.
 """
 
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request
 from fastapi.responses import StreamingResponse
 
 from riskcast.api.deps import get_company_id
@@ -26,6 +30,7 @@ router = APIRouter(prefix="/api/v1/events", tags=["events"])
 async def event_stream(
     request: Request,
     company_id: uuid.UUID = Depends(get_company_id),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
 ):
     """
     SSE notification stream for the current tenant.
@@ -35,8 +40,9 @@ async def event_stream(
     - signal_alert: high-severity signal detected
     - scan_completed: signal scan finished
     """
+    resume_from = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
     return StreamingResponse(
-        sse_manager.subscribe(str(company_id)),
+        sse_manager.subscribe(str(company_id), last_event_id=resume_from),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
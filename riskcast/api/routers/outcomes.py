@@ -32,9 +32,9 @@ from riskcast.outcomes.schemas import (
 router = APIRouter(prefix="/api/v1/outcomes", tags=["outcomes"])
 
 _recorder = OutcomeRecorder()
-_accuracy = AccuracyCalculator()
-_roi = ROICalculator()
-_flywheel = FlywheelEngine()
+_accuracy = AccuracyCalculator(use_rollup=True)
+_roi = ROICalculator(use_rollup=True)
+_flywheel = FlywheelEngine(use_rollup=True)
 
 
 class RecordOutcomeBody(BaseModel):
@@ -28,6 +28,7 @@ from riskcast.config import settings
 from riskcast.db.models import Order, Route, Signal
 from riskcast.decisions.engine import DecisionEngine
 from riskcast.decisions.schemas import Decision
+from riskcast.services.chokepoint_detector import CHOKEPOINT_KEYWORDS, default_detector  # noqa: F401
 from riskcast.services.omen_client import OmenClient, OmenSignal
 from riskcast.services.signal_service import SignalService
 
@@ -36,33 +37,6 @@ router = APIRouter(prefix="/api/v1/pipeline", tags=["pipeline"])
 
 # ── Chokepoint keyword detection ──────────────────────────────────────
 
-CHOKEPOINT_KEYWORDS: dict[str, list[str]] = {
-    "RED_SEA": [
-        "red sea", "houthi", "bab-el-mandeb", "bab el mandeb", "yemen",
-        "aden", "gulf of aden",
-    ],
-    "SUEZ": [
-        "suez", "suez canal", "ever given", "canal blockage",
-    ],
-    "MALACCA": [
-        "malacca", "strait of malacca", "singapore strait", "taiwan",
-        "china blockade", "south china sea", "taiwan strait",
-    ],
-    "HORMUZ": [
-        "hormuz", "strait of hormuz", "iran", "persian gulf",
-        "iran sanctions", "iran navy",
-    ],
-    "PANAMA": [
-        "panama", "panama canal", "gatun", "drought panama",
-    ],
-    "CAPE": [
-        "cape of good hope", "cape route", "south africa",
-    ],
-    "DARDANELLES": [
-        "dardanelles", "bosphorus", "turkish strait", "black sea",
-    ],
-}
-
 
 def detect_chokepoints(signal: OmenSignal) -> list[str]:
     """
@@ -70,31 +44,10 @@ def detect_chokepoints(signal: OmenSignal) -> list[str]:
 
     Combines:
     1. Geographic chokepoints from OMEN signal (if populated)
-    2. Keyword-based detection from title + description + context
+    2. Keyword-based detection from title + description + context + evidence
+       (compiled matcher, see riskcast.services.chokepoint_detector)
     """
-    chokepoints: set[str] = set()
-
-    # From OMEN geographic data
-    geo_cps = signal.context.get("chokepoints", [])
-    for cp in geo_cps:
-        if isinstance(cp, str):
-            chokepoints.add(cp.upper().replace(" ", "_"))
-
-    # Keyword-based detection from text
-    text_to_scan = " ".join([
-        signal.title.lower(),
-        signal.description.lower(),
-        str(signal.context).lower(),
-        str(signal.evidence).lower(),
-    ])
-
-    for chokepoint_name, keywords in CHOKEPOINT_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_to_scan:
-                chokepoints.add(chokepoint_name)
-                break
-
-    return list(chokepoints)
+    return default_detector.detect(signal)
 
 
 # ── Request / Response schemas ─────────────────────────────────────────
@@ -14,6 +14,7 @@ from sqlalchemy import text, select
 
 from riskcast.db.engine import get_db_session
 from riskcast.db.models import Company
+from riskcast.services.rate_limiter import get_plan_quota_resolver
 
 logger = structlog.get_logger(__name__)
 
@@ -371,6 +372,9 @@ async def upgrade_plan(request: Request, body: PlanUpgradeRequest):
             {"plan": body.plan_id, "cid": str(company_id)},
         )
 
+    # New API quota applies on this worker now, on others within the cache TTL
+    get_plan_quota_resolver().invalidate(company_id)
+
     plan_name = PLAN_DEFINITIONS[body.plan_id]["display_name"]
     logger.info("plan_upgraded", company_id=str(company_id), new_plan=body.plan_id)
 
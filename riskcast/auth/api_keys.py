@@ -8,14 +8,26 @@ Supports:
 - Expiration dates
 - Rate limiting per key
 - Last-used tracking
+- Per-process resolution cache keyed on the key hash (positive + negative,
+  TTL-bounded), invalidated on revoke/rotate
+
+CACHE:
+- Hit: no DB round trip. Entries never outlive the key's expires_at.
+- Unknown/revoked/expired keys are cached negatively for a shorter TTL, so
+  a client retrying a bad key cannot hammer the DB either.
+- revoke_api_key / rotate_api_key invalidate this process immediately;
+  other workers converge within API_KEY_CACHE_TTL_SECONDS.
+- last_used_at is written on cache misses only (accurate to the TTL).
 """
 
 import hashlib
 import secrets
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Optional
 
 import structlog
 from fastapi import HTTPException, Request
@@ -24,11 +36,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db.engine import get_db_session
 
+if TYPE_CHECKING:
+    from riskcast.db.models import APIKey
+
 logger = structlog.get_logger(__name__)
 
 API_KEY_PREFIX = "rc_live_"
 API_KEY_BYTE_LENGTH = 32
 
+API_KEY_CACHE_TTL_SECONDS = 30.0
+API_KEY_NEGATIVE_TTL_SECONDS = 5.0
+API_KEY_CACHE_MAX_ENTRIES = 10_000
+
 
 @dataclass(frozen=True)
 class APIKeyContext:
@@ -59,6 +78,95 @@ def hash_api_key(key: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()
 
 
+# ── Resolution cache ─────────────────────────────────────────────────────
+
+
+class APIKeyCache:
+    """
+    key_hash → APIKeyContext (or None for a rejected key), TTL-bounded LRU.
+
+    Args:
+        ttl_seconds: Lifetime of a positive entry
+        negative_ttl_seconds: Lifetime of a rejected-key entry
+        max_entries: LRU bound (covers clients spraying random keys)
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = API_KEY_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = API_KEY_NEGATIVE_TTL_SECONDS,
+        max_entries: int = API_KEY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Optional[APIKeyContext]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key_hash: str) -> tuple[bool, Optional[APIKeyContext]]:
+        """Return (hit, context); context is None for a cached rejection."""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return False, None
+        if entry[0] <= self._clock():
+            del self._entries[key_hash]
+            return False, None
+        self._entries.move_to_end(key_hash)
+        return True, entry[1]
+
+    def put(
+        self,
+        key_hash: str,
+        context: APIKeyContext,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, (_naive_utc(expires_at) - datetime.utcnow()).total_seconds())
+        if ttl > 0:
+            self._store(key_hash, ttl, context)
+
+    def put_negative(self, key_hash: str) -> None:
+        self._store(key_hash, self.negative_ttl_seconds, None)
+
+    def invalidate(self, key_hash: str) -> None:
+        self._entries.pop(key_hash, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key_hash: str, ttl: float, context: Optional[APIKeyContext]) -> None:
+        self._entries[key_hash] = (self._clock() + ttl, context)
+        self._entries.move_to_end(key_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Columns are naive UTC; tolerate aware values from callers."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+_api_key_cache: Optional[APIKeyCache] = None
+
+
+def get_api_key_cache() -> APIKeyCache:
+    global _api_key_cache
+    if _api_key_cache is None:
+        _api_key_cache = APIKeyCache()
+    return _api_key_cache
+
+
+# ── Validation ───────────────────────────────────────────────────────────
+
+
 async def validate_api_key(request: Request) -> APIKeyContext:
     """
     Validate an API key from the X-API-Key header.
@@ -66,7 +174,8 @@ async def validate_api_key(request: Request) -> APIKeyContext:
     Steps:
     1. Extract key from header
     2. Hash the provided key
-    3. Lookup in v2_api_keys WHERE is_active=True AND not expired
+    3. Resolve via the cache, else lookup in v2_api_keys
+       WHERE is_active=True AND not expired
     4. Return APIKeyContext with company_id, name, scopes
 
     Raises HTTPException 401 if invalid.
@@ -77,12 +186,34 @@ async def validate_api_key(request: Request) -> APIKeyContext:
             status_code=401,
             detail={"error": "missing_api_key", "message": "X-API-Key header required"},
         )
+    return await resolve_api_key(key)
+
 
+async def resolve_api_key(
+    key: str,
+    session_factory: Callable = get_db_session,
+    cache: Optional[APIKeyCache] = None,
+) -> APIKeyContext:
+    """
+    Resolve a raw API key to its context, hitting the DB only on a cache miss.
+
+    Raises HTTPException 401 if the key is unknown, inactive or expired.
+    """
+    cache = cache if cache is not None else get_api_key_cache()
     key_hash_value = hash_api_key(key)
 
+    hit, cached = cache.get(key_hash_value)
+    if hit:
+        if cached is None:
+            raise HTTPException(
+                status_code=401,
+                detail={"error": "invalid_api_key", "message": "Invalid or inactive API key"},
+            )
+        return cached
+
     from riskcast.db.models import APIKey
 
-    async with get_db_session() as session:
+    async with session_factory() as session:
         now = datetime.utcnow()
         result = await session.execute(
             select(APIKey).where(
@@ -93,6 +224,7 @@ async def validate_api_key(request: Request) -> APIKeyContext:
         api_key = result.scalar_one_or_none()
 
         if api_key is None:
+            cache.put_negative(key_hash_value)
             logger.warning(
                 "api_key_rejected",
                 key_prefix=key[:16] if len(key) >= 16 else key,
@@ -104,7 +236,8 @@ async def validate_api_key(request: Request) -> APIKeyContext:
             )
 
         # Check expiration
-        if api_key.expires_at and api_key.expires_at < now:
+        if api_key.expires_at and _naive_utc(api_key.expires_at) < now:
+            cache.put_negative(key_hash_value)
             logger.warning(
                 "api_key_expired",
                 key_name=api_key.key_name,
@@ -119,12 +252,85 @@ async def validate_api_key(request: Request) -> APIKeyContext:
         api_key.last_used_at = now
         await session.commit()
 
-        return APIKeyContext(
+        context = APIKeyContext(
             company_id=api_key.company_id,
             key_name=api_key.key_name,
             key_prefix=api_key.key_prefix,
-            scopes=api_key.scopes or [],
+            scopes=list(api_key.scopes or []),
         )
+        cache.put(key_hash_value, context, api_key.expires_at)
+        return context
+
+
+# ── Revocation / rotation ────────────────────────────────────────────────
+
+
+async def revoke_api_key(session: AsyncSession, key_id: uuid.UUID) -> bool:
+    """
+    Deactivate a key and drop it from the resolution cache.
+
+    Commits the session. Returns False if the key does not exist.
+    """
+    from riskcast.db.models import APIKey
+
+    api_key = await session.get(APIKey, key_id)
+    if api_key is None:
+        return False
+    api_key.is_active = False
+    await session.commit()
+    get_api_key_cache().invalidate(api_key.key_hash)
+    logger.info("api_key_revoked", key_name=api_key.key_name, key_prefix=api_key.key_prefix)
+    return True
+
+
+async def rotate_api_key(
+    session: AsyncSession,
+    key_id: uuid.UUID,
+    grace_period: timedelta = timedelta(0),
+) -> tuple[str, "APIKey"]:
+    """
+    Issue a replacement key with the same company, name, scopes and limit.
+
+    The old key is deactivated immediately, or keeps working until
+    now + grace_period for zero-downtime rollout. Commits the session.
+
+    Returns: (full_key, new APIKey row). The full key is shown ONCE.
+    Raises LookupError if the key does not exist.
+    """
+    from riskcast.db.models import APIKey
+
+    old = await session.get(APIKey, key_id)
+    if old is None:
+        raise LookupError(f"API key {key_id} not found")
+
+    full_key, key_hash_value, key_prefix = generate_api_key()
+    new = APIKey(
+        company_id=old.company_id,
+        key_name=old.key_name,
+        key_hash=key_hash_value,
+        key_prefix=key_prefix,
+        scopes=list(old.scopes or []),
+        rate_limit_per_minute=old.rate_limit_per_minute,
+        expires_at=old.expires_at,
+        created_by=old.created_by,
+    )
+    session.add(new)
+
+    if grace_period > timedelta(0):
+        old.expires_at = datetime.utcnow() + grace_period
+    else:
+        old.is_active = False
+    await session.commit()
+    get_api_key_cache().invalidate(old.key_hash)
+
+    logger.info(
+        "api_key_rotated",
+        key_name=old.key_name,
+        old_prefix=old.key_prefix,
+        new_prefix=key_prefix,
+        grace_seconds=grace_period.total_seconds(),
+    )
+    return full_key, new
 
 
 def check_scope(context: APIKeyContext, required_scope: str) -> None:
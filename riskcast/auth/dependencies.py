@@ -8,11 +8,9 @@ For PostgreSQL (prod): SET LOCAL for RLS enforcement.
 import uuid
 
 from fastapi import HTTPException, Request
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from riskcast.config import settings
-from riskcast.db.engine import get_session_factory
+from riskcast.db.engine import get_session_factory, set_tenant_context
 
 
 async def get_db(request: Request) -> AsyncSession:
@@ -27,14 +25,7 @@ async def get_db(request: Request) -> AsyncSession:
         company_id = getattr(request.state, "company_id", None)
 
         # SET tenant context for PostgreSQL RLS
-        # NOTE: asyncpg does not support parameterized SET LOCAL,
-        # so we interpolate the UUID directly. This is safe because
-        # company_id is a validated UUID from the JWT token.
-        if company_id and "postgresql" in settings.async_database_url:
-            cid = str(company_id).replace("'", "")  # extra safety
-            await session.execute(
-                text(f"SET LOCAL app.current_company_id = '{cid}'")
-            )
+        await set_tenant_context(session, company_id)
 
         try:
             yield session
@@ -57,8 +57,17 @@ class Settings(BaseSettings):
 
     # ── Security ────────────────────────────────────────────────────────────
     encryption_key: str = Field(default="", alias="RISKCAST_ENCRYPTION_KEY")
+    # HMAC key for security audit checkpoints (falls back to JWT_SECRET)
+    audit_checkpoint_key: str = Field(default="", alias="AUDIT_CHECKPOINT_KEY")
     rate_limit_default: int = Field(default=100, alias="RATE_LIMIT_DEFAULT")
     rate_limit_burst: int = Field(default=20, alias="RATE_LIMIT_BURST")
+    rate_limit_backend: str = Field(default="memory", alias="RATE_LIMIT_BACKEND")  # memory | redis
+
+    # SSE fan-out
+    sse_backend: str = Field(default="memory", alias="SSE_BACKEND")  # memory | redis
+    sse_queue_size: int = Field(default=256, alias="SSE_QUEUE_SIZE")
+    sse_overflow_policy: str = Field(default="drop_oldest", alias="SSE_OVERFLOW_POLICY")  # drop_oldest | disconnect
+    sse_replay_size: int = Field(default=100, alias="SSE_REPLAY_SIZE")
 
     # ── Alerting ──────────────────────────────────────────────────────────
     alert_cooldown_minutes: int = Field(default=30, alias="ALERT_COOLDOWN_MINUTES")
@@ -74,6 +83,8 @@ class Settings(BaseSettings):
     omen_timeout_seconds: int = Field(default=30, alias="OMEN_TIMEOUT_SECONDS")
     omen_retry_attempts: int = Field(default=3, alias="OMEN_RETRY_ATTEMPTS")
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
+    llm_backend: str = Field(default="anthropic", alias="LLM_BACKEND")  # anthropic | stub
+    brief_llm_concurrency: int = Field(default=4, alias="BRIEF_LLM_CONCURRENCY")
 
     # ── Risk Engine ────────────────────────────────────────────────────────
     # Analyzer weights (order risk composite)
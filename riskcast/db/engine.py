@@ -4,10 +4,12 @@ Database engine, session factory, and declarative base for RiskCast V2.
 Uses async SQLAlchemy 2.0 with asyncpg.
 """
 
+import uuid
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
 import structlog
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -74,6 +76,20 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def set_tenant_context(session: AsyncSession, company_id: object) -> None:
+    """
+    SET LOCAL the tenant for PostgreSQL RLS on this session's transaction.
+
+    No-op on other dialects (SQLite dev/test has no RLS; queries filter by
+    company_id). asyncpg does not support parameterized SET LOCAL, so the
+    value is interpolated — safe because it is round-tripped through UUID.
+    """
+    if not company_id or session.get_bind().dialect.name != "postgresql":
+        return
+    cid = str(uuid.UUID(str(company_id)))
+    await session.execute(text(f"SET LOCAL app.current_company_id = '{cid}'"))
+
+
 async def init_db() -> None:
     """Initialize the database engine and create tables if needed.
     
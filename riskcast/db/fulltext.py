@@ -0,0 +1,109 @@
+"""
+Full-text search support for incidents.
+
+Two backends, both maintained by the database itself:
+- PostgreSQL: ``search_vector`` tsvector generated column + GIN index
+- SQLite (dev/tests): FTS5 external-content shadow table kept in sync
+  by triggers on ``v2_incidents``
+
+The DDL is attached to the Incident table's ``after_create`` event, so
+``Base.metadata.create_all`` (dev mode, tests) sets it up automatically.
+Production PostgreSQL gets the same objects from the Alembic migration.
+"""
+
+import re
+
+from sqlalchemy import DDL, Table, event
+
+INCIDENT_FTS_TABLE = "v2_incidents_fts"
+
+# Cap on OR-ed search terms — keeps planner and ranking cost bounded
+MAX_SEARCH_TERMS = 16
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_PG_DDL = [
+    """
+    ALTER TABLE v2_incidents ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple',
+                coalesce(type, '') || ' ' ||
+                coalesce(description, '') || ' ' ||
+                coalesce(resolution, ''))
+        ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_v2_incidents_search_vector
+        ON v2_incidents USING GIN (search_vector)
+    """,
+]
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {INCIDENT_FTS_TABLE} USING fts5(
+        type, description, resolution,
+        content='v2_incidents', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS v2_incidents_fts_ai AFTER INSERT ON v2_incidents BEGIN
+        INSERT INTO {INCIDENT_FTS_TABLE}(rowid, type, description, resolution)
+        VALUES (new.rowid, new.type, new.description, new.resolution);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS v2_incidents_fts_ad AFTER DELETE ON v2_incidents BEGIN
+        INSERT INTO {INCIDENT_FTS_TABLE}({INCIDENT_FTS_TABLE}, rowid, type, description, resolution)
+        VALUES ('delete', old.rowid, old.type, old.description, old.resolution);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS v2_incidents_fts_au AFTER UPDATE ON v2_incidents BEGIN
+        INSERT INTO {INCIDENT_FTS_TABLE}({INCIDENT_FTS_TABLE}, rowid, type, description, resolution)
+        VALUES ('delete', old.rowid, old.type, old.description, old.resolution);
+        INSERT INTO {INCIDENT_FTS_TABLE}(rowid, type, description, resolution)
+        VALUES (new.rowid, new.type, new.description, new.resolution);
+    END
+    """,
+    # Backfill rows that existed before the shadow table
+    f"INSERT INTO {INCIDENT_FTS_TABLE}({INCIDENT_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def install_incident_fulltext(table: Table) -> None:
+    """Attach the dialect-specific search DDL to the incidents table."""
+    for stmt in _PG_DDL:
+        event.listen(table, "after_create", DDL(stmt).execute_if(dialect="postgresql"))
+    for stmt in _SQLITE_DDL:
+        event.listen(table, "after_create", DDL(stmt).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {INCIDENT_FTS_TABLE}").execute_if(dialect="sqlite"),
+    )
+
+
+def search_terms(query: str) -> list[str]:
+    """
+    Split a free-text query into safe search terms.
+
+    Only word characters survive, so the terms can be joined into
+    tsquery / FTS5 MATCH syntax without any user-controlled operators.
+    """
+    seen: dict[str, None] = {}
+    for term in _TERM_RE.findall(query.lower()):
+        seen.setdefault(term, None)
+        if len(seen) >= MAX_SEARCH_TERMS:
+            break
+    return list(seen)
+
+
+def pg_tsquery(terms: list[str]) -> str:
+    """OR-combine terms for ``to_tsquery`` — ranking orders the matches."""
+    return " | ".join(terms)
+
+
+def fts5_query(terms: list[str]) -> str:
+    """OR-combine quoted terms for an FTS5 MATCH expression."""
+    return " OR ".join(f'"{t}"' for t in terms)
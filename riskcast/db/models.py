@@ -11,6 +11,7 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Date,
     DateTime,
@@ -22,11 +23,13 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from riskcast.db.compat import GUID, JSONType
 from riskcast.db.engine import Base
+from riskcast.db.fulltext import install_incident_fulltext
 
 
 def _genuuid():
@@ -74,9 +77,13 @@ class SecurityAuditLog(Base):
         Index("ix_security_audit_timestamp", "timestamp"),
         Index("ix_security_audit_company", "company_id"),
         Index("ix_security_audit_action", "action"),
+        Index("ix_security_audit_seq", "seq", unique=True),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=_genuuid)
+    # Chain position, assigned under the append lock; unique so a racing
+    # writer fails instead of forking the chain
+    seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     company_id: Mapped[Optional[uuid.UUID]] = mapped_column(GUID())
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(GUID())
@@ -102,6 +109,23 @@ class SecurityAuditLog(Base):
     entry_hash: Mapped[Optional[str]] = mapped_column(String(128))
 
 
+class SecurityAuditCheckpoint(Base):
+    """
+    Signed marker of a verified prefix of the security audit chain.
+
+    Verification resumes after the latest checkpoint whose HMAC still
+    matches, so it only rehashes entries appended since.
+    """
+
+    __tablename__ = "v2_security_audit_checkpoints"
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    entry_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    entries_verified: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    signature: Mapped[str] = mapped_column(String(128), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class Company(Base):
     __tablename__ = "v2_companies"
 
@@ -254,6 +278,10 @@ class Incident(Base):
     customer: Mapped[Optional["Customer"]] = relationship(back_populates="incidents")
 
 
+# tsvector + GIN on PostgreSQL, FTS5 shadow table on SQLite
+install_incident_fulltext(Incident.__table__)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 1.3 Signals
 # ──────────────────────────────────────────────────────────────────────────────
@@ -286,6 +314,57 @@ class Signal(Base):
     company: Mapped["Company"] = relationship(back_populates="signals")
 
 
+# Hot-path indexes — every read filters on company + is_active first.
+# Partial (WHERE is_active) so inactive history does not bloat them.
+Index(
+    "ix_v2_signals_entity_active",
+    Signal.company_id,
+    Signal.entity_type,
+    Signal.entity_id,
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+)
+Index(
+    "ix_v2_signals_active_severity",
+    Signal.company_id,
+    Signal.severity_score.desc(),
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+    postgresql_include=["entity_type", "entity_id", "signal_type"],
+)
+
+
+class SignalArchive(Base):
+    """
+    Cold storage for inactive signals, moved here by SignalArchiver.
+
+    On PostgreSQL the table is range-partitioned by month on created_at,
+    so old history is dropped by detaching a partition, not by DELETE.
+    """
+
+    __tablename__ = "v2_signals_archive"
+    __table_args__ = (
+        Index("ix_v2_signals_archive_company", "company_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Partition key must be part of the primary key on PostgreSQL
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    company_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    source: Mapped[str] = mapped_column(String(100), nullable=False)
+    signal_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    entity_type: Mapped[Optional[str]] = mapped_column(String(50))
+    entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(GUID())
+    confidence: Mapped[Decimal] = mapped_column(Numeric(3, 2), nullable=False)
+    severity_score: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2))
+    evidence: Mapped[dict] = mapped_column(JSONType(), nullable=False)
+    context: Mapped[dict] = mapped_column(JSONType(), default=dict)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 1.4 AI Interaction
 # ──────────────────────────────────────────────────────────────────────────────
@@ -331,6 +410,8 @@ class MorningBrief(Base):
     signals_used: Mapped[dict] = mapped_column(JSONType(), nullable=False)
     priority_items: Mapped[dict] = mapped_column(JSONType(), nullable=False)
     read_by: Mapped[dict] = mapped_column(JSONType(), default=list)  # JSON array instead of ARRAY
+    # SHA-256 of the LLM prompt; a later day with the same hash reuses content
+    input_hash: Mapped[Optional[str]] = mapped_column(String(64))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
@@ -548,6 +629,55 @@ class Outcome(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text)
 
 
+class OutcomeAccuracyDaily(Base):
+    """
+    Per-day, per-calibration-bin accuracy sums, maintained by OutcomeRecorder.
+
+    Every accuracy metric (Brier, MAE, accuracy rate, ECE, confusion matrix)
+    is a ratio of these sums, so long-window reports read one row per
+    (day, bin) instead of every outcome. Bins ≥ 5 are the "predicted high
+    risk" side of the confusion matrix.
+    """
+
+    __tablename__ = "v2_outcome_accuracy_daily"
+
+    company_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    bin: Mapped[int] = mapped_column(Integer, primary_key=True)
+    n: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sum_predicted: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False, default=0)
+    sum_sq_error: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False, default=0)
+    sum_abs_error: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False, default=0)
+    materialized: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    accurate: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class OutcomeEntityDaily(Base):
+    """
+    Per-day, per-entity-type value and learning sums, maintained by OutcomeRecorder.
+
+    ROI reports (losses, value, follow rate) and flywheel priors (materialized
+    rate, mean predicted rate, mean error) are sums or ratios of these, so
+    they read one row per (day, entity type) instead of every outcome.
+    """
+
+    __tablename__ = "v2_outcome_entity_daily"
+
+    company_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    n: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    followed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    helped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    materialized: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    predicted_loss: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    actual_loss: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    value: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    followed_predicted_loss: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    sum_predicted: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False, default=0)
+    sum_error: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False, default=0)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 2.2 Alerting & Early Warning (Phase 6)
 # ──────────────────────────────────────────────────────────────────────────────
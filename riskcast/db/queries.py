@@ -9,9 +9,10 @@ All functions require an explicit company_id parameter.
 from datetime import date, timedelta
 from typing import Any, Optional, Sequence
 
-from sqlalchemy import and_, func, select, text
+from sqlalchemy import and_, case, func, literal_column, select, table, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from riskcast.db.fulltext import INCIDENT_FTS_TABLE, fts5_query, pg_tsquery, search_terms
 from riskcast.db.models import (
     ChatMessage,
     ChatSession,
@@ -151,6 +152,39 @@ async def get_active_signals(
     return result.scalars().all()
 
 
+async def get_top_active_signals_by_company(
+    session: AsyncSession, company_ids: Sequence[str], per_company: int = 50
+) -> dict[str, list[Signal]]:
+    """
+    get_active_signals for many companies in one query.
+
+    ROW_NUMBER() per company keeps the same top-N-by-severity cut.
+    Keyed by str(company_id); companies without signals are absent.
+    """
+    if not company_ids:
+        return {}
+    ranked = (
+        select(
+            Signal.id,
+            func.row_number()
+            .over(partition_by=Signal.company_id, order_by=Signal.severity_score.desc())
+            .label("rank"),
+        )
+        .where(Signal.company_id.in_(company_ids), Signal.is_active == True)  # noqa: E712
+        .subquery()
+    )
+    result = await session.execute(
+        select(Signal)
+        .join(ranked, ranked.c.id == Signal.id)
+        .where(ranked.c.rank <= per_company)
+        .order_by(Signal.company_id, ranked.c.rank)
+    )
+    grouped: dict[str, list[Signal]] = {}
+    for signal in result.scalars().all():
+        grouped.setdefault(str(signal.company_id), []).append(signal)
+    return grouped
+
+
 async def get_active_signals_map(
     session: AsyncSession, company_id: str
 ) -> dict[tuple[str, str], list[Signal]]:
@@ -227,6 +261,72 @@ async def count_incidents(
     return result.scalar_one()
 
 
+async def get_brief_metrics(
+    session: AsyncSession, company_ids: Sequence[str], incident_days: int = 7
+) -> dict[str, dict]:
+    """
+    Morning brief metrics for many companies in one grouped query.
+
+    Same numbers as count_orders / count_payments / sum_overdue_payments /
+    count_incidents per company: one aggregate subquery per table, left
+    joined onto the company list. Keyed by str(company_id).
+    """
+    if not company_ids:
+        return {}
+    cutoff = date.today() - timedelta(days=incident_days)
+
+    orders = (
+        select(
+            Order.company_id,
+            func.count(case((Order.status == "pending", 1))).label("pending"),
+            func.count(case((Order.status == "in_transit", 1))).label("in_transit"),
+        )
+        .where(Order.company_id.in_(company_ids), Order.status.in_(["pending", "in_transit"]))
+        .group_by(Order.company_id)
+        .subquery()
+    )
+    payments = (
+        select(
+            Payment.company_id,
+            func.count().label("overdue_count"),
+            func.sum(Payment.amount).label("overdue_value"),
+        )
+        .where(Payment.company_id.in_(company_ids), Payment.status == "overdue")
+        .group_by(Payment.company_id)
+        .subquery()
+    )
+    incidents = (
+        select(Incident.company_id, func.count().label("recent"))
+        .where(Incident.company_id.in_(company_ids), Incident.created_at >= cutoff)
+        .group_by(Incident.company_id)
+        .subquery()
+    )
+    result = await session.execute(
+        select(
+            Company.id,
+            func.coalesce(orders.c.pending, 0),
+            func.coalesce(orders.c.in_transit, 0),
+            func.coalesce(payments.c.overdue_count, 0),
+            func.coalesce(payments.c.overdue_value, 0),
+            func.coalesce(incidents.c.recent, 0),
+        )
+        .outerjoin(orders, orders.c.company_id == Company.id)
+        .outerjoin(payments, payments.c.company_id == Company.id)
+        .outerjoin(incidents, incidents.c.company_id == Company.id)
+        .where(Company.id.in_(company_ids))
+    )
+    return {
+        str(cid): {
+            "orders_pending": int(pending),
+            "orders_in_transit": int(in_transit),
+            "payments_overdue_count": int(overdue_count),
+            "payments_overdue_value": float(overdue_value),
+            "incidents_7d": int(recent),
+        }
+        for cid, pending, in_transit, overdue_count, overdue_value, recent in result.all()
+    }
+
+
 # ── Chat Sessions / Messages ─────────────────────────────────────────────
 
 
@@ -526,22 +626,47 @@ async def get_today_brief(
 async def search_incidents_fulltext(
     session: AsyncSession, company_id: str, query: str, limit: int = 5
 ) -> list[dict]:
-    """Full-text search incidents."""
-    result = await session.execute(
-        select(Incident)
-        .where(
-            and_(
-                Incident.company_id == company_id,
-                (
-                    Incident.type.ilike(f"%{query}%")
-                    | Incident.description.ilike(f"%{query}%")
-                    | Incident.resolution.ilike(f"%{query}%")
-                ),
+    """
+    Ranked full-text search over incident type/description/resolution.
+
+    PostgreSQL probes the GIN index on ``search_vector`` and ranks by
+    ``ts_rank``; SQLite probes the FTS5 shadow table and ranks by ``bm25``.
+    Ties (and equal relevance) are broken by recency.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    dialect = session.get_bind().dialect.name
+    stmt = select(Incident).where(Incident.company_id == company_id)
+
+    if dialect == "postgresql":
+        vector = literal_column("v2_incidents.search_vector")
+        tsquery = func.to_tsquery("simple", pg_tsquery(terms))
+        stmt = stmt.where(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank(vector, tsquery).desc(), Incident.created_at.desc()
+        )
+    elif dialect == "sqlite":
+        fts = literal_column(INCIDENT_FTS_TABLE)
+        stmt = (
+            stmt.join(
+                table(INCIDENT_FTS_TABLE),
+                literal_column(f"{INCIDENT_FTS_TABLE}.rowid")
+                == literal_column("v2_incidents.rowid"),
             )
+            .where(fts.op("MATCH")(fts5_query(terms)))
+            # bm25() is lower-is-better
+            .order_by(func.bm25(fts), Incident.created_at.desc())
         )
-        .order_by(Incident.created_at.desc())
-        .limit(limit)
-    )
+    else:
+        needle = f"%{query}%"
+        stmt = stmt.where(
+            Incident.type.ilike(needle)
+            | Incident.description.ilike(needle)
+            | Incident.resolution.ilike(needle)
+        ).order_by(Incident.created_at.desc())
+
+    result = await session.execute(stmt.limit(limit))
     rows = result.scalars().all()
     return [
         {
@@ -554,3 +679,28 @@ async def search_incidents_fulltext(
         }
         for i in rows
     ]
+
+
+async def get_latest_briefs(
+    session: AsyncSession, company_ids: Sequence[str], on_or_before: date
+) -> dict[str, MorningBrief]:
+    """Each company's most recent brief dated on or before a day, in one query."""
+    if not company_ids:
+        return {}
+    ranked = (
+        select(
+            MorningBrief.id,
+            func.row_number()
+            .over(partition_by=MorningBrief.company_id, order_by=MorningBrief.brief_date.desc())
+            .label("rank"),
+        )
+        .where(
+            MorningBrief.company_id.in_(company_ids),
+            MorningBrief.brief_date <= on_or_before,
+        )
+        .subquery()
+    )
+    result = await session.execute(
+        select(MorningBrief).join(ranked, ranked.c.id == MorningBrief.id).where(ranked.c.rank == 1)
+    )
+    return {str(b.company_id): b for b in result.scalars().all()}
@@ -19,14 +19,19 @@ import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from riskcast.alerting.auto_trigger import start_alert_delivery
+from riskcast.alerting.delivery import close_http_pool, stop_delivery_queue
 from riskcast.config import settings
 from riskcast.db.engine import close_db, init_db
 from riskcast.middleware.error_handler import ErrorHandlerMiddleware
+from riskcast.middleware.pipeline import MiddlewarePipeline
 from riskcast.middleware.rate_limit import RateLimitMiddleware
 from riskcast.middleware.request_context import RequestContextMiddleware
 from riskcast.middleware.security_headers import SecurityHeadersMiddleware
 from riskcast.middleware.tenant import TenantMiddleware
 from riskcast.services.cache import close_redis
+from riskcast.services.rate_limiter import build_rate_limit_store, get_plan_quota_resolver
+from riskcast.services.sse_manager import sse_manager
 
 # Import all routers
 from riskcast.auth.router import router as auth_router
@@ -68,7 +73,12 @@ async def lifespan(app: FastAPI):
     if not settings.anthropic_api_key:
         logger.warning("anthropic_api_key_not_set", msg="Chat/AI features will return fallback responses")
     await init_db()
+    start_alert_delivery()
+    await sse_manager.start()
     yield
+    await sse_manager.close()
+    await stop_delivery_queue()
+    await close_http_pool()
     await close_redis()
     await close_db()
     logger.info("riskcast_v2_shutdown")
@@ -126,21 +136,26 @@ def create_app() -> FastAPI:
         ],
     )
 
-    # ── Middleware (order matters — last added = outermost = first to process) ──
-    # Error handler — catches everything, returns structured JSON
-    app.add_middleware(ErrorHandlerMiddleware)
-
-    # Request context — request_id, timing, structured logging
-    app.add_middleware(RequestContextMiddleware)
-
-    # Security headers (OWASP A05)
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    # Rate limiter — per tenant / per API key, token bucket
-    app.add_middleware(RateLimitMiddleware)
-
-    # Tenant isolation (extracts JWT or API key, sets request.state)
-    app.add_middleware(TenantMiddleware)
+    # ── Middleware ────────────────────────────────────────────────────
+    # One pure-ASGI layer; stages run top to bottom on the way in.
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            # Request context — request_id, timing, structured logging
+            RequestContextMiddleware(),
+            # Security headers (OWASP A05) — on every response, incl. errors
+            SecurityHeadersMiddleware(),
+            # Error handler — catches everything below, returns structured JSON
+            ErrorHandlerMiddleware(),
+            # Tenant isolation (extracts JWT or API key, sets request.state)
+            TenantMiddleware(),
+            # Rate limiter — GCRA per tenant / per API key, plan quotas
+            RateLimitMiddleware(
+                store=build_rate_limit_store(),
+                quotas=get_plan_quota_resolver(),
+            ),
+        ],
+    )
 
     # CORS — MUST be outermost so OPTIONS preflight is handled before auth
     app.add_middleware(
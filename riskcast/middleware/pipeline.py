@@ -0,0 +1,99 @@
+"""
+Middleware Pipeline — one pure-ASGI layer running all HTTP stages.
+
+Replaces a stack of BaseHTTPMiddleware layers (one task + one body stream
+wrapper per layer) with a single ASGI callable. The response body is sent
+straight through to the server, so streaming/SSE keep backpressure.
+
+Stages run in list order (first = outermost):
+  on_request(request)            → may short-circuit with a Response
+  on_response_start(request, m)  → inner stages first; mutate headers
+  on_error(request, exc)         → inner stages first; may return a Response
+
+Response hooks only run for stages whose on_request was reached, and a
+stage that short-circuits does not post-process its own response — the
+same observable behaviour as nested middleware.
+"""
+
+from typing import Optional, Sequence
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class HTTPStage:
+    """Base class for pipeline stages. Override the hooks you need."""
+
+    async def on_request(self, request: Request) -> Optional[Response]:
+        return None
+
+    def on_response_start(self, request: Request, message: Message) -> None:
+        return None
+
+    def on_error(self, request: Request, exc: Exception) -> Optional[Response]:
+        return None
+
+
+class MiddlewarePipeline:
+    """Pure-ASGI middleware running ``stages`` around the app."""
+
+    def __init__(self, app: ASGIApp, stages: Sequence[HTTPStage]):
+        self.app = app
+        self.stages = tuple(stages)
+        # Only call hooks a stage actually overrides
+        self._start_hooks = tuple(
+            i for i, s in enumerate(self.stages)
+            if type(s).on_response_start is not HTTPStage.on_response_start
+        )
+        self._error_hooks = tuple(
+            i for i, s in enumerate(self.stages)
+            if type(s).on_error is not HTTPStage.on_error
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        entered = 0
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                for i in reversed(self._start_hooks):
+                    if i < entered:
+                        self.stages[i].on_response_start(request, message)
+            await send(message)
+
+        try:
+            short_circuit: Optional[Response] = None
+            for stage in self.stages:
+                short_circuit = await stage.on_request(request)
+                if short_circuit is not None:
+                    break
+                entered += 1
+
+            if short_circuit is not None:
+                await short_circuit(scope, receive, send_wrapper)
+            else:
+                await self.app(scope, receive, send_wrapper)
+
+        except Exception as exc:
+            if response_started:
+                raise
+            error_response = None
+            for i in reversed(self._error_hooks):
+                # A stage only handles errors raised inside it
+                if i < entered:
+                    error_response = self.stages[i].on_error(request, exc)
+                    if error_response is not None:
+                        # Stages inside the handler never see this response
+                        entered = i
+                        break
+            if error_response is None:
+                raise
+            await error_response(scope, receive, send_wrapper)
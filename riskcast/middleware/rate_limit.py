@@ -1,21 +1,27 @@
 """
-Rate Limiter Middleware — Token bucket per tenant + per API key.
+Rate Limiter Middleware — GCRA per tenant + per API key.
 
-Prevents abuse while allowing burst traffic.
-Uses in-memory storage (fine for single-process; use Redis for multi-process).
+Prevents abuse while allowing burst traffic. The limiter state lives in a
+pluggable store (riskcast.services.rate_limiter): LRU-bounded in-process
+by default, Redis (shared by all workers) with RATE_LIMIT_BACKEND=redis.
+Authenticated tenants get the quota of their company plan.
 
 NO endpoint is exempt from rate limiting except health/docs.
 """
 
-import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+import math
 
 import structlog
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from riskcast.config import settings
+from riskcast.middleware.pipeline import HTTPStage
+from riskcast.services.rate_limiter import (
+    MemoryGCRAStore,
+    PlanQuotaResolver,
+    Quota,
+    RateLimitStore,
+    default_quota,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -23,53 +29,34 @@ logger = structlog.get_logger(__name__)
 EXEMPT_PATHS = frozenset({"/health", "/docs", "/openapi.json", "/redoc"})
 
 
-@dataclass
-class TokenBucket:
-    """Token bucket for rate limiting."""
-
-    tokens: float = 20.0
-    last_refill: float = field(default_factory=time.monotonic)
-    rate: float = 100.0 / 60.0  # tokens per second
-    capacity: float = 20.0
-
-    def consume(self) -> bool:
-        """Try to consume a token. Returns True if allowed."""
-        now = time.monotonic()
-        elapsed = now - self.last_refill
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-        self.last_refill = now
-
-        if self.tokens >= 1:
-            self.tokens -= 1
-            return True
-        return False
-
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware(HTTPStage):
     """
-    Per-tenant / per-API-key rate limiter using token bucket algorithm.
+    Per-tenant / per-API-key rate limiter using GCRA.
 
     Extracts tenant from request.state.company_id (set by TenantMiddleware).
-    Returns 429 when rate exceeded.
-    """
+    Returns 429 with Retry-After when the quota is exceeded.
 
-    def __init__(self, app, rate: int | None = None, burst: int | None = None):
-        super().__init__(app)
-        self.rate = rate or settings.rate_limit_default
-        self.burst = burst or settings.rate_limit_burst
-        self._buckets: dict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(
-                tokens=float(self.burst),
-                rate=self.rate / 60.0,
-                capacity=float(self.burst),
-            )
-        )
+    Args:
+        store: Limiter state backend (default: in-process LRU store)
+        quotas: Per-tenant quota source; without it every key gets ``quota``
+        quota: Fixed quota for keys without a tenant (default: settings)
+    """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(
+        self,
+        store: RateLimitStore | None = None,
+        quotas: PlanQuotaResolver | None = None,
+        quota: Quota | None = None,
+    ):
+        self.store = store or MemoryGCRAStore()
+        self.quotas = quotas
+        self.quota = quota or default_quota()
+
+    async def on_request(self, request: Request) -> Response | None:
         path = request.url.path
 
         if path in EXEMPT_PATHS:
-            return await call_next(request)
+            return None
 
         # Rate limit key: company_id or API key prefix or IP
         company_id = getattr(request.state, "company_id", None)
@@ -82,16 +69,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         else:
             key = f"ip:{request.client.host if request.client else 'unknown'}"
 
-        bucket = self._buckets[key]
+        quota = self.quota
+        if company_id and self.quotas is not None:
+            quota = await self.quotas.quota_for(company_id)
+
+        result = await self.store.hit(key, quota)
 
-        if not bucket.consume():
+        if not result.allowed:
             logger.warning("rate_limit_exceeded", key=key, path=path)
             return Response(
                 status_code=429,
                 content='{"error":"Rate limit exceeded. Please retry after a moment.","status":429}',
                 media_type="application/json",
-                headers={"Retry-After": "10"},
+                headers={"Retry-After": str(max(1, math.ceil(result.retry_after)))},
             )
 
-        response = await call_next(request)
-        return response
+        return None
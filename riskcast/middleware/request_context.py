@@ -18,19 +18,23 @@ import uuid
 
 import structlog
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message
+
+from riskcast.middleware.pipeline import HTTPStage
 
 logger = structlog.get_logger(__name__)
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware(HTTPStage):
     """
     Adds request_id and timing to every request.
 
-    Placed AFTER error handler, BEFORE tenant middleware.
+    First stage of the pipeline, so every response — including 401/429
+    and error responses — carries X-Request-ID.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def on_request(self, request: Request) -> Response | None:
         # Generate or extract request ID
         request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         request.state.request_id = request_id
@@ -44,21 +48,20 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         )
 
         # Time the request
-        start = time.perf_counter()
-
-        response = await call_next(request)
+        request.state.request_start = time.perf_counter()
+        return None
 
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+    def on_response_start(self, request: Request, message: Message) -> None:
+        elapsed_ms = round((time.perf_counter() - request.state.request_start) * 1000, 2)
 
         # Add headers
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Response-Time"] = f"{elapsed_ms}ms"
+        headers = MutableHeaders(scope=message)
+        headers["X-Request-ID"] = request.state.request_id
+        headers["X-Response-Time"] = f"{elapsed_ms}ms"
 
         # Log request completion
         logger.info(
             "request_completed",
-            status=response.status_code,
+            status=message["status"],
             elapsed_ms=elapsed_ms,
         )
-
-        return response
@@ -11,8 +11,11 @@ Adds defense-in-depth headers to ALL HTTP responses:
 - Permissions-Policy
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message
+
+from riskcast.middleware.pipeline import HTTPStage
 
 
 SECURITY_HEADERS = {
@@ -28,11 +31,10 @@ SECURITY_HEADERS = {
 }
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(HTTPStage):
     """Add security headers to all responses."""
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
+    def on_response_start(self, request: Request, message: Message) -> None:
+        headers = MutableHeaders(scope=message)
         for header, value in SECURITY_HEADERS.items():
-            response.headers.setdefault(header, value)
-        return response
+            headers.setdefault(header, value)
@@ -6,14 +6,15 @@ CRITICAL SECURITY COMPONENT — bug here = data leak between tenants.
 - SET LOCAL app.current_company_id before any query
 - SET LOCAL scopes to current transaction — auto-resets on commit/rollback
 - Extracts JWT from Authorization header or ?token= query param (SSE)
-- API-key auth for service-to-service endpoints (ingest, reconcile)
+- API-key auth for service-to-service endpoints (ingest, reconcile),
+  resolved through the cached lookup in riskcast.auth.api_keys
 """
 
 import structlog
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from riskcast.auth.jwt import decode_token
+from riskcast.middleware.pipeline import HTTPStage
 
 logger = structlog.get_logger(__name__)
 
@@ -45,7 +46,7 @@ API_KEY_PREFIXES = (
 )
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class TenantMiddleware(HTTPStage):
     """
     Mandatory SET/RESET of app.current_company_id for every request.
 
@@ -55,20 +56,21 @@ class TenantMiddleware(BaseHTTPMiddleware):
     3. Everything else → JWT Bearer token
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def on_request(self, request: Request) -> Response | None:
+        """Authenticate and attach tenant state; a Response means reject."""
         path = request.url.path
 
         # 0. CORS preflight — always pass through (handled by CORSMiddleware)
         if request.method == "OPTIONS":
-            return await call_next(request)
+            return None
 
         # 1. Public endpoints — no auth required
         if path in PUBLIC_PATHS or path.rstrip("/") in PUBLIC_PATHS or path.startswith(PUBLIC_PREFIXES):
-            return await call_next(request)
+            return None
 
         # 2. API-key authenticated endpoints (service-to-service)
         if path in API_KEY_PATHS or path.startswith(API_KEY_PREFIXES):
-            return await self._handle_api_key_auth(request, call_next)
+            return await self._handle_api_key_auth(request)
 
         # 2b. Development mode: accept X-API-Key on ANY path as fallback
         #     This allows frontend and scripts to use a simple API key
@@ -76,12 +78,12 @@ class TenantMiddleware(BaseHTTPMiddleware):
         if os.getenv("ENVIRONMENT", "development") == "development":
             api_key = request.headers.get("X-API-Key")
             if api_key:
-                return await self._handle_api_key_auth(request, call_next)
+                return await self._handle_api_key_auth(request)
 
         # 3. JWT authenticated endpoints (user-facing)
-        return await self._handle_jwt_auth(request, call_next)
+        return self._handle_jwt_auth(request)
 
-    async def _handle_api_key_auth(self, request: Request, call_next) -> Response:
+    async def _handle_api_key_auth(self, request: Request) -> Response | None:
         """Authenticate via X-API-Key header for service-to-service calls."""
         import os
 
@@ -128,7 +130,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
             request.state.user_role = "admin"
             request.state.api_key_prefix = "dev-key"
             request.state.api_key_scopes = ["*"]
-            return await call_next(request)
+            return None
 
         try:
             from riskcast.auth.api_keys import validate_api_key
@@ -139,7 +141,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
             request.state.user_email = f"apikey:{context.key_name}"
             request.state.user_role = "admin"  # API keys have admin-equivalent access
             request.state.api_key_prefix = context.key_prefix
-            request.state.api_key_scopes = context.scopes
+            request.state.api_key_scopes = list(context.scopes)
         except Exception as e:
             logger.warning("api_key_auth_failed", error=str(e), path=request.url.path)
             return Response(
@@ -148,9 +150,9 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 media_type="application/json",
             )
 
-        return await call_next(request)
+        return None
 
-    async def _handle_jwt_auth(self, request: Request, call_next) -> Response:
+    def _handle_jwt_auth(self, request: Request) -> Response | None:
         """Authenticate via JWT Bearer token for user requests."""
         token = self._extract_token(request)
         if not token:
@@ -179,9 +181,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
         request.state.user_role = payload.get("role", "viewer")
         request.state.api_key_prefix = None
         request.state.api_key_scopes = None
-
-        response = await call_next(request)
-        return response
+        return None
 
     def _extract_token(self, request: Request) -> str | None:
         """Extract JWT from Authorization header or query param."""
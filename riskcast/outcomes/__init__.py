@@ -5,6 +5,7 @@ Components:
 - schemas: Outcome data models
 - recorder: Record actual outcomes for decisions
 - accuracy: Prediction vs actual metrics (Brier score, calibration drift)
+- aggregates: Grouped outcome sums and the per-day entity rollup
 - flywheel: Feed outcomes back to improve models
 - roi: Track value generated by RiskCast decisions
 """
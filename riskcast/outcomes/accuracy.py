@@ -8,19 +8,22 @@ Computes:
 - Confusion Matrix: TP, TN, FP, FN, precision, recall, F1
 - Accuracy Rate: % of predictions within threshold
 
-All metrics are computed from recorded outcomes.
+All metrics are ratios of per-bin sums (count, Σp, Σ(p−y)², Σ|err|,
+Σy, Σaccurate) computed in SQL — only the ≤10-row calibration histogram
+leaves the database. Long windows can read the same sums from the
+per-day rollup (v2_outcome_accuracy_daily) kept by OutcomeRecorder.
 """
 
-import math
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 import structlog
-from sqlalchemy import select, func
+from sqlalchemy import Float, case, cast, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from riskcast.db.models import Outcome
-from riskcast.outcomes.schemas import AccuracyReport
+from riskcast.db.models import Outcome, OutcomeAccuracyDaily
+from riskcast.outcomes.schemas import AccuracyReport, CalibrationBin
 
 logger = structlog.get_logger(__name__)
 
@@ -30,16 +33,26 @@ DEFAULT_ACCURACY_THRESHOLD: float = 0.15
 # Number of calibration bins for ECE
 N_CALIBRATION_BINS: int = 10
 
+# Bins at or above this index are "predicted high risk" (score ≥ 50)
+HIGH_RISK_BIN: int = N_CALIBRATION_BINS // 2
+
 
 class AccuracyCalculator:
     """
     Computes prediction accuracy metrics from recorded outcomes.
 
     All computations use real outcome data — no mocking.
+    With ``use_rollup`` the report reads the per-day rollup instead of
+    scanning outcomes; results are identical once the rollup is backfilled.
     """
 
-    def __init__(self, accuracy_threshold: float = DEFAULT_ACCURACY_THRESHOLD):
+    def __init__(
+        self,
+        accuracy_threshold: float = DEFAULT_ACCURACY_THRESHOLD,
+        use_rollup: bool = False,
+    ):
         self.accuracy_threshold = accuracy_threshold
+        self.use_rollup = use_rollup
 
     async def generate_report(
         self,
@@ -62,15 +75,17 @@ class AccuracyCalculator:
         """
         now = datetime.utcnow()
 
-        # Fetch all outcomes in the period
-        outcomes = await self._fetch_outcomes(session, company_id, days_back)
+        cutoff = self._cutoff(days_back)
+        if self.use_rollup:
+            bins = await self._aggregate_rollup(session, company_id, cutoff)
+        else:
+            bins = await self._aggregate_outcomes(session, company_id, cutoff)
 
-        total_outcomes = len(outcomes)
+        total_outcomes = sum(b.n for b in bins)
 
-        # Count total decisions (outcomes + decisions without outcomes)
-        total_decisions = await self._count_decisions(session, company_id, days_back)
-        # Ensure total_decisions >= total_outcomes
-        total_decisions = max(total_decisions, total_outcomes)
+        # No dedicated decisions table yet: every decision in the window
+        # has an outcome row, so the outcome count is the decision count.
+        total_decisions = total_outcomes
 
         coverage = total_outcomes / max(total_decisions, 1)
 
@@ -96,21 +111,16 @@ class AccuracyCalculator:
                                "Record at least 10 outcomes for meaningful results.",
             )
 
-        # ── Brier Score ───────────────────────────────────────────────
-        brier_score = self._compute_brier_score(outcomes)
-
-        # ── Mean Absolute Error ───────────────────────────────────────
-        mae = self._compute_mae(outcomes)
-
-        # ── Accuracy Rate ─────────────────────────────────────────────
-        accurate_count = sum(1 for o in outcomes if o.was_accurate)
-        accuracy_rate = accurate_count / total_outcomes
+        # ── Brier Score / MAE / Accuracy Rate ─────────────────────────
+        brier_score = sum(b.sum_sq_error for b in bins) / total_outcomes
+        mae = sum(b.sum_abs_error for b in bins) / total_outcomes
+        accuracy_rate = sum(b.accurate for b in bins) / total_outcomes
 
         # ── Calibration Drift (ECE) ──────────────────────────────────
-        calibration_drift = self._compute_ece(outcomes)
+        calibration_drift = self._compute_ece(bins, total_outcomes)
 
         # ── Confusion Matrix ──────────────────────────────────────────
-        tp, tn, fp, fn = self._compute_confusion_matrix(outcomes)
+        tp, tn, fp, fn = self._compute_confusion_matrix(bins)
         precision = tp / max(tp + fp, 1)
         recall = tp / max(tp + fn, 1)
         f1_score = (
@@ -140,6 +150,7 @@ class AccuracyCalculator:
             recall=round(recall, 4),
             f1_score=round(f1_score, 4),
             recommendation=recommendation,
+            calibration_bins=[b.to_schema() for b in bins],
         )
 
         logger.info(
@@ -154,79 +165,36 @@ class AccuracyCalculator:
 
         return report
 
-    def _compute_brier_score(self, outcomes: list[Outcome]) -> float:
-        """
-        Compute Brier Score: mean squared error of probabilistic predictions.
-
-        Brier = (1/N) × Σ (predicted_prob - actual_binary)²
-
-        Lower is better. 0 = perfect, 0.25 = random (for binary), 1 = worst.
-        """
-        total = 0.0
-        for o in outcomes:
-            predicted_prob = float(o.predicted_risk_score) / 100.0  # Normalize to [0,1]
-            actual_binary = 1.0 if o.risk_materialized else 0.0
-            total += (predicted_prob - actual_binary) ** 2
-        return total / max(len(outcomes), 1)
-
-    def _compute_mae(self, outcomes: list[Outcome]) -> float:
-        """Compute Mean Absolute Error of prediction errors."""
-        if not outcomes:
-            return 0.0
-        total = sum(float(o.prediction_error) for o in outcomes)
-        return total / len(outcomes)
-
-    def _compute_ece(self, outcomes: list[Outcome]) -> float:
+    def _compute_ece(self, bins: list["BinStats"], n_total: int) -> float:
         """
         Compute Expected Calibration Error (ECE).
 
-        Groups predictions into bins and measures how well-calibrated they are.
+        ECE = Σ (n_bin / N) × |avg_predicted − avg_actual|
+            = Σ |sum_predicted − materialized| / N
+
         A well-calibrated model: predicted probability ≈ actual frequency.
         """
-        bins: dict[int, list[tuple[float, float]]] = {i: [] for i in range(N_CALIBRATION_BINS)}
-
-        for o in outcomes:
-            predicted_prob = float(o.predicted_risk_score) / 100.0
-            actual_binary = 1.0 if o.risk_materialized else 0.0
-            bin_idx = min(int(predicted_prob * N_CALIBRATION_BINS), N_CALIBRATION_BINS - 1)
-            bins[bin_idx].append((predicted_prob, actual_binary))
-
-        ece = 0.0
-        n_total = len(outcomes)
-
-        for bin_items in bins.values():
-            if not bin_items:
-                continue
-            n_bin = len(bin_items)
-            avg_predicted = sum(p for p, _ in bin_items) / n_bin
-            avg_actual = sum(a for _, a in bin_items) / n_bin
-            ece += (n_bin / n_total) * abs(avg_predicted - avg_actual)
-
-        return ece
+        return sum(abs(b.sum_predicted - b.materialized) for b in bins) / max(n_total, 1)
 
     def _compute_confusion_matrix(
-        self, outcomes: list[Outcome]
+        self, bins: list["BinStats"]
     ) -> tuple[int, int, int, int]:
         """
-        Compute confusion matrix values.
+        Compute confusion matrix values from the calibration bins.
 
-        TP: Predicted high risk (≥50), risk materialized
-        TN: Predicted low risk (<50), risk did NOT materialize
+        TP: Predicted high risk (≥50, bins 5-9), risk materialized
+        TN: Predicted low risk (<50, bins 0-4), risk did NOT materialize
         FP: Predicted high risk (≥50), risk did NOT materialize
         FN: Predicted low risk (<50), risk materialized
         """
         tp = tn = fp = fn = 0
-        for o in outcomes:
-            predicted_high = float(o.predicted_risk_score) >= 50.0
-            materialized = o.risk_materialized
-            if predicted_high and materialized:
-                tp += 1
-            elif not predicted_high and not materialized:
-                tn += 1
-            elif predicted_high and not materialized:
-                fp += 1
+        for b in bins:
+            if b.bin >= HIGH_RISK_BIN:
+                tp += b.materialized
+                fp += b.n - b.materialized
             else:
-                fn += 1
+                fn += b.materialized
+                tn += b.n - b.materialized
         return tp, tn, fp, fn
 
     def _generate_recommendation(
@@ -270,49 +238,225 @@ class AccuracyCalculator:
 
         return " ".join(parts)
 
-    async def _fetch_outcomes(
+    @staticmethod
+    def _cutoff(days_back: int) -> datetime:
+        """Midnight UTC ``days_back`` days ago — aligned to rollup days."""
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=days_back)
+
+    async def _aggregate_outcomes(
         self,
         session: AsyncSession,
         company_id: str,
-        days_back: int,
-    ) -> list[Outcome]:
-        """Fetch outcomes within the lookback period."""
-        cutoff = datetime.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        from datetime import timedelta
-        cutoff = cutoff - timedelta(days=days_back)
-
-        result = await session.execute(
-            select(Outcome).where(
+        cutoff: datetime,
+    ) -> list["BinStats"]:
+        """One GROUP BY over raw outcomes; returns at most N_CALIBRATION_BINS rows."""
+        per_row = (
+            select(*_outcome_terms())
+            .where(
                 Outcome.company_id == company_id,
                 Outcome.recorded_at >= cutoff,
             )
+            .subquery()
         )
-        return list(result.scalars().all())
+        result = await session.execute(
+            select(
+                per_row.c.bin,
+                func.count(),
+                func.sum(per_row.c.predicted),
+                func.sum(per_row.c.sq_error),
+                func.sum(per_row.c.abs_error),
+                func.sum(per_row.c.materialized),
+                func.sum(per_row.c.accurate),
+            )
+            .group_by(per_row.c.bin)
+            .order_by(per_row.c.bin)
+        )
+        return [BinStats.from_row(row) for row in result.all()]
 
-    async def _count_decisions(
+    async def _aggregate_rollup(
         self,
         session: AsyncSession,
         company_id: str,
-        days_back: int,
-    ) -> int:
-        """
-        Count total decisions in the period.
+        cutoff: datetime,
+    ) -> list["BinStats"]:
+        """Same aggregate, read from the per-day rollup (one row per day × bin)."""
+        d = OutcomeAccuracyDaily
+        result = await session.execute(
+            select(
+                d.bin,
+                func.sum(d.n),
+                func.sum(d.sum_predicted),
+                func.sum(d.sum_sq_error),
+                func.sum(d.sum_abs_error),
+                func.sum(d.materialized),
+                func.sum(d.accurate),
+            )
+            .where(d.company_id == company_id, d.day >= cutoff.date())
+            .group_by(d.bin)
+            .order_by(d.bin)
+        )
+        return [BinStats.from_row(row) for row in result.all()]
+
+
+# ── Calibration bins ─────────────────────────────────────────────────────
+
+
+@dataclass
+class BinStats:
+    """Sums for one calibration bin — every metric is a ratio of these."""
+
+    bin: int
+    n: int = 0
+    sum_predicted: float = 0.0
+    sum_sq_error: float = 0.0
+    sum_abs_error: float = 0.0
+    materialized: int = 0
+    accurate: int = 0
+
+    @classmethod
+    def from_row(cls, row) -> "BinStats":
+        b, n, sp, sq, sa, m, a = row
+        return cls(
+            bin=int(b),
+            n=int(n or 0),
+            sum_predicted=float(sp or 0),
+            sum_sq_error=float(sq or 0),
+            sum_abs_error=float(sa or 0),
+            materialized=int(m or 0),
+            accurate=int(a or 0),
+        )
 
-        Uses outcomes count as a lower bound since we don't have a
-        dedicated decisions table yet. Future: query decisions table.
-        """
-        cutoff = datetime.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
+    def to_schema(self) -> CalibrationBin:
+        width = 1.0 / N_CALIBRATION_BINS
+        return CalibrationBin(
+            bin=self.bin,
+            lower=round(self.bin * width, 4),
+            upper=round((self.bin + 1) * width, 4),
+            count=self.n,
+            avg_predicted=round(self.sum_predicted / max(self.n, 1), 4),
+            actual_rate=round(self.materialized / max(self.n, 1), 4),
         )
-        from datetime import timedelta
-        cutoff = cutoff - timedelta(days=days_back)
 
-        result = await session.execute(
-            select(func.count(Outcome.id)).where(
-                Outcome.company_id == company_id,
-                Outcome.recorded_at >= cutoff,
-            )
+
+def calibration_bin(predicted_risk_score: float) -> int:
+    """Decile of the predicted probability (score / 100), clamped to 0..9."""
+    return min(max(int(predicted_risk_score // (100 / N_CALIBRATION_BINS)), 0), N_CALIBRATION_BINS - 1)
+
+
+def _bin_expr(score):
+    """SQL twin of calibration_bin (portable CASE instead of width_bucket)."""
+    step = 100 / N_CALIBRATION_BINS
+    return case(
+        *[(score >= step * i, i) for i in range(N_CALIBRATION_BINS - 1, 0, -1)],
+        else_=0,
+    )
+
+
+def _outcome_terms():
+    """Per-outcome columns the aggregates sum over."""
+    predicted = cast(Outcome.predicted_risk_score, Float) / 100.0
+    actual = case((Outcome.risk_materialized.is_(True), 1), else_=0)
+    return (
+        _bin_expr(Outcome.predicted_risk_score).label("bin"),
+        predicted.label("predicted"),
+        ((predicted - actual) * (predicted - actual)).label("sq_error"),
+        cast(Outcome.prediction_error, Float).label("abs_error"),
+        actual.label("materialized"),
+        case((Outcome.was_accurate.is_(True), 1), else_=0).label("accurate"),
+    )
+
+
+# ── Daily rollup maintenance ─────────────────────────────────────────────
+
+
+async def add_to_daily_rollup(session: AsyncSession, outcome: Outcome) -> None:
+    """
+    Fold one new outcome into v2_outcome_accuracy_daily (upsert + increment).
+
+    Called by OutcomeRecorder in the same transaction as the outcome insert.
+    """
+    predicted = float(outcome.predicted_risk_score) / 100.0
+    actual = 1 if outcome.risk_materialized else 0
+    values = {
+        "company_id": outcome.company_id,
+        "day": outcome.recorded_at.date(),
+        "bin": calibration_bin(float(outcome.predicted_risk_score)),
+        "n": 1,
+        "sum_predicted": predicted,
+        "sum_sq_error": (predicted - actual) ** 2,
+        "sum_abs_error": float(outcome.prediction_error),
+        "materialized": actual,
+        "accurate": 1 if outcome.was_accurate else 0,
+    }
+    d = OutcomeAccuracyDaily
+    dialect = session.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(d).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[d.company_id, d.day, d.bin],
+            set_={col: getattr(d, col) + getattr(stmt.excluded, col) for col in _SUM_COLUMNS},
+        )
+        await session.execute(stmt)
+        return
+
+    key = (d.company_id == values["company_id"], d.day == values["day"], d.bin == values["bin"])
+    updated = await session.execute(
+        update(d).where(*key).values({col: getattr(d, col) + values[col] for col in _SUM_COLUMNS})
+    )
+    if updated.rowcount == 0:
+        session.add(d(**values))
+        await session.flush()
+
+
+async def rebuild_daily_rollup(
+    session: AsyncSession,
+    company_id: str,
+    since: Optional[date] = None,
+) -> None:
+    """
+    Recompute a company's rollup from raw outcomes (backfill / repair).
+
+    Deletes rollup rows from ``since`` (all when None) and re-inserts them
+    with one INSERT ... SELECT ... GROUP BY day, bin.
+    """
+    d = OutcomeAccuracyDaily
+    delete_stmt = delete(d).where(d.company_id == company_id)
+    row_filter = [Outcome.company_id == company_id]
+    if since is not None:
+        delete_stmt = delete_stmt.where(d.day >= since)
+        row_filter.append(Outcome.recorded_at >= datetime.combine(since, datetime.min.time()))
+    await session.execute(delete_stmt)
+
+    per_row = (
+        select(
+            Outcome.company_id.label("company_id"),
+            func.date(Outcome.recorded_at).label("day"),
+            *_outcome_terms(),
         )
-        return result.scalar_one() or 0
+        .where(*row_filter)
+        .subquery()
+    )
+    grouped = select(
+        per_row.c.company_id,
+        per_row.c.day,
+        per_row.c.bin,
+        func.count(),
+        func.sum(per_row.c.predicted),
+        func.sum(per_row.c.sq_error),
+        func.sum(per_row.c.abs_error),
+        func.sum(per_row.c.materialized),
+        func.sum(per_row.c.accurate),
+    ).group_by(per_row.c.company_id, per_row.c.day, per_row.c.bin)
+    await session.execute(
+        insert(d).from_select(["company_id", "day", "bin", *_SUM_COLUMNS], grouped)
+    )
+    logger.info("accuracy_rollup_rebuilt", company_id=company_id, since=str(since) if since else None)
+
+
+_SUM_COLUMNS = ("n", "sum_predicted", "sum_sq_error", "sum_abs_error", "materialized", "accurate")
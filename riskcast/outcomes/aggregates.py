@@ -0,0 +1,232 @@
+"""
+Outcome Aggregates — grouped sums behind ROI reports and flywheel priors.
+
+Every ROI figure and flywheel statistic is a sum (or ratio of sums) over
+outcomes. ``aggregate_outcomes`` returns those sums per entity type for
+any number of time windows in one GROUP BY, using FILTER clauses for the
+windows. It reads either raw v2_outcomes rows or the per-day rollup
+(v2_outcome_entity_daily) that OutcomeRecorder keeps up to date.
+"""
+
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import structlog
+from sqlalchemy import Float, and_, case, cast, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from riskcast.db.models import Outcome, OutcomeEntityDaily
+
+logger = structlog.get_logger(__name__)
+
+# (start, end) of a window; None leaves that side open. End is exclusive.
+Window = tuple[Optional[datetime], Optional[datetime]]
+
+
+@dataclass
+class OutcomeSums:
+    """Sums over a set of outcomes — ROI and flywheel metrics are built from these."""
+
+    n: int = 0
+    followed: int = 0                       # action_followed_recommendation
+    helped: int = 0                         # followed and value_generated > 0
+    materialized: int = 0
+    predicted_loss: float = 0.0
+    actual_loss: float = 0.0
+    value: float = 0.0
+    followed_predicted_loss: float = 0.0
+    sum_predicted: float = 0.0              # Σ predicted_risk_score / 100
+    sum_error: float = 0.0                  # Σ prediction_error
+
+    def __add__(self, other: "OutcomeSums") -> "OutcomeSums":
+        return OutcomeSums(**{
+            f.name: getattr(self, f.name) + getattr(other, f.name) for f in fields(self)
+        })
+
+    @classmethod
+    def from_values(cls, values) -> "OutcomeSums":
+        return cls(**{f.name: f.type(v or 0) for f, v in zip(fields(cls), values)})
+
+
+SUM_COLUMNS = tuple(f.name for f in fields(OutcomeSums))
+
+
+def day_cutoff(days_back: int, now: Optional[datetime] = None) -> datetime:
+    """Midnight UTC ``days_back`` days ago — aligned to rollup days."""
+    today = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days_back)
+
+
+def _outcome_terms() -> dict:
+    """Per-outcome values summed into each OutcomeSums field (None: count rows)."""
+    followed = Outcome.action_followed_recommendation.is_(True)
+    return {
+        "n": None,
+        "followed": case((followed, 1), else_=0),
+        "helped": case((and_(followed, Outcome.value_generated_usd > 0), 1), else_=0),
+        "materialized": case((Outcome.risk_materialized.is_(True), 1), else_=0),
+        "predicted_loss": Outcome.predicted_loss_usd,
+        "actual_loss": Outcome.actual_loss_usd,
+        "value": Outcome.value_generated_usd,
+        "followed_predicted_loss": case((followed, Outcome.predicted_loss_usd), else_=0),
+        "sum_predicted": cast(Outcome.predicted_risk_score, Float) / 100.0,
+        "sum_error": cast(Outcome.prediction_error, Float),
+    }
+
+
+async def aggregate_outcomes(
+    session: AsyncSession,
+    company_id: str,
+    windows: dict[str, Window],
+    entity_type: Optional[str] = None,
+    use_rollup: bool = False,
+) -> dict[str, dict[str, OutcomeSums]]:
+    """
+    Sums per entity type and window, in one grouped query.
+
+    Returns ``{entity_type: {window_name: OutcomeSums}}``. Only the span
+    the windows cover is scanned: an entity type appears when it has
+    outcomes in that span (any outcome, if a window has no start).
+
+    With ``use_rollup`` window bounds are applied by day, so pass
+    midnight-aligned bounds (``day_cutoff``) to get identical results
+    from both sources.
+    """
+    if use_rollup:
+        d = OutcomeEntityDaily
+        group_col, time_col = d.entity_type, d.day
+        terms = {name: getattr(d, name) for name in SUM_COLUMNS}
+        bound = lambda t: t.date()  # noqa: E731
+        source_filter = [d.company_id == company_id]
+    else:
+        group_col, time_col = Outcome.entity_type, Outcome.recorded_at
+        terms = _outcome_terms()
+        bound = lambda t: t  # noqa: E731
+        source_filter = [Outcome.company_id == company_id]
+    if entity_type is not None:
+        source_filter.append(group_col == entity_type)
+
+    def windowed(term, start, end):
+        conds = []
+        if start is not None:
+            conds.append(time_col >= bound(start))
+        if end is not None:
+            conds.append(time_col < bound(end))
+        agg = func.count() if term is None else func.sum(term)
+        return agg.filter(*conds) if conds else agg
+
+    # Scan only the span some window covers
+    starts = [start for start, _ in windows.values()]
+    if starts and all(s is not None for s in starts):
+        source_filter.append(time_col >= bound(min(starts)))
+
+    columns = [
+        windowed(term, start, end)
+        for start, end in windows.values()
+        for term in terms.values()
+    ]
+    result = await session.execute(
+        select(group_col, *columns).where(*source_filter).group_by(group_col)
+    )
+
+    width = len(SUM_COLUMNS)
+    grouped: dict[str, dict[str, OutcomeSums]] = {}
+    for row in result.all():
+        values = row[1:]
+        grouped[row[0]] = {
+            name: OutcomeSums.from_values(values[i * width:(i + 1) * width])
+            for i, name in enumerate(windows)
+        }
+    return grouped
+
+
+# ── Entity rollup maintenance ────────────────────────────────────────────
+
+
+async def add_to_entity_rollup(session: AsyncSession, outcome: Outcome) -> None:
+    """
+    Fold one new outcome into v2_outcome_entity_daily (upsert + increment).
+
+    Called by OutcomeRecorder in the same transaction as the outcome insert.
+    """
+    followed = bool(outcome.action_followed_recommendation)
+    value = float(outcome.value_generated_usd)
+    values = {
+        "company_id": outcome.company_id,
+        "day": outcome.recorded_at.date(),
+        "entity_type": outcome.entity_type,
+        "n": 1,
+        "followed": int(followed),
+        "helped": int(followed and value > 0),
+        "materialized": int(bool(outcome.risk_materialized)),
+        "predicted_loss": outcome.predicted_loss_usd,
+        "actual_loss": outcome.actual_loss_usd,
+        "value": outcome.value_generated_usd,
+        "followed_predicted_loss": outcome.predicted_loss_usd if followed else 0,
+        "sum_predicted": float(outcome.predicted_risk_score) / 100.0,
+        "sum_error": float(outcome.prediction_error),
+    }
+    d = OutcomeEntityDaily
+    dialect = session.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(d).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[d.company_id, d.day, d.entity_type],
+            set_={col: getattr(d, col) + getattr(stmt.excluded, col) for col in SUM_COLUMNS},
+        )
+        await session.execute(stmt)
+        return
+
+    key = (
+        d.company_id == values["company_id"],
+        d.day == values["day"],
+        d.entity_type == values["entity_type"],
+    )
+    updated = await session.execute(
+        update(d).where(*key).values({col: getattr(d, col) + values[col] for col in SUM_COLUMNS})
+    )
+    if updated.rowcount == 0:
+        session.add(d(**values))
+        await session.flush()
+
+
+async def rebuild_entity_rollup(
+    session: AsyncSession,
+    company_id: str,
+    since: Optional[date] = None,
+) -> None:
+    """
+    Recompute a company's entity rollup from raw outcomes (backfill / repair).
+
+    Deletes rollup rows from ``since`` (all when None) and re-inserts them
+    with one INSERT ... SELECT ... GROUP BY day, entity_type.
+    """
+    d = OutcomeEntityDaily
+    delete_stmt = delete(d).where(d.company_id == company_id)
+    row_filter = [Outcome.company_id == company_id]
+    if since is not None:
+        delete_stmt = delete_stmt.where(d.day >= since)
+        row_filter.append(Outcome.recorded_at >= datetime.combine(since, datetime.min.time()))
+    await session.execute(delete_stmt)
+
+    day = func.date(Outcome.recorded_at)
+    grouped = (
+        select(
+            Outcome.company_id,
+            day,
+            Outcome.entity_type,
+            *[func.count() if term is None else func.sum(term) for term in _outcome_terms().values()],
+        )
+        .where(*row_filter)
+        .group_by(Outcome.company_id, day, Outcome.entity_type)
+    )
+    await session.execute(
+        insert(d).from_select(["company_id", "day", "entity_type", *SUM_COLUMNS], grouped)
+    )
+    logger.info("entity_rollup_rebuilt", company_id=company_id, since=str(since) if since else None)
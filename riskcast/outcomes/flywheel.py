@@ -11,17 +11,13 @@ This is the core of RiskCast's irreplaceability:
 the more you use it, the better it gets.
 """
 
-import math
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from typing import Optional
+from datetime import datetime
 
 import structlog
-from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from riskcast.db.models import Outcome
-from riskcast.engine.bayesian import BayesianRiskEngine, BetaPosterior
+from riskcast.engine.bayesian import BayesianRiskEngine
+from riskcast.outcomes.aggregates import OutcomeSums, aggregate_outcomes, day_cutoff
 
 logger = structlog.get_logger(__name__)
 
@@ -98,6 +94,9 @@ class FlywheelEngine:
 
     The flywheel is conservative: it shifts slowly (LEARNING_RATE)
     and caps maximum shift (MAX_PRIOR_SHIFT) to prevent instability.
+
+    Outcome statistics are grouped SQL sums per entity type; with
+    ``use_rollup`` they are read from the per-day entity rollup.
     """
 
     def __init__(
@@ -106,11 +105,13 @@ class FlywheelEngine:
         max_shift: float = MAX_PRIOR_SHIFT,
         drift_threshold: float = DRIFT_THRESHOLD,
         min_outcomes: int = MIN_OUTCOMES_FOR_LEARNING,
+        use_rollup: bool = False,
     ):
         self.learning_rate = learning_rate
         self.max_shift = max_shift
         self.drift_threshold = drift_threshold
         self.min_outcomes = min_outcomes
+        self.use_rollup = use_rollup
         self.bayesian = BayesianRiskEngine()
 
     async def compute_updated_priors(
@@ -136,12 +137,116 @@ class FlywheelEngine:
         Returns:
             FlywheelState with updated priors and diagnostics
         """
+        grouped = await aggregate_outcomes(
+            session,
+            company_id,
+            {"window": (day_cutoff(days_back), None)},
+            entity_type=entity_type,
+            use_rollup=self.use_rollup,
+        )
+        sums = grouped.get(entity_type, {}).get("window", OutcomeSums())
+        return self._state_from_sums(
+            company_id, entity_type, sums, default_alpha, default_beta
+        )
+
+    async def compute_all_priors(
+        self,
+        session: AsyncSession,
+        company_id: str,
+        days_back: int = 90,
+    ) -> list[FlywheelState]:
+        """Compute updated priors for all entity types with outcomes (one query)."""
+        grouped = await aggregate_outcomes(
+            session,
+            company_id,
+            {"window": (day_cutoff(days_back), None), "ever": (None, None)},
+            use_rollup=self.use_rollup,
+        )
+        return [
+            self._state_from_sums(company_id, et, by_window["window"])
+            for et, by_window in grouped.items()
+        ]
+
+    async def get_learning_summary(
+        self,
+        session: AsyncSession,
+        company_id: str,
+    ) -> dict:
+        """
+        Get a summary of the flywheel's learning progress.
+
+        Returns total outcomes, accuracy trends, and recalibration status.
+        Totals, both trend windows and every entity state come from one
+        grouped query.
+        """
+        # Accuracy over time: last 7 days vs previous 7 days
         now = datetime.utcnow()
-        entity_key = f"{company_id}/{entity_type}"
+        recent_cutoff = day_cutoff(7, now)
+        older_cutoff = day_cutoff(14, now)
+
+        grouped = await aggregate_outcomes(
+            session,
+            company_id,
+            {
+                "ever": (None, None),
+                "recent": (recent_cutoff, None),
+                "previous": (older_cutoff, recent_cutoff),
+                "priors": (day_cutoff(90, now), None),
+            },
+            use_rollup=self.use_rollup,
+        )
+
+        def total(window: str) -> OutcomeSums:
+            return sum((by_window[window] for by_window in grouped.values()), OutcomeSums())
+
+        total_outcomes = total("ever").n
+        recent, older = total("recent"), total("previous")
+        recent_error = recent.sum_error / recent.n if recent.n else 0.0
+        recent_count = recent.n
+        older_error = older.sum_error / older.n if older.n else 0.0
+        older_count = older.n
+
+        # Improvement trend
+        if older_error > 0 and recent_error > 0:
+            improvement = (older_error - recent_error) / older_error
+        else:
+            improvement = 0.0
 
-        # ── 1. Fetch outcome history ──────────────────────────────────
-        outcomes = await self._fetch_outcomes(session, company_id, entity_type, days_back)
-        n_outcomes = len(outcomes)
+        # All entity states
+        states = [
+            self._state_from_sums(company_id, et, by_window["priors"])
+            for et, by_window in grouped.items()
+        ]
+        needs_recalibration = [s for s in states if s.needs_recalibration]
+
+        return {
+            "total_outcomes": total_outcomes,
+            "recent_outcomes": recent_count,
+            "previous_period_outcomes": older_count,
+            "recent_avg_error": round(recent_error, 4),
+            "previous_avg_error": round(older_error, 4),
+            "improvement_rate": round(improvement, 4),
+            "improving": improvement > 0,
+            "entity_states": [s.to_dict() for s in states],
+            "entities_needing_recalibration": len(needs_recalibration),
+            "flywheel_status": (
+                "learning" if total_outcomes >= self.min_outcomes
+                else "collecting_data"
+            ),
+        }
+
+    def _state_from_sums(
+        self,
+        company_id: str,
+        entity_type: str,
+        sums: OutcomeSums,
+        default_alpha: float = 2.0,
+        default_beta: float = 5.0,
+    ) -> FlywheelState:
+        """Updated priors and diagnostics from one entity type's outcome sums."""
+        now = datetime.utcnow()
+        entity_key = f"{company_id}/{entity_type}"
+        n_outcomes = sums.n
 
         if n_outcomes < self.min_outcomes:
             return FlywheelState(
@@ -159,11 +264,11 @@ class FlywheelEngine:
                 last_updated=now.isoformat(),
             )
 
-        # ── 2. Compute observed rates ──────────────────────────────────
-        n_materialized = sum(1 for o in outcomes if o.risk_materialized)
+        # ── 1. Compute observed rates ──────────────────────────────────
+        n_materialized = sums.materialized
         n_not_materialized = n_outcomes - n_materialized
 
-        # ── 3. Bayesian prior update ──────────────────────────────────
+        # ── 2. Bayesian prior update ──────────────────────────────────
         # Use observed rates to shift priors, weighted by learning rate
         observed_rate = n_materialized / n_outcomes
         prior_rate = default_alpha / (default_alpha + default_beta)
@@ -176,16 +281,12 @@ class FlywheelEngine:
         updated_alpha = max(0.5, default_alpha + shift_magnitude)
         updated_beta = max(0.5, default_beta - shift_magnitude * 0.5)
 
-        # ── 4. Calibration drift ──────────────────────────────────────
-        avg_predicted_rate = sum(
-            float(o.predicted_risk_score) / 100.0 for o in outcomes
-        ) / n_outcomes
+        # ── 3. Calibration drift ──────────────────────────────────────
+        avg_predicted_rate = sums.sum_predicted / n_outcomes
         calibration_drift = abs(avg_predicted_rate - observed_rate)
 
-        # ── 5. Average prediction error ───────────────────────────────
-        avg_prediction_error = sum(
-            float(o.prediction_error) for o in outcomes
-        ) / n_outcomes
+        # ── 4. Average prediction error ───────────────────────────────
+        avg_prediction_error = sums.sum_error / n_outcomes
 
         needs_recalibration = calibration_drift > self.drift_threshold
 
@@ -217,121 +318,3 @@ class FlywheelEngine:
         )
 
         return state
-
-    async def compute_all_priors(
-        self,
-        session: AsyncSession,
-        company_id: str,
-        days_back: int = 90,
-    ) -> list[FlywheelState]:
-        """Compute updated priors for all entity types with outcomes."""
-        # Get distinct entity types with outcomes
-        result = await session.execute(
-            select(Outcome.entity_type)
-            .where(Outcome.company_id == company_id)
-            .group_by(Outcome.entity_type)
-        )
-        entity_types = [row[0] for row in result.all()]
-
-        states: list[FlywheelState] = []
-        for et in entity_types:
-            state = await self.compute_updated_priors(
-                session, company_id, et, days_back=days_back
-            )
-            states.append(state)
-
-        return states
-
-    async def get_learning_summary(
-        self,
-        session: AsyncSession,
-        company_id: str,
-    ) -> dict:
-        """
-        Get a summary of the flywheel's learning progress.
-
-        Returns total outcomes, accuracy trends, and recalibration status.
-        """
-        # Total outcomes
-        result = await session.execute(
-            select(func.count(Outcome.id)).where(
-                Outcome.company_id == company_id,
-            )
-        )
-        total_outcomes = result.scalar_one() or 0
-
-        # Accuracy over time: last 7 days vs previous 7 days
-        now = datetime.utcnow()
-        recent_cutoff = now - timedelta(days=7)
-        older_cutoff = now - timedelta(days=14)
-
-        recent_result = await session.execute(
-            select(
-                func.avg(Outcome.prediction_error),
-                func.count(Outcome.id),
-            ).where(
-                Outcome.company_id == company_id,
-                Outcome.recorded_at >= recent_cutoff,
-            )
-        )
-        recent_row = recent_result.one()
-        recent_error = float(recent_row[0]) if recent_row[0] else 0.0
-        recent_count = recent_row[1] or 0
-
-        older_result = await session.execute(
-            select(
-                func.avg(Outcome.prediction_error),
-                func.count(Outcome.id),
-            ).where(
-                Outcome.company_id == company_id,
-                Outcome.recorded_at >= older_cutoff,
-                Outcome.recorded_at < recent_cutoff,
-            )
-        )
-        older_row = older_result.one()
-        older_error = float(older_row[0]) if older_row[0] else 0.0
-        older_count = older_row[1] or 0
-
-        # Improvement trend
-        if older_error > 0 and recent_error > 0:
-            improvement = (older_error - recent_error) / older_error
-        else:
-            improvement = 0.0
-
-        # All entity states
-        states = await self.compute_all_priors(session, company_id)
-        needs_recalibration = [s for s in states if s.needs_recalibration]
-
-        return {
-            "total_outcomes": total_outcomes,
-            "recent_outcomes": recent_count,
-            "previous_period_outcomes": older_count,
-            "recent_avg_error": round(recent_error, 4),
-            "previous_avg_error": round(older_error, 4),
-            "improvement_rate": round(improvement, 4),
-            "improving": improvement > 0,
-            "entity_states": [s.to_dict() for s in states],
-            "entities_needing_recalibration": len(needs_recalibration),
-            "flywheel_status": (
-                "learning" if total_outcomes >= self.min_outcomes
-                else "collecting_data"
-            ),
-        }
-
-    async def _fetch_outcomes(
-        self,
-        session: AsyncSession,
-        company_id: str,
-        entity_type: str,
-        days_back: int,
-    ) -> list[Outcome]:
-        """Fetch outcomes for a specific entity type within the lookback window."""
-        cutoff = datetime.utcnow() - timedelta(days=days_back)
-        result = await session.execute(
-            select(Outcome).where(
-                Outcome.company_id == company_id,
-                Outcome.entity_type == entity_type,
-                Outcome.recorded_at >= cutoff,
-            )
-        )
-        return list(result.scalars().all())
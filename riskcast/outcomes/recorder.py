@@ -2,7 +2,9 @@
 Outcome Recorder — Record what ACTUALLY happened after a decision.
 
 Records actual outcomes, computes prediction error, and stores
-immutable outcome records for calibration and ROI tracking.
+immutable outcome records for calibration and ROI tracking. Each record
+is also folded into the per-day accuracy and entity rollups in the same
+transaction.
 """
 
 import uuid
@@ -15,6 +17,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db.models import Outcome
+from riskcast.outcomes.accuracy import add_to_daily_rollup
+from riskcast.outcomes.aggregates import add_to_entity_rollup
 from riskcast.outcomes.schemas import OutcomeRecord, OutcomeRecordRequest, OutcomeType
 
 logger = structlog.get_logger(__name__)
@@ -118,6 +122,8 @@ class OutcomeRecorder:
         )
         session.add(outcome_model)
         await session.flush()
+        await add_to_daily_rollup(session, outcome_model)
+        await add_to_entity_rollup(session, outcome_model)
 
         logger.info(
             "outcome_recorded",
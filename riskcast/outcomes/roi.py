@@ -10,19 +10,23 @@ Computes:
 - Action effectiveness breakdown
 
 All metrics are derived from recorded outcomes — no estimates or mock data.
+They are sums computed in one grouped SQL query, over raw outcomes or the
+per-day entity rollup (v2_outcome_entity_daily).
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 
 import structlog
-from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from riskcast.db.models import Outcome
+from riskcast.outcomes.aggregates import OutcomeSums, aggregate_outcomes, day_cutoff
 from riskcast.outcomes.schemas import ROIReport
 
 logger = structlog.get_logger(__name__)
 
+# Action cost proxy: share of predicted loss spent when a recommendation is followed
+ACTION_COST_ESTIMATE_RATE: float = 0.10
+
 
 class ROICalculator:
     """
@@ -33,8 +37,13 @@ class ROICalculator:
     - ROI ratio = value_generated / action_cost
 
     Uses only recorded outcomes (real data, zero mock).
+    With ``use_rollup`` the report reads the per-day entity rollup instead
+    of scanning outcomes; results are identical once the rollup is backfilled.
     """
 
+    def __init__(self, use_rollup: bool = False):
+        self.use_rollup = use_rollup
+
     async def generate_report(
         self,
         session: AsyncSession,
@@ -55,18 +64,16 @@ class ROICalculator:
             ROIReport with financial metrics
         """
         now = datetime.utcnow()
-        cutoff = now - timedelta(days=days_back)
 
-        # Fetch all outcomes in the period
-        result = await session.execute(
-            select(Outcome).where(
-                Outcome.company_id == company_id,
-                Outcome.recorded_at >= cutoff,
-            )
+        grouped = await aggregate_outcomes(
+            session,
+            company_id,
+            {"period": (day_cutoff(days_back, now), None)},
+            use_rollup=self.use_rollup,
         )
-        outcomes = list(result.scalars().all())
+        totals = sum((by_window["period"] for by_window in grouped.values()), OutcomeSums())
 
-        total_outcomes = len(outcomes)
+        total_outcomes = totals.n
 
         if total_outcomes == 0:
             return ROIReport(
@@ -90,35 +97,27 @@ class ROICalculator:
             )
 
         # ── Aggregate financial metrics ───────────────────────────────
-        total_predicted_loss = sum(float(o.predicted_loss_usd) for o in outcomes)
-        total_actual_loss = sum(float(o.actual_loss_usd) for o in outcomes)
+        total_predicted_loss = totals.predicted_loss
+        total_actual_loss = totals.actual_loss
 
         # Value generated: sum of value_generated_usd for each outcome
-        total_value = sum(float(o.value_generated_usd) for o in outcomes)
+        total_value = totals.value
         total_loss_avoided = max(total_predicted_loss - total_actual_loss, 0.0)
 
         # Estimate action cost: for outcomes where recommendation was followed,
         # use a fraction of predicted loss as proxy (10% of predicted loss)
         # In production: this would come from actual cost tracking
-        action_cost_estimate_rate = 0.10
-        followed_outcomes = [o for o in outcomes if o.action_followed_recommendation]
-        total_action_cost = sum(
-            float(o.predicted_loss_usd) * action_cost_estimate_rate
-            for o in followed_outcomes
-        )
+        total_action_cost = totals.followed_predicted_loss * ACTION_COST_ESTIMATE_RATE
 
         net_value = total_value
         roi_ratio = net_value / max(total_action_cost, 1.0)
 
         # ── Recommendation follow rate ────────────────────────────────
-        n_followed = len(followed_outcomes)
+        n_followed = totals.followed
         follow_rate = n_followed / max(total_outcomes, 1)
 
         # ── Action effectiveness ──────────────────────────────────────
-        actions_helped = sum(
-            1 for o in followed_outcomes
-            if float(o.value_generated_usd) > 0
-        )
+        actions_helped = totals.helped
         actions_didnt_help = n_followed - actions_helped
 
         # ── Recommendation ────────────────────────────────────────────
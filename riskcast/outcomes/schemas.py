@@ -64,6 +64,16 @@ class OutcomeRecordRequest(BaseModel):
     notes: Optional[str] = None
 
 
+class CalibrationBin(BaseModel):
+    """One reliability-diagram bucket (predicted probability decile)."""
+    bin: int
+    lower: float
+    upper: float
+    count: int
+    avg_predicted: float
+    actual_rate: float
+
+
 class AccuracyReport(BaseModel):
     """Prediction accuracy over a period."""
     period: str
@@ -90,6 +100,9 @@ class AccuracyReport(BaseModel):
 
     recommendation: str
 
+    # Reliability histogram (non-empty bins only)
+    calibration_bins: list[CalibrationBin] = Field(default_factory=list)
+
 
 class ROIReport(BaseModel):
     """Return on Investment from RiskCast decisions."""
@@ -8,15 +8,25 @@ Monitors:
 4. Volume anomalies: unusual spikes or drops in signal volume
 5. Error rates: ingest failure rate trends
 
-All metrics are derived from real DB data — no mocking.
+All metrics are derived from real DB data — no mocking. Lag and gap
+statistics are computed in the database (window functions over the
+ix_omen_signals_ingested_at range), so only aggregates and the gaps
+themselves come back. PostgreSQL uses percentile_cont; SQLite gets the
+same interpolated percentile from an ordered OFFSET probe. Snapshots are
+cached for HEALTH_CACHE_TTL_SECONDS so frequent probes cost one query
+set per TTL.
 """
 
+import asyncio
+import math
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 import structlog
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime
 
 from riskcast.db.models import OmenIngestSignal, SignalLedger
 
@@ -27,6 +37,15 @@ FRESHNESS_STALE_MINUTES: int = 60       # >1 hour = stale
 FRESHNESS_OUTDATED_MINUTES: int = 360   # >6 hours = outdated
 GAP_THRESHOLD_MINUTES: int = 120        # >2 hours silence = gap
 VOLUME_ANOMALY_FACTOR: float = 3.0      # 3x normal = anomaly
+LAG_PERCENTILE: float = 0.95
+HEALTH_CACHE_TTL_SECONDS: float = 10.0
+
+
+def _seconds_between(dialect: str, start, end):
+    """SQL expression for (end - start) in seconds."""
+    if dialect == "postgresql":
+        return func.extract("epoch", end - start)
+    return (func.julianday(end) - func.julianday(start)) * 86400.0
 
 
 class PipelineHealth:
@@ -49,12 +68,14 @@ class PipelineHealth:
         total_errors_24h: int,
         overall_status: str,
         recommendations: list[str],
+        p95_ingest_lag_seconds: float = 0.0,
     ):
         self.last_signal_at = last_signal_at
         self.freshness_status = freshness_status
         self.minutes_since_last = minutes_since_last
         self.avg_ingest_lag_seconds = avg_ingest_lag_seconds
         self.max_ingest_lag_seconds = max_ingest_lag_seconds
+        self.p95_ingest_lag_seconds = p95_ingest_lag_seconds
         self.signals_last_hour = signals_last_hour
         self.signals_last_24h = signals_last_24h
         self.avg_hourly_volume = avg_hourly_volume
@@ -77,6 +98,7 @@ class PipelineHealth:
             "ingest_lag": {
                 "avg_seconds": round(self.avg_ingest_lag_seconds, 2),
                 "max_seconds": round(self.max_ingest_lag_seconds, 2),
+                "p95_seconds": round(self.p95_ingest_lag_seconds, 2),
             },
             "volume": {
                 "last_hour": self.signals_last_hour,
@@ -102,9 +124,48 @@ class PipelineHealthMonitor:
     Queries real DB data to detect freshness issues, gaps, and anomalies.
     """
 
-    async def check_health(self, session: AsyncSession) -> PipelineHealth:
+    def __init__(
+        self,
+        cache_ttl_seconds: float = HEALTH_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._clock = clock
+        self._cached: Optional[tuple[float, PipelineHealth]] = None
+        self._lock = asyncio.Lock()
+
+    async def check_health(
+        self, session: AsyncSession, *, use_cache: bool = True
+    ) -> PipelineHealth:
+        """
+        Return a PipelineHealth snapshot, at most cache_ttl_seconds old.
+
+        Concurrent callers on an expired cache wait for a single refresh
+        instead of each running the checks.
+        """
+        if not use_cache or self.cache_ttl_seconds <= 0:
+            return await self._compute(session)
+
+        cached = self._cached
+        if cached is not None and self._clock() < cached[0]:
+            return cached[1]
+
+        async with self._lock:
+            cached = self._cached
+            if cached is not None and self._clock() < cached[0]:
+                return cached[1]
+            health = await self._compute(session)
+            self._cached = (self._clock() + self.cache_ttl_seconds, health)
+            return health
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot."""
+        self._cached = None
+
+    async def _compute(self, session: AsyncSession) -> PipelineHealth:
         """Run all health checks and return a PipelineHealth snapshot."""
         now = datetime.utcnow()
+        dialect = session.get_bind().dialect.name
         recommendations: list[str] = []
 
         # ── 1. Signal freshness ───────────────────────────────────────
@@ -125,7 +186,7 @@ class PipelineHealthMonitor:
             )
 
         # ── 2. Ingest lag ─────────────────────────────────────────────
-        avg_lag, max_lag = await self._check_ingest_lag(session, now)
+        avg_lag, max_lag, p95_lag = await self._check_ingest_lag(session, now, dialect)
 
         if max_lag > 300:  # >5 minutes
             recommendations.append(
@@ -148,7 +209,7 @@ class PipelineHealthMonitor:
             )
 
         # ── 4. Gap detection ──────────────────────────────────────────
-        gaps = await self._detect_gaps(session, now)
+        gaps = await self._detect_gaps(session, now, dialect)
         if gaps:
             recommendations.append(
                 f"Detected {len(gaps)} signal gap(s) in the last 24h. "
@@ -156,7 +217,8 @@ class PipelineHealthMonitor:
             )
 
         # ── 5. Error rate ─────────────────────────────────────────────
-        total_ingested, total_errors = await self._check_errors(session, now)
+        total_ingested = last_24h
+        total_errors = await self._check_errors(session, now)
         total = total_ingested + total_errors
         error_rate = total_errors / max(total, 1)
 
@@ -186,6 +248,7 @@ class PipelineHealthMonitor:
             total_errors_24h=total_errors,
             overall_status=overall,
             recommendations=recommendations,
+            p95_ingest_lag_seconds=p95_lag,
         )
 
     async def _check_freshness(
@@ -203,7 +266,7 @@ class PipelineHealthMonitor:
         if last_at.tzinfo is None:
             last_at = last_at.replace(tzinfo=timezone.utc)
 
-        minutes_since = (now - last_at).total_seconds() / 60.0
+        minutes_since = (now.replace(tzinfo=timezone.utc) - last_at).total_seconds() / 60.0
         return last_at.isoformat(), minutes_since
 
     def _classify_freshness(self, minutes_since: float) -> str:
@@ -216,38 +279,43 @@ class PipelineHealthMonitor:
         return "outdated"
 
     async def _check_ingest_lag(
-        self, session: AsyncSession, now: datetime
-    ) -> tuple[float, float]:
-        """Compute average and max lag between emitted_at and ingested_at."""
+        self, session: AsyncSession, now: datetime, dialect: str
+    ) -> tuple[float, float, float]:
+        """Average, max and p95 lag between emitted_at and ingested_at."""
         cutoff = now - timedelta(hours=24)
-        result = await session.execute(
-            select(
-                OmenIngestSignal.emitted_at,
-                OmenIngestSignal.ingested_at,
-            )
-            .where(
-                OmenIngestSignal.ingested_at >= cutoff,
-                OmenIngestSignal.emitted_at.isnot(None),
-            )
+        lag = _seconds_between(
+            dialect, OmenIngestSignal.emitted_at, OmenIngestSignal.ingested_at
+        )
+        window = (
+            OmenIngestSignal.ingested_at >= cutoff,
+            OmenIngestSignal.emitted_at.isnot(None),
+            lag >= 0,
         )
-        rows = result.all()
-
-        if not rows:
-            return 0.0, 0.0
-
-        lags: list[float] = []
-        for emitted_at, ingested_at in rows:
-            if emitted_at and ingested_at:
-                e = emitted_at.replace(tzinfo=timezone.utc) if emitted_at.tzinfo is None else emitted_at
-                i = ingested_at.replace(tzinfo=timezone.utc) if ingested_at.tzinfo is None else ingested_at
-                lag = (i - e).total_seconds()
-                if lag >= 0:
-                    lags.append(lag)
 
-        if not lags:
-            return 0.0, 0.0
+        aggregates = [func.count(), func.avg(lag), func.max(lag)]
+        if dialect == "postgresql":
+            aggregates.append(func.percentile_cont(LAG_PERCENTILE).within_group(lag))
+        row = (await session.execute(select(*aggregates).where(*window))).one()
+        n = row[0] or 0
+        if n == 0:
+            return 0.0, 0.0, 0.0
+
+        if dialect == "postgresql":
+            p95 = float(row[3])
+        else:
+            # Same linear interpolation as percentile_cont: the two ranks
+            # around the percentile position, via an ordered OFFSET probe
+            pos = LAG_PERCENTILE * (n - 1)
+            lo = math.floor(pos)
+            result = await session.execute(
+                select(lag).where(*window).order_by(lag).offset(lo).limit(2)
+            )
+            values = [float(v) for v in result.scalars().all()]
+            p95 = values[0]
+            if len(values) > 1:
+                p95 += (values[1] - values[0]) * (pos - lo)
 
-        return sum(lags) / len(lags), max(lags)
+        return float(row[1]), float(row[2]), p95
 
     async def _check_volume(
         self, session: AsyncSession, now: datetime
@@ -256,19 +324,14 @@ class PipelineHealthMonitor:
         hour_ago = now - timedelta(hours=1)
         day_ago = now - timedelta(hours=24)
 
-        result_hour = await session.execute(
-            select(func.count(OmenIngestSignal.id)).where(
-                OmenIngestSignal.ingested_at >= hour_ago,
-            )
-        )
-        last_hour = result_hour.scalar_one() or 0
-
-        result_day = await session.execute(
-            select(func.count(OmenIngestSignal.id)).where(
-                OmenIngestSignal.ingested_at >= day_ago,
-            )
+        result = await session.execute(
+            select(
+                func.count(case((OmenIngestSignal.ingested_at >= hour_ago, 1))),
+                func.count(),
+            ).where(OmenIngestSignal.ingested_at >= day_ago)
         )
-        last_24h = result_day.scalar_one() or 0
+        last_hour, last_24h = result.one()
+        last_hour, last_24h = last_hour or 0, last_24h or 0
 
         avg_hourly = last_24h / 24.0
         return last_hour, last_24h, avg_hourly
@@ -283,57 +346,53 @@ class PipelineHealthMonitor:
         return "normal"
 
     async def _detect_gaps(
-        self, session: AsyncSession, now: datetime
+        self, session: AsyncSession, now: datetime, dialect: str
     ) -> list[dict]:
         """Detect gaps >2 hours in the last 24h."""
         cutoff = now - timedelta(hours=24)
+        ingested_at = OmenIngestSignal.ingested_at
+        lagged = (
+            select(
+                func.lag(ingested_at, type_=DateTime)
+                .over(order_by=ingested_at)
+                .label("prev"),
+                ingested_at.label("curr"),
+            )
+            .where(ingested_at >= cutoff)
+            .subquery()
+        )
+        gap_seconds = _seconds_between(dialect, lagged.c.prev, lagged.c.curr)
         result = await session.execute(
-            select(OmenIngestSignal.ingested_at)
-            .where(OmenIngestSignal.ingested_at >= cutoff)
-            .order_by(OmenIngestSignal.ingested_at)
+            select(lagged.c.prev, lagged.c.curr)
+            .where(gap_seconds > GAP_THRESHOLD_MINUTES * 60)
+            .order_by(lagged.c.curr)
         )
-        times = [row[0] for row in result.all()]
 
         gaps: list[dict] = []
-        for i in range(1, len(times)):
-            prev = times[i - 1]
-            curr = times[i]
+        for prev, curr in result.all():
             if prev.tzinfo is None:
                 prev = prev.replace(tzinfo=timezone.utc)
             if curr.tzinfo is None:
                 curr = curr.replace(tzinfo=timezone.utc)
             gap_minutes = (curr - prev).total_seconds() / 60.0
-            if gap_minutes > GAP_THRESHOLD_MINUTES:
-                gaps.append({
-                    "start": prev.isoformat(),
-                    "end": curr.isoformat(),
-                    "duration_minutes": round(gap_minutes, 1),
-                })
+            gaps.append({
+                "start": prev.isoformat(),
+                "end": curr.isoformat(),
+                "duration_minutes": round(gap_minutes, 1),
+            })
 
         return gaps
 
-    async def _check_errors(
-        self, session: AsyncSession, now: datetime
-    ) -> tuple[int, int]:
-        """Count ingested and errored signals in last 24h."""
+    async def _check_errors(self, session: AsyncSession, now: datetime) -> int:
+        """Count errored signals in last 24h."""
         cutoff = now - timedelta(hours=24)
-
-        ingested = await session.execute(
-            select(func.count(OmenIngestSignal.id)).where(
-                OmenIngestSignal.ingested_at >= cutoff,
-            )
-        )
-        total_ingested = ingested.scalar_one() or 0
-
         errored = await session.execute(
             select(func.count(SignalLedger.id)).where(
                 SignalLedger.recorded_at >= cutoff,
                 SignalLedger.status == "failed",
             )
         )
-        total_errors = errored.scalar_one() or 0
-
-        return total_ingested, total_errors
+        return errored.scalar_one() or 0
 
     def _overall_status(
         self,
@@ -37,3 +37,5 @@ class AuditIntegrityResponse(BaseModel):
     total_entries: int
     chain_intact: bool
     breaks_found: int = 0
+    verified_entries: int = 0  # Entries rehashed since the last checkpoint
+    checkpoint_seq: Optional[int] = None
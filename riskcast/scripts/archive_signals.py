@@ -0,0 +1,31 @@
+"""Archive inactive V2 signals and drop old archive partitions.
+
+Usage:
+    python -m riskcast.scripts.archive_signals --older-than-days 30 --keep-months 12
+"""
+import argparse
+import asyncio
+
+from riskcast.db.engine import close_db, get_session_factory
+from riskcast.services.signal_archive import SignalArchiver
+
+
+async def main(older_than_days: int, keep_months: int, batch_size: int) -> None:
+    archiver = SignalArchiver(get_session_factory(), batch_size=batch_size)
+    result = await archiver.archive_inactive(older_than_days=older_than_days)
+    print(f"Archived {result.archived} signals in {result.batches} batches.")
+    if result.partitions_created:
+        print(f"Created partitions: {', '.join(result.partitions_created)}")
+    dropped = await archiver.drop_before(months_to_keep=keep_months)
+    if dropped:
+        print(f"Dropped partitions: {', '.join(dropped)}")
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--older-than-days", type=int, default=30)
+    parser.add_argument("--keep-months", type=int, default=12)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.older_than_days, args.keep_months, args.batch_size))
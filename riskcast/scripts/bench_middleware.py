@@ -0,0 +1,107 @@
+"""In-process benchmark: middleware overhead per request.
+
+Drives a minimal FastAPI app through httpx.ASGITransport (no sockets) and
+reports p50/p99 latency and requests/sec for:
+  bare       — no middleware
+  base_http  — five pass-through BaseHTTPMiddleware layers (the old shape)
+  pipeline   — the real MiddlewarePipeline with all five stages
+
+Usage:
+    python -m riskcast.scripts.bench_middleware --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from riskcast.auth.jwt import create_access_token
+from riskcast.middleware.error_handler import ErrorHandlerMiddleware
+from riskcast.middleware.pipeline import MiddlewarePipeline
+from riskcast.middleware.rate_limit import RateLimitMiddleware
+from riskcast.middleware.request_context import RequestContextMiddleware
+from riskcast.middleware.security_headers import SecurityHeadersMiddleware
+from riskcast.middleware.tenant import TenantMiddleware
+from riskcast.services.rate_limiter import Quota
+
+
+class _PassThrough(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def build(variant: str, requests: int) -> FastAPI:
+    app = _base_app()
+    if variant == "base_http":
+        for _ in range(5):
+            app.add_middleware(_PassThrough)
+    elif variant == "pipeline":
+        app.add_middleware(
+            MiddlewarePipeline,
+            stages=[
+                RequestContextMiddleware(),
+                SecurityHeadersMiddleware(),
+                ErrorHandlerMiddleware(),
+                TenantMiddleware(),
+                # Large bucket so the limiter does work but never rejects
+                RateLimitMiddleware(quota=Quota(per_minute=requests * 60, burst=requests * 2)),
+            ],
+        )
+    return app
+
+
+async def run(variant: str, total: int, concurrency: int) -> dict:
+    app = build(variant, total)
+    token = create_access_token(str(uuid.uuid4()), str(uuid.uuid4()), "bench@riskcast.io", "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def one():
+            async with gate:
+                t0 = time.perf_counter()
+                r = await client.get("/api/v1/ping", headers=headers)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                assert r.status_code == 200, r.text
+
+        # Warm up
+        await asyncio.gather(*(one() for _ in range(min(200, total))))
+        latencies.clear()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+
+    q = statistics.quantiles(latencies, n=100)
+    return {"variant": variant, "p50_ms": q[49], "p99_ms": q[98], "rps": total / elapsed}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'variant':<10} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9}")
+    for variant in ("bare", "base_http", "pipeline"):
+        r = await run(variant, args.requests, args.concurrency)
+        print(f"{r['variant']:<10} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['rps']:>9.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
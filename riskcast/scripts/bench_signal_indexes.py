@@ -0,0 +1,125 @@
+"""Benchmark v2_signals hot queries without vs. with the composite indexes.
+
+PostgreSQL only. Builds a synthetic copy of v2_signals (default 10M rows,
+~10% active, 200 companies) in a scratch schema, runs EXPLAIN ANALYZE for
+each hot query shape, creates the partial indexes from the
+v2_signal_indexes_003 migration, and runs them again.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... \\
+        python -m riskcast.scripts.bench_signal_indexes --rows 10000000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import text
+
+from riskcast.db.engine import close_db, get_engine
+
+SCHEMA = "bench_signals"
+
+QUERIES = {
+    "assess_entity": """
+        SELECT * FROM {s}.v2_signals
+        WHERE company_id = :cid AND entity_type = 'order' AND entity_id = :eid
+          AND is_active
+    """,
+    "active_by_severity": """
+        SELECT * FROM {s}.v2_signals
+        WHERE company_id = :cid AND is_active
+        ORDER BY severity_score DESC LIMIT 50
+    """,
+    "top_risks": """
+        SELECT entity_type, entity_id, max(severity_score)
+        FROM {s}.v2_signals
+        WHERE company_id = :cid AND is_active AND severity_score >= 70
+        GROUP BY entity_type, entity_id
+    """,
+}
+
+INDEXES = [
+    "CREATE INDEX ix_bench_entity_active ON {s}.v2_signals "
+    "(company_id, entity_type, entity_id) WHERE is_active",
+    "CREATE INDEX ix_bench_active_severity ON {s}.v2_signals "
+    "(company_id, severity_score DESC) INCLUDE (entity_type, entity_id, signal_type) "
+    "WHERE is_active",
+]
+
+
+async def _populate(conn, rows: int) -> None:
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.execute(text(f"""
+        CREATE TABLE {SCHEMA}.v2_signals AS
+        SELECT
+            gen_random_uuid() AS id,
+            ('00000000-0000-0000-0000-' || lpad((g % 200)::text, 12, '0'))::uuid AS company_id,
+            'scheduler' AS source,
+            (ARRAY['payment_risk','route_disruption','order_risk'])[1 + g % 3] AS signal_type,
+            (ARRAY['order','customer','route'])[1 + g % 3] AS entity_type,
+            ('00000000-0000-0000-0001-' || lpad((g % 50000)::text, 12, '0'))::uuid AS entity_id,
+            round((random())::numeric, 2) AS confidence,
+            round((random() * 100)::numeric, 2) AS severity_score,
+            '{{}}'::jsonb AS evidence,
+            (g % 10 = 0) AS is_active,
+            now() - (g % 365) * interval '1 day' AS created_at
+        FROM generate_series(1, :rows) AS g
+    """), {"rows": rows})
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.v2_signals (company_id)"))
+    await conn.execute(text(f"ANALYZE {SCHEMA}.v2_signals"))
+
+
+async def _explain(conn, sql: str) -> dict:
+    params = {
+        "cid": "00000000-0000-0000-0000-000000000007",
+        "eid": "00000000-0000-0000-0001-000000000007",
+    }
+    start = time.perf_counter()
+    res = await conn.execute(
+        text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql.format(s=SCHEMA)), params
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    plan = res.scalar()
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    root = plan[0]
+    return {
+        "node": root["Plan"]["Node Type"],
+        "execution_ms": round(root["Execution Time"], 2),
+        "wall_ms": round(wall_ms, 2),
+        "shared_hit_blocks": root["Plan"].get("Shared Hit Blocks"),
+    }
+
+
+async def main(rows: int, keep: bool) -> None:
+    engine = get_engine()
+    async with engine.begin() as conn:
+        print(f"Populating {rows:,} synthetic signals...")
+        await _populate(conn, rows)
+
+        before = {name: await _explain(conn, sql) for name, sql in QUERIES.items()}
+        for stmt in INDEXES:
+            await conn.execute(text(stmt.format(s=SCHEMA)))
+        await conn.execute(text(f"ANALYZE {SCHEMA}.v2_signals"))
+        after = {name: await _explain(conn, sql) for name, sql in QUERIES.items()}
+
+        print(f"{'query':<22}{'before':>28}{'after':>28}")
+        for name in QUERIES:
+            b, a = before[name], after[name]
+            print(
+                f"{name:<22}{b['node'] + ' ' + str(b['execution_ms']) + 'ms':>28}"
+                f"{a['node'] + ' ' + str(a['execution_ms']) + 'ms':>28}"
+            )
+
+        if not keep:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.keep))
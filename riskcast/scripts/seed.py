@@ -39,6 +39,7 @@ from riskcast.db.models import (
     Signal,
     User,
 )
+from riskcast.outcomes.accuracy import rebuild_daily_rollup
 
 
 def hash_password(password: str) -> str:
@@ -428,6 +429,7 @@ async def seed():
             )
             session.add(outcome)
         await session.flush()
+        await rebuild_daily_rollup(session, company_id)
         print("Created 15 outcomes")
 
         await session.commit()
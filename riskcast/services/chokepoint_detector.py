@@ -0,0 +1,206 @@
+"""
+Chokepoint Detector — compiled multi-keyword matcher for OMEN signals.
+
+All keywords are compiled ONCE into a single prefix-trie regex, so a
+field is scanned in one pass and the cost barely grows with the number of
+keywords. Structured fields (context, evidence) are walked value by value
+instead of being flattened with str(), so dict keys and repr noise never
+match.
+
+Matching rules:
+- Case-insensitive, whole words only ("iran" does not hit "Tirana")
+- Spaces in a keyword also match "-" / "_" ("red-sea" in a source URL)
+- Explicit geographic chokepoints in context["chokepoints"] always count
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping
+
+# ── Keywords ───────────────────────────────────────────────────────────
+
+CHOKEPOINT_KEYWORDS: dict[str, list[str]] = {
+    "RED_SEA": [
+        "red sea", "houthi", "bab-el-mandeb", "bab el mandeb", "yemen",
+        "aden", "gulf of aden",
+    ],
+    "SUEZ": [
+        "suez", "suez canal", "ever given", "canal blockage",
+    ],
+    "MALACCA": [
+        "malacca", "strait of malacca", "singapore strait", "taiwan",
+        "china blockade", "south china sea", "taiwan strait",
+    ],
+    "HORMUZ": [
+        "hormuz", "strait of hormuz", "iran", "persian gulf",
+        "iran sanctions", "iran navy",
+    ],
+    "PANAMA": [
+        "panama", "panama canal", "gatun", "drought panama",
+    ],
+    "CAPE": [
+        "cape of good hope", "cape route", "south africa",
+    ],
+    "DARDANELLES": [
+        "dardanelles", "bosphorus", "turkish strait", "black sea",
+    ],
+}
+
+_SEPARATORS = re.compile(r"[\s_-]+")
+
+
+def _normalize(keyword: str) -> str:
+    return _SEPARATORS.sub(" ", keyword.strip().lower())
+
+
+def _trie_pattern(keywords) -> str:
+    """
+    Regex for a set of lowercase keywords, factored as a prefix trie.
+
+    A flat "a|b|c" alternation makes re try every keyword at every offset;
+    the trie shares prefixes so only live branches are tried (the regex
+    analogue of an Aho-Corasick automaton). Optional tails are greedy, so
+    the longest keyword wins ("gulf of aden" over "aden").
+    """
+    trie: dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            (r"[\s_-]+" if ch == " " else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+@dataclass(frozen=True)
+class ChokepointMatch:
+    """One keyword hit: which chokepoint, which field, and where."""
+
+    chokepoint: str
+    keyword: str
+    field: str
+    start: int
+    end: int
+
+
+class ChokepointDetector:
+    """
+    Reusable detector; build once and share.
+
+    Args:
+        keywords: chokepoint → keywords (default: CHOKEPOINT_KEYWORDS)
+    """
+
+    def __init__(self, keywords: Mapping[str, list[str]] = CHOKEPOINT_KEYWORDS):
+        self._lookup: dict[str, tuple[str, str]] = {}
+        for chokepoint, words in keywords.items():
+            for word in words:
+                self._lookup.setdefault(_normalize(word), (chokepoint, word))
+
+        source = rf"(?<![a-z0-9]){_trie_pattern(self._lookup)}(?![a-z0-9])"
+        # Lowercasing once and matching case-sensitively is ~3x faster than
+        # re.IGNORECASE; the flagged pattern is only for the rare strings
+        # whose length changes when lowercased (spans must stay valid)
+        self._pattern = re.compile(source)
+        self._pattern_ci = re.compile(source, re.IGNORECASE)
+
+    def _finditer(self, text: str) -> Iterator[re.Match]:
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return self._pattern.finditer(lowered)
+        return self._pattern_ci.finditer(text)
+
+    def _resolve(self, matched: str) -> tuple[str, str]:
+        hit = self._lookup.get(matched)
+        return hit if hit is not None else self._lookup[_normalize(matched)]
+
+    def scan_text(self, text: str, field: str = "") -> Iterator[ChokepointMatch]:
+        """Yield every keyword hit in one string."""
+        for m in self._finditer(text):
+            chokepoint, keyword = self._resolve(m.group())
+            yield ChokepointMatch(chokepoint, keyword, field, m.start(), m.end())
+
+    def scan(self, signal: Any) -> list[ChokepointMatch]:
+        """All keyword hits across title, description, context and evidence."""
+        matches: list[ChokepointMatch] = []
+        for field, text in self._fields(signal):
+            matches.extend(self.scan_text(text, field))
+        return matches
+
+    def detect(self, signal: Any) -> list[str]:
+        """Sorted chokepoint codes: explicit geographic ones plus keyword hits."""
+        chokepoints: set[str] = set()
+        for cp in (signal.context or {}).get("chokepoints", []) or []:
+            if isinstance(cp, str):
+                chokepoints.add(cp.upper().replace(" ", "_"))
+
+        texts = [t for t in (signal.title, signal.description) if t]
+        _collect(signal.context, texts)
+        _collect(signal.evidence, texts)
+        # One regex pass per signal; NUL is a word boundary no keyword spans
+        text = "\x00".join(texts)
+        for m in self._finditer(text):
+            chokepoints.add(self._resolve(m.group())[0])
+        return sorted(chokepoints)
+
+    @staticmethod
+    def _fields(signal: Any) -> Iterator[tuple[str, str]]:
+        if signal.title:
+            yield "title", signal.title
+        if signal.description:
+            yield "description", signal.description
+        yield from _walk(signal.context, "context")
+        yield from _walk(signal.evidence, "evidence")
+
+
+def _walk(value: Any, path: str) -> Iterator[tuple[str, str]]:
+    """Yield (path, text) for every string leaf of nested dicts/lists."""
+    if isinstance(value, str):
+        if value:
+            yield path, value
+    elif isinstance(value, Mapping):
+        for key, child in value.items():
+            yield from _walk(child, f"{path}.{key}")
+    elif isinstance(value, (list, tuple)):
+        for i, child in enumerate(value):
+            yield from _walk(child, f"{path}[{i}]")
+
+
+def _collect(value: Any, out: list[str]) -> None:
+    """Append every non-empty string leaf of nested dicts/lists to ``out``."""
+    # Iterative with exact type checks: payloads are parsed JSON, and the
+    # recursive isinstance(…, Mapping) walk dominated the profile
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        t = type(v)
+        if t is str:
+            if v:
+                out.append(v)
+        elif t is dict:
+            stack.extend(v.values())
+        elif t is list or t is tuple:
+            stack.extend(v)
+        elif isinstance(v, str):
+            out.append(v)
+        elif isinstance(v, Mapping):
+            stack.extend(v.values())
+        elif isinstance(v, (list, tuple)):
+            stack.extend(v)
+
+
+# Built once at import; the pipeline shares this instance
+default_detector = ChokepointDetector()
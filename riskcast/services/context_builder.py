@@ -6,16 +6,27 @@ Pipeline: Query → Intent (regex→Haiku) → Data + Signals → Compress → P
 Intent classification:
 - Regex fast path for obvious patterns (free, instant)
 - Claude Haiku fallback when regex misses (~$0.0001/req, ~200ms)
+
+Concurrency:
+- Independent lookups (company, appetite, DB signals, OMEN signals,
+  per-intent summaries) run concurrently, each under its own timeout
+- A step that fails or times out degrades to an empty value instead of
+  failing the whole chat turn; per-step timings land in ChatContext
 """
 
+import asyncio
 import json
 import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db import queries as db_queries
+from riskcast.db.engine import set_tenant_context
 from riskcast.services.llm_gateway import LLMGateway
 from riskcast.services.omen_client import OmenClient
 
@@ -30,6 +41,8 @@ class ChatContext(BaseModel):
     signals_summary: list[dict]
     intent: dict
     token_estimate: int
+    timings_ms: dict[str, float] = Field(default_factory=dict)
+    degraded_steps: list[str] = Field(default_factory=list)
 
 
 # Regex fast path — obvious patterns
@@ -50,22 +63,129 @@ NO_ENTITY_INTENTS = frozenset({
 })
 
 
+class _StepRunner:
+    """
+    Per-build helper that runs context steps with timeouts and timings.
+
+    DB access goes through ``db()``: with a session factory each step gets
+    its own short-lived session, at most ``max_sessions`` at a time; without
+    one, steps share the request session, serialized by a lock because an
+    AsyncSession does not allow concurrent operations. Waiting for a session
+    is never counted against a step's timeout, and steps on the borrowed
+    request session are not timed out at all — cancelling an in-flight
+    ``execute`` would leave the caller's session in an unknown state.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        company_id: str,
+        session_factory: Optional[Callable[[], AsyncSession]],
+        timeout: float,
+        max_sessions: int,
+    ):
+        self.session = session
+        self.company_id = company_id
+        self.session_factory = session_factory
+        self.timeout = timeout
+        self.timings_ms: dict[str, float] = {}
+        self.degraded: list[str] = []
+        self._lock = asyncio.Lock()
+        self._session_slots = asyncio.Semaphore(max_sessions)
+
+    @property
+    def shared_session(self) -> bool:
+        return self.session_factory is None
+
+    @asynccontextmanager
+    async def db(self) -> AsyncIterator[AsyncSession]:
+        if self.shared_session:
+            async with self._lock:
+                yield self.session
+            return
+
+        async with self._session_slots:
+            async with self.session_factory() as step_session:
+                await set_tenant_context(step_session, self.company_id)
+                # Check out the pooled connection before the step clock starts
+                await step_session.connection()
+                yield step_session
+
+    def _degrade(self, name: str, event: str, **kw: Any) -> None:
+        self.degraded.append(name)
+        logger.warning(event, step=name, **kw)
+
+    async def run(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable[Any]],
+        default: Any = None,
+        timeout: Optional[float] = None,
+        timed: bool = True,
+    ) -> Any:
+        """Run one step; on timeout or error record it and return ``default``."""
+        limit = (timeout or self.timeout) if timed else None
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(factory(), timeout=limit)
+        except asyncio.TimeoutError:
+            self._degrade(name, "context_step_timeout", timeout_s=limit)
+            return default
+        except Exception as e:
+            self._degrade(name, "context_step_failed", error=str(e))
+            return default
+        finally:
+            self.timings_ms[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    async def query(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        default: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a ``db_queries`` function as a step on its own (or the shared) session."""
+        try:
+            async with self.db() as s:
+                return await self.run(
+                    name,
+                    lambda: fn(s, self.company_id, *args, **kwargs),
+                    default=default,
+                    timed=not self.shared_session,
+                )
+        except Exception as e:
+            self._degrade(name, "context_session_failed", error=str(e))
+            return default
+
+
 class ContextBuilder:
     """
     Builds LLM context from user query + company data + signals.
 
     Pipeline: classify intent → retrieve data → enrich with signals → build prompt
+
+    Everything except intent-dependent data retrieval starts immediately and
+    overlaps with intent classification.
     """
 
     MAX_CONTEXT_TOKENS = 6000
+    STEP_TIMEOUT_S = 3.0
+    INTENT_TIMEOUT_S = 5.0
+    # Extra pooled connections one build may hold at once (on top of the
+    # request's own session). Keeps ~30 pooled connections good for many
+    # concurrent chats; beyond that, steps queue instead of timing out.
+    MAX_PARALLEL_SESSIONS = 2
 
     def __init__(
         self,
         llm: LLMGateway,
         omen_client: OmenClient,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
     ):
         self.llm = llm
         self.omen_client = omen_client
+        self.session_factory = session_factory
 
     async def build(
         self,
@@ -75,24 +195,49 @@ class ContextBuilder:
         session_history: list[dict],
     ) -> ChatContext:
         """Build full context for a chat response."""
+        runner = _StepRunner(
+            session,
+            company_id,
+            self.session_factory,
+            self.STEP_TIMEOUT_S,
+            self.MAX_PARALLEL_SESSIONS,
+        )
+        total_start = time.perf_counter()
+
+        # TaskGroup cancels and awaits the background lookups if build() is
+        # cancelled (e.g. the SSE client disconnects), releasing their sessions.
+        async with asyncio.TaskGroup() as tg:
+            # Intent-independent lookups start right away
+            company_task = tg.create_task(runner.query("company", db_queries.get_company))
+            appetite_task = tg.create_task(
+                runner.query("appetite", db_queries.get_risk_appetite)
+            )
+            signals_task = tg.create_task(self._get_signals(runner))
+
+            # Step 1: Classify intent (overlaps with the lookups above)
+            intent = await runner.run(
+                "intent",
+                lambda: self._classify_intent(user_query),
+                default={"type": "general", "entity": "", "raw": user_query, "method": "fallback"},
+                timeout=self.INTENT_TIMEOUT_S,
+            )
 
-        # Step 1: Classify intent
-        intent = await self._classify_intent(user_query)
-
-        # Step 2: Retrieve relevant data
-        data = await self._retrieve_data(session, company_id, intent, user_query)
-
-        # Step 3: Get active signals
-        signals = await self._get_signals(session, company_id, intent)
+            # Step 2: Retrieve intent-specific data
+            data = await self._retrieve_data(runner, intent, user_query)
 
-        # Step 4: Company + appetite context
-        company = await db_queries.get_company(session, company_id)
-        appetite = await db_queries.get_risk_appetite(session, company_id)
+        # Step 3: Collect signals + company/appetite context
+        signals = signals_task.result()
+        company = company_task.result()
+        appetite = appetite_task.result()
 
-        # Step 5: Build system prompt
+        # Step 4: Build system prompt
         prompt = self._build_prompt(
             company, appetite, data, signals, user_query, session_history[-5:]
         )
+        runner.timings_ms["total"] = round((time.perf_counter() - total_start) * 1000, 2)
+
+        if runner.degraded:
+            logger.info("chat_context_partial", degraded=runner.degraded, timings_ms=runner.timings_ms)
 
         return ChatContext(
             system_prompt=prompt,
@@ -100,6 +245,8 @@ class ContextBuilder:
             signals_summary=[s if isinstance(s, dict) else s.dict() for s in signals[:10]],
             intent=intent,
             token_estimate=len(prompt) // 4,
+            timings_ms=runner.timings_ms,
+            degraded_steps=runner.degraded,
         )
 
     # ── Intent Classification ────────────────────────────────────────
@@ -154,7 +301,7 @@ class ContextBuilder:
     # ── Data Retrieval ───────────────────────────────────────────────
 
     async def _retrieve_data(
-        self, session: AsyncSession, company_id: str, intent: dict, query: str
+        self, runner: _StepRunner, intent: dict, query: str
     ) -> dict:
         """Retrieve data relevant to the classified intent."""
         data: dict = {"_intent_method": intent.get("method", "unknown")}
@@ -162,48 +309,63 @@ class ContextBuilder:
         entity = intent.get("entity", "")
 
         if t == "order_risk_check" and entity:
-            data["order"] = await db_queries.find_order(session, company_id, entity)
+            data["order"] = await runner.query("order", db_queries.find_order, entity)
             if data["order"] and data["order"].get("customer_id"):
-                data["customer_summary"] = await db_queries.get_customer_summary(
-                    session, company_id, data["order"]["customer_id"]
+                data["customer_summary"] = await runner.query(
+                    "customer_summary", db_queries.get_customer_summary,
+                    data["order"]["customer_id"],
                 )
 
         elif t in ("weekly_overview", "recommendation"):
-            data["orders_7d"] = await db_queries.get_orders_summary(session, company_id, days=7)
-            data["payments_overdue"] = await db_queries.get_overdue_payments_summary(session, company_id)
-            data["incidents_7d"] = await db_queries.get_incidents_summary(session, company_id, days=7)
+            (
+                data["orders_7d"],
+                data["payments_overdue"],
+                data["incidents_7d"],
+            ) = await asyncio.gather(
+                runner.query("orders_7d", db_queries.get_orders_summary, days=7),
+                runner.query("payments_overdue", db_queries.get_overdue_payments_summary),
+                runner.query("incidents_7d", db_queries.get_incidents_summary, days=7),
+            )
 
         elif t == "customer_inquiry" and entity:
-            data["customer"] = await db_queries.find_customer(session, company_id, entity)
+            data["customer"] = await runner.query("customer", db_queries.find_customer, entity)
             if data["customer"]:
                 cid = data["customer"]["id"]
-                data["customer_summary"] = await db_queries.get_customer_summary(
-                    session, company_id, cid
+                data["customer_summary"] = await runner.query(
+                    "customer_summary", db_queries.get_customer_summary, cid
                 )
 
         elif t == "route_inquiry" and entity:
-            data["route"] = await db_queries.find_route(session, company_id, entity)
+            data["route"] = await runner.query("route", db_queries.find_route, entity)
 
         elif t == "payment_overview":
-            data["overdue"] = await db_queries.get_overdue_payments_summary(session, company_id)
+            data["overdue"] = await runner.query(
+                "overdue", db_queries.get_overdue_payments_summary
+            )
 
         elif t == "historical_lookup":
-            data["similar_incidents"] = await db_queries.search_incidents_fulltext(
-                session, company_id, query, limit=5
+            data["similar_incidents"] = await runner.query(
+                "similar_incidents", db_queries.search_incidents_fulltext,
+                query, limit=5, default=[],
             )
 
         elif t == "morning_brief":
-            data["brief"] = await db_queries.get_today_brief(session, company_id)
+            data["brief"] = await runner.query("brief", db_queries.get_today_brief)
 
         return data
 
     # ── Signals ──────────────────────────────────────────────────────
 
-    async def _get_signals(
-        self, session: AsyncSession, company_id: str, intent: dict
-    ) -> list:
-        """Get active signals, enriched with OMEN market data."""
-        signals_raw = await db_queries.get_active_signals(session, company_id, limit=10)
+    async def _get_signals(self, runner: _StepRunner) -> list:
+        """Get active signals, enriched with OMEN market data (fetched concurrently)."""
+        signals_raw, omen_signals = await asyncio.gather(
+            runner.query("signals", db_queries.get_active_signals, limit=10, default=[]),
+            runner.run(
+                "omen_signals",
+                lambda: self.omen_client.get_signals(min_confidence=0.5, limit=5),
+                default=[],
+            ),
+        )
         signals = [
             {
                 "signal_type": s.signal_type,
@@ -216,7 +378,6 @@ class ContextBuilder:
         ]
 
         # OMEN market signals (graceful)
-        omen_signals = await self.omen_client.get_signals(min_confidence=0.5, limit=5)
         for os_ in omen_signals:
             signals.append({
                 "signal_type": os_.signal_type,
@@ -4,8 +4,12 @@ LLM Gateway — Claude API integration.
 Single provider (Anthropic) to reduce complexity.
 - Claude Sonnet: chat responses (streaming)
 - Claude Haiku: intent classification (fast, cheap)
+
+StubLLMGateway answers offline (LLM_BACKEND=stub, tests).
 """
 
+import asyncio
+import hashlib
 from typing import AsyncGenerator
 
 import httpx
@@ -161,3 +165,57 @@ class LLMGateway:
         except Exception as e:
             logger.error("llm_generate_error", model=model, error=str(e))
             return ""
+
+
+class StubLLMGateway(LLMGateway):
+    """
+    Offline LLMGateway: deterministic replies, no network.
+
+    The reply is derived from the prompt (or fixed via ``reply``), after an
+    optional delay. Calls and peak concurrency are recorded for tests.
+    """
+
+    def __init__(self, reply: str | None = None, delay_seconds: float = 0.0):
+        self.api_key = "stub"
+        self.reply = reply
+        self.delay_seconds = delay_seconds
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_message: str,
+        model: str = "claude-sonnet-4-20250514",
+        max_tokens: int = 2048,
+    ) -> AsyncGenerator[str, None]:
+        yield await self.generate(system_prompt, user_message, model, max_tokens)
+
+    async def generate(
+        self,
+        system: str,
+        user_message: str,
+        model: str = "claude-haiku-4-5-20251001",
+        max_tokens: int = 500,
+    ) -> str:
+        self.calls.append({"system": system, "user_message": user_message, "model": model})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay_seconds:
+                await asyncio.sleep(self.delay_seconds)
+        finally:
+            self.in_flight -= 1
+
+        if self.reply is not None:
+            return self.reply
+        digest = hashlib.sha256(f"{system}\n{user_message}".encode()).hexdigest()[:12]
+        return f"[stub {model}] {digest}"
+
+
+def build_llm_gateway() -> LLMGateway:
+    """Gateway selected by LLM_BACKEND (anthropic | stub)."""
+    if settings.llm_backend == "stub":
+        return StubLLMGateway()
+    return LLMGateway()
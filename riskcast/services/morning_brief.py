@@ -1,105 +1,271 @@
 """
 Morning Brief Generator — ORM-based for cross-database compatibility.
+
+Briefs for any number of companies are planned from three grouped reads
+(latest briefs, metrics, top signals), then the LLM calls run
+concurrently under a semaphore. The prompt is content-hashed: when it
+matches the company's previous LLM-written brief, that text is reused
+and no LLM call is made.
 """
 
+import asyncio
+import hashlib
 import json
 import uuid
+from dataclasses import dataclass, field
 from datetime import date
+from typing import Optional, Sequence
 
 import structlog
-from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from riskcast.config import settings
 from riskcast.db import queries as db_queries
 from riskcast.db.models import MorningBrief
 from riskcast.services.llm_gateway import LLMGateway
 
 logger = structlog.get_logger(__name__)
 
+BRIEF_SYSTEM_PROMPT = "Bạn là RiskCast AI. Viết morning brief ngắn gọn, data-driven."
+BRIEF_MODEL = "claude-sonnet-4-20250514"
+BRIEF_MAX_TOKENS = 500
+BRIEF_SIGNAL_POOL = 20   # Top active signals (by severity) considered per company
+BRIEF_PRIORITY_ITEMS = 5
+
+
+def _select_actionable(signals: Sequence) -> list:
+    """Top signals worth a brief mention, by severity x confidence."""
+    return sorted(
+        [s for s in signals if (s.severity_score or 0) >= 40 and float(s.confidence) >= 0.5],
+        key=lambda s: float(s.severity_score or 0) * float(s.confidence),
+        reverse=True,
+    )[:BRIEF_PRIORITY_ITEMS]
+
+
+def _brief_prompt(metrics: dict, actionable: list) -> str:
+    return (
+        "Tạo bản tóm tắt rủi ro sáng nay. Tiếng Việt, chuyên nghiệp.\n"
+        f"Metrics: {json.dumps(metrics, ensure_ascii=False)}\n"
+        f"Signals: {len(actionable)} signals found"
+    )
+
+
+def brief_input_hash(prompt: str) -> str:
+    """SHA-256 over everything sent to the LLM for a brief."""
+    payload = json.dumps(
+        [BRIEF_SYSTEM_PROMPT, prompt, BRIEF_MODEL, BRIEF_MAX_TOKENS], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _brief_dict(brief: MorningBrief) -> dict:
+    return {
+        "id": str(brief.id),
+        "brief_date": str(brief.brief_date),
+        "content": brief.content,
+        "priority_items": brief.priority_items,
+    }
+
+
+@dataclass
+class _BriefPlan:
+    """Inputs and (once generated) content for one company's brief."""
+
+    company_id: uuid.UUID
+    metrics: dict
+    actionable: list
+    prompt: str
+    input_hash: Optional[str]
+    content: str = ""
+    reused: bool = False
+
+
+@dataclass
+class BriefBatchResult:
+    """Outcome of generating briefs for many companies."""
+
+    generated: int = 0      # New content from the LLM (or fallback)
+    reused: int = 0         # Prompt unchanged, previous content reused
+    existing: int = 0       # Today's brief already present
+    conflicts: int = 0      # Created concurrently by someone else
+    llm_calls: int = 0
+    briefs: dict[str, dict] = field(default_factory=dict)
+
 
 class MorningBriefGenerator:
-    def __init__(self, llm: LLMGateway, sse_manager=None):
+    def __init__(self, llm: LLMGateway, sse_manager=None, max_concurrency: Optional[int] = None):
         self.llm = llm
         self.sse_manager = sse_manager
+        self._llm_slots = asyncio.Semaphore(max_concurrency or settings.brief_llm_concurrency)
 
     async def generate(self, session: AsyncSession, company_id: str) -> dict | None:
+        """Today's brief for one company, generating it if missing."""
         cid = uuid.UUID(company_id) if isinstance(company_id, str) else company_id
 
-        # Check existing
-        existing = await db_queries.get_today_brief(session, str(cid))
+        existing, plans = await self._plan(session, [str(cid)])
         if existing:
-            return existing
-
-        # Collect signals
-        all_signals = await db_queries.get_active_signals(session, str(cid), limit=20)
-        actionable = sorted(
-            [s for s in all_signals if (s.severity_score or 0) >= 40 and float(s.confidence) >= 0.5],
-            key=lambda s: float(s.severity_score or 0) * float(s.confidence),
-            reverse=True,
-        )[:5]
-
-        # Metrics
-        metrics = {
-            "orders_pending": await db_queries.count_orders(session, str(cid), status="pending"),
-            "orders_in_transit": await db_queries.count_orders(session, str(cid), status="in_transit"),
-            "payments_overdue_count": await db_queries.count_payments(session, str(cid), status="overdue"),
-            "payments_overdue_value": await db_queries.sum_overdue_payments(session, str(cid)),
-            "incidents_7d": await db_queries.count_incidents(session, str(cid), days=7),
-        }
+            return existing[str(cid)]
+        if not plans:
+            return None  # Unknown company
 
-        # LLM or fallback
-        brief_text = await self.llm.generate(
-            system="Bạn là RiskCast AI. Viết morning brief ngắn gọn, data-driven.",
-            user_message=(
-                "Tạo bản tóm tắt rủi ro sáng nay. Tiếng Việt, chuyên nghiệp.\n"
-                f"Metrics: {json.dumps(metrics, ensure_ascii=False)}\n"
-                f"Signals: {len(actionable)} signals found"
-            ),
-            model="claude-sonnet-4-20250514",
-            max_tokens=500,
-        )
+        await self._write_all(plans)
+        (brief,) = await self._save(session, plans)
+        await self._announce([brief])
+        return _brief_dict(brief)
 
-        if not brief_text:
-            brief_text = self._fallback_brief(metrics, actionable)
-
-        priority_items = [
-            {
-                "signal_id": str(s.id),
-                "signal_type": s.signal_type,
-                "severity_score": float(s.severity_score or 0),
-                "confidence": float(s.confidence),
-                "summary": f"{s.signal_type}: severity {float(s.severity_score or 0):.0f}",
-            }
-            for s in actionable
-        ]
-
-        # Save
-        brief = MorningBrief(
-            company_id=cid,
-            brief_date=date.today(),
-            content=brief_text,
-            signals_used=priority_items,
-            priority_items=priority_items,
+    async def generate_all(
+        self,
+        session_factory: async_sessionmaker,
+        company_ids: Optional[Sequence[str]] = None,
+    ) -> BriefBatchResult:
+        """
+        Today's briefs for many companies (all companies by default).
+
+        No session is held while the LLM calls run. Briefs are saved in
+        one transaction; if another writer created one of them meanwhile,
+        the rest are saved one by one.
+        """
+        async with session_factory() as session:
+            if company_ids is None:
+                company_ids = [str(c.id) for c in await db_queries.get_active_companies(session)]
+            existing, plans = await self._plan(session, [str(c) for c in company_ids])
+
+        result = BriefBatchResult(existing=len(existing), briefs=dict(existing))
+        result.llm_calls = await self._write_all(plans)
+
+        try:
+            async with session_factory() as session:
+                saved = await self._save(session, plans)
+                await session.commit()
+        except IntegrityError:
+            saved = []
+            for plan in plans:
+                try:
+                    async with session_factory() as session:
+                        saved += await self._save(session, [plan])
+                        await session.commit()
+                except IntegrityError:
+                    result.conflicts += 1
+                    logger.warning("brief_created_concurrently", company_id=str(plan.company_id))
+
+        reused = {p.company_id for p in plans if p.reused}
+        for brief in saved:
+            result.briefs[str(brief.company_id)] = _brief_dict(brief)
+            if brief.company_id in reused:
+                result.reused += 1
+            else:
+                result.generated += 1
+        await self._announce(saved)
+
+        logger.info(
+            "morning_briefs_generated",
+            companies=len(company_ids),
+            generated=result.generated,
+            reused=result.reused,
+            existing=result.existing,
+            conflicts=result.conflicts,
+            llm_calls=result.llm_calls,
         )
-        session.add(brief)
-        await session.flush()
+        return result
 
-        result = {
-            "id": str(brief.id),
-            "brief_date": str(date.today()),
-            "content": brief_text,
-            "priority_items": priority_items,
+    async def _plan(
+        self, session: AsyncSession, company_ids: list[str]
+    ) -> tuple[dict[str, dict], list[_BriefPlan]]:
+        """Today's existing briefs, and a plan for every company without one."""
+        today = date.today()
+        latest = await db_queries.get_latest_briefs(session, company_ids, today)
+        existing = {
+            cid: _brief_dict(b) for cid, b in latest.items() if b.brief_date == today
         }
+        pending = [cid for cid in company_ids if cid not in existing]
+
+        metrics = await db_queries.get_brief_metrics(session, pending)
+        signals = await db_queries.get_top_active_signals_by_company(
+            session, pending, per_company=BRIEF_SIGNAL_POOL
+        )
 
-        if self.sse_manager:
-            await self.sse_manager.broadcast(str(cid), {
+        plans = []
+        for cid in pending:
+            if cid not in metrics:
+                continue  # Unknown company
+            actionable = _select_actionable(signals.get(cid, []))
+            prompt = _brief_prompt(metrics[cid], actionable)
+            plan = _BriefPlan(
+                company_id=uuid.UUID(cid),
+                metrics=metrics[cid],
+                actionable=actionable,
+                prompt=prompt,
+                input_hash=brief_input_hash(prompt),
+            )
+            prior = latest.get(cid)
+            if prior is not None and prior.input_hash == plan.input_hash:
+                plan.content, plan.reused = prior.content, True
+            plans.append(plan)
+        return existing, plans
+
+    async def _write_all(self, plans: list[_BriefPlan]) -> int:
+        """Fill in content for every plan; returns the number of LLM calls."""
+        todo = [p for p in plans if not p.reused]
+        await asyncio.gather(*(self._write(p) for p in todo))
+        return len(todo)
+
+    async def _write(self, plan: _BriefPlan) -> None:
+        async with self._llm_slots:
+            try:
+                text = await self.llm.generate(
+                    system=BRIEF_SYSTEM_PROMPT,
+                    user_message=plan.prompt,
+                    model=BRIEF_MODEL,
+                    max_tokens=BRIEF_MAX_TOKENS,
+                )
+            except Exception as e:
+                logger.error("brief_llm_failed", company_id=str(plan.company_id), error=str(e))
+                text = ""
+
+        if text:
+            plan.content = text
+        else:
+            # Fallback text is dated, so it is never reused
+            plan.content = self._fallback_brief(plan.metrics, plan.actionable)
+            plan.input_hash = None
+
+    async def _save(self, session: AsyncSession, plans: list[_BriefPlan]) -> list[MorningBrief]:
+        briefs = []
+        for plan in plans:
+            priority_items = [
+                {
+                    "signal_id": str(s.id),
+                    "signal_type": s.signal_type,
+                    "severity_score": float(s.severity_score or 0),
+                    "confidence": float(s.confidence),
+                    "summary": f"{s.signal_type}: severity {float(s.severity_score or 0):.0f}",
+                }
+                for s in plan.actionable
+            ]
+            brief = MorningBrief(
+                company_id=plan.company_id,
+                brief_date=date.today(),
+                content=plan.content,
+                signals_used=priority_items,
+                priority_items=priority_items,
+                input_hash=plan.input_hash,
+            )
+            session.add(brief)
+            briefs.append(brief)
+        await session.flush()
+        return briefs
+
+    async def _announce(self, briefs: list[MorningBrief]) -> None:
+        if not self.sse_manager:
+            return
+        for brief in briefs:
+            await self.sse_manager.broadcast(str(brief.company_id), {
                 "type": "morning_brief",
                 "brief_id": str(brief.id),
-                "preview": brief_text[:150],
+                "preview": brief.content[:150],
             })
 
-        return result
-
     def _fallback_brief(self, metrics, signals):
         today = date.today().strftime("%d/%m/%Y")
         parts = [f"Báo cáo rủi ro ngày {today}."]
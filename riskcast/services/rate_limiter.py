@@ -0,0 +1,256 @@
+"""
+Rate Limiter — GCRA (Generic Cell Rate Algorithm) with pluggable stores.
+
+GCRA keeps ONE number per key: the theoretical arrival time (TAT) of the
+next request. A request is allowed when it would not push TAT more than
+``burst`` emission intervals into the future. Same behaviour as a token
+bucket, but no refill bookkeeping and trivially atomic in Redis.
+
+Stores:
+- MemoryGCRAStore: per-process, LRU-bounded (memory does not grow with
+  every distinct client key)
+- RedisGCRAStore: shared across workers via one Lua script (atomic
+  read-check-write, Redis server clock). Falls back to a memory store
+  when Redis is unavailable — limits become per-process, never fail-open.
+
+Quotas:
+- PlanQuotaResolver maps company → plan → api_rate_limit_per_minute,
+  cached per process with a TTL. Unauthenticated traffic uses the
+  settings default.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Protocol
+
+import structlog
+
+from riskcast.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Seconds of quota a client may spend at once (starter: 60/min → burst 20)
+BURST_SECONDS = 20
+
+REDIS_KEY_PREFIX = "v2:ratelimit:"
+
+
+# ── Quotas ───────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Quota:
+    """Sustained rate plus burst allowance."""
+
+    per_minute: int
+    burst: int
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return 60.0 / max(self.per_minute, 1)
+
+    @classmethod
+    def for_rate(cls, per_minute: int) -> "Quota":
+        return cls(per_minute=per_minute, burst=max(1, per_minute * BURST_SECONDS // 60))
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0  # seconds until the next request would pass
+
+
+def default_quota() -> Quota:
+    return Quota(per_minute=settings.rate_limit_default, burst=settings.rate_limit_burst)
+
+
+# ── Stores ───────────────────────────────────────────────────────────────
+
+
+class RateLimitStore(Protocol):
+    async def hit(self, key: str, quota: Quota) -> RateLimitResult: ...
+
+
+def gcra(tat: Optional[float], now: float, quota: Quota) -> tuple[RateLimitResult, Optional[float]]:
+    """
+    One GCRA step. Returns (result, new_tat); new_tat is None when denied.
+
+    Shared by the memory store and mirrored by the Redis Lua script.
+    """
+    interval = quota.emission_interval
+    new_tat = max(tat if tat is not None else now, now) + interval
+    allow_at = new_tat - quota.burst * interval
+    if now < allow_at:
+        return RateLimitResult(allowed=False, remaining=0, retry_after=allow_at - now), None
+    remaining = int((now - allow_at) / interval)
+    return RateLimitResult(allowed=True, remaining=remaining), new_tat
+
+
+class MemoryGCRAStore:
+    """In-process GCRA store, LRU-bounded to ``max_keys`` entries."""
+
+    def __init__(self, max_keys: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._tats: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    async def hit(self, key: str, quota: Quota) -> RateLimitResult:
+        now = self._clock()
+        result, new_tat = gcra(self._tats.get(key), now, quota)
+        if new_tat is not None:
+            self._tats[key] = new_tat
+            self._tats.move_to_end(key)
+            while len(self._tats) > self.max_keys:
+                self._tats.popitem(last=False)
+        return result
+
+
+# KEYS[1] = bucket key; ARGV[1] = emission interval (ms), ARGV[2] = burst.
+# Integer milliseconds on the Redis clock so every worker agrees on "now".
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - burst * interval
+if now < allow_at then
+  return {0, 0, allow_at - now}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now)
+return {1, math.floor((now - allow_at) / interval), 0}
+"""
+
+
+class RedisGCRAStore:
+    """Redis-backed GCRA store shared by all workers."""
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Awaitable[object]],
+        fallback: Optional[MemoryGCRAStore] = None,
+    ):
+        self._redis_factory = redis_factory
+        self._fallback = fallback if fallback is not None else MemoryGCRAStore()
+        self._script = None
+        self._script_client = None
+
+    async def _get_script(self):
+        client = await self._redis_factory()
+        if client is None:
+            return None
+        if self._script is None or self._script_client is not client:
+            self._script = client.register_script(GCRA_LUA)
+            self._script_client = client
+        return self._script
+
+    async def hit(self, key: str, quota: Quota) -> RateLimitResult:
+        try:
+            script = await self._get_script()
+            if script is not None:
+                interval_ms = max(1, round(quota.emission_interval * 1000))
+                allowed, remaining, retry_ms = await script(
+                    keys=[REDIS_KEY_PREFIX + key], args=[interval_ms, quota.burst]
+                )
+                return RateLimitResult(
+                    allowed=bool(int(allowed)),
+                    remaining=int(remaining),
+                    retry_after=int(retry_ms) / 1000.0,
+                )
+        except Exception as e:
+            logger.warning("rate_limit_redis_error", error=str(e))
+        return await self._fallback.hit(key, quota)
+
+
+def build_rate_limit_store() -> RateLimitStore:
+    """Store selected by RATE_LIMIT_BACKEND (memory | redis)."""
+    if settings.rate_limit_backend == "redis":
+        from riskcast.services.cache import get_redis
+        return RedisGCRAStore(get_redis)
+    return MemoryGCRAStore()
+
+
+# ── Per-tenant quotas from the company plan ──────────────────────────────
+
+
+async def _load_company_plan(company_id: str) -> Optional[str]:
+    from sqlalchemy import select
+
+    from riskcast.db.engine import get_db_session
+    from riskcast.db.models import Company
+
+    async with get_db_session() as session:
+        result = await session.execute(select(Company.plan).where(Company.id == company_id))
+        return result.scalar_one_or_none()
+
+
+def quota_for_plan(plan: Optional[str]) -> Optional[Quota]:
+    """Quota from PLAN_DEFINITIONS, or None for an unknown plan."""
+    from riskcast.api.routers.plan import PLAN_DEFINITIONS
+
+    defn = PLAN_DEFINITIONS.get(plan or "")
+    if defn is None:
+        return None
+    return Quota.for_rate(defn["limits"]["api_rate_limit_per_minute"])
+
+
+class PlanQuotaResolver:
+    """company_id → Quota, cached per process (bounded, TTL)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10_000,
+        plan_loader: Callable[[str], Awaitable[Optional[str]]] = _load_company_plan,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._plan_loader = plan_loader
+        self._clock = clock
+        self._cache: OrderedDict[str, tuple[float, Quota]] = OrderedDict()
+
+    async def quota_for(self, company_id: Optional[str]) -> Quota:
+        if not company_id:
+            return default_quota()
+        cid = str(company_id)
+        entry = self._cache.get(cid)
+        if entry is not None and entry[0] > self._clock():
+            return entry[1]
+
+        return await self._resolve(cid)
+
+    async def _resolve(self, cid: str) -> Quota:
+        try:
+            plan = await self._plan_loader(cid)
+            quota = quota_for_plan(plan) or default_quota()
+        except Exception as e:
+            logger.warning("rate_limit_plan_lookup_failed", company_id=cid, error=str(e))
+            quota = default_quota()
+        self._cache[cid] = (self._clock() + self.ttl_seconds, quota)
+        self._cache.move_to_end(cid)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return quota
+
+    def invalidate(self, company_id: str) -> None:
+        """Forget a tenant's cached quota (e.g. after a plan change)."""
+        self._cache.pop(str(company_id), None)
+
+
+_resolver: Optional[PlanQuotaResolver] = None
+
+
+def get_plan_quota_resolver() -> PlanQuotaResolver:
+    global _resolver
+    if _resolver is None:
+        _resolver = PlanQuotaResolver()
+    return _resolver
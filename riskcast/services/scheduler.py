@@ -18,7 +18,7 @@ from riskcast.analyzers.order_risk import OrderRiskScorer
 from riskcast.analyzers.payment_risk import PaymentRiskAnalyzer
 from riskcast.analyzers.route_disruption import RouteDisruptionAnalyzer
 from riskcast.db import queries as db_queries
-from riskcast.services.llm_gateway import LLMGateway
+from riskcast.services.llm_gateway import LLMGateway, build_llm_gateway
 from riskcast.services.morning_brief import MorningBriefGenerator
 from riskcast.services.omen_client import OmenClient
 from riskcast.services.signal_service import SignalService
@@ -75,7 +75,7 @@ class SignalScheduler:
         self.session_factory = session_factory
         self.omen_client = omen_client
         self.signal_service = SignalService()
-        self.brief_generator = MorningBriefGenerator(llm=llm or LLMGateway())
+        self.brief_generator = MorningBriefGenerator(llm=llm or build_llm_gateway())
         self.scheduler = AsyncIOScheduler()
 
     def start(self):
@@ -182,22 +182,18 @@ class SignalScheduler:
     async def generate_all_briefs(self):
         """Generate morning briefs for all companies (6AM daily)."""
         logger.info("morning_brief_generation_started")
-        async with self.session_factory() as session:
-            companies = await db_queries.get_active_companies(session)
-
-        for company in companies:
-            try:
-                async with self.session_factory() as session:
-                    await self.brief_generator.generate(session, str(company.id))
-                    await session.commit()
-            except Exception as e:
-                logger.error(
-                    "brief_generation_failed",
-                    company_id=str(company.id),
-                    error=str(e),
-                )
-
-        logger.info("morning_brief_generation_completed", companies=len(companies))
+        try:
+            result = await self.brief_generator.generate_all(self.session_factory)
+        except Exception as e:
+            logger.error("brief_generation_failed", error=str(e))
+            return
+
+        logger.info(
+            "morning_brief_generation_completed",
+            generated=result.generated,
+            reused=result.reused,
+            existing=result.existing,
+        )
 
     async def expire_signals(self):
         """Deactivate expired signals across all companies."""
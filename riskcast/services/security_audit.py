@@ -3,23 +3,34 @@ Security Audit Trail Service.
 
 Immutable, append-only logging of ALL security-relevant events.
 Each entry carries a SHA-256 hash chain for tamper detection.
+
+Appends take a transaction-scoped advisory lock (PostgreSQL) and assign
+the next chain sequence number under it; seq is unique, so a writer that
+bypasses the lock fails rather than forking the chain. Verification
+resumes from the latest HMAC-signed checkpoint and streams only the
+entries appended since.
 """
 
 import hashlib
+import hmac
 import json
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
 import structlog
-from sqlalchemy import desc, select
+from sqlalchemy import desc, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from riskcast.config import settings
 from riskcast.db.engine import get_db_session
-from riskcast.db.models import SecurityAuditLog
+from riskcast.db.models import SecurityAuditCheckpoint, SecurityAuditLog
 
 logger = structlog.get_logger(__name__)
 
+# pg_advisory_xact_lock key serializing appends to the chain
+_APPEND_LOCK_KEY = 0x5A0D17C4A1
+
 
 def _compute_entry_hash(
     entry_id: str,
@@ -35,9 +46,25 @@ def _compute_entry_hash(
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
+def _sign_checkpoint(seq: int, entry_hash: str, entries_verified: int) -> str:
+    """HMAC-SHA256 over a checkpoint's fields."""
+    key = settings.audit_checkpoint_key or settings.jwt_secret
+    payload = f"{seq}|{entry_hash}|{entries_verified}"
+    return hmac.new(key.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
 class SecurityAuditService:
     """Append-only audit trail with hash chain integrity."""
 
+    def __init__(self, checkpoint_every: int = 1000, stream_batch_size: int = 1000):
+        """
+        Args:
+            checkpoint_every: Verified entries between signed checkpoints
+            stream_batch_size: Rows fetched per round trip while verifying
+        """
+        self.checkpoint_every = checkpoint_every
+        self.stream_batch_size = stream_batch_size
+
     async def log_event(
         self,
         session: AsyncSession,
@@ -62,8 +89,9 @@ class SecurityAuditService:
         settings_change, role_change, api_key_created, api_key_revoked,
         decision_approved, signal_ingested, reconcile_triggered, etc.
         """
-        # Get the hash of the most recent entry for chain linking
-        previous_hash = await self._get_last_hash(session)
+        # Serialize appends, then link to the current tail of the chain
+        await self._lock_chain(session)
+        tail_seq, previous_hash = await self._get_tail(session)
 
         entry_id = uuid.uuid4()
         now = datetime.utcnow()
@@ -80,6 +108,7 @@ class SecurityAuditService:
 
         entry = SecurityAuditLog(
             id=entry_id,
+            seq=tail_seq + 1,
             timestamp=now,
             company_id=company_id,
             user_id=user_id,
@@ -102,6 +131,7 @@ class SecurityAuditService:
 
         logger.info(
             "security_audit_logged",
+            seq=entry.seq,
             action=action,
             status=status,
             company_id=str(company_id) if company_id else None,
@@ -110,44 +140,116 @@ class SecurityAuditService:
 
         return entry
 
-    async def _get_last_hash(self, session: AsyncSession) -> Optional[str]:
-        """Get the entry_hash of the most recent audit log entry."""
+    async def _lock_chain(self, session: AsyncSession) -> None:
+        """
+        Hold the append lock until the caller's transaction ends.
+
+        PostgreSQL only; SQLite serializes writers itself, and the unique
+        seq index rejects any append that read a stale tail.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _APPEND_LOCK_KEY}
+            )
+
+    async def _get_tail(self, session: AsyncSession) -> tuple[int, Optional[str]]:
+        """(seq, entry_hash) of the last entry in the chain, (0, None) if empty."""
         result = await session.execute(
-            select(SecurityAuditLog.entry_hash)
-            .order_by(desc(SecurityAuditLog.timestamp))
+            select(SecurityAuditLog.seq, SecurityAuditLog.entry_hash)
+            .order_by(desc(SecurityAuditLog.seq))
             .limit(1)
         )
-        row = result.scalar_one_or_none()
-        return row
+        row = result.first()
+        return (row.seq, row.entry_hash) if row else (0, None)
+
+    async def _get_anchor(
+        self, session: AsyncSession, breaks: list[dict]
+    ) -> Optional[SecurityAuditCheckpoint]:
+        """Latest checkpoint, if its signature and chain entry still match."""
+        checkpoint = (await session.execute(
+            select(SecurityAuditCheckpoint)
+            .order_by(desc(SecurityAuditCheckpoint.seq))
+            .limit(1)
+        )).scalar_one_or_none()
+        if checkpoint is None:
+            return None
 
-    async def verify_chain_integrity(self, session: AsyncSession) -> dict:
+        expected = _sign_checkpoint(
+            checkpoint.seq, checkpoint.entry_hash, checkpoint.entries_verified
+        )
+        if not hmac.compare_digest(checkpoint.signature, expected):
+            breaks.append({"seq": checkpoint.seq, "issue": "checkpoint_signature_invalid"})
+            return None
+
+        actual = (await session.execute(
+            select(SecurityAuditLog.entry_hash).where(SecurityAuditLog.seq == checkpoint.seq)
+        )).scalar_one_or_none()
+        if actual != checkpoint.entry_hash:
+            breaks.append({
+                "seq": checkpoint.seq,
+                "issue": "checkpoint_entry_mismatch",
+                "expected": checkpoint.entry_hash,
+                "actual": actual,
+            })
+            return None
+        return checkpoint
+
+    async def verify_chain_integrity(
+        self, session: AsyncSession, *, full: bool = False
+    ) -> dict:
         """
         Verify the hash chain is unbroken.
 
+        Starts after the latest valid checkpoint (or from the beginning if
+        full=True or no checkpoint verifies) and streams the remaining
+        entries in seq order, so cost tracks entries appended since the
+        last checkpoint. When at least checkpoint_every entries verify
+        cleanly, a new signed checkpoint is flushed to the session.
+
         Returns a report with integrity status and any breaks found.
         """
-        result = await session.execute(
-            select(SecurityAuditLog)
-            .order_by(SecurityAuditLog.timestamp)
+        breaks: list[dict] = []
+        anchor = None if full else await self._get_anchor(session, breaks)
+        if anchor is not None:
+            last_seq, previous_hash, verified_before = (
+                anchor.seq, anchor.entry_hash, anchor.entries_verified
+            )
+        else:
+            last_seq, previous_hash, verified_before = 0, None, 0
+
+        stream = await session.stream(
+            select(
+                SecurityAuditLog.id,
+                SecurityAuditLog.seq,
+                SecurityAuditLog.timestamp,
+                SecurityAuditLog.action,
+                SecurityAuditLog.company_id,
+                SecurityAuditLog.user_id,
+                SecurityAuditLog.status,
+                SecurityAuditLog.previous_hash,
+                SecurityAuditLog.entry_hash,
+            )
+            .where(SecurityAuditLog.seq > last_seq)
+            .order_by(SecurityAuditLog.seq)
+            .execution_options(yield_per=self.stream_batch_size)
         )
-        entries = result.scalars().all()
-
-        if not entries:
-            return {
-                "status": "empty",
-                "total_entries": 0,
-                "chain_intact": True,
-                "breaks": [],
-            }
 
-        breaks: list[dict] = []
-        previous_hash: Optional[str] = None
+        verified = 0
+        async for entry in stream:
+            # A gap means entries were removed from the chain
+            if entry.seq != last_seq + 1:
+                breaks.append({
+                    "entry_id": str(entry.id),
+                    "seq": entry.seq,
+                    "issue": "sequence_gap",
+                    "expected_seq": last_seq + 1,
+                })
 
-        for entry in entries:
             # Verify this entry's previous_hash matches the last entry's hash
             if entry.previous_hash != previous_hash:
                 breaks.append({
                     "entry_id": str(entry.id),
+                    "seq": entry.seq,
                     "timestamp": entry.timestamp.isoformat(),
                     "expected_previous_hash": previous_hash,
                     "actual_previous_hash": entry.previous_hash,
@@ -166,17 +268,47 @@ class SecurityAuditService:
             if entry.entry_hash != expected_hash:
                 breaks.append({
                     "entry_id": str(entry.id),
+                    "seq": entry.seq,
                     "timestamp": entry.timestamp.isoformat(),
                     "issue": "entry_hash_mismatch",
                     "expected": expected_hash,
                     "actual": entry.entry_hash,
                 })
 
-            previous_hash = entry.entry_hash
+            last_seq, previous_hash = entry.seq, entry.entry_hash
+            verified += 1
+
+        total = verified_before + verified
+        new_checkpoint = None
+        if not breaks and verified and verified >= self.checkpoint_every:
+            new_checkpoint = SecurityAuditCheckpoint(
+                seq=last_seq,
+                entry_hash=previous_hash,
+                entries_verified=total,
+                signature=_sign_checkpoint(last_seq, previous_hash, total),
+            )
+            session.add(new_checkpoint)
+            await session.flush()
+
+        logger.info(
+            "security_audit_chain_verified",
+            chain_intact=not breaks,
+            verified_entries=verified,
+            total_entries=total,
+            from_seq=anchor.seq if anchor else 0,
+            checkpointed=new_checkpoint is not None,
+        )
 
+        if total == 0 and not breaks:
+            status = "empty"
+        else:
+            status = "intact" if not breaks else "broken"
         return {
-            "status": "intact" if not breaks else "broken",
-            "total_entries": len(entries),
+            "status": status,
+            "total_entries": total,
+            "verified_entries": verified,
+            "checkpoint_seq": anchor.seq if anchor else None,
+            "new_checkpoint_seq": new_checkpoint.seq if new_checkpoint else None,
             "chain_intact": len(breaks) == 0,
             "breaks_found": len(breaks),
             "breaks": breaks[:10],  # Cap output
@@ -0,0 +1,163 @@
+"""
+Signal Archive — moves inactive signals out of the hot v2_signals table.
+
+FLOW:
+  1. Select a batch of inactive signals older than the cutoff
+  2. Make sure a monthly archive partition exists for each row (PostgreSQL)
+  3. INSERT ... SELECT into v2_signals_archive, DELETE from v2_signals
+  4. Repeat until no rows are left; each batch is its own transaction
+
+Old history is dropped per month: on PostgreSQL by detaching and dropping
+the partition (no DELETE, no vacuum debt); on SQLite by a plain DELETE.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+import structlog
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from riskcast.db.models import Signal, SignalArchive
+
+logger = structlog.get_logger(__name__)
+
+_ARCHIVE_COLUMNS = [
+    "id", "created_at", "company_id", "source", "signal_type", "entity_type",
+    "entity_id", "confidence", "severity_score", "evidence", "context",
+    "expires_at", "updated_at",
+]
+
+
+def _month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def _next_month(d: date) -> date:
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def partition_name(month: date) -> str:
+    return f"v2_signals_archive_{month:%Y_%m}"
+
+
+@dataclass
+class ArchiveResult:
+    archived: int = 0
+    batches: int = 0
+    partitions_created: list[str] = field(default_factory=list)
+
+
+class SignalArchiver:
+    """Batch archiver for inactive v2 signals."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], batch_size: int = 5000):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    async def archive_inactive(self, older_than_days: int = 30) -> ArchiveResult:
+        """Move inactive signals created before the cutoff into the archive."""
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        result = ArchiveResult()
+
+        while True:
+            async with self.session_factory() as session:
+                moved = await self._archive_batch(session, cutoff, result)
+                await session.commit()
+            if moved == 0:
+                break
+            result.archived += moved
+            result.batches += 1
+
+        logger.info(
+            "signals_archived",
+            archived=result.archived,
+            batches=result.batches,
+            cutoff=cutoff.isoformat(),
+        )
+        return result
+
+    async def _archive_batch(
+        self, session: AsyncSession, cutoff: datetime, result: ArchiveResult
+    ) -> int:
+        is_pg = session.get_bind().dialect.name == "postgresql"
+        stmt = (
+            select(Signal.id, Signal.created_at)
+            .where(Signal.is_active.is_(False), Signal.created_at < cutoff)
+            .order_by(Signal.created_at)
+            .limit(self.batch_size)
+        )
+        if is_pg:
+            stmt = stmt.with_for_update(skip_locked=True)
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return 0
+
+        if is_pg:
+            months = {_month_start(r.created_at.date()) for r in rows}
+            for month in sorted(months):
+                name = await self.ensure_partition(session, month)
+                if name:
+                    result.partitions_created.append(name)
+
+        ids = [r.id for r in rows]
+        source = select(*[getattr(Signal, c) for c in _ARCHIVE_COLUMNS]).where(Signal.id.in_(ids))
+        await session.execute(
+            insert(SignalArchive).from_select(_ARCHIVE_COLUMNS, source)
+        )
+        await session.execute(delete(Signal).where(Signal.id.in_(ids)))
+        return len(ids)
+
+    async def ensure_partition(self, session: AsyncSession, month: date) -> str | None:
+        """Create the monthly partition if missing. Returns its name when created."""
+        name = partition_name(month)
+        exists = await session.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+        )
+        if exists.scalar():
+            return None
+        # Names/bounds come from date formatting, never from user input
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF v2_signals_archive "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            )
+        )
+        return name
+
+    async def drop_before(self, months_to_keep: int = 12) -> list[str]:
+        """Drop archived history older than ``months_to_keep`` whole months."""
+        keep_from = _month_start(date.today())
+        for _ in range(months_to_keep):
+            keep_from = _month_start(keep_from - timedelta(days=1))
+
+        async with self.session_factory() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                await session.execute(
+                    delete(SignalArchive).where(
+                        SignalArchive.created_at < datetime.combine(keep_from, datetime.min.time())
+                    )
+                )
+                await session.commit()
+                return []
+
+            rows = await session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = 'v2_signals_archive'"
+                )
+            )
+            cutoff_name = partition_name(keep_from)
+            dropped = [
+                r.relname for r in rows
+                if r.relname.startswith("v2_signals_archive_") and r.relname < cutoff_name
+            ]
+            for name in sorted(dropped):
+                await session.execute(text(f"ALTER TABLE v2_signals_archive DETACH PARTITION {name}"))
+                await session.execute(text(f"DROP TABLE {name}"))
+            await session.commit()
+
+        logger.info("signal_archive_partitions_dropped", partitions=dropped)
+        return dropped
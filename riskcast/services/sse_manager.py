@@ -7,58 +7,260 @@ SSE is simpler: Nginx config, debugging, auto-reconnect all easier.
 Usage:
 - Subscribe: GET /api/v1/events/stream?token=xxx
 - Publish: await sse_manager.broadcast(company_id, event_dict)
+
+FLOW:
+  broadcast → json.dumps ONCE → backend.publish
+    memory: deliver in this process
+    redis:  INCR event id + PUBLISH; every worker's listener delivers
+  deliver → build the SSE frame ONCE → replay ring → bounded subscriber queues
+
+- Backpressure: each subscriber has a bounded queue. On overflow either the
+  oldest queued event is dropped ("drop_oldest") or the subscriber is
+  disconnected ("disconnect") and resumes via Last-Event-ID on reconnect.
+- Resume: the last ``replay_size`` frames per company are kept; a client
+  reconnecting with Last-Event-ID gets the frames it missed first.
 """
 
 import asyncio
+import itertools
 import json
-from collections import defaultdict
-from typing import AsyncGenerator
+from collections import defaultdict, deque
+from typing import AsyncGenerator, Awaitable, Callable, Optional, Protocol
 
 import structlog
 
+from riskcast.config import settings
+
 logger = structlog.get_logger(__name__)
 
+OVERFLOW_POLICIES = ("drop_oldest", "disconnect")
+
+DeliverFn = Callable[[str, int, str], None]
+
+_CLOSE = None  # queue sentinel: subscriber was disconnected
+
+
+# ── Backends ─────────────────────────────────────────────────────────────
+
+
+class SSEBackend(Protocol):
+    def bind(self, deliver: DeliverFn) -> None: ...
+    async def start(self) -> None: ...
+    async def close(self) -> None: ...
+    async def publish(self, company_id: str, payload: str) -> None: ...
+
+
+class MemorySSEBackend:
+    """Single-process fan-out: events reach subscribers of this worker only."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._deliver: Optional[DeliverFn] = None
+
+    def bind(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    async def publish(self, company_id: str, payload: str) -> None:
+        self._deliver(company_id, next(self._ids), payload)
+
+
+class RedisSSEBackend:
+    """
+    Cross-process fan-out over one Redis pub/sub channel.
+
+    Event ids come from a Redis counter so Last-Event-ID means the same
+    thing on every worker. While the listener is not connected, events are
+    delivered locally only (graceful degradation, same as the cache).
+    """
+
+    CHANNEL = "v2:sse:events"
+    SEQ_KEY = "v2:sse:seq"
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Awaitable[object]],
+        reconnect_delay: float = 1.0,
+    ):
+        self._redis_factory = redis_factory
+        self.reconnect_delay = reconnect_delay
+        self._deliver: Optional[DeliverFn] = None
+        self._local_ids = itertools.count(1)
+        self._task: Optional[asyncio.Task] = None
+        self._listening = asyncio.Event()
+
+    @property
+    def listening(self) -> bool:
+        return self._listening.is_set()
+
+    def bind(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def wait_listening(self, timeout: float = 5.0) -> None:
+        await asyncio.wait_for(self._listening.wait(), timeout)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._listening.clear()
+
+    async def publish(self, company_id: str, payload: str) -> None:
+        if self.listening:
+            try:
+                client = await self._redis_factory()
+                event_id = await client.incr(self.SEQ_KEY)
+                await client.publish(self.CHANNEL, f"{company_id}\n{event_id}\n{payload}")
+                return
+            except Exception as e:
+                logger.warning("sse_redis_publish_failed", error=str(e))
+        self._deliver(company_id, next(self._local_ids), payload)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                client = await self._redis_factory()
+                if client is None:
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self.CHANNEL)
+                self._listening.set()
+                logger.info("sse_redis_listening", channel=self.CHANNEL)
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._handle(message["data"])
+                finally:
+                    self._listening.clear()
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("sse_redis_listener_error", error=str(e))
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _handle(self, data) -> None:
+        if isinstance(data, bytes):
+            data = data.decode()
+        try:
+            company_id, event_id, payload = data.split("\n", 2)
+            self._deliver(company_id, int(event_id), payload)
+        except Exception as e:
+            logger.warning("sse_redis_bad_message", error=str(e))
+
+
+def build_sse_backend() -> SSEBackend:
+    """Backend selected by SSE_BACKEND (memory | redis)."""
+    if settings.sse_backend == "redis":
+        from riskcast.services.cache import get_redis
+        return RedisSSEBackend(get_redis)
+    return MemorySSEBackend()
+
+
+# ── Manager ──────────────────────────────────────────────────────────────
+
+
+class _Subscriber:
+    __slots__ = ("queue",)
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
 
 class SSEManager:
     """
     SSE pub/sub manager.
 
-    Each company has a set of subscriber queues.
-    Broadcast puts event into all company queues.
-    Subscribe yields SSE-formatted strings.
+    Each company has a set of bounded subscriber queues and a replay ring.
+    Broadcast serializes once and hands the payload to the backend.
+    Subscribe yields SSE-formatted strings (with ``id:`` for resume).
     """
 
-    def __init__(self):
-        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+    def __init__(
+        self,
+        backend: Optional[SSEBackend] = None,
+        queue_size: int = 256,
+        overflow: str = "drop_oldest",
+        replay_size: int = 100,
+        keepalive_seconds: float = 30.0,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self.backend = backend or MemorySSEBackend()
+        self.backend.bind(self._deliver)
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.replay_size = replay_size
+        self.keepalive_seconds = keepalive_seconds
+        self._subscribers: dict[str, set[_Subscriber]] = defaultdict(set)
+        self._replay: dict[str, deque[tuple[int, str]]] = {}
+        self.dropped = 0
+        self.disconnected = 0
 
     @property
     def subscriber_count(self) -> int:
-        return sum(len(queues) for queues in self._subscribers.values())
+        return sum(len(subs) for subs in self._subscribers.values())
 
-    async def subscribe(self, company_id: str) -> AsyncGenerator[str, None]:
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    async def subscribe(
+        self,
+        company_id: str,
+        last_event_id: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
         """
         Subscribe to events for a company. Yields SSE-formatted strings.
 
+        With ``last_event_id``, first replays newer frames from the ring.
         Sends keepalive comment every 30s to prevent connection timeout.
         """
-        queue: asyncio.Queue = asyncio.Queue()
-        self._subscribers[company_id].add(queue)
+        sub = _Subscriber(self.queue_size)
+        # Register and snapshot the ring without awaiting in between: every
+        # later delivery lands in the queue, so there is no gap or duplicate
+        self._subscribers[company_id].add(sub)
+        backlog = []
+        if last_event_id is not None:
+            backlog = [f for i, f in self._replay.get(company_id, ()) if i > last_event_id]
         logger.info(
             "sse_subscriber_added",
             company_id=company_id,
             total=len(self._subscribers[company_id]),
+            replayed=len(backlog),
         )
 
         try:
+            for frame in backlog:
+                yield frame
             while True:
                 try:
-                    data = await asyncio.wait_for(queue.get(), timeout=30)
-                    yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+                    item = await asyncio.wait_for(sub.queue.get(), timeout=self.keepalive_seconds)
                 except asyncio.TimeoutError:
                     # SSE comment = keepalive (not data, won't trigger onmessage)
                     yield ": keepalive\n\n"
+                    continue
+                if item is _CLOSE:
+                    return
+                yield item[1]
         finally:
-            self._subscribers[company_id].discard(queue)
+            self._subscribers[company_id].discard(sub)
             logger.info(
                 "sse_subscriber_removed",
                 company_id=company_id,
@@ -66,24 +268,49 @@ class SSEManager:
             )
 
     async def broadcast(self, company_id: str, event: dict):
-        """Send an event to all subscribers of a company."""
-        queues = self._subscribers.get(company_id, set())
-        if not queues:
+        """Send an event to all subscribers of a company (on every worker)."""
+        payload = json.dumps(event, ensure_ascii=False, default=str)
+        await self.backend.publish(company_id, payload)
+        logger.debug("sse_broadcast", company_id=company_id, event_type=event.get("type"))
+
+    def _deliver(self, company_id: str, event_id: int, payload: str) -> None:
+        """Backend callback: one frame per event, shared by all subscribers."""
+        frame = f"id: {event_id}\ndata: {payload}\n\n"
+        ring = self._replay.get(company_id)
+        if ring is None:
+            ring = self._replay[company_id] = deque(maxlen=self.replay_size)
+        ring.append((event_id, frame))
+
+        for sub in tuple(self._subscribers.get(company_id, ())):
+            self._offer(company_id, sub, (event_id, frame))
+
+    def _offer(self, company_id: str, sub: _Subscriber, item: tuple[int, str]) -> None:
+        try:
+            sub.queue.put_nowait(item)
             return
+        except asyncio.QueueFull:
+            pass
 
-        for queue in queues:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning("sse_queue_full", company_id=company_id)
+        if self.overflow == "drop_oldest":
+            sub.queue.get_nowait()
+            sub.queue.put_nowait(item)
+            self.dropped += 1
+            logger.warning("sse_queue_full_dropped_oldest", company_id=company_id)
+            return
 
-        logger.debug(
-            "sse_broadcast",
-            company_id=company_id,
-            event_type=event.get("type"),
-            recipients=len(queues),
-        )
+        # disconnect: discard the backlog; the client resumes from the ring
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(_CLOSE)
+        self._subscribers[company_id].discard(sub)
+        self.disconnected += 1
+        logger.warning("sse_slow_subscriber_disconnected", company_id=company_id)
 
 
 # Global singleton — shared across the API process
-sse_manager = SSEManager()
+sse_manager = SSEManager(
+    backend=build_sse_backend(),
+    queue_size=settings.sse_queue_size,
+    overflow=settings.sse_overflow_policy,
+    replay_size=settings.sse_replay_size,
+)
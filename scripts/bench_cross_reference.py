@@ -0,0 +1,113 @@
+"""Throughput benchmark: CrossReferenceValidator at a given daily signal rate.
+
+Streams --signals-per-day signals over --days simulated days (validate,
+then add, as ValidationPipeline does) through the windowed validator.
+The old list-scan validator, kept here for comparison only, runs on the
+first --legacy-signals of the same stream; both are checked to agree there.
+
+Usage: python -m scripts.bench_cross_reference [--signals-per-day 100000] [--days 2]
+"""
+import argparse
+import logging
+import random
+import time
+
+import structlog
+
+from app.omen.validators.cross_reference import CrossReferenceValidator
+
+CHOKEPOINTS = ["red_sea", "suez", "malacca", "hormuz", "panama", "cape", "dardanelles"]
+WINDOW = 24 * 3600.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LegacyValidator:
+    """The pre-index validator: one list, rebuilt on add, scanned on validate."""
+
+    def __init__(self, clock):
+        self._clock = clock
+        self._recent = []
+
+    def add_signal(self, signal):
+        signal = dict(signal, _cached_at=self._clock())
+        self._recent.append(signal)
+        cutoff = self._clock() - WINDOW
+        self._recent = [s for s in self._recent if s["_cached_at"] > cutoff]
+
+    def validate(self, signal):
+        corroborating, conflicting = 0, 0
+        p = signal.get("probability", 0.5)
+        for other in self._recent:
+            if other.get("signal_id") == signal.get("signal_id"):
+                continue
+            if other.get("chokepoint") != signal.get("chokepoint"):
+                continue
+            q = other.get("probability", 0.5)
+            if abs(p - q) < 0.2:
+                corroborating += 1
+            elif abs(p - q) > 0.5:
+                conflicting += 1
+        return corroborating, conflicting
+
+
+def synthetic_stream(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(n):
+        yield {
+            "signal_id": f"OMEN-{i}",
+            "chokepoint": rng.choice(CHOKEPOINTS),
+            "probability": rng.random(),
+        }
+
+
+def _run(validator, clock, signals, step):
+    out = []
+    start = time.perf_counter()
+    for signal in signals:
+        clock.now += step
+        out.append(validator.validate(signal))
+        validator.add_signal(signal)
+    return time.perf_counter() - start, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signals-per-day", type=int, default=100_000)
+    parser.add_argument("--days", type=float, default=2.0)
+    parser.add_argument("--legacy-signals", type=int, default=10_000)
+    parser.add_argument("--max-listed", type=int, default=50)
+    args = parser.parse_args()
+    # Per-signal debug logs would dominate the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+    step = WINDOW / args.signals_per_day
+    total = int(args.signals_per_day * args.days)
+    signals = list(synthetic_stream(total))
+    legacy_n = min(args.legacy_signals, total)
+
+    clock = FakeClock()
+    validator = CrossReferenceValidator(max_listed=args.max_listed, clock=clock)
+    t_new, new = _run(validator, clock, signals, step)
+
+    legacy_clock = FakeClock()
+    t_old, old = _run(LegacyValidator(legacy_clock), legacy_clock, signals[:legacy_n], step)
+    differ = sum(
+        1 for a, b in zip(old, new)
+        if a != (b.corroboration_count, b.conflict_count)
+    )
+
+    print(f"{args.signals_per_day} signals/day, {total} signals, window {validator.cached_signals} at end")
+    print(f"  windowed  {t_new:>7.2f}s  {total / t_new:>10.0f} signals/s  ({total} signals)")
+    print(f"  legacy    {t_old:>7.2f}s  {legacy_n / t_old:>10.0f} signals/s  (first {legacy_n})")
+    print(f"  counts differ on {differ} of the first {legacy_n} signals")
+
+
+if __name__ == "__main__":
+    main()
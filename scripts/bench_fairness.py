@@ -0,0 +1,126 @@
+"""Throughput benchmark: group fairness metrics over --decisions decisions.
+
+Loads synthetic decision dicts into DecisionColumns once, then analyzes
+the four fairness attributes plus --intersections intersectional
+groupings with FairnessEngine. The old per-attribute dict analysis,
+kept here for comparison only, runs on the four attributes; both are
+checked to agree on every group's counts.
+
+Usage: python -m scripts.bench_fairness [--decisions 1000000]
+"""
+import argparse
+import logging
+import random
+import time
+
+import structlog
+
+from app.governance.bias_detection import (
+    FAIRNESS_ATTRIBUTES,
+    DecisionColumns,
+    FairnessEngine,
+)
+
+SIZES = ["small", "medium", "large", "enterprise"]
+CHOKEPOINTS = ["red_sea", "panama", "suez", "malacca", "hormuz", "cape", "gibraltar"]
+REGIONS = ["APAC", "EMEA", "Americas"]
+CARGO = ["general", "hazmat", "perishable", "high_value"]
+INTERSECTIONS = [
+    ("customer_size", "region"),
+    ("customer_size", "chokepoint"),
+    ("region", "cargo_type"),
+    ("customer_size", "region", "cargo_type"),
+]
+
+
+def synthetic_decisions(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    action_prob = {"small": 0.55, "medium": 0.60, "large": 0.65, "enterprise": 0.70}
+    decisions = []
+    for i in range(n):
+        size = rng.choice(SIZES)
+        known = rng.random() < 0.6
+        decisions.append({
+            "decision_id": f"dec_{i}",
+            "customer_size": size,
+            "chokepoint": rng.choice(CHOKEPOINTS),
+            "region": rng.choice(REGIONS),
+            "cargo_type": rng.choice(CARGO),
+            "action_recommended": rng.random() < action_prob[size],
+            "outcome_known": known,
+            "was_correct": known and rng.random() < 0.7,
+        })
+    return decisions
+
+
+def legacy_counts(decisions, attribute):
+    """The pre-columnar analysis: bucket dicts, then recount each bucket."""
+    groups = {}
+    for d in decisions:
+        groups.setdefault(d.get(attribute, "unknown"), []).append(d)
+
+    counts = {}
+    for value, group in groups.items():
+        positive = len([d for d in group if d.get("action_recommended", False)])
+        tp = fp = tn = fn = 0
+        for d in group:
+            if d.get("outcome_known", False):
+                if d.get("action_recommended") and d.get("was_correct"):
+                    tp += 1
+                elif d.get("action_recommended") and not d.get("was_correct"):
+                    fp += 1
+                elif not d.get("action_recommended") and d.get("was_correct"):
+                    tn += 1
+                else:
+                    fn += 1
+        counts[value] = (len(group), positive, tp, fp, tn, fn)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1_000_000)
+    parser.add_argument("--intersections", type=int, default=len(INTERSECTIONS))
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+    decisions = synthetic_decisions(args.decisions)
+    intersections = INTERSECTIONS[:args.intersections]
+
+    start = time.perf_counter()
+    columns = DecisionColumns.from_decisions(decisions)
+    t_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = FairnessEngine(columns)
+    attributes_only = engine.analyze(list(FAIRNESS_ATTRIBUTES))
+    t_attributes = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with_intersections = engine.analyze(list(FAIRNESS_ATTRIBUTES) + intersections)
+    t_all = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = {a: legacy_counts(decisions, a) for a in FAIRNESS_ATTRIBUTES}
+    t_legacy = time.perf_counter() - start
+
+    differ = 0
+    for attribute, reports in attributes_only.items():
+        for r in reports:
+            m = r.metrics
+            got = (m.total, m.positive_outcomes, m.true_positives,
+                   m.false_positives, m.true_negatives, m.false_negatives)
+            differ += got != legacy[attribute][r.group_value]
+    n_groups = sum(len(r) for r in with_intersections.values())
+
+    print(f"{args.decisions} decisions, {len(FAIRNESS_ATTRIBUTES)} attributes + "
+          f"{len(intersections)} intersections ({n_groups} groups)")
+    print(f"  load columns       {t_load:>7.2f}s")
+    print(f"  columnar, attrs    {t_attributes:>7.2f}s")
+    print(f"  columnar, + inter. {t_all:>7.2f}s")
+    print(f"  legacy, attrs      {t_legacy:>7.2f}s")
+    print(f"  group counts differ on {differ} groups")
+
+
+if __name__ == "__main__":
+    main()
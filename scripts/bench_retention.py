@@ -0,0 +1,91 @@
+"""Throughput benchmark: RetentionManager decision sweep on seeded SQLite.
+
+Seeds --rows decisions (--expired-pct of them past retention, every
+--hold-every-th expired row under legal hold) into a temporary SQLite
+file and runs the batched sweep, reporting rows deleted per second.
+
+Usage: python -m scripts.bench_retention [--rows 200000] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import structlog
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.core.retention import RETENTION_POLICIES, LegalHoldManager, RetentionManager
+from app.db.models import DecisionModel, LegalHoldEntityModel, RetentionCheckpointModel
+
+
+async def _seed(factory, rows: int, expired_pct: float, hold_every: int) -> list:
+    now = datetime.utcnow()
+    old = now - timedelta(days=RETENTION_POLICIES["decisions"].total_retention_days + 1)
+    held, chunk = [], []
+    async with factory() as session:
+        for i in range(rows):
+            expired = (i * 7919 % 100) < expired_pct
+            decision_id = f"dec_{i:08d}"
+            if expired and hold_every and i % hold_every == 0:
+                held.append(decision_id)
+            chunk.append(dict(
+                decision_id=decision_id, customer_id="cust", chokepoint="red_sea",
+                severity="high", urgency="soon",
+                q1_what={}, q2_when={}, q3_severity={}, q4_why={},
+                q5_action={}, q6_confidence={}, q7_inaction={},
+                exposure_usd=1.0, recommended_action="reroute", confidence_score=0.5,
+                valid_until=now, created_at=old if expired else now,
+            ))
+            if len(chunk) == 10_000:
+                await session.execute(insert(DecisionModel), chunk)
+                chunk = []
+        if chunk:
+            await session.execute(insert(DecisionModel), chunk)
+        await session.commit()
+    return held
+
+
+async def _main(args) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "retention.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        for model in (DecisionModel, LegalHoldEntityModel, RetentionCheckpointModel):
+            await conn.execute(CreateTable(model.__table__))
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    start = time.perf_counter()
+    held = await _seed(factory, args.rows, args.expired_pct, args.hold_every)
+    print(f"seeded {args.rows} decisions in {time.perf_counter() - start:.1f}s ({len(held)} held)")
+
+    holds = LegalHoldManager()
+    holds.create_hold("bench", "decisions", held, "Benchmark", "", created_by="bench")
+    manager = RetentionManager(factory, holds, batch_size=args.batch_size)
+    result = await manager._process_data_type(
+        "decisions", RETENTION_POLICIES["decisions"], dry_run=False,
+    )
+    print(
+        f"  deleted {result['deleted']} in {result['batches']} batches, "
+        f"{result['duration_seconds']:.2f}s, {result['rows_per_second']:.0f} rows/s, "
+        f"held {result['held']}"
+    )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--expired-pct", type=float, default=60.0)
+    parser.add_argument("--hold-every", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
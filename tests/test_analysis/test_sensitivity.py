@@ -20,6 +20,10 @@ from app.analysis.sensitivity import (
 )
 
 
+MULTI_BASE = {"probability": 0.7, "exposure": 40000, "cost": 5000}
+MULTI_RANGES = {"probability": (0, 1), "exposure": (0, 100000), "cost": (0, 30000)}
+
+
 # ============================================================================
 # MOCK DECISION FUNCTIONS
 # ============================================================================
@@ -391,6 +395,148 @@ class TestFactory:
         assert analyzer._is_async is True
 
 
+# ============================================================================
+# BATCHED EVALUATION TESTS
+# ============================================================================
+
+
+class TestBatchedEvaluation:
+    """Tests for batched boundary search and memoized evaluation."""
+    
+    @pytest.mark.asyncio
+    async def test_grid_search_matches_binary_search(self):
+        """k-ary rounds find the same boundaries as plain binary search."""
+        binary = await SensitivityAnalyzer(multi_factor_decision, grid_points=1).analyze(
+            MULTI_BASE, MULTI_RANGES
+        )
+        batched = await SensitivityAnalyzer(multi_factor_decision).analyze(
+            MULTI_BASE, MULTI_RANGES
+        )
+        
+        assert batched.decision_boundaries.keys() == binary.decision_boundaries.keys()
+        for name, boundary in binary.decision_boundaries.items():
+            tolerance = 0.01 * MULTI_BASE[name]
+            assert abs(batched.decision_boundaries[name] - boundary) <= tolerance
+        headroom = {f.factor_name: f.headroom for f in binary.key_drivers}
+        for f in batched.key_drivers:
+            assert f.headroom == pytest.approx(headroom[f.factor_name], abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_batch_function_called_once_per_round(self):
+        """All inputs share each round; no point is evaluated twice."""
+        batches = []
+        
+        def batch(points: list[dict]) -> list[Tuple[str, float]]:
+            batches.append(points)
+            return [
+                ("proceed", 1.0) if p["probability"] * p["exposure"] - p["cost"] > 10000 else ("wait", 0.0)
+                for p in points
+            ]
+        
+        analyzer = SensitivityAnalyzer(multi_factor_decision, batch_function=batch)
+        robustness = await analyzer.analyze(MULTI_BASE, MULTI_RANGES)
+        
+        assert set(robustness.decision_boundaries) == set(MULTI_RANGES)
+        # Base + extremes, then a handful of shared k-ary rounds
+        assert len(batches) <= 6
+        seen = [tuple(sorted(p.items())) for points in batches for p in points]
+        assert len(seen) == len(set(seen))
+    
+    @pytest.mark.asyncio
+    async def test_sync_decision_function(self):
+        """Sync decision functions are evaluated in the batch loop."""
+        def decide(inputs: dict) -> Tuple[str, float]:
+            return ("a", 1.0) if inputs["value"] > 100 else ("b", 0.0)
+        
+        robustness = await SensitivityAnalyzer(decide, is_async=False).analyze(
+            {"value": 150}, {"value": (0, 200)}
+        )
+        assert 98 < robustness.decision_boundaries["value"] < 102
+
+
+# ============================================================================
+# GLOBAL SENSITIVITY TESTS
+# ============================================================================
+
+
+async def linear_decision(inputs: dict) -> Tuple[str, float]:
+    """Additive utility 4a + 2b + 0c on unit ranges (Sobol S_a = 0.8, S_b = 0.2)."""
+    utility = 4 * inputs["a"] + 2 * inputs["b"]
+    return ("act" if utility > 3 else "wait"), utility
+
+
+class TestGlobalSensitivity:
+    """Tests for Morris and Sobol indices."""
+    
+    UNIT = {"a": (0, 1), "b": (0, 1), "c": (0, 1)}
+    BASE = {"a": 0.5, "b": 0.5, "c": 0.5}
+    
+    @pytest.mark.asyncio
+    async def test_morris_ranks_factors(self):
+        analyzer = SensitivityAnalyzer(linear_decision)
+        result = await analyzer.morris(self.BASE, self.UNIT, trajectories=10, seed=1)
+        
+        assert result.method == "morris"
+        assert result.evaluations <= 10 * 4 + 1
+        by_name = {idx.factor_name: idx for idx in result.indices}
+        # Linear model: every elementary effect equals the coefficient
+        assert by_name["a"].mu_star == pytest.approx(4)
+        assert by_name["b"].mu_star == pytest.approx(2)
+        assert by_name["c"].mu_star == 0
+        assert by_name["a"].sigma == pytest.approx(0, abs=1e-9)
+        assert [idx.factor_name for idx in result.indices] == ["a", "b", "c"]
+    
+    @pytest.mark.asyncio
+    async def test_sobol_indices_match_analytic(self):
+        analyzer = SensitivityAnalyzer(linear_decision)
+        result = await analyzer.sobol(self.BASE, self.UNIT, samples=2048, seed=3)
+        
+        by_name = {idx.factor_name: idx for idx in result.indices}
+        assert by_name["a"].first_order == pytest.approx(0.8, abs=0.05)
+        assert by_name["b"].first_order == pytest.approx(0.2, abs=0.05)
+        assert by_name["a"].total_order == pytest.approx(0.8, abs=0.05)
+        assert by_name["c"].total_order == pytest.approx(0, abs=1e-9)
+    
+    @pytest.mark.asyncio
+    async def test_max_evaluations_bounds_cost(self):
+        calls = []
+        
+        async def counted(inputs: dict) -> Tuple[str, float]:
+            calls.append(inputs)
+            return await linear_decision(inputs)
+        
+        analyzer = SensitivityAnalyzer(counted)
+        result = await analyzer.sobol(
+            self.BASE, self.UNIT, samples=10_000, output="action_flip", max_evaluations=500, seed=0
+        )
+        
+        assert len(calls) <= 500
+        assert result.evaluations == len(calls)
+        assert result.output == "action_flip"
+        assert result.indices[0].factor_name == "a"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method, cap", [("morris", 5), ("morris", 43), ("sobol", 11), ("sobol", 400)])
+    async def test_max_evaluations_is_hard_cap(self, method, cap):
+        """The base evaluation counts toward the cap."""
+        calls = []
+        
+        async def counted(inputs: dict) -> Tuple[str, float]:
+            calls.append(inputs)
+            return await linear_decision(inputs)
+        
+        analyze = getattr(SensitivityAnalyzer(counted), method)
+        await analyze(self.BASE, self.UNIT, max_evaluations=cap, seed=0)
+        assert len(calls) <= cap
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method, cap", [("morris", 4), ("sobol", 10)])
+    async def test_max_evaluations_below_minimum_design(self, method, cap):
+        analyze = getattr(SensitivityAnalyzer(linear_decision), method)
+        with pytest.raises(ValueError, match="max_evaluations"):
+            await analyze(self.BASE, self.UNIT, max_evaluations=cap)
+
+
 # ============================================================================
 # EDGE CASE TESTS
 # ============================================================================
@@ -0,0 +1,114 @@
+"""Tests for sharded BacktestFramework.run.
+
+A sharded run over a process pool must give the same results, in the same
+order, as a serial run, and report per-shard counters.
+"""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.backtest.framework import (
+    BacktestFramework,
+    _shard_ranges,
+    get_sample_events,
+)
+from app.riskcast.schemas.customer import CustomerContext, CustomerProfile, Shipment
+
+
+class JitterComposer:
+    """Deterministic given `random`'s state; module-level so it pickles."""
+
+    def __init__(self, fail_for: str = ""):
+        self.fail_for = fail_for
+
+    def compose(self, intelligence, context):
+        if context.profile.customer_id == self.fail_for:
+            raise RuntimeError("compose failed")
+        chokepoint = intelligence.signal.geographic.primary_chokepoint.value
+        exposed = [s for s in context.active_shipments if chokepoint in s.route_chokepoints]
+        if not exposed:
+            return None
+        score = min(1.0, intelligence.combined_confidence * (0.8 + 0.4 * random.random()))
+        exposure = sum(s.cargo_value_usd for s in exposed) * 0.1
+        act = score >= 0.6
+        return SimpleNamespace(
+            decision_id=f"dec_{intelligence.signal.signal_id}_{context.profile.customer_id}",
+            q3_severity=SimpleNamespace(expected_delay_days=round(10 * score), total_exposure_usd=exposure),
+            q5_action=SimpleNamespace(
+                action_type="REROUTE" if act else "MONITOR",
+                estimated_cost_usd=exposure * 0.2 if act else 0.0,
+                deadline=intelligence.correlated_at + timedelta(days=2),
+            ),
+            q6_confidence=SimpleNamespace(score=score),
+        )
+
+
+def _contexts(n: int) -> list[CustomerContext]:
+    now = datetime.utcnow()
+    routes = [["red_sea", "suez"], ["malacca"], ["panama"]]
+    contexts = []
+    for i in range(n):
+        cid = f"cust_{i:03d}"
+        contexts.append(CustomerContext(
+            profile=CustomerProfile(customer_id=cid, company_name="Test Co", primary_phone="+84901234567"),
+            active_shipments=[
+                Shipment(
+                    shipment_id=f"{cid}-{j}",
+                    customer_id=cid,
+                    origin_port="CNSHA",
+                    destination_port="NLRTM",
+                    route_chokepoints=routes[(i + j) % len(routes)],
+                    etd=now + timedelta(days=j),
+                    eta=now + timedelta(days=20 + j),
+                    cargo_value_usd=10_000 * (j + 1),
+                )
+                for j in range(2)
+            ],
+        ))
+    return contexts
+
+
+def _comparable(summary) -> list[dict]:
+    return [r.model_dump(exclude={"backtest_run_at"}) for r in summary.results]
+
+
+def test_shard_ranges_cover_all_pairs():
+    ranges = _shard_ranges(10, 4)
+    assert ranges == [(0, 3), (3, 6), (6, 8), (8, 10)]
+    assert _shard_ranges(2, 8) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.asyncio
+class TestShardedRun:
+    """Serial vs process-pool runs of the same pairs."""
+
+    async def test_serial_run_reports_one_shard(self):
+        framework = BacktestFramework(decision_composer=JitterComposer(fail_for="cust_001"))
+        summary = await framework.run(get_sample_events(), _contexts(3), seed=1)
+
+        stats = framework.last_run_stats
+        assert len(stats.shards) == 1
+        assert stats.pairs == len(get_sample_events()) * 3
+        assert stats.failures == len(get_sample_events())
+        assert stats.results == len(summary.results) > 0
+        assert sum(b.sample_count for b in summary.calibration_buckets) == len(summary.results)
+
+    async def test_sharded_matches_serial(self):
+        events, contexts = get_sample_events(), _contexts(4)
+        framework = BacktestFramework(decision_composer=JitterComposer())
+
+        serial = await framework.run(events, contexts, seed=7)
+        sharded = await framework.run(events, contexts, workers=2, shards=3, seed=7)
+
+        assert _comparable(sharded) == _comparable(serial)
+        assert sharded.calibration_buckets == serial.calibration_buckets
+        assert sharded.brier_score == serial.brier_score
+        assert sharded.net_value_usd == serial.net_value_usd
+
+        stats = framework.last_run_stats
+        assert [s.shard for s in stats.shards] == [0, 1, 2]
+        assert sum(s.pairs for s in stats.shards) == len(events) * len(contexts)
+        assert stats.results == len(serial.results)
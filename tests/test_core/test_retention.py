@@ -0,0 +1,222 @@
+"""
+Tests for RetentionManager batched sweeps.
+
+Runs against a seeded in-memory SQLite database:
+- Expired rows are deleted, fresh rows kept
+- Legal holds (specific and wildcard) are excluded in SQL
+- Batches are bounded and an interrupted sweep resumes from its checkpoint
+- Archive sink sees every deleted row exactly once
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.core.retention import (
+    RETENTION_POLICIES,
+    LegalHoldManager,
+    RetentionManager,
+)
+from app.db.models import (
+    AlertModel,
+    DecisionModel,
+    LegalHoldEntityModel,
+    RetentionCheckpointModel,
+)
+
+
+NOW = datetime.utcnow()
+OLD = NOW - timedelta(days=RETENTION_POLICIES["decisions"].total_retention_days + 30)
+N_EXPIRED = 250
+N_FRESH = 50
+
+
+def _decision(i: int, created_at: datetime) -> DecisionModel:
+    return DecisionModel(
+        decision_id=f"dec_{i:05d}",
+        customer_id="cust_a",
+        chokepoint="red_sea",
+        severity="high",
+        urgency="soon",
+        q1_what={}, q2_when={}, q3_severity={}, q4_why={},
+        q5_action={}, q6_confidence={}, q7_inaction={},
+        exposure_usd=1000.0,
+        recommended_action="reroute",
+        confidence_score=0.8,
+        valid_until=created_at + timedelta(days=1),
+        created_at=created_at,
+    )
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """SQLite database with expired and fresh decisions."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        # Tables only: DecisionModel declares ix_decisions_chokepoint twice
+        # (index=True and __table_args__), which SQLite rejects
+        for model in (
+            DecisionModel, AlertModel, LegalHoldEntityModel, RetentionCheckpointModel,
+        ):
+            await conn.execute(CreateTable(model.__table__))
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        # Every sixth row is fresh, so batches are not contiguous id ranges
+        session.add_all(
+            _decision(i, NOW if i % 6 == 5 else OLD)
+            for i in range(N_EXPIRED + N_FRESH)
+        )
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+async def _remaining(factory) -> set:
+    async with factory() as session:
+        result = await session.execute(select(DecisionModel.decision_id))
+        return {row[0] for row in result}
+
+
+async def _expired_ids(factory) -> set:
+    async with factory() as session:
+        result = await session.execute(
+            select(DecisionModel.decision_id).where(DecisionModel.created_at == OLD)
+        )
+        return {row[0] for row in result}
+
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestDecisionSweep:
+    async def test_deletes_expired_in_batches(self, session_factory):
+        before = await _remaining(session_factory)
+        expired = await _expired_ids(session_factory)
+        assert len(expired) == N_EXPIRED
+
+        manager = RetentionManager(session_factory, batch_size=40)
+        result = await manager._process_data_type(
+            "decisions", RETENTION_POLICIES["decisions"], dry_run=False,
+        )
+
+        assert result["deleted"] == N_EXPIRED
+        assert result["batches"] == -(-N_EXPIRED // 40)
+        assert result["complete"] is True
+        assert result["rows_per_second"] > 0
+        assert await _remaining(session_factory) == before - expired
+
+        async with session_factory() as session:
+            assert await session.get(RetentionCheckpointModel, "decisions") is None
+
+    async def test_legal_holds_excluded(self, session_factory):
+        expired = sorted(await _expired_ids(session_factory))
+        holds = LegalHoldManager()
+        holds.create_hold(
+            "hold-1", "decisions", expired[:3], "Matter A", "", created_by="legal",
+        )
+        holds.create_hold(
+            "hold-2", "decisions", [expired[3]], "Matter B", "", created_by="legal",
+        )
+        holds.create_hold(
+            "hold-3", "decisions", [expired[4]], "Matter C", "", created_by="legal",
+        )
+        holds.release_hold("hold-3", released_by="legal")
+
+        manager = RetentionManager(session_factory, holds, batch_size=64)
+        result = await manager._process_data_type(
+            "decisions", RETENTION_POLICIES["decisions"], dry_run=False,
+        )
+
+        assert result["held"] == 4
+        assert result["deleted"] == N_EXPIRED - 4
+        remaining = await _remaining(session_factory)
+        assert set(expired[:4]) <= remaining
+        assert expired[4] not in remaining
+
+    async def test_wildcard_hold_blocks_everything(self, session_factory):
+        holds = LegalHoldManager()
+        holds.create_hold("hold-all", "decisions", ["*"], "Matter", "", created_by="legal")
+
+        manager = RetentionManager(session_factory, holds)
+        result = await manager._process_data_type(
+            "decisions", RETENTION_POLICIES["decisions"], dry_run=False,
+        )
+
+        assert result["held"] == N_EXPIRED
+        assert result["deleted"] == 0
+        assert len(await _remaining(session_factory)) == N_EXPIRED + N_FRESH
+
+    async def test_dry_run_counts_only(self, session_factory):
+        manager = RetentionManager(session_factory)
+        result = await manager._process_data_type(
+            "decisions", RETENTION_POLICIES["decisions"], dry_run=True,
+        )
+
+        assert result["to_delete"] == N_EXPIRED
+        assert result["deleted"] == 0
+        assert len(await _remaining(session_factory)) == N_EXPIRED + N_FRESH
+
+    async def test_resumes_from_checkpoint(self, session_factory):
+        policy = RETENTION_POLICIES["decisions"]
+        manager = RetentionManager(session_factory, batch_size=30, max_batches=3)
+
+        first = await manager._process_data_type("decisions", policy, dry_run=False)
+        assert first["deleted"] == 90
+        assert first["complete"] is False
+        async with session_factory() as session:
+            checkpoint = await session.get(RetentionCheckpointModel, "decisions")
+            assert checkpoint.rows_processed == 90
+            last_id = checkpoint.last_id
+
+        second = await manager._process_data_type("decisions", policy, dry_run=False)
+        assert second["resumed_from"] == last_id
+        assert second["to_delete"] == N_EXPIRED - 90
+
+        manager = RetentionManager(session_factory, batch_size=30)
+        third = await manager._process_data_type("decisions", policy, dry_run=False)
+        assert third["complete"] is True
+        assert first["deleted"] + second["deleted"] + third["deleted"] == N_EXPIRED
+        assert len(await _remaining(session_factory)) == N_FRESH
+
+    async def test_archiver_sees_each_row_once(self, session_factory):
+        archived = []
+
+        async def sink(data_type, rows):
+            assert data_type == "decisions"
+            archived.extend(row["decision_id"] for row in rows)
+
+        manager = RetentionManager(session_factory, batch_size=33, archiver=sink)
+        result = await manager._process_data_type(
+            "decisions", RETENTION_POLICIES["decisions"], dry_run=False,
+        )
+
+        assert result["archived"] == result["deleted"] == N_EXPIRED
+        assert len(archived) == len(set(archived)) == N_EXPIRED
+
+
+@pytest.mark.asyncio
+class TestRunCleanup:
+    async def test_report_totals(self, session_factory):
+        manager = RetentionManager(session_factory, batch_size=100)
+        report = await manager.run_cleanup()
+
+        assert report["errors"] == []
+        assert report["total_deleted"] == N_EXPIRED
+        assert report["data_types"]["alerts"]["to_delete"] == 0
+
+        async with session_factory() as session:
+            count = await session.execute(select(func.count()).select_from(LegalHoldEntityModel))
+            assert count.scalar() == 0
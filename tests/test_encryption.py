@@ -4,6 +4,7 @@ Tests for Encryption Module.
 Tests:
 - Key management
 - Field encryption/decryption
+- Derived-key cache and bulk encryption
 - Hashing
 - PII masking
 """
@@ -14,7 +15,9 @@ import os
 # Set a test encryption key before importing the module
 os.environ.setdefault("ENCRYPTION_KEY", "test-encryption-key-12345-abcdef")
 
+from app.core import encryption
 from app.core.encryption import (
+    DecryptionError,
     KeyManager,
     FieldEncryptor,
     hash_value,
@@ -125,6 +128,80 @@ class TestFieldEncryptor:
         assert result is None
 
 
+class TestFieldEncryptorKeyCache:
+    """Derived-key cache and bulk encrypt/decrypt."""
+    
+    @pytest.fixture
+    def encryptor(self):
+        return FieldEncryptor(b"k" * 32)
+    
+    @pytest.fixture
+    def pbkdf2_calls(self, monkeypatch):
+        calls = []
+        real = encryption.hashlib.pbkdf2_hmac
+        
+        def counting(*args, **kwargs):
+            calls.append(args[2])
+            return real(*args, **kwargs)
+        
+        monkeypatch.setattr(encryption.hashlib, "pbkdf2_hmac", counting)
+        return calls
+    
+    def test_key_derived_once_per_context(self, encryptor, pbkdf2_calls):
+        """Repeated calls reuse the derived key."""
+        for _ in range(5):
+            encryptor.decrypt(encryptor.encrypt("x", context="pii_email"), context="pii_email")
+        encryptor.encrypt("x", context="pii_phone")
+        
+        assert pbkdf2_calls == [b"pii_email", b"pii_phone"]
+    
+    def test_cache_is_bounded(self, encryptor, monkeypatch):
+        monkeypatch.setattr(encryption, "DERIVED_KEY_CACHE_SIZE", 3)
+        for i in range(10):
+            encryptor.encrypt("x", context=f"ctx{i}")
+        
+        assert list(encryptor._key_cache) == ["ctx7", "ctx8", "ctx9"]
+    
+    def test_cached_key_matches_fresh_derivation(self, encryptor):
+        """A fresh encryptor with the same master key decrypts cached-key output."""
+        encrypted = encryptor.encrypt("secret", context="c")
+        encryptor.encrypt("warm", context="c")
+        
+        assert FieldEncryptor(b"k" * 32).decrypt(encrypted, context="c") == b"secret"
+    
+    def test_encrypt_many_roundtrip(self, encryptor, pbkdf2_calls):
+        values = [f"row-{i}" for i in range(50)] + ["", "Hà Nội 🌍"]
+        
+        encrypted = encryptor.encrypt_many(values, context="pii_name")
+        decrypted = encryptor.decrypt_many(encrypted, context="pii_name")
+        
+        assert [d.decode("utf-8") for d in decrypted] == values
+        assert len({e.nonce for e in encrypted}) == len(values)
+        assert pbkdf2_calls == [b"pii_name"]
+    
+    def test_bulk_matches_single_value_api(self, encryptor):
+        encrypted = encryptor.encrypt_strings(["a", "b"], context="c")
+        
+        assert [encryptor.decrypt_string(e, context="c") for e in encrypted] == ["a", "b"]
+        assert encryptor.decrypt_strings([encryptor.encrypt_string("z", "c")], "c") == ["z"]
+    
+    def test_version_tag_does_not_select_key(self, encryptor, pbkdf2_calls):
+        """The version tag is metadata; one key per context decrypts every value."""
+        old = encryptor.encrypt("before", context="c")
+        encryptor._key_version = 2
+        new = encryptor.encrypt("after", context="c")
+        
+        assert (old.version, new.version) == (1, 2)
+        assert encryptor.decrypt_many([old, new], context="c") == [b"before", b"after"]
+        assert pbkdf2_calls == [b"c"]
+    
+    def test_decrypt_many_wrong_context_fails(self, encryptor):
+        encrypted = encryptor.encrypt_many(["a"], context="c1")
+        
+        with pytest.raises(DecryptionError):
+            encryptor.decrypt_many(encrypted, context="c2")
+
+
 class TestHashing:
     """Tests for hashing functions."""
     
@@ -26,8 +26,11 @@ from app.governance.model_registry import (
 )
 from app.governance.bias_detection import (
     BiasDetector,
+    DecisionColumns,
+    FairnessEngine,
     FairnessReport,
     create_bias_detector,
+    wilson_intervals,
     ProductionBiasDetector,
     create_production_bias_detector,
 )
@@ -470,6 +473,95 @@ class TestBiasDetection:
         
         assert len(report.mitigation_recommendations) > 0
 
+    @pytest.mark.asyncio
+    async def test_intersectional_groups(self):
+        """Configured intersections are reported and partition all decisions."""
+        detector = BiasDetector(intersections=[("customer_size", "region")])
+        end_date = datetime.utcnow()
+        report = await detector.generate_fairness_report(end_date - timedelta(days=90), end_date)
+
+        groups = report.fairness_by_intersection["customer_size|region"]
+        assert sum(g.metrics.total for g in groups) == report.total_decisions
+        assert all(g.group_attribute == "customer_size|region" for g in groups)
+        assert {g.group_value.split("|")[0] for g in groups} == {
+            g.group_value for g in report.fairness_by_customer_size
+        }
+
+
+class TestFairnessEngine:
+    """Columnar group metrics match the per-decision definitions."""
+
+    DECISIONS = [
+        # size, region, action, known, correct
+        ("small", "EMEA", True, True, True),      # TP
+        ("small", "EMEA", True, True, False),     # FP
+        ("small", "APAC", False, True, True),     # TN
+        ("small", "APAC", False, True, False),    # FN
+        ("large", "EMEA", True, False, False),    # unknown, action
+        ("large", "EMEA", False, False, False),   # unknown, no action
+        ("large", "APAC", True, True, True),      # TP
+    ]
+
+    @pytest.fixture
+    def engine(self):
+        decisions = [
+            {
+                "customer_size": size, "region": region,
+                "action_recommended": action, "outcome_known": known, "was_correct": correct,
+            }
+            for size, region, action, known, correct in self.DECISIONS
+        ]
+        decisions.append({"region": "EMEA"})  # No size, no flags
+        columns = DecisionColumns.from_decisions(decisions, ("customer_size", "region"))
+        return FairnessEngine(columns)
+
+    def test_confusion_counts(self, engine):
+        by_size = {g.group_value: g.metrics for g in engine.analyze(["customer_size"])["customer_size"]}
+
+        assert list(by_size) == ["small", "large", "unknown"]
+        small, large = by_size["small"], by_size["large"]
+        assert (small.true_positives, small.false_positives,
+                small.true_negatives, small.false_negatives) == (1, 1, 1, 1)
+        assert (small.total, small.positive_outcomes, small.outcomes_known) == (4, 2, 4)
+        assert (large.total, large.positive_outcomes, large.outcomes_known) == (3, 2, 1)
+        assert large.true_positives == 1
+        assert by_size["unknown"].total == 1
+
+    def test_overall_rates_and_ratios(self, engine):
+        assert engine.total == 8
+        assert engine.overall_positive_rate == pytest.approx(4 / 8)
+        assert engine.overall_accuracy == pytest.approx(3 / 5)
+
+        small = engine.analyze(["customer_size"])["customer_size"][0]
+        assert small.positive_rate_ratio == pytest.approx((2 / 4) / (4 / 8))
+        assert small.accuracy_ratio == pytest.approx((2 / 4) / (3 / 5))
+
+    def test_intersections_skip_empty_groups(self, engine):
+        groups = engine.analyze([("customer_size", "region")])["customer_size|region"]
+
+        assert [(g.group_value, g.metrics.total) for g in groups] == [
+            ("small|EMEA", 2), ("small|APAC", 2), ("large|EMEA", 2),
+            ("large|APAC", 1), ("unknown|EMEA", 1),
+        ]
+
+    def test_wilson_matches_scalar(self, bias_detector):
+        successes, totals = [0, 3, 17, 30, 0], [0, 10, 40, 30, 5]
+        lower, upper = wilson_intervals(successes, totals)
+        for i, (k, n) in enumerate(zip(successes, totals)):
+            assert (lower[i], upper[i]) == pytest.approx(
+                bias_detector._wilson_confidence_interval(k, n)
+            )
+
+    def test_analyze_by_group_matches_report(self, bias_detector):
+        decisions = bias_detector._generate_mock_decisions(datetime.utcnow(), datetime.utcnow())
+        engine = FairnessEngine(DecisionColumns.from_decisions(decisions))
+        all_groups = engine.analyze(["chokepoint", "region"])
+
+        single = bias_detector._analyze_by_group(
+            decisions, "chokepoint", engine.overall_positive_rate, engine.overall_accuracy
+        )
+        assert single == all_groups["chokepoint"]
+
 
 # ============================================================================
 # TRANSPARENCY TESTS
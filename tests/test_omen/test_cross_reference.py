@@ -0,0 +1,136 @@
+"""Tests for the OMEN cross-reference validator.
+
+Tests cover:
+- Same results as a brute-force scan over the window (randomized)
+- Window eviction, including the bucket straddling the cutoff
+- A signal is never related to itself
+- max_listed caps the listing but keeps counts and score exact
+"""
+
+import random
+
+import pytest
+
+from app.omen.validators.cross_reference import CrossReferenceValidator, SignalWindowStore
+
+WINDOW = 24 * 3600.0
+CHOKEPOINTS = ["red_sea", "suez", "panama", None]
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scan(window: list[tuple[float, dict]], signal: dict, now: float):
+    """The original list scan: (corroborating ids, conflicting ids)."""
+    corroborating, conflicting = [], []
+    p = signal.get("probability", 0.5)
+    for cached_at, other in window:
+        if cached_at <= now - WINDOW:
+            continue
+        if other.get("signal_id") == signal.get("signal_id"):
+            continue
+        if other.get("chokepoint") != signal.get("chokepoint"):
+            continue
+        q = other.get("probability", 0.5)
+        if abs(p - q) < 0.2:
+            corroborating.append(other.get("signal_id", "unknown"))
+        elif abs(p - q) > 0.5:
+            conflicting.append(other.get("signal_id", "unknown"))
+    return corroborating, conflicting
+
+
+def _signal(rng: random.Random, i: int) -> dict:
+    return {
+        "signal_id": f"sig-{rng.randrange(i + 1)}" if rng.random() < 0.05 else f"sig-{i}",
+        "chokepoint": rng.choice(CHOKEPOINTS),
+        # Coarse grid so the 0.2 / 0.5 boundaries are hit exactly
+        "probability": rng.choice([round(x * 0.05, 2) for x in range(21)]),
+    }
+
+
+class TestMatchesScan:
+    def test_randomized_stream(self):
+        rng = random.Random(3)
+        clock = FakeClock()
+        validator = CrossReferenceValidator(clock=clock)
+        window: list[tuple[float, dict]] = []
+
+        for i in range(1500):
+            clock.now += rng.uniform(0, 300)  # ~2 days in total
+            signal = _signal(rng, i)
+            result = validator.validate(signal)
+
+            corroborating, conflicting = _scan(window, signal, clock.now)
+            assert result.corroborating_signals == corroborating
+            assert result.conflicting_signals == conflicting
+            assert result.corroboration_count == len(corroborating)
+            assert result.conflict_count == len(conflicting)
+
+            validator.add_signal(signal)
+            window.append((clock.now, signal))
+
+        live = sum(1 for t, _ in window if t > clock.now - WINDOW)
+        assert validator.cached_signals == live
+
+    def test_scores(self):
+        clock = FakeClock()
+        validator = CrossReferenceValidator(clock=clock)
+        assert validator.validate({"signal_id": "a", "chokepoint": "suez"}).consistency_score == 0.5
+
+        for sid, p in [("b", 0.8), ("c", 0.85), ("d", 0.1)]:
+            validator.add_signal({"signal_id": sid, "chokepoint": "suez", "probability": p})
+        result = validator.validate(
+            {"signal_id": "a", "chokepoint": "suez", "probability": 0.75}, min_corroboration=3,
+        )
+        assert result.corroborating_signals == ["b", "c"]
+        assert result.conflicting_signals == ["d"]
+        assert result.consistency_score == pytest.approx(2 / 3)
+        assert result.warnings[0].startswith("Conflicts with signal d")
+        assert result.warnings[-1] == "Insufficient corroboration: 2 < 3"
+
+
+class TestWindow:
+    def test_eviction_is_exact(self):
+        store = SignalWindowStore(window_seconds=100, bucket_seconds=30)
+        for t in range(0, 200, 10):
+            store.add("suez", 0.5, f"s{t}", float(t))
+        # Cutoff 90: t=90 is out, t=100..190 are in
+        assert store.evict(190.0) == 0
+        assert len(store) == 10
+        assert store.related("suez", 0.5, None, 190.0).corroboration_count == 10
+        assert store.evict(195.0) == 0
+        assert store.evict(200.0) == 1
+        assert len(store) == 9
+
+    def test_self_is_excluded(self):
+        store = SignalWindowStore()
+        store.add("suez", 0.5, "a", 0.0)
+        store.add("suez", 0.5, "a", 1.0)  # re-added
+        store.add("suez", 0.55, "b", 2.0)
+        related = store.related("suez", 0.5, "a", 3.0)
+        assert related.corroboration_count == 1
+        assert [e[2] for e in related.corroborating] == ["b"]
+
+
+class TestMaxListed:
+    def test_cap_keeps_counts(self):
+        clock = FakeClock()
+        validator = CrossReferenceValidator(max_listed=3, clock=clock)
+        for i in range(50):
+            clock.now += 600
+            validator.add_signal({"signal_id": f"hi{i}", "chokepoint": "suez", "probability": 0.9})
+            validator.add_signal({"signal_id": f"lo{i}", "chokepoint": "suez", "probability": 0.1})
+
+        result = validator.validate({"signal_id": "x", "chokepoint": "suez", "probability": 0.85})
+        assert result.corroboration_count == 50
+        assert result.conflict_count == 50
+        # The newest ones, in insertion order
+        assert result.corroborating_signals == ["hi47", "hi48", "hi49"]
+        assert result.conflicting_signals == ["lo47", "lo48", "lo49"]
+        assert result.warnings[-1] == "Conflicts with 47 more signals"
+        assert result.consistency_score == 0.5
@@ -0,0 +1,202 @@
+"""Tests for SignalCorrelator reality snapshots.
+
+Tests cover:
+- Concurrent correlations share one single-flight snapshot fetch
+- TTL expiry and invalidation refetch
+- Global snapshot fetches chokepoints concurrently under the semaphore
+- Failed loads are not cached
+- correlate_batch concurrency limit
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.omen.schemas import (
+    Chokepoint,
+    GeographicScope,
+    OmenSignal,
+    SignalCategory,
+    TemporalScope,
+)
+from app.oracle.correlator import SignalCorrelator, SnapshotCache
+
+
+# ============================================================================
+# FAKE DATA CLIENTS
+# ============================================================================
+
+
+class FakeClients:
+    """AIS/freight/port stand-in counting calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls: dict[str, int] = {}
+        self.active = 0
+        self.peak = 0
+        self.fail = False
+
+    async def _call(self, name: str, result=None):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError("upstream down")
+            return result if result is not None else []
+        finally:
+            self.active -= 1
+
+    async def get_vessels_in_chokepoint(self, chokepoint):
+        return await self._call(f"vessels:{chokepoint.value}")
+
+    async def get_vessels_waiting(self, chokepoint):
+        return await self._call(f"waiting:{chokepoint.value}")
+
+    async def get_rerouting_vessels(self, chokepoint=None):
+        return await self._call(f"rerouting:{chokepoint.value if chokepoint else 'all'}")
+
+    async def get_rates_for_chokepoint(self, chokepoint):
+        return await self._call(f"rates:{chokepoint.value}")
+
+    async def get_ports_for_chokepoint(self, chokepoint):
+        return await self._call(f"ports:{chokepoint.value}")
+
+
+def _correlator(clients: FakeClients, **kwargs) -> SignalCorrelator:
+    return SignalCorrelator(
+        ais_client=clients, freight_client=clients, port_client=clients, **kwargs
+    )
+
+
+def _signal(signal_id: str, chokepoint: Chokepoint = Chokepoint.RED_SEA) -> OmenSignal:
+    now = datetime.utcnow()
+    return OmenSignal(
+        signal_id=signal_id,
+        title="Disruption",
+        description="Test signal",
+        category=SignalCategory.GEOPOLITICAL,
+        probability=0.8,
+        confidence_score=0.7,
+        geographic=GeographicScope(primary_chokepoint=chokepoint),
+        temporal=TemporalScope(detected_at=now, earliest_impact=now + timedelta(days=1)),
+    )
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+class TestSnapshotSharing:
+    """Concurrent correlations share cached snapshots."""
+
+    async def test_concurrent_correlations_fetch_once(self):
+        clients = FakeClients()
+        correlator = _correlator(clients)
+
+        results = await correlator.correlate_batch([_signal(f"OMEN-{i}") for i in range(20)])
+
+        assert len(results) == 20
+        assert clients.calls == {
+            "vessels:red_sea": 1,
+            "waiting:red_sea": 1,
+            "rerouting:red_sea": 1,
+            "rates:red_sea": 1,
+            "ports:red_sea": 1,
+        }
+        assert len({r.reality.snapshot_id for r in results}) == 1
+        assert correlator.snapshot_cache_stats()["misses"] == 1
+
+    async def test_ttl_expiry_refetches(self):
+        now = [0.0]
+        clients = FakeClients(delay=0)
+        correlator = _correlator(clients, snapshot_cache=SnapshotCache(ttl_seconds=30, clock=lambda: now[0]))
+
+        await correlator.correlate(_signal("OMEN-1"))
+        now[0] = 29
+        await correlator.correlate(_signal("OMEN-2"))
+        assert clients.calls["rates:red_sea"] == 1
+
+        now[0] = 31
+        await correlator.correlate(_signal("OMEN-3"))
+        assert clients.calls["rates:red_sea"] == 2
+
+        correlator.invalidate_snapshots(Chokepoint.RED_SEA)
+        await correlator.correlate(_signal("OMEN-4"))
+        assert clients.calls["rates:red_sea"] == 3
+
+    async def test_global_snapshot_is_concurrent_and_bounded(self):
+        clients = FakeClients(delay=0.02)
+        correlator = _correlator(clients, max_concurrent_fetches=2)
+
+        snapshot = await correlator.get_reality_snapshot()
+
+        assert set(snapshot.chokepoint_health) == {"red_sea", "suez", "panama", "malacca"}
+        # Two chokepoint fetches at a time, five upstream calls each
+        assert clients.peak == 10
+        assert clients.calls["rerouting:all"] == 1
+
+        # Per-chokepoint snapshots were cached by the global load
+        await correlator.correlate(_signal("OMEN-1", Chokepoint.SUEZ))
+        await correlator.get_reality_snapshot()
+        assert clients.calls["rates:suez"] == 1
+        assert clients.calls["rerouting:all"] == 1
+
+    async def test_failed_load_is_not_cached(self):
+        clients = FakeClients()
+        clients.fail = True
+        correlator = _correlator(clients)
+
+        outcomes = await asyncio.gather(
+            *(correlator.correlate(_signal(f"OMEN-{i}")) for i in range(5)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(o, ConnectionError) for o in outcomes)
+        assert clients.calls["rates:red_sea"] == 1
+
+        clients.fail = False
+        intelligence = await correlator.correlate(_signal("OMEN-ok"))
+        assert intelligence.reality is not None
+        assert clients.calls["rates:red_sea"] == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_load(self):
+        clients = FakeClients(delay=0.05)
+        correlator = _correlator(clients)
+
+        first = asyncio.ensure_future(correlator.correlate(_signal("OMEN-1")))
+        second = asyncio.ensure_future(correlator.correlate(_signal("OMEN-2")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        intelligence = await second
+        assert intelligence.reality is not None
+        assert clients.calls["rates:red_sea"] == 1
+
+
+@pytest.mark.asyncio
+async def test_correlate_batch_respects_limit():
+    clients = FakeClients(delay=0)
+    correlator = _correlator(clients, max_concurrent_correlations=3)
+    active = peak = 0
+    original = correlator.correlate
+
+    async def tracked(signal):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.01)
+            return await original(signal)
+        finally:
+            active -= 1
+
+    correlator.correlate = tracked
+    results = await correlator.correlate_batch([_signal(f"OMEN-{i}") for i in range(10)])
+
+    assert len(results) == 10
+    assert peak == 3
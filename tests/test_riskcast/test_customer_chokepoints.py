@@ -0,0 +1,145 @@
+"""Tests for the chokepoint association tables.
+
+Runs PostgresCustomerRepository against an in-memory SQLite database and
+checks that customer_chokepoints / shipment_chokepoints follow every
+write, and that get_customers_by_chokepoint answers from them.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from app.db.models import (
+    AlertModel,
+    CustomerChokepointModel,
+    CustomerModel,
+    DecisionModel,
+    ShipmentChokepointModel,
+    ShipmentModel,
+)
+from app.riskcast.constants import ShipmentStatus
+from app.riskcast.repos.customer import PostgresCustomerRepository
+from app.riskcast.schemas.customer import CustomerProfile, Shipment
+
+NOW = datetime.utcnow()
+
+
+def _profile(customer_id: str, chokepoints=("red_sea", "suez"), **kw) -> CustomerProfile:
+    return CustomerProfile(
+        customer_id=customer_id,
+        company_name=f"{customer_id} Co",
+        primary_phone="+84901234567",
+        relevant_chokepoints=list(chokepoints),
+        **kw,
+    )
+
+
+def _shipment(sid: str, customer_id: str, chokepoints=("RED_SEA", "suez"), **kw) -> Shipment:
+    return Shipment(
+        shipment_id=sid,
+        customer_id=customer_id,
+        origin_port="CNSHA",
+        destination_port="NLRTM",
+        route_chokepoints=list(chokepoints),
+        etd=NOW + timedelta(days=1),
+        eta=NOW + timedelta(days=30),
+        cargo_value_usd=50_000,
+        **kw,
+    )
+
+
+@pytest_asyncio.fixture
+async def repo():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        # Tables only: some models declare the same index twice
+        # (index=True and __table_args__), which SQLite rejects
+        for model in (
+            CustomerModel, ShipmentModel, DecisionModel, AlertModel,
+            CustomerChokepointModel, ShipmentChokepointModel,
+        ):
+            await conn.execute(CreateTable(model.__table__))
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield PostgresCustomerRepository(session)
+    await engine.dispose()
+
+
+async def _rows(repo, model) -> set[tuple]:
+    result = await repo._session.execute(select(model))
+    if model is CustomerChokepointModel:
+        return {(r.customer_id, r.chokepoint) for r in result.scalars()}
+    return {(r.shipment_id, r.chokepoint, r.is_active) for r in result.scalars()}
+
+
+@pytest.mark.asyncio
+class TestAssociationSync:
+    async def test_rows_follow_writes(self, repo):
+        await repo.create_profile(_profile("c1", chokepoints=("Red_Sea", "suez")))
+        await repo.add_shipment(_shipment("s1", "c1"))
+        assert await _rows(repo, CustomerChokepointModel) == {("c1", "red_sea"), ("c1", "suez")}
+        assert await _rows(repo, ShipmentChokepointModel) == {
+            ("s1", "red_sea", True), ("s1", "suez", True),
+        }
+
+        await repo.update_profile("c1", relevant_chokepoints=["malacca"])
+        assert await _rows(repo, CustomerChokepointModel) == {("c1", "malacca")}
+
+        await repo.update_shipment("s1", status=ShipmentStatus.DELIVERED)
+        assert await _rows(repo, ShipmentChokepointModel) == {
+            ("s1", "red_sea", False), ("s1", "suez", False),
+        }
+
+        await repo.update_shipment("s1", route_chokepoints=["panama"])
+        assert await _rows(repo, ShipmentChokepointModel) == {("s1", "panama", False)}
+
+        await repo.delete_shipment("s1")
+        assert await _rows(repo, ShipmentChokepointModel) == set()
+
+    async def test_delete_profile_clears_rows(self, repo):
+        await repo.create_profile(_profile("c1"))
+        await repo.add_shipment(_shipment("s1", "c1"))
+        assert await repo.delete_profile("c1") is True
+        assert await _rows(repo, CustomerChokepointModel) == set()
+        assert await _rows(repo, ShipmentChokepointModel) == set()
+
+
+@pytest.mark.asyncio
+class TestCustomersByChokepoint:
+    async def test_exposed_customers(self, repo):
+        # c1: relevant + active shipment through red_sea -> exposed
+        await repo.create_profile(_profile("c1"))
+        await repo.add_shipment(_shipment("s1", "c1"))
+        await repo.add_shipment(_shipment("s1b", "c1", chokepoints=("panama",)))
+        # c2: relevant, but its only red_sea shipment is delivered
+        await repo.create_profile(_profile("c2"))
+        await repo.add_shipment(_shipment("s2", "c2", status=ShipmentStatus.DELIVERED))
+        # c3: active shipment through red_sea, but not a relevant chokepoint
+        await repo.create_profile(_profile("c3", chokepoints=("malacca",)))
+        await repo.add_shipment(_shipment("s3", "c3"))
+        # c4: exposed but inactive customer
+        await repo.create_profile(_profile("c4", is_active=False))
+        await repo.add_shipment(_shipment("s4", "c4"))
+        # c5: exposed, second customer
+        await repo.create_profile(_profile("c5"))
+        await repo.add_shipment(_shipment("s5", "c5", chokepoints=("red_sea",)))
+
+        contexts = await repo.get_customers_by_chokepoint("RED_SEA")
+
+        assert [c.profile.customer_id for c in contexts] == ["c1", "c5"]
+        # Context carries all of the customer's active shipments
+        assert sorted(s.shipment_id for s in contexts[0].active_shipments) == ["s1", "s1b"]
+        assert all(c.has_exposure_to("red_sea") for c in contexts)
+
+    async def test_completed_shipment_ends_exposure(self, repo):
+        await repo.create_profile(_profile("c1"))
+        await repo.add_shipment(_shipment("s1", "c1"))
+        assert len(await repo.get_customers_by_chokepoint("suez")) == 1
+
+        await repo.update_shipment("s1", status=ShipmentStatus.CANCELLED)
+        assert await repo.get_customers_by_chokepoint("suez") == []
@@ -0,0 +1,155 @@
+"""Tests for decision summary listings.
+
+Runs PostgresDecisionRepository.list_summaries against an in-memory
+SQLite database: filters are applied in SQL, only summary columns are
+returned, and keyset pages walk the full ordered result exactly once.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.models import DecisionModel
+from app.riskcast.repos.decision import (
+    DecisionSummaryRow,
+    PostgresDecisionRepository,
+    decode_decision_cursor,
+    encode_decision_cursor,
+)
+
+NOW = datetime.utcnow()
+
+
+def _row(i: int, rng: random.Random, **overrides) -> DecisionModel:
+    values = dict(
+        decision_id=f"dec_{i:04d}",
+        customer_id=rng.choice(["cust_a", "cust_b"]),
+        signal_id=f"OMEN-{i}",
+        chokepoint=rng.choice(["red_sea", "suez", "panama"]),
+        severity=rng.choice(["low", "medium", "high", "critical"]),
+        urgency="soon",
+        q1_what={"event_summary": f"Event {i}"},
+        q2_when={},
+        q3_severity={},
+        q4_why={},
+        q5_action={"action_summary": f"Reroute {i}"},
+        q6_confidence={},
+        q7_inaction={},
+        exposure_usd=1000.0 * i,
+        potential_loss_usd=10.0 * i,
+        potential_delay_days=2.0,
+        recommended_action="reroute",
+        action_cost_usd=5.0,
+        confidence_score=0.8,
+        valid_until=NOW + timedelta(days=1),
+        is_expired=False,
+        # Only a few distinct timestamps, so ties on created_at are common
+        created_at=NOW - timedelta(minutes=rng.randint(0, 9)),
+    )
+    values.update(overrides)
+    return DecisionModel(**values)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        # Table only: the model declares ix_decisions_chokepoint twice
+        # (index=True and __table_args__), which SQLite rejects
+        await conn.execute(CreateTable(DecisionModel.__table__))
+
+    rng = random.Random(11)
+    rows = [_row(i, rng) for i in range(120)]
+    rows.append(_row(500, rng, is_expired=True))
+    rows.append(_row(501, rng, valid_until=NOW - timedelta(hours=1)))
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as s:
+        s.add_all(rows)
+        await s.commit()
+        yield s
+    await engine.dispose()
+
+
+def _expected(rows: list[DecisionModel], **filters) -> list[str]:
+    keep = [
+        r for r in rows
+        if not r.is_expired and r.valid_until > NOW
+        and all(getattr(r, k) == v for k, v in filters.items())
+    ]
+    keep.sort(key=lambda r: (r.created_at, r.decision_id), reverse=True)
+    return [r.decision_id for r in keep]
+
+
+async def _all_rows(session) -> list[DecisionModel]:
+    return list((await session.execute(select(DecisionModel))).scalars())
+
+
+class TestCursor:
+    def test_round_trip(self):
+        ts = datetime(2026, 2, 13, 8, 30, 15, 123456)
+        assert decode_decision_cursor(encode_decision_cursor(ts, "dec_1|x")) == (ts, "dec_1|x")
+
+    def test_malformed(self):
+        with pytest.raises(ValueError):
+            decode_decision_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+class TestListSummaries:
+    async def test_filters_in_query(self, session):
+        repo = PostgresDecisionRepository(session)
+        rows = await _all_rows(session)
+
+        page = await repo.list_summaries(
+            customer_id="cust_a", chokepoint="RED_SEA", severity="high", limit=100,
+        )
+        want = _expected(rows, customer_id="cust_a", chokepoint="red_sea", severity="high")
+        assert [r.decision_id for r in page.items] == want
+        assert page.total == len(want)
+        assert page.next_cursor is None
+
+    async def test_keyset_pages_cover_everything_once(self, session):
+        repo = PostgresDecisionRepository(session)
+        want = _expected(await _all_rows(session))
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = await repo.list_summaries(limit=7, cursor=cursor, include_total=False)
+            seen.extend(r.decision_id for r in page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == want
+        assert pages == -(-len(want) // 7)
+
+    async def test_offset_without_cursor(self, session):
+        repo = PostgresDecisionRepository(session)
+        want = _expected(await _all_rows(session))
+
+        page = await repo.list_summaries(limit=10, offset=20)
+        assert [r.decision_id for r in page.items] == want[20:30]
+        assert page.total == len(want)
+
+    async def test_projection(self, session):
+        repo = PostgresDecisionRepository(session)
+        page = await repo.list_summaries(limit=1)
+        (row,) = page.items
+        assert isinstance(row, DecisionSummaryRow)
+        n = int(row.decision_id.split("_")[1])
+        assert row.headline == f"Event {n}"
+        assert row.action_summary == f"Reroute {n}"
+
+    async def test_inactive_included_on_request(self, session):
+        repo = PostgresDecisionRepository(session)
+        page = await repo.list_summaries(active_only=False, limit=200)
+        ids = {r.decision_id for r in page.items}
+        assert {"dec_0500", "dec_0501"} <= ids
+        assert page.total == 122
@@ -0,0 +1,251 @@
+"""Tests for the Exposure Index.
+
+Tests IntervalTree, ExposureIndex maintenance, and that ExposureMatcher
+and InMemoryCustomerRepository give the same answers with the index as
+with a full scan.
+"""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.riskcast.constants import ShipmentStatus
+from app.riskcast.matchers.exposure import ExposureMatcher
+from app.riskcast.matchers.exposure_index import ExposureIndex, IntervalTree
+from app.riskcast.repos.customer import InMemoryCustomerRepository
+from app.riskcast.schemas.customer import CustomerContext, CustomerProfile, Shipment
+
+NOW = datetime.utcnow()
+
+
+def _shipment(
+    sid: str,
+    etd_days: float,
+    eta_days: float,
+    customer_id: str = "cust_1",
+    chokepoints: tuple[str, ...] = ("red_sea", "suez"),
+    status: ShipmentStatus = ShipmentStatus.BOOKED,
+) -> Shipment:
+    return Shipment(
+        shipment_id=sid,
+        customer_id=customer_id,
+        origin_port="CNSHA",
+        destination_port="NLRTM",
+        route_chokepoints=list(chokepoints),
+        etd=NOW + timedelta(days=etd_days),
+        eta=NOW + timedelta(days=eta_days),
+        cargo_value_usd=10_000,
+        status=status,
+    )
+
+
+def _profile(customer_id: str = "cust_1", **kw) -> CustomerProfile:
+    return CustomerProfile(
+        customer_id=customer_id, company_name="Test Co", primary_phone="+84901234567", **kw
+    )
+
+
+def _intelligence(chokepoint: str = "red_sea", start_days: float = 0, end_days: float = 10):
+    """Minimal stand-in for CorrelatedIntelligence (fields the matcher reads)."""
+    return SimpleNamespace(
+        signal=SimpleNamespace(
+            signal_id="OMEN-TEST",
+            geographic=SimpleNamespace(primary_chokepoint=SimpleNamespace(value=chokepoint)),
+            temporal=SimpleNamespace(
+                earliest_impact=NOW + timedelta(days=start_days),
+                latest_resolution=NOW + timedelta(days=end_days),
+            ),
+        ),
+        combined_confidence=0.8,
+        correlation_status=SimpleNamespace(value="confirmed"),
+    )
+
+
+class TestIntervalTree:
+    """Tests for the treap-based interval tree."""
+
+    def test_overlap_query(self):
+        tree = IntervalTree()
+        tree.insert(_shipment("a", 0, 5))
+        tree.insert(_shipment("b", 10, 20))
+        tree.insert(_shipment("c", 30, 40))
+
+        ids = [s.shipment_id for s in tree.overlapping(NOW + timedelta(days=4), NOW + timedelta(days=12))]
+        assert ids == ["a", "b"]
+
+    def test_remove_and_reinsert(self):
+        tree = IntervalTree()
+        tree.insert(_shipment("a", 0, 5))
+        tree.insert(_shipment("a", 50, 60))  # re-insert moves the window
+        assert len(tree) == 1
+        assert tree.overlapping(NOW, NOW + timedelta(days=10)) == []
+        assert tree.remove("a") is True
+        assert tree.remove("a") is False
+        assert list(tree) == []
+
+    def test_matches_brute_force(self):
+        rng = random.Random(42)
+        tree = IntervalTree()
+        live: dict[str, Shipment] = {}
+        for i in range(2000):
+            etd = rng.uniform(-60, 60)
+            s = _shipment(f"s{i}", etd, etd + rng.uniform(1, 45))
+            tree.insert(s)
+            live[s.shipment_id] = s
+        for sid in rng.sample(sorted(live), 500):
+            tree.remove(sid)
+            del live[sid]
+
+        for _ in range(50):
+            a = NOW + timedelta(days=rng.uniform(-70, 70))
+            b = a + timedelta(days=rng.uniform(0, 30))
+            got = {s.shipment_id for s in tree.overlapping(a, b)}
+            want = {sid for sid, s in live.items() if s.eta >= a and s.etd <= b}
+            assert got == want
+
+
+class TestExposureIndex:
+    """Tests for index maintenance."""
+
+    def test_keyed_by_customer_and_chokepoint(self):
+        index = ExposureIndex([
+            _shipment("a", 0, 5, customer_id="c1"),
+            _shipment("b", 0, 5, customer_id="c2", chokepoints=("malacca",)),
+        ])
+        window = (NOW - timedelta(days=1), NOW + timedelta(days=10))
+        assert [s.shipment_id for s in index.candidates("c1", "RED_SEA", *window)] == ["a"]
+        assert index.candidates("c2", "red_sea", *window) == []
+        assert index.customers_exposed_to("suez") == ["c1"]
+
+    def test_completed_shipments_are_dropped(self):
+        index = ExposureIndex([_shipment("a", 0, 5)])
+        index.upsert(_shipment("a", 0, 5, status=ShipmentStatus.DELIVERED))
+        assert "a" not in index
+        assert index.customers_exposed_to("red_sea") == []
+
+    def test_remove_updates_customer_counts(self):
+        index = ExposureIndex([_shipment("a", 0, 5), _shipment("b", 1, 6)])
+        index.remove("a")
+        assert index.customers_exposed_to("red_sea") == ["cust_1"]
+        index.remove("b")
+        assert index.customers_exposed_to("red_sea") == []
+        assert len(index) == 0
+
+
+class TestIndexedMatcher:
+    """ExposureMatcher with an index gives the same result as a scan."""
+
+    def test_same_result_as_scan(self):
+        rng = random.Random(7)
+        profile = _profile()
+        shipments = []
+        for i in range(300):
+            etd = rng.uniform(-40, 40)
+            shipments.append(_shipment(
+                f"s{i}", etd, etd + rng.uniform(5, 35),
+                chokepoints=rng.choice([("red_sea", "suez"), ("malacca",), ("panama",)]),
+                status=rng.choice([ShipmentStatus.BOOKED, ShipmentStatus.IN_TRANSIT]),
+            ))
+        context = CustomerContext(profile=profile, active_shipments=shipments)
+        intel = _intelligence("red_sea", start_days=5, end_days=12)
+
+        scanned = ExposureMatcher().match(intel, context)
+        indexed = ExposureMatcher(index=ExposureIndex(shipments)).match(intel, context)
+
+        assert scanned.affected_shipments
+
+        assert {s.shipment_id for s in indexed.affected_shipments} == {
+            s.shipment_id for s in scanned.affected_shipments
+        }
+        assert indexed.total_exposure_usd == scanned.total_exposure_usd
+        assert indexed.match_confidence == scanned.match_confidence
+        assert indexed.earliest_impact == scanned.earliest_impact
+
+    def test_match_multiple_skips_unexposed_customers(self):
+        shipment = _shipment("a", 0, 5, customer_id="c1")
+        index = ExposureIndex([shipment])
+        contexts = [
+            CustomerContext(profile=_profile("c1"), active_shipments=[shipment]),
+            CustomerContext(profile=_profile("c2")),
+        ]
+        matches = ExposureMatcher(index=index).match_multiple(_intelligence(), contexts)
+        assert [m.customer_id for m in matches] == ["c1"]
+
+    def test_only_context_shipments_match(self):
+        a, b = _shipment("a", 0, 5), _shipment("b", 0, 5)
+        context = CustomerContext(profile=_profile(), active_shipments=[a])
+        match = ExposureMatcher(index=ExposureIndex([a, b])).match(_intelligence(), context)
+        assert [s.shipment_id for s in match.affected_shipments] == ["a"]
+
+
+class TestComposerUsesIndex:
+    """Composers built with a repository's index take the indexed path."""
+
+    def test_compose_queries_index(self, monkeypatch):
+        from app.riskcast.composers import create_decision_composer
+
+        repo = InMemoryCustomerRepository()
+        repo._profiles["cust_1"] = _profile()
+        repo._customer_shipments["cust_1"] = {"a"}
+        repo._shipments["a"] = _shipment("a", 0, 5)
+        repo.exposure_index.upsert(repo._shipments["a"])
+
+        calls = []
+        candidates = repo.exposure_index.candidates
+        monkeypatch.setattr(
+            repo.exposure_index, "candidates",
+            lambda *args: calls.append(args) or candidates(*args),
+        )
+
+        def no_scan(*args):
+            raise AssertionError("legacy per-shipment scan used")
+
+        monkeypatch.setattr(ExposureMatcher, "_is_affected", no_scan)
+
+        composer = create_decision_composer(exposure_index=repo.exposure_index)
+        exposure = composer._extract_exposure_from_factual(
+            None, _intelligence("red_sea"), repo.get_context_sync("cust_1")
+        )
+        assert [s.shipment_id for s in exposure.affected_shipments] == ["a"]
+        assert [args[:2] for args in calls] == [("cust_1", "red_sea")]
+
+    def test_service_passes_repository_index(self):
+        from app.riskcast.service import RiskCastService
+
+        repo = InMemoryCustomerRepository()
+        service = RiskCastService(customer_repository=repo)
+        assert service._composer.exposure_matcher.index is repo.exposure_index
+
+
+@pytest.mark.asyncio
+class TestRepositoryIndex:
+    """InMemoryCustomerRepository keeps the index in sync."""
+
+    async def test_index_follows_repository_changes(self):
+        repo = InMemoryCustomerRepository()
+        await repo.create_profile(_profile(relevant_chokepoints=["red_sea", "suez"]))
+        await repo.add_shipment(_shipment("a", 0, 5))
+        assert [c.profile.customer_id for c in await repo.get_customers_by_chokepoint("red_sea")] == ["cust_1"]
+
+        await repo.update_shipment("a", status=ShipmentStatus.DELIVERED)
+        assert await repo.get_customers_by_chokepoint("red_sea") == []
+
+        await repo.add_shipment(_shipment("b", 0, 5))
+        await repo.delete_shipment("b")
+        assert len(repo.exposure_index) == 0
+
+    async def test_import_rebuilds_index(self):
+        repo = InMemoryCustomerRepository()
+        await repo.create_profile(_profile())
+        await repo.add_shipment(_shipment("a", 0, 5))
+        data = repo.export_data()
+
+        other = InMemoryCustomerRepository()
+        index = other.exposure_index
+        other.import_data(data)
+        assert other.exposure_index is index
+        assert "a" in other.exposure_index
+        other.clear()
+        assert len(other.exposure_index) == 0
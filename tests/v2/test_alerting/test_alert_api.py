@@ -142,6 +142,43 @@ async def test_evaluate_triggers_alert(client):
     assert data[0]["metric_value"] == 85.0
 
 
+@pytest.mark.asyncio
+async def test_evaluate_dispatches_alerts_in_one_batch(client, monkeypatch):
+    """Alerts fired by one evaluation are dispatched together via dispatch_many."""
+    from riskcast.api.routers import alerts as alerts_router
+
+    for name in ("Batch Rule A", "Batch Rule B"):
+        await client.post("/api/v1/alerts/rules", json={
+            "rule_name": name,
+            "metric": "risk_score",
+            "operator": "gte",
+            "threshold": 10.0,
+            "channels": ["in_app"],
+            "cooldown_minutes": 0,
+            "max_per_day": 100,
+        })
+
+    batches = []
+    real = alerts_router._channels.dispatch_many
+
+    async def _spy(alerts):
+        batches.append([alert.rule_name for alert, _ in alerts])
+        return await real(alerts)
+
+    monkeypatch.setattr(alerts_router._channels, "dispatch_many", _spy)
+
+    eval_resp = await client.post("/api/v1/alerts/evaluate", json={
+        "metrics": {"risk_score": 90.0},
+        "entity_type": "order",
+        "entity_id": "ord-batch-1",
+    })
+    assert eval_resp.status_code == 200, f"Response: {eval_resp.text}"
+    sent = [a for a in eval_resp.json() if a["rule_name"].startswith("Batch Rule")]
+    assert len(batches) == 1
+    assert {"Batch Rule A", "Batch Rule B"} <= set(batches[0])
+    assert all(a["status"] == "sent" for a in sent)
+
+
 @pytest.mark.asyncio
 async def test_evaluate_no_trigger(client):
     """POST /api/v1/alerts/evaluate returns empty when no rules match."""
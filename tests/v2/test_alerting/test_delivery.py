@@ -0,0 +1,305 @@
+"""
+Tests for Alert Delivery.
+
+Covers:
+- HostClientPool reuses one client per host and caps per-host concurrency
+- WebhookDispatcher marks 5xx / transport errors as retryable
+- ChannelRouter sends an alert's channels concurrently
+- AlertDeliveryQueue retries retryable channels and reports queue-full
+- AlertDeliveryQueue.stop gives scheduled retries a final attempt
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from riskcast.alerting.channels import ChannelRouter, WebhookDispatcher
+from riskcast.alerting.delivery import AlertDeliveryQueue, HostClientPool
+from riskcast.alerting.schemas import (
+    AlertChannel,
+    AlertRecord,
+    AlertSeverity,
+    AlertStatus,
+)
+
+
+def _make_alert(alert_id: str = "alert_dl_001", channels=None) -> AlertRecord:
+    return AlertRecord(
+        alert_id=alert_id,
+        rule_id="rule_001",
+        rule_name="Test Rule",
+        company_id="comp-001",
+        severity=AlertSeverity.HIGH,
+        status=AlertStatus.PENDING,
+        metric="risk_score",
+        metric_value=85.0,
+        threshold=70.0,
+        title="[HIGH] Test Alert",
+        message="Test alert message",
+        channels=channels or [AlertChannel.WEBHOOK],
+        triggered_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+class _GatedDispatcher:
+    """Blocks every dispatch until released; records how many ran at once."""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.started = 0
+        self.all_started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def dispatch(self, alert, config):
+        self.started += 1
+        if self.started >= self.expected:
+            self.all_started.set()
+        await self.release.wait()
+        return {"success": True, "detail": "ok"}
+
+
+class _FlakyDispatcher:
+    """Fails with a retryable result ``failures`` times, then succeeds."""
+
+    def __init__(self, failures: int, retryable: bool = True):
+        self.failures = failures
+        self.retryable = retryable
+        self.calls = 0
+
+    async def dispatch(self, alert, config):
+        self.calls += 1
+        if self.calls <= self.failures:
+            return {"success": False, "detail": "HTTP 503", "retryable": self.retryable}
+        return {"success": True, "detail": "HTTP 200"}
+
+
+# ── HostClientPool ─────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_host():
+    pool = HostClientPool(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    try:
+        async with pool.acquire("https://hooks.example.com/a") as c1:
+            pass
+        async with pool.acquire("https://HOOKS.example.com/b?x=1") as c2:
+            pass
+        async with pool.acquire("https://other.example.com/a") as c3:
+            pass
+        assert c1 is c2
+        assert c3 is not c1
+    finally:
+        await pool.aclose()
+    assert c1.is_closed and c3.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pool_caps_concurrency_per_host():
+    pool = HostClientPool(max_per_host=2)
+    inside = 0
+    peak = 0
+    two_inside = asyncio.Event()
+    release = asyncio.Event()
+
+    async def borrow():
+        nonlocal inside, peak
+        async with pool.acquire("https://hooks.example.com/x"):
+            inside += 1
+            peak = max(peak, inside)
+            if inside == 2:
+                two_inside.set()
+            await release.wait()
+            inside -= 1
+
+    tasks = [asyncio.create_task(borrow()) for _ in range(5)]
+    await two_inside.wait()
+    await asyncio.sleep(0)
+    assert inside == 2
+    release.set()
+    await asyncio.gather(*tasks)
+    await pool.aclose()
+    assert peak == 2
+
+
+# ── WebhookDispatcher ──────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_webhook_5xx_is_retryable():
+    pool = HostClientPool(transport=httpx.MockTransport(lambda r: httpx.Response(503)))
+    dispatcher = WebhookDispatcher(pool=pool)
+    result = await dispatcher.dispatch(_make_alert(), {"url": "https://hooks.example.com/x"})
+    await pool.aclose()
+    assert result["success"] is False
+    assert result["retryable"] is True
+
+
+@pytest.mark.asyncio
+async def test_webhook_4xx_is_not_retryable():
+    pool = HostClientPool(transport=httpx.MockTransport(lambda r: httpx.Response(400)))
+    dispatcher = WebhookDispatcher(pool=pool)
+    result = await dispatcher.dispatch(_make_alert(), {"url": "https://hooks.example.com/x"})
+    await pool.aclose()
+    assert result["retryable"] is False
+
+
+@pytest.mark.asyncio
+async def test_webhook_transport_error_is_retryable():
+    def boom(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    pool = HostClientPool(transport=httpx.MockTransport(boom))
+    dispatcher = WebhookDispatcher(pool=pool)
+    result = await dispatcher.dispatch(_make_alert(), {"url": "https://hooks.example.com/x"})
+    await pool.aclose()
+    assert result["success"] is False
+    assert result["retryable"] is True
+
+
+@pytest.mark.asyncio
+async def test_webhook_does_not_mutate_config_headers():
+    pool = HostClientPool(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    headers = {"X-Token": "abc"}
+    await WebhookDispatcher(pool=pool).dispatch(
+        _make_alert(), {"url": "https://hooks.example.com/x", "headers": headers}
+    )
+    await pool.aclose()
+    assert headers == {"X-Token": "abc"}
+
+
+# ── ChannelRouter ──────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_router_dispatches_channels_concurrently():
+    router = ChannelRouter()
+    gated = _GatedDispatcher(expected=2)
+    router._dispatchers[AlertChannel.WEBHOOK] = gated
+    router._dispatchers[AlertChannel.EMAIL] = gated
+    alert = _make_alert(channels=[AlertChannel.WEBHOOK, AlertChannel.EMAIL])
+
+    task = asyncio.create_task(router.dispatch_alert(alert, {}))
+    await asyncio.wait_for(gated.all_started.wait(), timeout=1)
+    gated.release.set()
+    results = await task
+
+    assert set(results) == {"webhook", "email"}
+    assert all(r["success"] for r in results.values())
+
+
+@pytest.mark.asyncio
+async def test_dispatch_many_is_bounded():
+    router = ChannelRouter(max_concurrent_alerts=3)
+    gated = _GatedDispatcher(expected=3)
+    router._dispatchers[AlertChannel.WEBHOOK] = gated
+    alerts = [(_make_alert(f"a{i}"), {}) for i in range(6)]
+
+    task = asyncio.create_task(router.dispatch_many(alerts))
+    await asyncio.wait_for(gated.all_started.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert gated.started == 3
+    gated.release.set()
+    results = await task
+
+    assert len(results) == 6
+    assert gated.started == 6
+
+
+# ── AlertDeliveryQueue ─────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_queue_retries_retryable_failures():
+    router = ChannelRouter()
+    flaky = _FlakyDispatcher(failures=2)
+    router._dispatchers[AlertChannel.WEBHOOK] = flaky
+    queue = AlertDeliveryQueue(router, workers=2, base_delay=0.001, max_delay=0.01)
+    queue.start()
+    alert = _make_alert()
+
+    assert queue.submit(alert, {}) is True
+    await asyncio.wait_for(queue.join(), timeout=2)
+    await queue.stop()
+
+    assert flaky.calls == 3
+    assert queue.delivered == 1
+    assert alert.delivery_results["webhook"]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_queue_gives_up_after_max_retries():
+    router = ChannelRouter()
+    flaky = _FlakyDispatcher(failures=100)
+    router._dispatchers[AlertChannel.WEBHOOK] = flaky
+    queue = AlertDeliveryQueue(router, max_retries=2, base_delay=0.001, max_delay=0.01)
+    queue.start()
+
+    queue.submit(_make_alert(), {})
+    await asyncio.wait_for(queue.join(), timeout=2)
+    await queue.stop()
+
+    assert flaky.calls == 3
+    assert queue.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_does_not_retry_permanent_failures():
+    router = ChannelRouter()
+    flaky = _FlakyDispatcher(failures=1, retryable=False)
+    router._dispatchers[AlertChannel.WEBHOOK] = flaky
+    queue = AlertDeliveryQueue(router, base_delay=0.001)
+    queue.start()
+
+    queue.submit(_make_alert(), {})
+    await asyncio.wait_for(queue.join(), timeout=2)
+    await queue.stop()
+
+    assert flaky.calls == 1
+    assert queue.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_requeues_scheduled_retries():
+    """A retry waiting out its backoff gets a final attempt on stop."""
+    router = ChannelRouter()
+    flaky = _FlakyDispatcher(failures=1)
+    router._dispatchers[AlertChannel.WEBHOOK] = flaky
+    queue = AlertDeliveryQueue(router, base_delay=60, max_delay=60)
+    queue.start()
+    alert = _make_alert()
+
+    queue.submit(alert, {})
+    await asyncio.wait_for(queue._queue.join(), timeout=2)
+    assert len(queue._pending_retries) == 1
+    await queue.stop()
+
+    assert flaky.calls == 2
+    assert queue.delivered == 1
+    assert not queue._pending_retries
+    assert alert.delivery_results["webhook"]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_stop_does_not_schedule_new_retries():
+    router = ChannelRouter()
+    flaky = _FlakyDispatcher(failures=100)
+    router._dispatchers[AlertChannel.WEBHOOK] = flaky
+    queue = AlertDeliveryQueue(router, base_delay=60, max_delay=60)
+    queue.start()
+
+    queue.submit(_make_alert(), {})
+    await asyncio.wait_for(queue._queue.join(), timeout=2)
+    await queue.stop()
+
+    assert flaky.calls == 2
+    assert queue.failed == 1
+    assert not queue._pending_retries
+
+
+@pytest.mark.asyncio
+async def test_queue_full_returns_false():
+    queue = AlertDeliveryQueue(ChannelRouter(), maxsize=1)
+    assert queue.submit(_make_alert("a1"), {}) is True
+    assert queue.submit(_make_alert("a2"), {}) is False
@@ -0,0 +1,198 @@
+"""
+Context Builder Tests — concurrent assembly, per-step timeouts, timings.
+
+Tests: lookups overlap with intent classification, slow/failing steps
+degrade to partial context, shared-session mode never times out queued
+steps, cancellation cleans up background lookups.
+"""
+
+import asyncio
+
+import pytest
+
+from riskcast.db import queries as db_queries
+from riskcast.services.context_builder import ContextBuilder
+
+
+class _FakeLLM:
+    async def generate(self, **kwargs):
+        return '{"type": "general", "entity": "", "raw": ""}'
+
+
+class _FakeOmen:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def get_signals(self, min_confidence: float = 0.5, limit: int = 5):
+        self.started.set()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("omen down")
+        return []
+
+
+class _WaitingLLM:
+    """Only answers once OMEN has been called — proves the two overlap."""
+
+    def __init__(self, omen: _FakeOmen, wait: float = 1.0):
+        self.omen = omen
+        self.wait = wait
+
+    async def generate(self, **kwargs):
+        await asyncio.wait_for(self.omen.started.wait(), timeout=self.wait)
+        return '{"type": "general", "entity": "", "raw": ""}'
+
+
+@pytest.mark.asyncio
+class TestContextBuilder:
+    """Test concurrent context assembly."""
+
+    async def test_builds_context_with_timings(self, session_factory, company_a):
+        """Every step reports a timing; nothing degraded on the happy path."""
+        builder = ContextBuilder(
+            llm=_FakeLLM(), omen_client=_FakeOmen(), session_factory=session_factory
+        )
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+
+        assert ctx.intent["type"] == "weekly_overview"
+        assert ctx.degraded_steps == []
+        for step in ("intent", "company", "appetite", "signals", "omen_signals",
+                     "orders_7d", "payments_overdue", "incidents_7d", "total"):
+            assert step in ctx.timings_ms
+        assert "Company Alpha" in ctx.system_prompt
+
+    async def test_lookups_overlap_with_intent(self, session_factory, company_a):
+        """OMEN is queried while the LLM intent classifier is still running."""
+        omen = _FakeOmen()
+        builder = ContextBuilder(
+            llm=_WaitingLLM(omen), omen_client=omen, session_factory=session_factory
+        )
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "xyz", [])
+
+        # A sequential build would time out inside _WaitingLLM → "fallback"
+        assert ctx.intent["method"] == "haiku"
+
+    async def test_slow_omen_times_out_to_partial_context(self, session_factory, company_a):
+        """A slow OMEN call is cut off by its step timeout; the rest still arrives."""
+        builder = ContextBuilder(
+            llm=_FakeLLM(), omen_client=_FakeOmen(delay=30), session_factory=session_factory
+        )
+        builder.STEP_TIMEOUT_S = 0.05
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+
+        assert ctx.degraded_steps == ["omen_signals"]
+        assert "orders_7d" in ctx.data_summary
+
+    async def test_failing_omen_degrades(self, session_factory, company_a):
+        """An exception in one step yields its default, not an error."""
+        builder = ContextBuilder(
+            llm=_FakeLLM(), omen_client=_FakeOmen(fail=True), session_factory=session_factory
+        )
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+        assert ctx.degraded_steps == ["omen_signals"]
+        assert ctx.signals_summary == []
+
+    async def test_failing_db_step_degrades(self, session_factory, company_a, monkeypatch):
+        """A failing per-intent query drops only its own key."""
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("db error")
+
+        monkeypatch.setattr(db_queries, "get_orders_summary", boom)
+        builder = ContextBuilder(
+            llm=_FakeLLM(), omen_client=_FakeOmen(), session_factory=session_factory
+        )
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+
+        assert ctx.degraded_steps == ["orders_7d"]
+        assert ctx.data_summary["orders_7d"] is None
+        assert ctx.data_summary["incidents_7d"] is not None
+
+    async def test_slow_company_lookup_degrades(self, session_factory, company_a, monkeypatch):
+        """A timed-out company lookup falls back to N/A in the prompt."""
+
+        async def slow_company(*args, **kwargs):
+            await asyncio.sleep(30)
+
+        monkeypatch.setattr(db_queries, "get_company", slow_company)
+        builder = ContextBuilder(
+            llm=_FakeLLM(), omen_client=_FakeOmen(), session_factory=session_factory
+        )
+        builder.STEP_TIMEOUT_S = 0.05
+        async with session_factory() as db:
+            ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+
+        assert ctx.degraded_steps == ["company"]
+        assert "Tên: N/A" in ctx.system_prompt
+
+    async def test_shared_session_without_factory(self, db, company_a):
+        """Without a session factory, steps serialize on the request session."""
+        builder = ContextBuilder(llm=_FakeLLM(), omen_client=_FakeOmen())
+        ctx = await builder.build(db, str(company_a.id), "payment overdue?", [])
+        assert ctx.intent["type"] == "payment_overview"
+        assert "overdue" in ctx.data_summary
+        assert ctx.degraded_steps == []
+
+    async def test_shared_session_steps_are_not_timed_out(self, db, company_a, monkeypatch):
+        """Queueing behind a slow step on the shared session is not a timeout."""
+        real = db_queries.get_orders_summary
+
+        async def slow_orders(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return await real(*args, **kwargs)
+
+        monkeypatch.setattr(db_queries, "get_orders_summary", slow_orders)
+        builder = ContextBuilder(llm=_FakeLLM(), omen_client=_FakeOmen())
+        builder.STEP_TIMEOUT_S = 0.05
+        ctx = await builder.build(db, str(company_a.id), "weekly overview", [])
+
+        assert ctx.degraded_steps == []
+        assert ctx.data_summary["orders_7d"] is not None
+
+    async def test_cancel_cleans_up_background_lookups(
+        self, session_factory, company_a, monkeypatch
+    ):
+        """Cancelling build() cancels and awaits the lookups it started."""
+        cancelled: list[str] = []
+        running = {"company": asyncio.Event(), "appetite": asyncio.Event()}
+
+        def _hanging(name):
+            async def fn(*args, **kwargs):
+                running[name].set()
+                try:
+                    await asyncio.sleep(30)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            return fn
+
+        monkeypatch.setattr(db_queries, "get_company", _hanging("company"))
+        monkeypatch.setattr(db_queries, "get_risk_appetite", _hanging("appetite"))
+        omen = _FakeOmen(delay=30)
+        builder = ContextBuilder(
+            llm=_WaitingLLM(omen, wait=30), omen_client=omen, session_factory=session_factory
+        )
+        builder.STEP_TIMEOUT_S = 60
+        async with session_factory() as db:
+            task = asyncio.create_task(builder.build(db, str(company_a.id), "xyz", []))
+            await omen.started.wait()
+            for event in running.values():
+                await event.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert omen.cancelled
+        assert sorted(cancelled) == ["appetite", "company"]
@@ -0,0 +1,88 @@
+"""
+Incident Full-Text Search Tests — FTS5 shadow table on SQLite.
+
+Tests: relevance ranking, tenant filtering, trigger sync on update/delete,
+operator-looking input is treated as plain terms.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from riskcast.db.fulltext import fts5_query, search_terms
+from riskcast.db.models import Incident
+from riskcast.db.queries import search_incidents_fulltext
+
+
+async def _add(db, company, type_, description="", resolution=None, age_days=0):
+    inc = Incident(
+        id=uuid.uuid4(),
+        company_id=company.id,
+        type=type_,
+        severity="high",
+        description=description,
+        resolution=resolution,
+        created_at=datetime.utcnow() - timedelta(days=age_days),
+    )
+    db.add(inc)
+    await db.flush()
+    return inc
+
+
+class TestSearchTerms:
+    """Query → safe terms."""
+
+    def test_strips_operators(self):
+        assert search_terms('port" OR NEAR(delay*') == ["port", "or", "near", "delay"]
+
+    def test_dedupes_and_keeps_unicode(self):
+        assert search_terms("Cảng cảng Hải Phòng") == ["cảng", "hải", "phòng"]
+
+    def test_fts5_query_quotes_terms(self):
+        assert fts5_query(["port", "delay"]) == '"port" OR "delay"'
+
+
+@pytest.mark.asyncio
+class TestIncidentFulltext:
+    """Search over the FTS5 shadow table."""
+
+    async def test_ranks_by_relevance(self, db, company_a):
+        await _add(db, company_a, "customs", "paperwork missing", age_days=0)
+        best = await _add(db, company_a, "port_delay", "port congestion delay at port", age_days=30)
+        await _add(db, company_a, "weather", "storm delay", age_days=1)
+
+        results = await search_incidents_fulltext(db, str(company_a.id), "port delay")
+
+        assert [r["id"] for r in results][0] == str(best.id)
+        assert len(results) == 2
+
+    async def test_filters_by_company(self, db, company_a, company_b):
+        await _add(db, company_b, "port", "port strike")
+        mine = await _add(db, company_a, "port", "port strike")
+
+        results = await search_incidents_fulltext(db, str(company_a.id), "strike")
+
+        assert [r["id"] for r in results] == [str(mine.id)]
+
+    async def test_update_and_delete_stay_in_sync(self, db, company_a):
+        inc = await _add(db, company_a, "carrier", "vessel rolled over")
+        inc.resolution = "rebooked on feeder"
+        await db.flush()
+
+        found = await search_incidents_fulltext(db, str(company_a.id), "feeder")
+        assert [r["id"] for r in found] == [str(inc.id)]
+
+        await db.execute(delete(Incident).where(Incident.id == inc.id))
+        assert await search_incidents_fulltext(db, str(company_a.id), "feeder") == []
+
+    async def test_empty_or_symbol_only_query(self, db, company_a):
+        await _add(db, company_a, "port", "anything")
+        assert await search_incidents_fulltext(db, str(company_a.id), "  %*\"()  ") == []
+
+    async def test_respects_limit(self, db, company_a):
+        for i in range(4):
+            await _add(db, company_a, "delay", f"delay number {i}", age_days=i)
+        results = await search_incidents_fulltext(db, str(company_a.id), "delay", limit=2)
+        assert len(results) == 2
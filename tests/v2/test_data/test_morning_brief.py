@@ -0,0 +1,188 @@
+"""
+Tests for batched morning brief generation.
+
+Runs MorningBriefGenerator against a private SQLite database with the
+offline StubLLMGateway:
+- Grouped metrics match the per-company count/sum queries
+- LLM calls are bounded by the concurrency limit
+- An unchanged prompt reuses the previous brief without an LLM call
+- Existing briefs are returned, not regenerated
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from riskcast.db import queries as db_queries
+from riskcast.db.models import Base, Company, Incident, MorningBrief, Order, Payment, Signal
+from riskcast.services.llm_gateway import StubLLMGateway, build_llm_gateway
+from riskcast.services.morning_brief import BRIEF_SYSTEM_PROMPT, MorningBriefGenerator
+
+N_COMPANIES = 12
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield factory
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def company_ids(session_factory) -> list[str]:
+    """Companies with varied orders, payments, incidents and signals."""
+    ids = []
+    async with session_factory() as session:
+        for i in range(N_COMPANIES):
+            company = Company(name=f"Co {i}", slug=f"brief-co-{i}")
+            session.add(company)
+            await session.flush()
+            ids.append(str(company.id))
+
+            for j in range(i % 4):
+                session.add(Order(company_id=company.id, order_number=f"P{i}-{j}", status="pending"))
+            for j in range(i % 3):
+                session.add(Order(company_id=company.id, order_number=f"T{i}-{j}", status="in_transit"))
+            session.add(Order(company_id=company.id, order_number=f"D{i}", status="delivered"))
+            for j in range(i % 2 + 1):
+                session.add(Payment(
+                    company_id=company.id,
+                    amount=Decimal("1500.50") * (j + 1),
+                    status="overdue" if (i + j) % 2 else "paid",
+                    due_date=date.today() - timedelta(days=10),
+                ))
+            session.add(Incident(
+                company_id=company.id, type="delay", severity="high",
+                created_at=datetime.utcnow() - timedelta(days=2 if i % 2 else 30),
+            ))
+            for j in range(i % 5):
+                session.add(Signal(
+                    company_id=company.id,
+                    source="test",
+                    signal_type=f"risk_{j}",
+                    entity_type="order",
+                    entity_id=uuid.uuid4(),
+                    confidence=Decimal("0.80"),
+                    severity_score=Decimal(30 + 15 * j),
+                    evidence={},
+                ))
+        await session.commit()
+    return ids
+
+
+async def _brief_count(factory) -> int:
+    async with factory() as session:
+        return (await session.execute(select(func.count()).select_from(MorningBrief))).scalar_one()
+
+
+class TestGroupedQueries:
+    @pytest.mark.asyncio
+    async def test_metrics_match_per_company_queries(self, session_factory, company_ids):
+        async with session_factory() as session:
+            grouped = await db_queries.get_brief_metrics(session, company_ids)
+            for cid in company_ids:
+                assert grouped[cid] == {
+                    "orders_pending": await db_queries.count_orders(session, cid, status="pending"),
+                    "orders_in_transit": await db_queries.count_orders(session, cid, status="in_transit"),
+                    "payments_overdue_count": await db_queries.count_payments(session, cid, status="overdue"),
+                    "payments_overdue_value": await db_queries.sum_overdue_payments(session, cid),
+                    "incidents_7d": await db_queries.count_incidents(session, cid, days=7),
+                }
+
+    @pytest.mark.asyncio
+    async def test_top_signals_match_per_company_queries(self, session_factory, company_ids):
+        async with session_factory() as session:
+            grouped = await db_queries.get_top_active_signals_by_company(
+                session, company_ids, per_company=2
+            )
+            for cid in company_ids:
+                single = await db_queries.get_active_signals(session, cid, limit=2)
+                assert [s.id for s in grouped.get(cid, [])] == [s.id for s in single]
+
+
+class TestGenerateAll:
+    @pytest.mark.asyncio
+    async def test_llm_concurrency_bounded(self, session_factory, company_ids):
+        llm = StubLLMGateway(delay_seconds=0.02)
+        generator = MorningBriefGenerator(llm=llm, max_concurrency=3)
+
+        result = await generator.generate_all(session_factory)
+
+        assert result.generated == N_COMPANIES
+        assert result.llm_calls == len(llm.calls) == N_COMPANIES
+        assert 1 < llm.max_in_flight <= 3
+        assert all(c["system"] == BRIEF_SYSTEM_PROMPT for c in llm.calls)
+        assert await _brief_count(session_factory) == N_COMPANIES
+
+    @pytest.mark.asyncio
+    async def test_existing_briefs_not_regenerated(self, session_factory, company_ids):
+        generator = MorningBriefGenerator(llm=StubLLMGateway())
+        async with session_factory() as session:
+            first = await generator.generate(session, company_ids[0])
+            await session.commit()
+
+        llm = StubLLMGateway()
+        result = await MorningBriefGenerator(llm=llm).generate_all(session_factory, company_ids)
+
+        assert result.existing == 1
+        assert result.generated == N_COMPANIES - 1
+        assert len(llm.calls) == N_COMPANIES - 1
+        assert result.briefs[company_ids[0]] == first
+        assert await _brief_count(session_factory) == N_COMPANIES
+
+    @pytest.mark.asyncio
+    async def test_unchanged_inputs_reuse_previous_brief(self, session_factory, company_ids):
+        await MorningBriefGenerator(llm=StubLLMGateway()).generate_all(session_factory)
+        async with session_factory() as session:
+            briefs = (await session.execute(select(MorningBrief))).scalars().all()
+            yesterday = {str(b.company_id): b.content for b in briefs}
+            for b in briefs:
+                b.brief_date = date.today() - timedelta(days=1)
+            # One company's situation changes overnight
+            session.add(Order(company_id=uuid.UUID(company_ids[1]), order_number="NEW", status="pending"))
+            await session.commit()
+
+        llm = StubLLMGateway()
+        result = await MorningBriefGenerator(llm=llm).generate_all(session_factory)
+
+        assert result.llm_calls == len(llm.calls) == 1
+        assert result.reused == N_COMPANIES - 1
+        assert result.generated == 1
+        assert result.briefs[company_ids[0]]["content"] == yesterday[company_ids[0]]
+        assert await _brief_count(session_factory) == 2 * N_COMPANIES
+
+    @pytest.mark.asyncio
+    async def test_fallback_brief_not_reused(self, session_factory, company_ids):
+        result = await MorningBriefGenerator(llm=StubLLMGateway(reply="")).generate_all(
+            session_factory, company_ids[:1]
+        )
+        content = result.briefs[company_ids[0]]["content"]
+        assert content.startswith("Báo cáo rủi ro ngày")
+
+        async with session_factory() as session:
+            brief = (await session.execute(select(MorningBrief))).scalar_one()
+            assert brief.input_hash is None
+
+
+class TestStubGateway:
+    @pytest.mark.asyncio
+    async def test_deterministic_reply(self):
+        llm = StubLLMGateway()
+        a = await llm.generate("sys", "hello", model="m")
+        assert a == await llm.generate("sys", "hello", model="m")
+        assert a != await llm.generate("sys", "other", model="m")
+        assert a.startswith("[stub m]")
+
+    def test_backend_switch(self, monkeypatch):
+        from riskcast.config import settings
+
+        monkeypatch.setattr(settings, "llm_backend", "stub")
+        assert isinstance(build_llm_gateway(), StubLLMGateway)
@@ -0,0 +1,75 @@
+"""
+Signal Archive Tests — batch move of inactive signals, retention drop.
+
+Runs the SQLite path (plain archive table); PostgreSQL adds monthly
+partitions on top of the same flow.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from riskcast.db.models import Signal, SignalArchive
+from riskcast.services.signal_archive import SignalArchiver, _next_month, partition_name
+
+
+async def _seed(session_factory, company, *, active: bool, age_days: int, n: int = 1):
+    async with session_factory() as session:
+        for _ in range(n):
+            session.add(Signal(
+                id=uuid.uuid4(),
+                company_id=company.id,
+                source="test",
+                signal_type=f"t-{uuid.uuid4().hex[:6]}",
+                entity_type="order",
+                entity_id=uuid.uuid4(),
+                confidence=0.8,
+                severity_score=50,
+                evidence={"k": "v"},
+                is_active=active,
+                created_at=datetime.utcnow() - timedelta(days=age_days),
+            ))
+        await session.commit()
+
+
+async def _count(session_factory, model, company):
+    async with session_factory() as session:
+        return (await session.execute(
+            select(func.count()).select_from(model).where(model.company_id == company.id)
+        )).scalar()
+
+
+class TestPartitionNaming:
+    def test_partition_name(self):
+        assert partition_name(date(2026, 3, 1)) == "v2_signals_archive_2026_03"
+
+    def test_next_month_rolls_year(self):
+        assert _next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+
+
+@pytest.mark.asyncio
+class TestSignalArchiver:
+    async def test_moves_only_old_inactive_signals(self, session_factory, company_a):
+        await _seed(session_factory, company_a, active=False, age_days=90, n=5)
+        await _seed(session_factory, company_a, active=False, age_days=1, n=2)
+        await _seed(session_factory, company_a, active=True, age_days=90, n=3)
+
+        archiver = SignalArchiver(session_factory, batch_size=2)
+        result = await archiver.archive_inactive(older_than_days=30)
+
+        assert result.archived == 5
+        assert result.batches == 3
+        assert await _count(session_factory, Signal, company_a) == 5
+        assert await _count(session_factory, SignalArchive, company_a) == 5
+
+    async def test_drop_before_removes_old_history(self, session_factory, company_b):
+        await _seed(session_factory, company_b, active=False, age_days=500, n=2)
+        await _seed(session_factory, company_b, active=False, age_days=40, n=1)
+        archiver = SignalArchiver(session_factory)
+        await archiver.archive_inactive(older_than_days=30)
+
+        await archiver.drop_before(months_to_keep=12)
+
+        assert await _count(session_factory, SignalArchive, company_b) == 1
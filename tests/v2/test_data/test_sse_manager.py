@@ -0,0 +1,213 @@
+"""
+SSE Manager Tests.
+
+Covers:
+- Fan-out to every subscriber of a company, tenant separation
+- Each event is serialized once, whatever the subscriber count
+- Bounded queues: drop-oldest and disconnect policies
+- Last-Event-ID resume from the replay ring
+- Redis backend: events published on one worker reach another
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from riskcast.services import sse_manager as sse_module
+from riskcast.services.sse_manager import MemorySSEBackend, RedisSSEBackend, SSEManager
+
+
+async def _next(gen, timeout: float = 1.0) -> str:
+    return await asyncio.wait_for(gen.__anext__(), timeout)
+
+
+def _data(frame: str) -> dict:
+    line = next(l for l in frame.splitlines() if l.startswith("data: "))
+    return json.loads(line[len("data: "):])
+
+
+async def _subscribed(manager: SSEManager, company_id: str, **kw):
+    """Start a subscription and wait until it is registered."""
+    gen = manager.subscribe(company_id, **kw)
+    first = asyncio.ensure_future(gen.__anext__())
+    await asyncio.sleep(0)
+    return gen, first
+
+
+@pytest.mark.asyncio
+class TestFanOut:
+    async def test_all_company_subscribers_receive(self):
+        m = SSEManager()
+        a, fa = await _subscribed(m, "c1")
+        b, fb = await _subscribed(m, "c1")
+        other, fo = await _subscribed(m, "c2")
+        assert m.subscriber_count == 3
+
+        await m.broadcast("c1", {"type": "signal_alert", "n": 1})
+        assert _data(await asyncio.wait_for(fa, 1)) == {"type": "signal_alert", "n": 1}
+        assert _data(await asyncio.wait_for(fb, 1)) == {"type": "signal_alert", "n": 1}
+        assert not fo.done()
+
+        fo.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await fo
+        for g in (a, b, other):
+            await g.aclose()
+
+    async def test_serialized_once(self, monkeypatch):
+        calls = []
+        real_dumps = json.dumps
+
+        def counting_dumps(*args, **kw):
+            calls.append(1)
+            return real_dumps(*args, **kw)
+
+        monkeypatch.setattr(sse_module.json, "dumps", counting_dumps)
+        m = SSEManager()
+        subs = [await _subscribed(m, "c1") for _ in range(50)]
+        await m.broadcast("c1", {"type": "x"})
+        frames = {await asyncio.wait_for(f, 1) for _, f in subs}
+        assert len(calls) == 1
+        assert len(frames) == 1  # every subscriber got the same frame
+        for g, _ in subs:
+            await g.aclose()
+
+    async def test_frames_carry_event_id(self):
+        m = SSEManager()
+        g, f = await _subscribed(m, "c1")
+        await m.broadcast("c1", {"type": "x"})
+        frame = await asyncio.wait_for(f, 1)
+        assert frame.startswith("id: 1\n")
+        assert frame.endswith("\n\n")
+        await g.aclose()
+
+
+@pytest.mark.asyncio
+class TestBackpressure:
+    async def test_drop_oldest_keeps_newest(self):
+        m = SSEManager(queue_size=3, overflow="drop_oldest")
+        g, first = await _subscribed(m, "c1")
+        for i in range(10):
+            await m.broadcast("c1", {"n": i})
+        got = [_data(await asyncio.wait_for(first, 1))["n"]]
+        got += [_data(await _next(g))["n"] for _ in range(2)]
+        assert got == [7, 8, 9]
+        assert m.dropped == 7
+        await g.aclose()
+
+    async def test_disconnect_slow_subscriber(self):
+        m = SSEManager(queue_size=2, overflow="disconnect")
+        g, first = await _subscribed(m, "c1")
+        for i in range(5):
+            await m.broadcast("c1", {"n": i})
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(first, 1)
+        assert m.disconnected == 1
+        assert m.subscriber_count == 0
+
+        # The client reconnects and resumes from the replay ring
+        g = m.subscribe("c1", last_event_id=0)
+        assert [_data(await _next(g))["n"] for _ in range(5)] == [0, 1, 2, 3, 4]
+        await g.aclose()
+
+    async def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            SSEManager(overflow="block")
+
+
+@pytest.mark.asyncio
+class TestResume:
+    async def test_last_event_id_replays_missed(self):
+        m = SSEManager(replay_size=10)
+        for i in range(5):
+            await m.broadcast("c1", {"n": i})  # ids 1..5, nobody listening
+
+        g = m.subscribe("c1", last_event_id=2)
+        replayed = [_data(await _next(g))["n"] for _ in range(3)]
+        assert replayed == [2, 3, 4]
+
+        await m.broadcast("c1", {"n": 5})
+        assert _data(await _next(g))["n"] == 5
+        await g.aclose()
+
+    async def test_ring_is_bounded(self):
+        m = SSEManager(replay_size=3)
+        for i in range(10):
+            await m.broadcast("c1", {"n": i})
+        g = m.subscribe("c1", last_event_id=0)
+        assert [_data(await _next(g))["n"] for _ in range(3)] == [7, 8, 9]
+        await g.aclose()
+
+    async def test_keepalive(self):
+        m = SSEManager(keepalive_seconds=0.01)
+        g = m.subscribe("c1")
+        assert await _next(g) == ": keepalive\n\n"
+        await g.aclose()
+
+
+@pytest.fixture
+async def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    clients = []
+
+    def make():
+        c = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        clients.append(c)
+        return c
+
+    yield make
+    for c in clients:
+        await c.aclose()
+
+
+@pytest.mark.asyncio
+class TestRedisBackend:
+    async def test_cross_worker_delivery(self, fake_redis):
+        workers = []
+        for _ in range(2):
+            client = fake_redis()
+
+            async def factory(client=client):
+                return client
+
+            backend = RedisSSEBackend(factory)
+            m = SSEManager(backend=backend)
+            await m.start()
+            await backend.wait_listening()
+            workers.append(m)
+
+        worker_a, worker_b = workers
+        g, first = await _subscribed(worker_b, "c1")
+        await worker_a.broadcast("c1", {"type": "morning_brief"})
+
+        frame = await asyncio.wait_for(first, 2)
+        assert _data(frame) == {"type": "morning_brief"}
+        assert frame.startswith("id: 1\n")
+
+        # Both workers share event ids, so resume works on either one
+        await asyncio.sleep(0.05)
+        resumed = worker_a.subscribe("c1", last_event_id=0)
+        assert _data(await _next(resumed)) == {"type": "morning_brief"}
+
+        await g.aclose()
+        await resumed.aclose()
+        for m in workers:
+            await m.close()
+
+    async def test_local_delivery_when_redis_unavailable(self):
+        async def none():
+            return None
+
+        m = SSEManager(backend=RedisSSEBackend(none, reconnect_delay=0.01))
+        await m.start()
+        g, first = await _subscribed(m, "c1")
+        await m.broadcast("c1", {"type": "x"})
+        assert _data(await asyncio.wait_for(first, 1)) == {"type": "x"}
+        await g.aclose()
+        await m.close()
+
+
+def test_memory_backend_is_default():
+    assert isinstance(SSEManager().backend, MemorySSEBackend)
@@ -8,6 +8,7 @@ Covers:
 - Confusion matrix (TP, TN, FP, FN, precision, recall, F1)
 - Empty state handling
 - Recommendation generation
+- Calibration histogram and per-day rollup
 """
 
 import uuid
@@ -19,7 +20,11 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db.models import Outcome
-from riskcast.outcomes.accuracy import AccuracyCalculator
+from riskcast.outcomes.accuracy import (
+    AccuracyCalculator,
+    calibration_bin,
+    rebuild_daily_rollup,
+)
 
 
 @pytest.fixture
@@ -232,3 +237,67 @@ async def test_accuracy_rate(db, company_a, calculator):
 
     report = await calculator.generate_report(db, cid, days_back=365)
     assert report.accuracy_rate == 0.8
+
+
+# ── Calibration Histogram / Daily Rollup ──────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_report_includes_calibration_histogram(db, company_a, calculator):
+    """Only non-empty bins are returned, with per-bin rates."""
+    cid = str(company_a.id)
+    for _ in range(3):
+        await _insert_outcome(db, cid, 95.0, True)
+    await _insert_outcome(db, cid, 95.0, False)
+    await _insert_outcome(db, cid, 12.0, False)
+    await db.commit()
+
+    report = await calculator.generate_report(db, cid, days_back=365)
+    bins = {b.bin: b for b in report.calibration_bins}
+    assert set(bins) == {1, 9}
+    assert bins[9].count == 4
+    assert bins[9].actual_rate == 0.75
+    assert bins[9].avg_predicted == 0.95
+    assert bins[1].lower == 0.1 and bins[1].upper == 0.2
+
+
+@pytest.mark.parametrize("score,expected", [
+    (0.0, 0), (9.99, 0), (10.0, 1), (49.99, 4), (50.0, 5), (99.99, 9), (100.0, 9),
+])
+def test_calibration_bin_edges(score, expected):
+    assert calibration_bin(score) == expected
+
+
+@pytest.mark.asyncio
+async def test_rollup_matches_raw_scan(db, company_a, calculator):
+    """Rebuilt rollup gives the same report as the raw outcome scan."""
+    cid = str(company_a.id)
+    for i in range(20):
+        await _insert_outcome(
+            db, cid, float(i * 5), i % 3 == 0,
+            prediction_error=i / 40, was_accurate=i % 2 == 0,
+        )
+    await rebuild_daily_rollup(db, cid)
+    await db.commit()
+
+    raw = await calculator.generate_report(db, cid, days_back=365)
+    rolled = await AccuracyCalculator(use_rollup=True).generate_report(db, cid, days_back=365)
+
+    for field in (
+        "total_outcomes", "brier_score", "mean_absolute_error", "accuracy_rate",
+        "calibration_drift", "true_positives", "true_negatives",
+        "false_positives", "false_negatives", "calibration_bins",
+    ):
+        assert getattr(rolled, field) == getattr(raw, field), field
+
+
+@pytest.mark.asyncio
+async def test_rollup_is_tenant_scoped(db, company_a, company_b):
+    await _insert_outcome(db, str(company_a.id), 80.0, True)
+    await rebuild_daily_rollup(db, str(company_a.id))
+    await db.commit()
+
+    report = await AccuracyCalculator(use_rollup=True).generate_report(
+        db, str(company_b.id), days_back=365
+    )
+    assert report.total_outcomes == 0
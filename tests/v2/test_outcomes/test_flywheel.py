@@ -7,6 +7,7 @@ Covers:
 - Calibration drift detection
 - Learning summary
 - Conservative shift limits
+- Grouped priors for every entity type
 """
 
 import uuid
@@ -18,6 +19,7 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db.models import Outcome
+from riskcast.outcomes.aggregates import rebuild_entity_rollup
 from riskcast.outcomes.flywheel import FlywheelEngine
 
 
@@ -208,6 +210,43 @@ async def test_learning_summary_with_data(db, company_a, flywheel):
     assert "entity_states" in summary
 
 
+# ── Grouped Priors ────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_all_priors_match_per_entity_type(db, company_a, flywheel):
+    """compute_all_priors (one grouped query) matches per-type computation."""
+    cid = str(company_a.id)
+    for i in range(8):
+        await _insert_outcome(db, cid, "order", 70.0, i % 4 != 0, prediction_error=i / 20)
+    for i in range(6):
+        await _insert_outcome(db, cid, "route", 20.0, i == 0, prediction_error=0.3)
+    for _ in range(2):
+        await _insert_outcome(db, cid, "customer", 50.0, True)
+    await rebuild_entity_rollup(db, cid)
+    await db.commit()
+
+    def by_entity(states):
+        return {s.entity_key.split("/")[1]: {**s.to_dict(), "last_updated": None} for s in states}
+
+    states = by_entity(await flywheel.compute_all_priors(db, cid))
+    assert sorted(states) == ["customer", "order", "route"]
+    for entity_type, state in states.items():
+        single = await flywheel.compute_updated_priors(db, cid, entity_type)
+        assert by_entity([single])[entity_type] == state
+
+    rolled = FlywheelEngine(min_outcomes=5, use_rollup=True)
+    assert by_entity(await rolled.compute_all_priors(db, cid)) == states
+
+    summary = await flywheel.get_learning_summary(db, cid)
+    assert summary["total_outcomes"] == 16
+    assert summary["recent_outcomes"] == 16
+    assert summary["recent_avg_error"] == pytest.approx((sum(i / 20 for i in range(8)) + 2.0) / 16, abs=1e-4)
+    assert len(summary["entity_states"]) == 3
+    rolled_summary = await rolled.get_learning_summary(db, cid)
+    assert {**rolled_summary, "entity_states": None} == {**summary, "entity_states": None}
+
+
 # ── Serialization ─────────────────────────────────────────────────────
 
 
@@ -7,6 +7,8 @@ Covers:
 - Value generated computation
 - Outcome retrieval
 - Duplicate decision_id prevention
+- Daily accuracy rollup maintenance
+- Daily entity rollup maintenance (ROI / flywheel)
 """
 
 import uuid
@@ -15,9 +17,13 @@ from decimal import Decimal
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import select
 
-from riskcast.db.models import Outcome
+from riskcast.db.models import Outcome, OutcomeAccuracyDaily, OutcomeEntityDaily
+from riskcast.outcomes.accuracy import AccuracyCalculator
+from riskcast.outcomes.flywheel import FlywheelEngine
 from riskcast.outcomes.recorder import OutcomeRecorder
+from riskcast.outcomes.roi import ROICalculator
 from riskcast.outcomes.schemas import OutcomeRecordRequest, OutcomeType
 
 
@@ -311,3 +317,96 @@ async def test_get_nonexistent_outcome(db, company_a, recorder):
         db, str(company_a.id), "dec_doesnotexist"
     )
     assert result is None
+
+
+# ── Daily Accuracy Rollup ──────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_record_outcome_updates_daily_rollup(db, company_a, recorder):
+    """Recorded outcomes are folded into the per-day rollup incrementally."""
+    cid = str(company_a.id)
+    for materialized in (True, False, True):
+        await recorder.record_outcome(
+            session=db,
+            company_id=cid,
+            request=OutcomeRecordRequest(
+                decision_id=f"dec_{uuid.uuid4().hex[:16]}",
+                outcome_type=OutcomeType.LOSS_OCCURRED if materialized else OutcomeType.NO_IMPACT,
+                actual_loss_usd=1000.0 if materialized else 0.0,
+            ),
+            predicted_risk_score=72.0,
+            predicted_confidence=0.8,
+            predicted_loss_usd=1000.0,
+            predicted_action="insure",
+            entity_type="order",
+            entity_id="ord-roll",
+        )
+    await db.commit()
+
+    rows = (await db.execute(
+        select(OutcomeAccuracyDaily).where(OutcomeAccuracyDaily.company_id == company_a.id)
+    )).scalars().all()
+    assert len(rows) == 1
+    assert rows[0].bin == 7
+    assert rows[0].n == 3
+    assert rows[0].materialized == 2
+
+    report = await AccuracyCalculator(use_rollup=True).generate_report(db, cid, days_back=1)
+    assert report.total_outcomes == 3
+    assert report.true_positives == 2
+    assert report.false_positives == 1
+
+
+@pytest.mark.asyncio
+async def test_record_outcome_updates_entity_rollup(db, company_a, recorder):
+    """ROI and flywheel read the same numbers from the incremental rollup."""
+    cid = str(company_a.id)
+    cases = [
+        # entity_type, outcome, actual loss, followed
+        ("order", OutcomeType.LOSS_OCCURRED, 400.0, True),
+        ("order", OutcomeType.NO_IMPACT, 0.0, True),
+        ("order", OutcomeType.LOSS_OCCURRED, 2500.0, False),
+        ("route", OutcomeType.DELAY_AVOIDED, 0.0, False),
+        ("route", OutcomeType.PARTIAL_IMPACT, 800.0, True),
+        ("route", OutcomeType.NO_IMPACT, 0.0, True),
+    ]
+    for i, (entity_type, outcome_type, loss, followed) in enumerate(cases):
+        await recorder.record_outcome(
+            session=db,
+            company_id=cid,
+            request=OutcomeRecordRequest(
+                decision_id=f"dec_{uuid.uuid4().hex[:16]}",
+                outcome_type=outcome_type,
+                actual_loss_usd=loss,
+                action_followed_recommendation=followed,
+            ),
+            predicted_risk_score=30.0 + 10 * i,
+            predicted_confidence=0.8,
+            predicted_loss_usd=1500.0,
+            predicted_action="insure",
+            entity_type=entity_type,
+            entity_id=f"{entity_type}-roll",
+        )
+    await db.commit()
+
+    rows = (await db.execute(
+        select(OutcomeEntityDaily).where(OutcomeEntityDaily.company_id == company_a.id)
+    )).scalars().all()
+    assert sorted((r.entity_type, r.n, r.followed) for r in rows) == [
+        ("order", 3, 2), ("route", 3, 2),
+    ]
+
+    raw = await ROICalculator().generate_report(db, cid, days_back=1)
+    rolled = await ROICalculator(use_rollup=True).generate_report(db, cid, days_back=1)
+    assert rolled.model_dump(exclude={"generated_at"}) == raw.model_dump(exclude={"generated_at"})
+
+    engine = FlywheelEngine(min_outcomes=3)
+    raw_states = await engine.compute_all_priors(db, cid)
+    rolled_states = await FlywheelEngine(min_outcomes=3, use_rollup=True).compute_all_priors(db, cid)
+
+    def by_entity(states):
+        return {s.entity_key: {**s.to_dict(), "last_updated": None} for s in states}
+
+    assert len(raw_states) == 2
+    assert by_entity(rolled_states) == by_entity(raw_states)
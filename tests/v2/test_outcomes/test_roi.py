@@ -8,6 +8,7 @@ Covers:
 - ROI ratio
 - Recommendation follow rate
 - Action effectiveness
+- Per-day entity rollup matches the raw scan
 """
 
 import uuid
@@ -19,6 +20,7 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from riskcast.db.models import Outcome
+from riskcast.outcomes.aggregates import rebuild_entity_rollup
 from riskcast.outcomes.roi import ROICalculator
 
 
@@ -189,3 +191,37 @@ async def test_recommendation_insufficient_data(db, company_a, roi):
 
     report = await roi.generate_report(db, cid, days_back=365)
     assert "Only 3 outcomes" in report.recommendation
+
+
+# ── Entity Rollup ─────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_rollup_matches_raw_scan(db, company_a, roi):
+    """Rebuilt entity rollup gives the same report as the raw outcome scan."""
+    cid = str(company_a.id)
+    for i in range(12):
+        followed = i % 3 != 0
+        actual = 0.0 if i % 2 else 1000.0 * i
+        value = (5000.0 - actual) if followed else -actual
+        await _insert_outcome(db, cid, 5000.0 + i, actual, followed, value)
+    await rebuild_entity_rollup(db, cid)
+    await db.commit()
+
+    raw = await roi.generate_report(db, cid, days_back=365)
+    rolled = await ROICalculator(use_rollup=True).generate_report(db, cid, days_back=365)
+
+    assert raw.decisions_with_outcomes == 12
+    assert rolled.model_dump(exclude={"generated_at"}) == raw.model_dump(exclude={"generated_at"})
+
+
+@pytest.mark.asyncio
+async def test_rollup_is_tenant_scoped(db, company_a, company_b):
+    await _insert_outcome(db, str(company_a.id), 1000.0, 0.0, True, 1000.0)
+    await rebuild_entity_rollup(db, str(company_a.id))
+    await db.commit()
+
+    report = await ROICalculator(use_rollup=True).generate_report(
+        db, str(company_b.id), days_back=365
+    )
+    assert report.decisions_with_outcomes == 0
@@ -0,0 +1,99 @@
+"""
+Chokepoint Detector Tests.
+
+Covers:
+- Keyword hits in title, description and nested context/evidence values
+- Whole-word matching (no substring false hits)
+- Separator-insensitive keywords (hyphens, underscores in URLs/tags)
+- Longest keyword wins; spans point into the original field
+- Explicit geographic chokepoints
+- detect_chokepoints in the pipeline router uses the shared detector
+"""
+
+from riskcast.api.routers.pipeline_process import detect_chokepoints
+from riskcast.services.chokepoint_detector import (
+    ChokepointDetector,
+    default_detector,
+)
+from riskcast.services.omen_client import OmenSignal
+
+
+def _signal(title="", description="", context=None, evidence=None) -> OmenSignal:
+    return OmenSignal(
+        id="OMEN-1",
+        signal_type="geopolitical",
+        confidence=0.8,
+        severity_score=80,
+        title=title,
+        description=description,
+        context=context or {},
+        evidence=evidence or {},
+        created_at="2026-01-01T00:00:00Z",
+    )
+
+
+class TestDetect:
+    def test_title_and_description(self):
+        sig = _signal(title="Houthi attack", description="Delays at the Suez Canal")
+        assert default_detector.detect(sig) == ["RED_SEA", "SUEZ"]
+
+    def test_nested_structured_fields(self):
+        sig = _signal(
+            context={"regions": ["asia"], "tags": ["strait-of-hormuz"]},
+            evidence={"sources": [{"source": "reuters", "url": "https://x.example/panama_canal"}]},
+        )
+        assert default_detector.detect(sig) == ["HORMUZ", "PANAMA"]
+
+    def test_no_substring_false_hits(self):
+        sig = _signal(
+            title="Fuel prices rise in Tirana",
+            description="Madden report on Caribbean freight; taiwanese chip demand",
+        )
+        assert default_detector.detect(sig) == []
+
+    def test_case_insensitive(self):
+        assert default_detector.detect(_signal(title="BLACK SEA grain")) == ["DARDANELLES"]
+
+    def test_dict_keys_are_not_scanned(self):
+        sig = _signal(context={"iran": "n/a", "suez": 1})
+        assert default_detector.detect(sig) == []
+
+    def test_explicit_geographic_chokepoints(self):
+        sig = _signal(context={"chokepoints": ["strait of gibraltar", "SUEZ"]})
+        assert default_detector.detect(sig) == ["STRAIT_OF_GIBRALTAR", "SUEZ"]
+
+    def test_fields_do_not_join_into_keyword(self):
+        sig = _signal(title="Ships in the red", description="sea lanes reopen")
+        assert default_detector.detect(sig) == []
+
+    def test_router_uses_detector(self):
+        sig = _signal(title="Drought at Gatun Lake")
+        assert detect_chokepoints(sig) == ["PANAMA"]
+
+
+class TestScan:
+    def test_spans_point_into_field(self):
+        sig = _signal(title="Attack in the Gulf of Aden today")
+        (m,) = default_detector.scan(sig)
+        assert m.chokepoint == "RED_SEA"
+        assert m.keyword == "gulf of aden"  # longest keyword wins
+        assert m.field == "title"
+        assert sig.title[m.start:m.end] == "Gulf of Aden"
+
+    def test_nested_field_paths(self):
+        sig = _signal(evidence={"sources": [{"source": "a"}, {"source": "Bosphorus watch"}]})
+        (m,) = default_detector.scan(sig)
+        assert m.field == "evidence.sources[1].source"
+        assert (m.start, m.end) == (0, 9)
+
+    def test_custom_keywords(self):
+        detector = ChokepointDetector({"GIBRALTAR": ["gibraltar", "strait of gibraltar"]})
+        matches = list(detector.scan_text("Strait_of_Gibraltar closed", "tags"))
+        assert [(m.chokepoint, m.keyword, m.start, m.end) for m in matches] == [
+            ("GIBRALTAR", "strait of gibraltar", 0, 19),
+        ]
+
+    def test_many_keywords_share_prefixes(self):
+        detector = ChokepointDetector({"PORTS": [f"port of zz{i:04d}" for i in range(1000)]})
+        matches = list(detector.scan_text("delays at port of zz0999 and port of zz10000"))
+        assert [m.keyword for m in matches] == ["port of zz0999"]
@@ -8,15 +8,19 @@ Covers:
 - Gap detection
 - Error rate calculation
 - Overall status determination
+- SQL lag/gap aggregates against a Python reference, index use, TTL cache
 """
 
+import math
+import random
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import insert
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest_asyncio
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from riskcast.db.models import OmenIngestSignal, SignalLedger
 from riskcast.pipeline.health import (
@@ -24,6 +28,7 @@ from riskcast.pipeline.health import (
     FRESHNESS_STALE_MINUTES,
     FRESHNESS_OUTDATED_MINUTES,
     GAP_THRESHOLD_MINUTES,
+    LAG_PERCENTILE,
 )
 
 
@@ -239,3 +244,110 @@ class TestSerialization:
         health = await monitor.check_health(db)
         # Recommendations may be empty if shared DB has healthy data
         assert isinstance(health.recommendations, list)
+
+
+# ── SQL aggregates ────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def private_db():
+    """Session on a private database, so exact statistics are predictable."""
+    eng = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        for model in (OmenIngestSignal, SignalLedger):
+            await conn.run_sync(model.__table__.create)
+    factory = async_sessionmaker(eng, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await eng.dispose()
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile (percentile_cont semantics)."""
+    values = sorted(values)
+    pos = q * (len(values) - 1)
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+class TestSqlAggregates:
+    @pytest.mark.asyncio
+    async def test_lag_stats_match_python(self, private_db):
+        rng = random.Random(3)
+        now = datetime.utcnow()
+        lags = []
+        for _ in range(101):
+            ingested = now - timedelta(minutes=rng.uniform(0, 600))
+            lag = rng.uniform(0, 900)
+            lags.append(lag)
+            await _insert_signal(
+                private_db, ingested_at=ingested, emitted_at=ingested - timedelta(seconds=lag)
+            )
+        # Outside the window, negative lag, and no emitted_at: all ignored
+        await _insert_signal(private_db, ingested_at=now - timedelta(hours=30),
+                             emitted_at=now - timedelta(hours=31))
+        await _insert_signal(private_db, ingested_at=now, emitted_at=now + timedelta(minutes=5))
+        await _insert_signal(private_db, ingested_at=now)
+
+        health = await PipelineHealthMonitor().check_health(private_db)
+
+        assert health.avg_ingest_lag_seconds == pytest.approx(sum(lags) / len(lags), abs=0.01)
+        assert health.max_ingest_lag_seconds == pytest.approx(max(lags), abs=0.01)
+        assert health.p95_ingest_lag_seconds == pytest.approx(
+            _percentile(lags, LAG_PERCENTILE), abs=0.01
+        )
+        assert health.to_dict()["ingest_lag"]["p95_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_gaps_match_python(self, private_db):
+        now = datetime.utcnow()
+        offsets = [0, 10, 20, 200, 210, 500, 505, 1300, 1600]  # minutes ago
+        for m in offsets:
+            await _insert_signal(private_db, ingested_at=now - timedelta(minutes=m))
+
+        health = await PipelineHealthMonitor().check_health(private_db)
+
+        times = sorted(now - timedelta(minutes=m) for m in offsets if m < 24 * 60)
+        expected = [
+            round((b - a).total_seconds() / 60.0, 1)
+            for a, b in zip(times, times[1:])
+            if (b - a).total_seconds() / 60.0 > GAP_THRESHOLD_MINUTES
+        ]
+        assert [g["duration_minutes"] for g in health.gaps_detected] == expected
+        assert expected == [795.0, 290.0, 180.0]
+
+    @pytest.mark.asyncio
+    async def test_window_scans_use_ingested_at_index(self, private_db):
+        plan = await private_db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT lag(ingested_at) OVER (ORDER BY ingested_at) "
+            "FROM v2_omen_signals WHERE ingested_at >= :cutoff"
+        ), {"cutoff": datetime.utcnow() - timedelta(hours=24)})
+        assert any("ix_omen_signals_ingested_at" in row[-1] for row in plan.all())
+
+
+class TestHealthCache:
+    @pytest.mark.asyncio
+    async def test_snapshot_cached_for_ttl(self, private_db):
+        clock = [0.0]
+        monitor = PipelineHealthMonitor(cache_ttl_seconds=10, clock=lambda: clock[0])
+
+        first = await monitor.check_health(private_db)
+        await _insert_signal(private_db, ingested_at=datetime.utcnow())
+        assert await monitor.check_health(private_db) is first
+
+        clock[0] = 11.0
+        refreshed = await monitor.check_health(private_db)
+        assert refreshed is not first
+        assert refreshed.signals_last_24h == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_and_invalidate(self, private_db):
+        monitor = PipelineHealthMonitor(cache_ttl_seconds=60)
+        first = await monitor.check_health(private_db)
+        await _insert_signal(private_db, ingested_at=datetime.utcnow())
+
+        assert (await monitor.check_health(private_db, use_cache=False)).signals_last_24h == 1
+        assert await monitor.check_health(private_db) is first
+        monitor.invalidate()
+        assert (await monitor.check_health(private_db)).signals_last_24h == 1
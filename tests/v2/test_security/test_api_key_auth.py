@@ -2,17 +2,24 @@
 API Key Authentication Tests.
 
 Tests: valid key, invalid key, expired key, revoked key,
-wrong scope, missing header, hash correctness.
+wrong scope, missing header, hash correctness, resolution cache.
 """
 
+from datetime import timedelta
+
 import pytest
 
 from riskcast.auth.api_keys import (
     API_KEY_PREFIX,
+    APIKeyCache,
     APIKeyContext,
     generate_api_key,
+    get_api_key_cache,
     hash_api_key,
     check_scope,
+    resolve_api_key,
+    revoke_api_key,
+    rotate_api_key,
 )
 from fastapi import HTTPException
 
@@ -116,3 +123,117 @@ class TestCheckScope:
         )
         with pytest.raises(HTTPException):
             check_scope(ctx, "signals:inges")  # Typo
+
+
+# ── Resolution cache ──────────────────────────────────────────────────
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def counting_factory(session_factory):
+    """session_factory that counts DB round trips."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return session_factory()
+
+    factory.calls = calls
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def _clear_global_cache():
+    get_api_key_cache().clear()
+    yield
+    get_api_key_cache().clear()
+
+
+@pytest.mark.asyncio
+class TestResolveAPIKeyCache:
+    """Cached key resolution."""
+
+    async def test_valid_key_cached(self, valid_api_key, counting_factory):
+        """Second resolution of a valid key does not touch the DB."""
+        full_key, api_key = valid_api_key
+        cache = APIKeyCache()
+        a = await resolve_api_key(full_key, counting_factory, cache)
+        b = await resolve_api_key(full_key, counting_factory, cache)
+        assert a == b
+        assert a.company_id == api_key.company_id
+        assert len(counting_factory.calls) == 1
+
+    async def test_unknown_key_negatively_cached(self, db, counting_factory):
+        """Unknown keys are rejected from cache until the negative TTL expires."""
+        clock = _Clock()
+        cache = APIKeyCache(negative_ttl_seconds=5, clock=clock)
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc:
+                await resolve_api_key("rc_live_nope", counting_factory, cache)
+            assert exc.value.status_code == 401
+        assert len(counting_factory.calls) == 1
+
+        clock.now += 6
+        with pytest.raises(HTTPException):
+            await resolve_api_key("rc_live_nope", counting_factory, cache)
+        assert len(counting_factory.calls) == 2
+
+    async def test_expired_and_revoked_rejected(self, expired_api_key, revoked_api_key, session_factory):
+        cache = APIKeyCache()
+        for full_key, _ in (expired_api_key, revoked_api_key):
+            with pytest.raises(HTTPException):
+                await resolve_api_key(full_key, session_factory, cache)
+            assert cache.get(hash_api_key(full_key)) == (True, None)
+
+    async def test_positive_entry_expires(self, valid_api_key, counting_factory):
+        clock = _Clock()
+        cache = APIKeyCache(ttl_seconds=30, clock=clock)
+        full_key, _ = valid_api_key
+        await resolve_api_key(full_key, counting_factory, cache)
+        clock.now += 31
+        await resolve_api_key(full_key, counting_factory, cache)
+        assert len(counting_factory.calls) == 2
+
+    async def test_revoke_invalidates_cache(self, valid_api_key, session_factory):
+        """A revoked key is rejected on the very next request."""
+        full_key, api_key = valid_api_key
+        await resolve_api_key(full_key, session_factory)
+        async with session_factory() as session:
+            assert await revoke_api_key(session, api_key.id)
+        with pytest.raises(HTTPException):
+            await resolve_api_key(full_key, session_factory)
+
+    async def test_rotate_issues_new_key(self, valid_api_key, session_factory):
+        full_key, api_key = valid_api_key
+        await resolve_api_key(full_key, session_factory)
+        async with session_factory() as session:
+            new_key, row = await rotate_api_key(session, api_key.id)
+        assert row.scopes == api_key.scopes
+        ctx = await resolve_api_key(new_key, session_factory)
+        assert ctx.company_id == api_key.company_id
+        with pytest.raises(HTTPException):
+            await resolve_api_key(full_key, session_factory)
+
+    async def test_rotate_with_grace_keeps_old_key(self, valid_api_key, session_factory):
+        full_key, api_key = valid_api_key
+        async with session_factory() as session:
+            await rotate_api_key(session, api_key.id, grace_period=timedelta(hours=1))
+        ctx = await resolve_api_key(full_key, session_factory)
+        assert ctx.key_name == api_key.key_name
+
+
+class TestAPIKeyCacheBounds:
+    def test_lru_bounded(self):
+        cache = APIKeyCache(max_entries=10)
+        for i in range(100):
+            cache.put_negative(f"h{i}")
+        assert len(cache) == 10
+        assert cache.get("h99") == (True, None)
+        assert cache.get("h0") == (False, None)
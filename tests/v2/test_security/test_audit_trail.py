@@ -1,7 +1,8 @@
 """
 Security Audit Trail Tests.
 
-Tests: event logging, hash chain integrity, chain break detection, immutability.
+Tests: event logging, hash chain integrity, chain break detection, immutability,
+sequence numbers, checkpointed incremental verification.
 """
 
 import uuid
@@ -9,8 +10,11 @@ from datetime import datetime, timezone
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from riskcast.db.models import SecurityAuditCheckpoint, SecurityAuditLog
 from riskcast.services.security_audit import SecurityAuditService, _compute_entry_hash
 
 
@@ -119,3 +123,121 @@ class TestSecurityAuditService:
         )
         assert entry.status == "denied"
         assert entry.action == "login_failed"
+
+
+# ── Checkpointed verification ────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def audit_db():
+    """Session on a private database, so the chain holds only this test's entries."""
+    eng = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        for model in (SecurityAuditLog, SecurityAuditCheckpoint):
+            await conn.run_sync(model.__table__.create)
+    factory = async_sessionmaker(eng, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await eng.dispose()
+
+
+async def _log(svc: SecurityAuditService, db: AsyncSession, n: int) -> list[SecurityAuditLog]:
+    entries = [await svc.log_event(db, action=f"event_{i}") for i in range(n)]
+    await db.commit()
+    return entries
+
+
+@pytest.mark.asyncio
+class TestIncrementalVerification:
+    async def test_seq_is_contiguous(self, audit_db):
+        svc = SecurityAuditService()
+        entries = await _log(svc, audit_db, 5)
+        assert [e.seq for e in entries] == [1, 2, 3, 4, 5]
+        assert all(b.previous_hash == a.entry_hash for a, b in zip(entries, entries[1:]))
+
+    async def test_stale_tail_cannot_fork_chain(self, audit_db, monkeypatch):
+        svc = SecurityAuditService()
+        first = (await _log(svc, audit_db, 2))[0]
+
+        async def stale_tail(session):
+            return first.seq, first.entry_hash
+
+        monkeypatch.setattr(svc, "_get_tail", stale_tail)
+        with pytest.raises(IntegrityError):
+            await svc.log_event(audit_db, action="racing_writer")
+
+    async def test_verifies_only_entries_since_checkpoint(self, audit_db):
+        svc = SecurityAuditService(checkpoint_every=5, stream_batch_size=4)
+        await _log(svc, audit_db, 12)
+
+        report = await svc.verify_chain_integrity(audit_db)
+        await audit_db.commit()
+        assert report["chain_intact"]
+        assert report["verified_entries"] == 12
+        assert report["new_checkpoint_seq"] == 12
+
+        await _log(svc, audit_db, 3)
+        report = await svc.verify_chain_integrity(audit_db)
+        assert report["chain_intact"]
+        assert report["checkpoint_seq"] == 12
+        assert report["verified_entries"] == 3
+        assert report["total_entries"] == 15
+        # Fewer than checkpoint_every new entries: no new checkpoint
+        assert report["new_checkpoint_seq"] is None
+
+    async def test_tampering_after_checkpoint_detected(self, audit_db):
+        svc = SecurityAuditService(checkpoint_every=1)
+        await _log(svc, audit_db, 6)
+        await svc.verify_chain_integrity(audit_db)
+        await audit_db.commit()
+
+        entries = await _log(svc, audit_db, 4)
+        await audit_db.execute(
+            update(SecurityAuditLog)
+            .where(SecurityAuditLog.id == entries[1].id)
+            .values(action="nothing_to_see")
+        )
+        report = await svc.verify_chain_integrity(audit_db)
+        assert not report["chain_intact"]
+        assert report["breaks"][0]["issue"] == "entry_hash_mismatch"
+        assert report["breaks"][0]["seq"] == entries[1].seq
+
+    async def test_full_rescan_catches_old_tampering(self, audit_db):
+        svc = SecurityAuditService(checkpoint_every=1)
+        entries = await _log(svc, audit_db, 6)
+        await svc.verify_chain_integrity(audit_db)
+        await audit_db.commit()
+
+        await audit_db.execute(
+            update(SecurityAuditLog)
+            .where(SecurityAuditLog.id == entries[2].id)
+            .values(status="denied")
+        )
+        assert (await svc.verify_chain_integrity(audit_db))["chain_intact"]
+        report = await svc.verify_chain_integrity(audit_db, full=True)
+        assert not report["chain_intact"]
+        assert report["verified_entries"] == 6
+
+    async def test_forged_checkpoint_falls_back_to_full_scan(self, audit_db):
+        svc = SecurityAuditService(checkpoint_every=1)
+        await _log(svc, audit_db, 4)
+        await svc.verify_chain_integrity(audit_db)
+        await audit_db.commit()
+
+        await audit_db.execute(
+            update(SecurityAuditCheckpoint).values(entries_verified=1_000_000)
+        )
+        report = await svc.verify_chain_integrity(audit_db)
+        assert report["breaks"][0]["issue"] == "checkpoint_signature_invalid"
+        assert report["checkpoint_seq"] is None
+        assert report["verified_entries"] == 4
+
+    async def test_deleted_entry_is_a_gap(self, audit_db):
+        svc = SecurityAuditService()
+        entries = await _log(svc, audit_db, 5)
+        await audit_db.execute(delete(SecurityAuditLog).where(SecurityAuditLog.id == entries[2].id))
+
+        report = await svc.verify_chain_integrity(audit_db)
+        issues = [b.get("issue") for b in report["breaks"]]
+        assert "sequence_gap" in issues
+        assert report["breaks"][0]["expected_seq"] == 3
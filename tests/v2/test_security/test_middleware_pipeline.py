@@ -0,0 +1,199 @@
+"""
+Middleware Pipeline Tests.
+
+Covers:
+- Security headers and request id on normal, rejected and error responses
+- Tenant rejection short-circuits before the app and the rate limiter
+- Rate limiter returns 429 with Retry-After
+- Error handler returns the structured 500 body
+- Streaming responses are forwarded chunk by chunk (no buffering)
+- Non-HTTP scopes pass straight through
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from riskcast.auth.jwt import create_access_token
+from riskcast.middleware.error_handler import ErrorHandlerMiddleware
+from riskcast.middleware.pipeline import HTTPStage, MiddlewarePipeline
+from riskcast.middleware.rate_limit import RateLimitMiddleware
+from riskcast.middleware.request_context import RequestContextMiddleware
+from riskcast.middleware.security_headers import SECURITY_HEADERS, SecurityHeadersMiddleware
+from riskcast.middleware.tenant import TenantMiddleware
+from riskcast.services.rate_limiter import Quota
+
+
+def _app(burst: int = 100) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    @app.get("/api/v1/me")
+    async def me(request: Request):
+        return {
+            "company_id": request.state.company_id,
+            "request_id": request.state.request_id,
+        }
+
+    @app.get("/api/v1/boom")
+    async def boom():
+        raise RuntimeError("db password=hunter2")
+
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            RequestContextMiddleware(),
+            SecurityHeadersMiddleware(),
+            ErrorHandlerMiddleware(),
+            TenantMiddleware(),
+            RateLimitMiddleware(quota=Quota(per_minute=60, burst=burst)),
+        ],
+    )
+    return app
+
+
+def _token() -> str:
+    return create_access_token(
+        user_id=str(uuid.uuid4()),
+        company_id=str(uuid.uuid4()),
+        email="a@b.c",
+        role="admin",
+    )
+
+
+async def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+class TestPipelineSemantics:
+    async def test_public_path_gets_headers(self):
+        async with await _client(_app()) as c:
+            r = await c.get("/health", headers={"X-Request-ID": "req-1"})
+        assert r.status_code == 200
+        assert r.headers["X-Request-ID"] == "req-1"
+        assert r.headers["X-Response-Time"].endswith("ms")
+        for name, value in SECURITY_HEADERS.items():
+            assert r.headers[name] == value
+
+    async def test_authenticated_request_sees_state(self):
+        async with await _client(_app()) as c:
+            r = await c.get("/api/v1/me", headers={"Authorization": f"Bearer {_token()}"})
+        assert r.status_code == 200
+        body = r.json()
+        assert body["company_id"]
+        assert body["request_id"] == r.headers["X-Request-ID"]
+
+    async def test_missing_token_rejected_with_headers(self):
+        async with await _client(_app()) as c:
+            r = await c.get("/api/v1/me")
+        assert r.status_code == 401
+        assert r.json() == {"detail": "Missing authentication token"}
+        assert "X-Request-ID" in r.headers
+        assert r.headers["X-Frame-Options"] == "DENY"
+
+    async def test_rate_limit_returns_429(self):
+        headers = {"Authorization": f"Bearer {_token()}"}
+        async with await _client(_app(burst=2)) as c:
+            codes = [(await c.get("/api/v1/me", headers=headers)).status_code for _ in range(3)]
+            r = await c.get("/api/v1/me", headers=headers)
+        assert codes == [200, 200, 429]
+        assert r.headers["Retry-After"] == "1"
+        assert "X-Request-ID" in r.headers
+
+    async def test_unhandled_error_is_structured(self):
+        async with await _client(_app()) as c:
+            r = await c.get("/api/v1/boom", headers={"Authorization": f"Bearer {_token()}"})
+        assert r.status_code == 500
+        body = r.json()
+        assert body["error"] == "An internal error occurred. Please try again later."
+        uuid.UUID(body["error_id"])
+        assert "hunter2" not in r.text
+        assert r.headers["X-Content-Type-Options"] == "nosniff"
+
+
+class _Recorder(HTTPStage):
+    def __init__(self, name, log, reject=False):
+        self.name, self.log, self.reject = name, log, reject
+
+    async def on_request(self, request):
+        self.log.append(f"{self.name}:in")
+        if self.reject:
+            from starlette.responses import PlainTextResponse
+            return PlainTextResponse("no", status_code=403)
+        return None
+
+    def on_response_start(self, request, message):
+        self.log.append(f"{self.name}:out")
+
+
+@pytest.mark.asyncio
+class TestPipelineMechanics:
+    async def test_hook_order_matches_nesting(self):
+        log: list[str] = []
+        app = FastAPI()
+        app.get("/x")(lambda: {"ok": True})
+        app.add_middleware(MiddlewarePipeline, stages=[
+            _Recorder("a", log), _Recorder("b", log), _Recorder("c", log, reject=True),
+        ])
+        async with await _client(app) as c:
+            r = await c.get("/x")
+        assert r.status_code == 403
+        # c short-circuited: it does not post-process its own response
+        assert log == ["a:in", "b:in", "c:in", "b:out", "a:out"]
+
+    async def test_streaming_is_not_buffered(self):
+        """The first chunk reaches the server before the body generator finishes."""
+        release = asyncio.Event()
+        sent: list[dict] = []
+        first_chunk = asyncio.Event()
+
+        async def gen():
+            yield b"data: 1\n\n"
+            await release.wait()
+            yield b"data: 2\n\n"
+
+        app = FastAPI()
+        app.get("/health")(lambda: StreamingResponse(gen(), media_type="text/event-stream"))
+        app.add_middleware(MiddlewarePipeline, stages=[
+            RequestContextMiddleware(), SecurityHeadersMiddleware(), TenantMiddleware(),
+        ])
+
+        async def send(message):
+            sent.append(message)
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_chunk.set()
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        scope = {
+            "type": "http", "method": "GET", "path": "/health", "raw_path": b"/health",
+            "query_string": b"", "headers": [], "http_version": "1.1", "scheme": "http",
+            "server": ("test", 80), "client": ("1.2.3.4", 1), "root_path": "",
+        }
+        task = asyncio.create_task(app(scope, receive, send))
+        await asyncio.wait_for(first_chunk.wait(), timeout=2)
+        assert not task.done()
+        release.set()
+        await asyncio.wait_for(task, timeout=2)
+
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body" and m.get("body")]
+        assert bodies == [b"data: 1\n\n", b"data: 2\n\n"]
+
+    async def test_non_http_scope_passes_through(self):
+        seen = []
+
+        async def inner(scope, receive, send):
+            seen.append(scope["type"])
+
+        pipeline = MiddlewarePipeline(inner, stages=[_Recorder("a", [])])
+        await pipeline({"type": "lifespan"}, None, None)
+        assert seen == ["lifespan"]
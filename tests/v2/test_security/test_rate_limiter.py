@@ -0,0 +1,242 @@
+"""
+Rate Limiter Tests.
+
+Covers:
+- GCRA burst, denial and refill (fake clock)
+- Memory store stays bounded (LRU)
+- Redis Lua store: atomic, shared across store instances, memory fallback
+- Per-tenant quotas from the company plan (TTL cache, invalidation)
+- Middleware applies the tenant's plan quota
+"""
+
+import uuid
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from riskcast.auth.jwt import create_access_token
+from riskcast.middleware.pipeline import MiddlewarePipeline
+from riskcast.middleware.rate_limit import RateLimitMiddleware
+from riskcast.middleware.tenant import TenantMiddleware
+from riskcast.services.rate_limiter import (
+    MemoryGCRAStore,
+    PlanQuotaResolver,
+    Quota,
+    RedisGCRAStore,
+    default_quota,
+    quota_for_plan,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ── GCRA (memory store) ──────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestMemoryGCRA:
+    async def test_burst_then_deny(self):
+        store = MemoryGCRAStore(clock=FakeClock())
+        quota = Quota(per_minute=60, burst=3)
+        results = [await store.hit("k", quota) for _ in range(4)]
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[3].retry_after == pytest.approx(1.0)
+
+    async def test_refills_after_emission_interval(self):
+        clock = FakeClock()
+        store = MemoryGCRAStore(clock=clock)
+        quota = Quota(per_minute=60, burst=1)
+        assert (await store.hit("k", quota)).allowed
+        assert not (await store.hit("k", quota)).allowed
+        clock.now += 1.0
+        assert (await store.hit("k", quota)).allowed
+
+    async def test_keys_are_independent(self):
+        store = MemoryGCRAStore(clock=FakeClock())
+        quota = Quota(per_minute=60, burst=1)
+        assert (await store.hit("a", quota)).allowed
+        assert (await store.hit("b", quota)).allowed
+
+    async def test_lru_bounded(self):
+        store = MemoryGCRAStore(max_keys=100, clock=FakeClock())
+        quota = Quota(per_minute=60, burst=5)
+        for i in range(1000):
+            await store.hit(f"ip:{i}", quota)
+        assert len(store) == 100
+
+    async def test_denied_hits_do_not_extend_penalty(self):
+        clock = FakeClock()
+        store = MemoryGCRAStore(clock=clock)
+        quota = Quota(per_minute=60, burst=1)
+        await store.hit("k", quota)
+        for _ in range(10):
+            await store.hit("k", quota)
+        clock.now += 1.0
+        assert (await store.hit("k", quota)).allowed
+
+
+# ── Redis Lua store ──────────────────────────────────────────────────────
+
+
+@pytest.fixture
+async def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.aioredis.FakeRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+class TestRedisGCRA:
+    async def test_burst_then_deny(self, fake_redis):
+        async def factory():
+            return fake_redis
+
+        store = RedisGCRAStore(factory)
+        quota = Quota(per_minute=60, burst=3)
+        results = [await store.hit("k", quota) for _ in range(4)]
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert 0 < results[3].retry_after <= 1.0
+
+    async def test_limit_shared_across_workers(self, fake_redis):
+        async def factory():
+            return fake_redis
+
+        worker_a, worker_b = RedisGCRAStore(factory), RedisGCRAStore(factory)
+        quota = Quota(per_minute=60, burst=2)
+        assert (await worker_a.hit("k", quota)).allowed
+        assert (await worker_b.hit("k", quota)).allowed
+        assert not (await worker_a.hit("k", quota)).allowed
+        assert not (await worker_b.hit("k", quota)).allowed
+
+    async def test_key_expires_with_tat(self, fake_redis):
+        async def factory():
+            return fake_redis
+
+        store = RedisGCRAStore(factory)
+        await store.hit("k", Quota(per_minute=60, burst=3))
+        ttl = await fake_redis.pttl("v2:ratelimit:k")
+        assert 0 < ttl <= 1000
+
+    async def test_falls_back_to_memory_when_redis_down(self):
+        async def broken():
+            raise ConnectionError("redis down")
+
+        fallback = MemoryGCRAStore(clock=FakeClock())
+        store = RedisGCRAStore(broken, fallback=fallback)
+        quota = Quota(per_minute=60, burst=1)
+        assert (await store.hit("k", quota)).allowed
+        assert not (await store.hit("k", quota)).allowed
+        assert len(fallback) == 1
+
+    async def test_falls_back_when_redis_not_configured(self):
+        async def none():
+            return None
+
+        store = RedisGCRAStore(none, fallback=MemoryGCRAStore(clock=FakeClock()))
+        assert (await store.hit("k", Quota(per_minute=60, burst=1))).allowed
+
+
+# ── Plan quotas ──────────────────────────────────────────────────────────
+
+
+class TestQuotaForPlan:
+    def test_plan_limits(self):
+        assert quota_for_plan("free") == Quota(per_minute=10, burst=3)
+        assert quota_for_plan("starter") == Quota(per_minute=60, burst=20)
+        assert quota_for_plan("enterprise").per_minute == 1000
+
+    def test_unknown_plan(self):
+        assert quota_for_plan("platinum") is None
+        assert quota_for_plan(None) is None
+
+
+@pytest.mark.asyncio
+class TestPlanQuotaResolver:
+    async def test_uses_company_plan_and_caches(self):
+        calls = []
+
+        async def loader(cid):
+            calls.append(cid)
+            return "free"
+
+        clock = FakeClock()
+        resolver = PlanQuotaResolver(ttl_seconds=60, plan_loader=loader, clock=clock)
+        assert (await resolver.quota_for("c1")).per_minute == 10
+        assert (await resolver.quota_for("c1")).per_minute == 10
+        assert calls == ["c1"]
+
+        clock.now += 61
+        await resolver.quota_for("c1")
+        assert calls == ["c1", "c1"]
+
+    async def test_invalidate_picks_up_plan_change(self):
+        plan = {"c1": "free"}
+
+        async def loader(cid):
+            return plan[cid]
+
+        resolver = PlanQuotaResolver(plan_loader=loader, clock=FakeClock())
+        assert (await resolver.quota_for("c1")).per_minute == 10
+        plan["c1"] = "professional"
+        assert (await resolver.quota_for("c1")).per_minute == 10
+        resolver.invalidate("c1")
+        assert (await resolver.quota_for("c1")).per_minute == 300
+
+    async def test_lookup_failure_uses_default(self):
+        async def loader(cid):
+            raise RuntimeError("db down")
+
+        resolver = PlanQuotaResolver(plan_loader=loader, clock=FakeClock())
+        assert await resolver.quota_for("c1") == default_quota()
+
+    async def test_no_company_uses_default(self):
+        async def loader(cid):
+            raise AssertionError("should not be called")
+
+        resolver = PlanQuotaResolver(plan_loader=loader)
+        assert await resolver.quota_for(None) == default_quota()
+
+
+# ── Middleware ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_middleware_applies_plan_quota():
+    async def loader(cid):
+        return "free"  # burst 3
+
+    app = FastAPI()
+
+    @app.get("/api/v1/me")
+    async def me(request: Request):
+        return {"ok": True}
+
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            TenantMiddleware(),
+            RateLimitMiddleware(
+                store=MemoryGCRAStore(),
+                quotas=PlanQuotaResolver(plan_loader=loader),
+            ),
+        ],
+    )
+    token = create_access_token(str(uuid.uuid4()), str(uuid.uuid4()), "a@b.c", "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        codes = [(await c.get("/api/v1/me", headers=headers)).status_code for _ in range(4)]
+        r = await c.get("/api/v1/me", headers=headers)
+
+    assert codes == [200, 200, 200, 429]
+    assert int(r.headers["Retry-After"]) >= 1